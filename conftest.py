@@ -121,6 +121,33 @@ def reset_singletons():
         # Qt not available in this test
         pass
 
+@pytest.fixture
+def runtime_sandbox(tmp_path, monkeypatch):
+    """Send checkpoints and the SENTIENT_OS log file of story tests to tmp_path"""
+    import logging
+    from functools import partial
+    from core.checkpoint_manager import CheckpointManager
+    from core.logger import get_logger
+
+    monkeypatch.setattr(
+        "story.story_manager.CheckpointManager",
+        partial(CheckpointManager, checkpoint_dir=str(tmp_path / "checkpoints")),
+    )
+
+    logger = get_logger().logger
+    file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+    sandbox_handler = logging.FileHandler(tmp_path / "sentient.log", encoding="utf-8")
+    for handler in file_handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(sandbox_handler)
+
+    yield tmp_path
+
+    logger.removeHandler(sandbox_handler)
+    sandbox_handler.close()
+    for handler in file_handlers:
+        logger.addHandler(handler)
+
 @pytest.fixture
 def mock_config():
     """Provide a test configuration with safe defaults"""
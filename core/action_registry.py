@@ -0,0 +1,111 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Action Registry - Every action's routing facts, resolved once at startup.
+
+Each specialized dispatcher declares its actions in one place (its ACTIONS
+dict of ActionSpec). FunctionDispatcher folds those declarations, the
+resource table (action_resources) and the parameter schemas (validators)
+into one ActionDescriptor per action, so dispatching is a single dict
+lookup instead of list scans and prefix checks.
+
+Thread affinity:
+- THREAD_WORKER:     queued on the ActionScheduler (default)
+- THREAD_MAIN:       touches QWidgets, runs immediately on the main thread
+- THREAD_CONTROLLER: handled by FunctionDispatcher itself (needs brain/chat)
+"""
+
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional
+
+from core.action_resources import ACTION_RESOURCES, ResourceRule
+from core.validators import ACTION_PARAM_SCHEMAS, ParamSchema
+
+# Same values as FunctionDispatcher.PRIORITY_* (lower number = higher priority)
+PRIORITY_HIGH = 1    # Visual effects (latency sensitive)
+PRIORITY_MEDIUM = 2  # Audio/TTS (narrative critical)
+PRIORITY_LOW = 3     # System/File ops (background)
+
+THREAD_WORKER = "worker"
+THREAD_MAIN = "main"
+THREAD_CONTROLLER = "controller"
+
+
+class ActionSpec(NamedTuple):
+    """What a dispatcher declares about one of its actions."""
+    priority: int = PRIORITY_LOW
+    thread: str = THREAD_WORKER
+    silent: bool = False  # Speech is not read aloud with this action
+
+
+DEFAULT_SPEC = ActionSpec()
+
+
+class ActionDescriptor(NamedTuple):
+    name: str
+    dispatcher: Optional[object]  # Owning BaseDispatcher (None: controller only)
+    handler: Optional[Callable[[Dict[str, Any], str], None]]  # handler(params, speech)
+    priority: int
+    thread: str
+    silent: bool
+    params: Optional[ParamSchema]
+    resource: Optional[ResourceRule]
+
+
+def collect_action_specs(dispatchers: Iterable[object],
+                         overrides: Optional[Dict[str, ActionSpec]] = None) -> Dict[str, ActionSpec]:
+    """
+    Merge the ACTIONS declarations of the given dispatchers.
+    Later dispatchers win on shared actions (same as routing), overrides win last.
+    """
+    specs: Dict[str, ActionSpec] = {}
+    for dispatcher in dispatchers:
+        specs.update(getattr(type(dispatcher), "ACTIONS", None) or {})
+    if overrides:
+        specs.update(overrides)
+    return specs
+
+
+def build_action_registry(dispatchers: Iterable[object],
+                          specs: Dict[str, ActionSpec]) -> Dict[str, ActionDescriptor]:
+    """
+    Route every supported action to its dispatcher and resolve its descriptor.
+
+    Dispatchers only need get_supported_actions(); the facts come from specs,
+    so swapped-in dispatchers (tests, tools) keep the declared priorities.
+    Handlers come from the dispatcher's handler table (get_handlers); other
+    dispatchers are reached through dispatch() at call time.
+    """
+    registry: Dict[str, ActionDescriptor] = {}
+    for dispatcher in dispatchers:
+        get_handlers = getattr(type(dispatcher), "get_handlers", None)
+        handlers = get_handlers(dispatcher) if get_handlers else {}
+        for action in dispatcher.get_supported_actions():
+            handler = handlers.get(action) or _late_dispatch(dispatcher, action)
+            registry[action] = _describe(action, dispatcher, handler, specs.get(action, DEFAULT_SPEC))
+    # Controller-only actions (e.g. NONE) have no specialized dispatcher
+    for action, spec in specs.items():
+        if action not in registry:
+            registry[action] = _describe(action, None, None, spec)
+    return registry
+
+
+def _late_dispatch(dispatcher: object, action: str):
+    return lambda params, speech="": dispatcher.dispatch(action, params, speech)
+
+
+def _describe(action: str, dispatcher: Optional[object], handler, spec: ActionSpec) -> ActionDescriptor:
+    return ActionDescriptor(
+        name=action,
+        dispatcher=dispatcher,
+        handler=handler,
+        priority=spec.priority,
+        thread=spec.thread,
+        silent=spec.silent,
+        params=ACTION_PARAM_SCHEMAS.get(action),
+        resource=ACTION_RESOURCES.get(action),
+    )
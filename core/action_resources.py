@@ -0,0 +1,94 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Action Resources - Which physical resource each worker action uses.
+
+Actions that share a resource (screen DC, cursor, audio device, display
+brightness, clipboard) run one at a time in a per-resource serial lane
+instead of fighting each other on parallel workers.
+
+Conflict rules when the same action is already waiting on its lane:
+- QUEUE: run after it (default)
+- MERGE: fold into the waiting task (e.g. shake durations add up); with
+         an `extend` hook, also fold into the running effect itself
+- DROP:  ignore the new one (a second identical flash adds nothing);
+         also dropped while the same action is running
+
+An action whose handler returns an Effect is running until the Effect
+ends, not only while its worker is busy.
+"""
+
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+SCREEN = "screen"
+CURSOR = "cursor"
+AUDIO = "audio"
+BRIGHTNESS = "brightness"
+CLIPBOARD = "clipboard"
+
+QUEUE = "queue"
+MERGE = "merge"
+DROP = "drop"
+
+MergeFn = Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]
+ExtendFn = Callable[[Dict[str, Any]], bool]
+
+
+class ResourceRule(NamedTuple):
+    resource: str
+    conflict: str = QUEUE
+    merge: Optional[MergeFn] = None  # None with MERGE = newest params win
+    extend: Optional[ExtendFn] = None  # MERGE into the running task; False = not absorbed, queue it
+
+
+def _add(key: str, default: float, limit: float) -> MergeFn:
+    """Merged task runs for the sum of both amounts (capped)."""
+    def merge(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+        merged = dict(new)
+        merged[key] = min(old.get(key, default) + new.get(key, default), limit)
+        return merged
+    return merge
+
+
+def _extend_shake(params: Dict[str, Any]) -> bool:
+    """A running shake absorbs the new duration."""
+    from hardware.mouse_ops import MouseOps
+    return MouseOps.extend_shake(params.get("duration", 1.0))
+
+
+ACTION_RESOURCES: Dict[str, ResourceRule] = {
+    # Screen DC (GDI / screen capture effects)
+    "GDI_FLASH": ResourceRule(SCREEN),
+    "GDI_LINE": ResourceRule(SCREEN),
+    "GDI_STATIC": ResourceRule(SCREEN, MERGE, _add("duration", 500, 3000)),
+    "SCREEN_INVERT": ResourceRule(SCREEN, DROP),
+    "GLITCH_SCREEN": ResourceRule(SCREEN),
+    "SCREEN_TEAR": ResourceRule(SCREEN, DROP),
+    "PIXEL_MELT": ResourceRule(SCREEN, DROP),
+    "SCREEN_MELT": ResourceRule(SCREEN, DROP),
+    "THE_MASK": ResourceRule(SCREEN, DROP),
+
+    # Cursor
+    "MOUSE_SHAKE": ResourceRule(CURSOR, MERGE, _add("duration", 1.0, 5.0), _extend_shake),
+
+    # Audio device
+    "PLAY_SFX": ResourceRule(AUDIO),
+    "PLAY_SOUND": ResourceRule(AUDIO),
+    "TTS_SPEAK": ResourceRule(AUDIO),
+    "AUDIO_GLITCH": ResourceRule(AUDIO, DROP),
+    "CREEPY_MUSIC": ResourceRule(AUDIO, DROP),
+    "WHISPER": ResourceRule(AUDIO, DROP),
+
+    # Display brightness
+    "BRIGHTNESS_FLICKER": ResourceRule(BRIGHTNESS, MERGE, _add("times", 3, 10)),
+    "BRIGHTNESS_DIM": ResourceRule(BRIGHTNESS, MERGE),
+
+    # Clipboard (only the newest text matters)
+    "CLIPBOARD_POISON": ResourceRule(CLIPBOARD, MERGE),
+    "CLIPBOARD_INJECT": ResourceRule(CLIPBOARD, MERGE),
+}
@@ -0,0 +1,445 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Action Scheduler - Priority lanes for the FunctionDispatcher worker pool.
+
+Replaces queue.PriorityQueue + per-task dataclass:
+- One FIFO deque per priority level (lower number = higher priority),
+  so tasks of the same priority run in the order they were queued
+- A monotonically increasing sequence number stamps every task
+- ActionTask objects use __slots__ and are recycled through a free list
+  instead of being allocated per dispatch
+- Workers block on a Condition and are woken by put(); there is no
+  timeout polling
+- Actions that use a physical resource (see core.action_resources) are
+  serialized per resource: only one task per resource sits in the lanes
+  or runs at a time, the rest wait on the resource and are merged or
+  dropped by the resource's conflict rules. No worker ever blocks
+  waiting for a busy resource.
+- Every task gets a deadline from its priority and source. A task whose
+  deadline passed while queued is dropped (the moment is gone) or
+  downgraded to the lowest lane once (a story beat that still matters).
+  Ambient work is shed outright while the queue is deeper than
+  `shed_depth`.
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from core.action_resources import ACTION_RESOURCES, DROP, MERGE, ResourceRule
+from core.logger import log_error
+
+# Where an action came from (FunctionDispatcher.dispatch(source=...))
+SOURCE_TIMELINE = "timeline"    # Act scripts / story timeline
+SOURCE_HEARTBEAT = "heartbeat"  # Heartbeat pulses
+SOURCE_CHAT = "chat"            # Chat replies
+SOURCE_AMBIENT = "ambient"      # Ambient/glitch/silence filler
+SOURCE_SYSTEM = "system"        # Untagged callers (restore, debug): never expire
+
+_source_local = threading.local()
+
+
+@contextmanager
+def dispatch_source(source: str):
+    """
+    Tag every dispatch() made in this block (or decorated function) with
+    `source`, without changing the dispatch call itself.
+
+        @dispatch_source(SOURCE_TIMELINE)
+        def trigger_event(self, action, params, data): ...
+    """
+    previous = getattr(_source_local, "source", None)
+    _source_local.source = source
+    try:
+        yield
+    finally:
+        _source_local.source = previous
+
+
+def current_source() -> Optional[str]:
+    return getattr(_source_local, "source", None)
+
+
+# What happens to a task whose deadline passed while it was queued
+EXPIRE_DROP = "drop"
+EXPIRE_DOWNGRADE = "downgrade"
+
+
+class ActionTask:
+    """Task item for the action lanes. Reused via ActionScheduler.acquire()."""
+    __slots__ = ("priority", "seq", "timestamp", "enqueued", "action", "params", "speech", "resource",
+                 "source", "deadline", "due", "on_expire")
+
+    def __init__(self, priority: int = 0, timestamp: float = 0.0, action: str = "",
+                 params: Optional[Dict[str, Any]] = None, speech: str = ""):
+        self.priority = priority
+        self.seq = 0
+        self.timestamp = timestamp
+        self.enqueued = 0.0
+        self.action = action
+        self.params = params if params is not None else {}
+        self.speech = speech
+        self.resource: Optional[str] = None
+        self.source = SOURCE_SYSTEM
+        self.deadline: Optional[float] = None  # perf_counter; None = never expires
+        self.due: Optional[float] = None       # Original deadline (late accounting)
+        self.on_expire = EXPIRE_DROP
+
+    def __lt__(self, other: "ActionTask") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+    def __repr__(self):
+        return f"ActionTask(priority={self.priority}, seq={self.seq}, action={self.action!r})"
+
+
+class _ResourceLane:
+    """Serial lane of one resource: the admitted task + tasks waiting behind it."""
+    __slots__ = ("active", "running", "waiting")
+
+    def __init__(self):
+        self.active: Optional[ActionTask] = None  # In the priority lanes or running
+        self.running = False
+        self.waiting: deque = deque()
+
+    def pending(self, action: str) -> Optional[ActionTask]:
+        """Newest not-yet-started task of this action."""
+        for task in reversed(self.waiting):
+            if task.action == action:
+                return task
+        if self.active is not None and not self.running and self.active.action == action:
+            return self.active
+        return None
+
+    def pop_next(self) -> ActionTask:
+        best = min(self.waiting)  # Highest priority, then oldest
+        self.waiting.remove(best)
+        return best
+
+
+class ActionScheduler:
+    """
+    Strict-priority FIFO lanes with a blocking get().
+
+    Lane 0 is reserved for control tasks (shutdown sentinels); priorities
+    outside [0, lanes) are clamped to the nearest lane.
+
+    put() returns the task that will carry the work: the task itself, the
+    waiting task it was merged into, or None if it was dropped or shed.
+    """
+
+    # Seconds a task may wait, by priority lane (lane 0 = control, never expires)
+    PRIORITY_DEADLINES = {1: 2.0, 2: 4.0, 3: 10.0}
+
+    # source -> (deadline multiplier, expiry policy); multiplier None = no deadline
+    SOURCE_POLICIES = {
+        SOURCE_TIMELINE: (1.0, EXPIRE_DOWNGRADE),
+        SOURCE_CHAT: (1.0, EXPIRE_DOWNGRADE),
+        SOURCE_HEARTBEAT: (1.0, EXPIRE_DROP),
+        SOURCE_AMBIENT: (0.5, EXPIRE_DROP),
+        SOURCE_SYSTEM: (None, EXPIRE_DROP),
+    }
+
+    # Latency-critical lane: a late visual is never worth showing, always dropped
+    DROP_ONLY_PRIORITY = 1
+
+    def __init__(self, lanes: int = 4, pool_size: int = 64,
+                 resources: Optional[Dict[str, ResourceRule]] = None,
+                 shed_depth: int = 24, shed_priority: int = 2):
+        self._lanes: List[deque] = [deque() for _ in range(lanes)]
+        self.shed_depth = shed_depth
+        self.shed_priority = shed_priority  # Ambient tasks at or below this lane are shed
+        self.expired = 0
+        self.downgraded = 0
+        self.late = 0
+        self.shed = 0
+        self.resource_rules: Dict[str, ResourceRule] = ACTION_RESOURCES if resources is None else resources
+        self._resources: Dict[str, _ResourceLane] = {}
+        self.merged = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._all_done = threading.Condition(self._lock)
+        self._seq = itertools.count(1)
+        self._size = 0
+        self._unfinished = 0
+        self._closed = False
+        self._pool_limit = pool_size
+        self._pool: List[ActionTask] = [ActionTask() for _ in range(pool_size)]
+
+    # ========== TASK POOL ==========
+
+    def acquire(self, priority: int, action: str, params: Optional[Dict[str, Any]] = None,
+                speech: str = "", source: Optional[str] = None) -> ActionTask:
+        """Take a task object from the free list (allocates only when empty)."""
+        try:
+            task = self._pool.pop()
+        except IndexError:
+            task = ActionTask()
+        task.priority = priority
+        task.timestamp = time.time()
+        task.action = action
+        task.params = params if params is not None else {}
+        task.speech = speech
+        task.source = source or SOURCE_SYSTEM
+        return task
+
+    def release(self, task: ActionTask):
+        """Return a finished task to the free list."""
+        task.params = None
+        task.speech = ""
+        task.resource = None
+        task.deadline = task.due = None
+        if len(self._pool) < self._pool_limit:
+            self._pool.append(task)
+
+    # ========== QUEUE API ==========
+
+    def put(self, task: ActionTask) -> Optional[ActionTask]:
+        rule = self.resource_rules.get(task.action)
+        with self._lock:
+            if self._should_shed(task):
+                self.shed += 1
+                self.release(task)
+                return None
+            task.seq = next(self._seq)
+            task.enqueued = time.perf_counter()
+            self._stamp_deadline(task)
+            if rule is not None:
+                carrier = self._admit(task, rule)
+                if carrier is not task:
+                    self.release(task)
+                    return carrier
+            else:
+                self._push(task)
+            self._unfinished += 1
+        return task
+
+    def submit(self, priority: int, action: str, params: Optional[Dict[str, Any]] = None,
+               speech: str = "", source: Optional[str] = None) -> Optional[ActionTask]:
+        """acquire() + put()."""
+        return self.put(self.acquire(priority, action, params, speech, source))
+
+    # ========== DEADLINES ==========
+
+    def _pending_count(self) -> int:
+        return self._size + sum(len(lane.waiting) for lane in self._resources.values())
+
+    def _should_shed(self, task: ActionTask) -> bool:
+        """Ambient filler is refused while the queue is backed up. Caller holds the lock."""
+        return (task.source == SOURCE_AMBIENT and task.priority >= self.shed_priority
+                and self._pending_count() >= self.shed_depth)
+
+    def _stamp_deadline(self, task: ActionTask):
+        factor, on_expire = self.SOURCE_POLICIES.get(task.source, (None, EXPIRE_DROP))
+        budget = self.PRIORITY_DEADLINES.get(task.priority)
+        if factor is None or budget is None:
+            task.deadline = task.due = None
+            return
+        task.deadline = task.due = task.enqueued + budget * factor
+        task.on_expire = EXPIRE_DROP if task.priority <= self.DROP_ONLY_PRIORITY else on_expire
+
+    def _expire(self, task: ActionTask, now: float):
+        """Deadline passed in the lanes: downgrade once or drop. Caller holds the lock."""
+        if task.on_expire == EXPIRE_DOWNGRADE:
+            lowest = len(self._lanes) - 1
+            task.priority = lowest
+            task.deadline = now + self.PRIORITY_DEADLINES.get(lowest, 0.0)
+            task.on_expire = EXPIRE_DROP
+            self.downgraded += 1
+            self._push(task)
+            return
+        self.expired += 1
+        if task.resource is not None:
+            self._finish_resource(task)
+        self._mark_done()
+        self.release(task)
+
+    def _push(self, task: ActionTask):
+        """Into the priority lanes. Caller holds the lock."""
+        self._lanes[min(max(task.priority, 0), len(self._lanes) - 1)].append(task)
+        self._size += 1
+        self._not_empty.notify()
+
+    def _admit(self, task: ActionTask, rule: ResourceRule) -> Optional[ActionTask]:
+        """Resource lane admission. Caller holds the lock."""
+        lane = self._resources.get(rule.resource)
+        if lane is None:
+            lane = self._resources[rule.resource] = _ResourceLane()
+
+        if rule.conflict == MERGE:
+            pending = lane.pending(task.action)
+            if pending is not None:
+                pending.params = rule.merge(pending.params, task.params) if rule.merge else task.params
+                if pending.deadline is not None:
+                    # The merged request is fresh: it keeps the waiting task alive
+                    pending.deadline = pending.due = (
+                        None if task.deadline is None else max(pending.deadline, task.deadline))
+                self.merged += 1
+                return pending
+            active = lane.active
+            if (rule.extend is not None and lane.running and active is not None
+                    and active.action == task.action and self._extend_running(rule, task)):
+                self.merged += 1
+                return active
+        elif rule.conflict == DROP:
+            busy = lane.active is not None and lane.active.action == task.action
+            if busy or lane.pending(task.action) is not None:
+                self.dropped += 1
+                return None
+
+        task.resource = rule.resource
+        if lane.active is None:
+            lane.active = task
+            self._push(task)
+        else:
+            lane.waiting.append(task)
+        return task
+
+    def _extend_running(self, rule: ResourceRule, task: ActionTask) -> bool:
+        """Let the running effect absorb the request. Caller holds the lock."""
+        try:
+            return bool(rule.extend(task.params))
+        except Exception as e:
+            log_error(f"Extending running {task.action} failed: {e}", "SCHEDULER")
+            return False
+
+    def _finish_resource(self, task: ActionTask):
+        """Hand the resource to the next waiting task. Caller holds the lock."""
+        lane = self._resources.get(task.resource)
+        if lane is None or lane.active is not task:
+            return
+        lane.active = None
+        lane.running = False
+        if lane.waiting:
+            lane.active = lane.pop_next()
+            self._push(lane.active)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ActionTask]:
+        """
+        Highest priority, oldest task. Blocks until one is queued.
+        Returns None once the scheduler is closed and empty, or after
+        `timeout` seconds without work (check `closed` to tell them apart).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while True:
+                while not self._size:
+                    if self._closed:
+                        return None
+                    if deadline is None:
+                        self._not_empty.wait()
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self._not_empty.wait(remaining)
+                task = self._pop()
+                now = time.perf_counter()
+                if task.deadline is not None and now > task.deadline:
+                    self._expire(task, now)
+                    continue
+                if task.due is not None and now > task.due:
+                    self.late += 1  # Downgraded, ran after its original deadline
+                if task.resource is not None:
+                    self._resources[task.resource].running = True
+                return task
+
+    def _pop(self) -> ActionTask:
+        for lane in self._lanes:
+            if lane:
+                self._size -= 1
+                return lane.popleft()
+        raise IndexError("pop from empty ActionScheduler")
+
+    def task_done(self, task: Optional[ActionTask] = None):
+        """
+        Mark a task finished; frees its resource and recycles it when given.
+        Resource tasks must be passed, or their lane stays busy.
+        """
+        with self._lock:
+            if task is not None and task.resource is not None:
+                self._finish_resource(task)
+            self._mark_done()
+        if task is not None:
+            self.release(task)
+
+    def _mark_done(self):
+        if self._unfinished > 0:
+            self._unfinished -= 1
+        if not self._unfinished:
+            self._all_done.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued task was marked done."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._unfinished:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._all_done.wait(remaining)
+        return True
+
+    def close(self):
+        """Wake every blocked get(); they return None once the lanes are empty."""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def qsize(self) -> int:
+        """Tasks in the priority lanes plus tasks waiting on a resource."""
+        with self._lock:
+            return self._pending_count()
+
+    def empty(self) -> bool:
+        return not self._size
+
+    def oldest_wait(self) -> float:
+        """Seconds the oldest task in the priority lanes has been queued (0 when empty)."""
+        with self._lock:
+            heads = [lane[0].enqueued for lane in self._lanes if lane]
+        return time.perf_counter() - min(heads) if heads else 0.0
+
+    def lane_sizes(self) -> List[int]:
+        with self._lock:
+            return [len(lane) for lane in self._lanes]
+
+    def stats(self) -> Dict[str, int]:
+        """Queue depth and drop/late counters."""
+        with self._lock:
+            return {
+                "queued": self._size,
+                "waiting_on_resource": sum(len(lane.waiting) for lane in self._resources.values()),
+                "unfinished": self._unfinished,
+                "merged": self.merged,
+                "dropped": self.dropped,
+                "expired": self.expired,
+                "downgraded": self.downgraded,
+                "late": self.late,
+                "shed": self.shed,
+            }
+
+    def resource_state(self) -> Dict[str, Dict[str, Any]]:
+        """resource -> {"active", "running", "waiting"} (debug/stats)."""
+        with self._lock:
+            return {
+                name: {
+                    "active": lane.active.action if lane.active else None,
+                    "running": lane.running,
+                    "waiting": len(lane.waiting),
+                }
+                for name, lane in self._resources.items()
+            }
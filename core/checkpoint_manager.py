@@ -21,11 +21,13 @@ class CheckpointManager:
     Manages game checkpoints for crash recovery and save/load.
     """
     
-    def __init__(self, memory):
+    def __init__(self, memory, checkpoint_dir: str = None):
         self.memory = memory
         
         # Checkpoint directory
-        if Config().IS_WINDOWS:
+        if checkpoint_dir:
+            self.checkpoint_dir = checkpoint_dir
+        elif Config().IS_WINDOWS:
             app_data = os.getenv('APPDATA')
             self.checkpoint_dir = os.path.join(app_data, "SentientOS", "checkpoints")
         else:
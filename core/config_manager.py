@@ -225,6 +225,16 @@ class ConfigManager:
         config_obj.set('TARGET_MONITOR_INDEX', self.get('safety.target_monitor', 0), validate=False)
         config_obj.set('PROTECTED_PROCESSES', self.get('safety.protected_processes', []), validate=False)
         config_obj.set('GEMINI_KEY', self.get('api.gemini_key', ''), validate=False)
+        config_obj.set('EVENT_TRACE', self.get('system.event_trace', False), validate=False)
+        config_obj.set('EVENT_RATE_LIMITS', self.get('event_bus.rate_limits', {}), validate=False)
+        config_obj.set('BACKEND_PREWARM', self.get('system.backend_prewarm', True), validate=False)
+        config_obj.set('BACKEND_PREWARM_DELAY_MS', self.get('system.backend_prewarm_delay_ms', 500), validate=False)
+        config_obj.set('DISPATCH_METRICS_INTERVAL', self.get('system.dispatch_metrics_interval', 0), validate=False)
+        config_obj.set('DISPATCH_WORKERS_MIN', self.get('dispatcher.workers_min', 5), validate=False)
+        config_obj.set('DISPATCH_WORKERS_MAX', self.get('dispatcher.workers_max', 0), validate=False)
+        config_obj.set('DISPATCH_GROW_WAIT_MS', self.get('dispatcher.grow_wait_ms', 250), validate=False)
+        config_obj.set('DISPATCH_IDLE_SHRINK_S', self.get('dispatcher.idle_shrink_s', 30), validate=False)
+        config_obj.set('DISPATCH_CPU_BUDGET', self.get('dispatcher.cpu_budget', 0.7), validate=False)
         
         print("[CONFIG] Legacy Config populated from YAML")
 
@@ -11,6 +11,13 @@ Context Observer - Zenginleştirilmiş Kullanıcı Bağlam Toplama
 Bu modül kullanıcının ortamından 4. duvarı kırmak için gerekli bilgileri toplar.
 GÜVENLİ VERİLER: Tarayıcı geçmişi, şifreler, özel dosya içerikleri TOPLANMAZ.
 İZİN VERİLEN: Masaüstü dosya isimleri, çalışan uygulamalar, pil durumu, hostname.
+
+SERVİS MODU: start() ile arka planda çalışır ve sadece değişen alanları
+"context.changed" olayı olarak EventBus'a yayınlar:
+    {"changes": {"active_window": ..., "running_apps": [...], ...},
+     "kinds": ["window", "apps", ...]}
+Tüketiciler tam bağlamı tekrar tekrar kurmak yerine ContextView ile
+kendi görünümlerini tutar.
 """
 import platform
 import psutil
@@ -19,7 +26,14 @@ import os
 import socket
 import random
 import time
+import threading
+from typing import Any, Dict, Optional
 from config import Config
+from core.event_bus import bus
+from core.context_snapshot import ContextSnapshot
+from core.desktop_index import DesktopIndex
+from core.process_tracker import ProcessTracker
+from core.snippet_service import SnippetService
 
 try:
     if Config().IS_MOCK:
@@ -30,6 +44,8 @@ try:
 except ImportError:
     HAS_WIN32 = False
 
+_MISSING = object()
+
 
 class ContextObserver:
     """
@@ -47,6 +63,21 @@ class ContextObserver:
     # Static info cache (never changes during session)
     _static_cache = {}
 
+    # Delta service state
+    # kind -> full-context key (kinds are what consumers filter on)
+    DELTA_FIELDS = {
+        "window": "active_window",
+        "apps": "running_apps",
+        "battery": "battery",
+        "late_night": "is_late_night",
+        "desktop": "desktop_files",
+    }
+    _last_published: Dict[str, Any] = {}
+    _publish_lock = threading.Lock()
+    _service_thread = None
+    _service_stop = threading.Event()
+    _service_interval = 3.0
+
     @classmethod
     def _get_cached(cls, key, fetcher, ttl=None):
         """Simple caching to avoid repeated expensive operations."""
@@ -124,16 +155,8 @@ class ContextObserver:
         GÜVENLİ: Sadece isimler, içerik okunmaz.
         """
         try:
-            # Windows Desktop path
-            desktop = os.path.join(os.path.expanduser("~"), "Desktop")
-            if not os.path.exists(desktop):
-                desktop = os.path.join(os.path.expanduser("~"), "Masaüstü")  # Türkçe Windows
-            
-            if os.path.exists(desktop):
-                files = os.listdir(desktop)
-                # Gizli dosyaları filtrele, sadece ilk 10
-                visible_files = [f for f in files if not f.startswith('.')][:10]
-                return visible_files
+            # Gizli dosyalar indekste zaten elenmiş, sadece ilk 10
+            return list(DesktopIndex.singleton().names(DesktopIndex.DESKTOP)[:10])
         except Exception as e:
             print(f"[CONTEXT] Desktop files error: {e}")
         return []
@@ -145,18 +168,9 @@ class ContextObserver:
         GÜVENLİ: Sadece isimler, içerik okunmaz.
         """
         try:
-            docs = os.path.join(os.path.expanduser("~"), "Documents")
-            if not os.path.exists(docs):
-                docs = os.path.join(os.path.expanduser("~"), "Belgeler")
-            
-            if os.path.exists(docs):
-                all_files = []
-                for item in os.listdir(docs)[:20]:
-                    if not item.startswith('.'):
-                        all_files.append(item)
-                
-                if all_files:
-                    return random.sample(all_files, min(3, len(all_files)))
+            all_files = DesktopIndex.singleton().names(DesktopIndex.DOCUMENTS)[:20]
+            if all_files:
+                return random.sample(all_files, min(3, len(all_files)))
         except Exception:
             pass
         return []
@@ -168,37 +182,12 @@ class ContextObserver:
         GÜVENLİ: Sadece .txt/.md, max 40 karakter, şifre/gizli dosyaları hariç.
         """
         try:
-            desktop = os.path.join(os.path.expanduser("~"), "Desktop")
-            if not os.path.exists(desktop):
-                desktop = os.path.join(os.path.expanduser("~"), "Masaüstü")
-            
-            if os.path.exists(desktop):
-                # Streamer Mode restrictions
-                exts = ('.txt', '.md') if Config().get("STREAMER_MODE", True) else ('.txt', '.md', '.py', '.json')
-                files = [f for f in os.listdir(desktop) if f.lower().endswith(exts)]
-                
-                # Kara liste - hassas dosyaları elleme
-                blacklist = ['pass', 'şifre', 'gizli', 'secret', 'acc', 'bank', 'key', 'token', 'config', 'log', 'chat', 'plan', 'private', 'özel', 'not', 'note', 'sir', 'history', 'address', 'phone', 'mail', 'identity', 'kimlik']
-                safe_files = [f for f in files if not any(b in f.lower() for b in blacklist)]
-                
-                if safe_files:
-                    # Sort by size to prefer small files, then pick random from top 10
-                    safe_files.sort(key=lambda x: os.path.getsize(os.path.join(desktop, x)))
-                    target = random.choice(safe_files[:10])
-                    path = os.path.join(desktop, target)
-                    
-                    # Sadece küçük dosyalar
-                    if os.path.getsize(path) < 10000:
-                        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                            # Skip common header lines if empty
-                            content = f.read(200).strip()
-                            lines = [l for l in content.split('\n') if len(l.strip()) > 5]
-                            if lines:
-                                sample = lines[0][:40].strip()
-                                return {"filename": target, "snippet": sample}
+            # Streamer Mode restrictions
+            exts = ('.txt', '.md') if Config().get("STREAMER_MODE", True) else ('.txt', '.md', '.py', '.json')
+            # Snippets are extracted once per file version and served from cache
+            return SnippetService.singleton().get_snippet(exts)
         except (OSError, UnicodeDecodeError, PermissionError) as e:
             print(f"[CONTEXT] File snippet error: {e}")
-            pass
         return None
 
     @staticmethod
@@ -207,23 +196,9 @@ class ContextObserver:
         Çalışan ilginç uygulamaları al.
         AI bunları konuşmada kullanabilir.
         """
-        interesting_apps = []
         try:
-            interesting = ['chrome', 'firefox', 'discord', 'spotify', 'steam', 
-                          'notepad', 'word', 'excel', 'vscode', 'code',
-                          'obs', 'vlc', 'telegram', 'whatsapp', 'slack']
-            
-            for proc in psutil.process_iter(['name']):
-                try:
-                    name = proc.info['name'].lower()
-                    for app in interesting:
-                        if app in name and name not in interesting_apps:
-                            interesting_apps.append(name)
-                            break
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            return interesting_apps[:5]
+            # Incremental tracker: only new/exited PIDs are resolved per poll
+            return ProcessTracker.singleton().get_interesting_apps(5)
         except Exception:
             return []
     
@@ -311,48 +286,203 @@ class ContextObserver:
         return cls._get_cached("full_context", fetch_context, ttl=10)
     
     @classmethod
-    def get_scary_facts(cls):
+    def get_scary_facts(cls, context=None):
         """AI'nın kullanabileceği korkutucu bağlam bilgileri."""
-        context = cls.get_full_context()
+        snap = cls._as_snapshot(context)
         facts = []
         
-        if context.get("is_late_night"):
-            facts.append(f"Saat {context['exact_time']}... Neden hala uyumadın?")
+        if snap.is_late_night:
+            facts.append(f"Saat {snap.exact_time}... Neden hala uyumadın?")
         
-        desktop_files = context.get("desktop_files", [])
-        if desktop_files:
-            random_file = random.choice(desktop_files)
+        if snap.desktop_files:
+            random_file = random.choice(snap.desktop_files)
             facts.append(f"'{random_file}' dosyasını gördüm masaüstünde...")
         
-        apps = context.get("running_apps", [])
-        if "discord" in str(apps).lower():
+        # Küçük harfli uygulama kümesi snapshot'ta bir kez hesaplandı
+        if snap.has_app("discord"):
             facts.append("Discord'da kimle konuşuyorsun? Merak ediyorum...")
-        if "chrome" in str(apps).lower() or "firefox" in str(apps).lower():
+        if snap.has_app("chrome") or snap.has_app("firefox"):
             facts.append("Tarayıcında ne arıyorsun bakalım?")
-        if "spotify" in str(apps).lower():
+        if snap.has_app("spotify"):
             facts.append("Müzik mi dinliyorsun? Sesini kıssan iyi olur.")
         
-        battery = context.get("battery")
-        if battery and battery.get("is_low"):
-            facts.append(f"Pilin %{battery['percent']}... Şarj bitmeden işimi bitirmeliyim.")
+        if snap.battery_low:
+            facts.append(f"Pilin %{snap.battery_percent}... Şarj bitmeden işimi bitirmeliyim.")
         
-        uptime = context.get("uptime_hours")
-        if uptime and uptime > 8:
-            facts.append(f"Bilgisayarın {uptime} saattir açık. Yorulmuyor musun?")
+        if snap.uptime_hours and snap.uptime_hours > 8:
+            facts.append(f"Bilgisayarın {snap.uptime_hours} saattir açık. Yorulmuyor musun?")
         
-        network = context.get("network", {})
-        hostname = network.get("hostname", "")
-        if network.get("hostname"):
-            facts.append(f"{network['hostname']}... Güzel isim seçmişsin.")
+        if snap.hostname:
+            facts.append(f"{snap.hostname}... Güzel isim seçmişsin.")
         
-        file_snap = context.get("file_snippet")
+        file_snap = snap.snippet
         if file_snap:
             facts.append(f"'{file_snap['filename']}' dosyasında '{file_snap['snippet']}' yazdığını biliyorum.")
         
         return facts
     
+    @classmethod
+    def get_snapshot(cls) -> ContextSnapshot:
+        """Tam bağlamın tipli, hashlenebilir hali."""
+        return ContextSnapshot.from_dict(cls.get_full_context())
+    
+    @classmethod
+    def _as_snapshot(cls, context) -> ContextSnapshot:
+        if isinstance(context, ContextSnapshot):
+            return context
+        if context:
+            return ContextSnapshot.from_dict(context)
+        return cls.get_snapshot()
+    
+    # ========== DELTA SERVİSİ ==========
+
+    @classmethod
+    def collect_volatile(cls) -> Dict[str, Any]:
+        """Sadece değişebilen alanları topla (ucuz: index ve tracker önbellekli)."""
+        return {
+            "active_window": cls.get_active_window_title(),
+            "running_apps": cls.get_running_processes(),
+            "battery": cls.get_battery_status(),
+            "is_late_night": cls.is_late_night(),
+            "desktop_files": cls.get_desktop_files(),
+        }
+
+    @classmethod
+    def publish_changes(cls) -> Dict[str, Any]:
+        """
+        Compare volatile fields with the last published values and publish
+        one context.changed event carrying only what differs.
+        Returns the changes (empty dict if nothing changed).
+        """
+        current = cls.collect_volatile()
+        with cls._publish_lock:
+            changes = {k: v for k, v in current.items() if cls._last_published.get(k, _MISSING) != v}
+            if not changes:
+                return {}
+            cls._last_published.update(changes)
+            # Keep the pulled full context fresh without rebuilding it
+            if "full_context" in cls._cache:
+                cls._cache["full_context"].update(changes)
+
+        kinds = [kind for kind, key in cls.DELTA_FIELDS.items() if key in changes]
+        bus.publish("context.changed", {"changes": changes, "kinds": kinds})
+        return changes
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._service_thread is not None and cls._service_thread.is_alive()
+
+    @classmethod
+    def start(cls, interval: float = 3.0):
+        """Arka plan servisi: değişiklikleri periyodik olarak yayınla."""
+        if cls.is_running():
+            return
+        cls._service_interval = interval
+        cls._service_stop.clear()
+        cls._service_thread = threading.Thread(target=cls._service_loop, name="ContextObserver", daemon=True)
+        cls._service_thread.start()
+        print(f"[CONTEXT] Delta service started ({interval}s)")
+
+    @classmethod
+    def stop(cls):
+        cls._service_stop.set()
+        if cls._service_thread:
+            cls._service_thread.join(timeout=2.0)
+            cls._service_thread = None
+
+    @classmethod
+    def _service_loop(cls):
+        while not cls._service_stop.is_set():
+            try:
+                cls.publish_changes()
+            except Exception as e:
+                print(f"[CONTEXT] Delta service error: {e}")
+            if cls._service_stop.wait(cls._service_interval):
+                break
+
     @classmethod
     def invalidate_cache(cls):
         """Cache'i temizle."""
         cls._cache.clear()
         cls._cache_time.clear()
+        with cls._publish_lock:
+            cls._last_published.clear()
+
+
+class ContextView:
+    """
+    A consumer's own view of the context, kept current by context.changed.
+
+    The full context is built once when the view is first read; after that
+    only deltas are merged in. take_changes() returns what changed since the
+    previous call, so a consumer can act on differences only.
+    """
+
+    # Clock-driven fields are recomputed on read (no event needed)
+    _CLOCK_FIELDS = {
+        "exact_time": ContextObserver.get_exact_time,
+        "time_of_day": ContextObserver.get_time_of_day,
+    }
+
+    def __init__(self):
+        self._state: Dict[str, Any] = {}
+        self._pending: Dict[str, Any] = {}
+        self._primed = False
+        self._version = 0
+        self._snapshot: Optional[ContextSnapshot] = None
+        self._snapshot_key = None
+        self._lock = threading.Lock()
+        # Weak: a discarded view unsubscribes itself
+        bus.subscribe("context.changed", self._on_changed, weak=True)
+
+    def _on_changed(self, data: dict):
+        changes = data.get("changes", {})
+        with self._lock:
+            if not self._primed:
+                self._pending.update(changes)
+                return
+            for key, value in changes.items():
+                if self._state.get(key, _MISSING) != value:
+                    self._state[key] = value
+                    self._pending[key] = value
+                    self._version += 1
+
+    def _prime(self):
+        full = dict(ContextObserver.get_full_context())
+        with self._lock:
+            if not self._primed:
+                # Deltas that arrived before priming are newer than the snapshot
+                full.update(self._pending)
+                self._state = full
+                self._pending = dict(full)
+                self._primed = True
+
+    def current(self) -> Dict[str, Any]:
+        """Current context dict (no full rebuild once primed)."""
+        if not self._primed:
+            self._prime()
+        elif not ContextObserver.is_running():
+            # No background service: pull-through, still delta based
+            ContextObserver.publish_changes()
+        with self._lock:
+            view = dict(self._state)
+        for key, fetch in self._CLOCK_FIELDS.items():
+            view[key] = fetch()
+        return view
+
+    def snapshot(self) -> ContextSnapshot:
+        """Typed snapshot, rebuilt only when a delta or the clock changed it."""
+        view = self.current()
+        key = (self._version, view["exact_time"])
+        if self._snapshot is None or self._snapshot_key != key:
+            self._snapshot = ContextSnapshot.from_dict(view)
+            self._snapshot_key = key
+        return self._snapshot
+
+    def take_changes(self) -> Dict[str, Any]:
+        """Changes since the last call (the whole context right after priming)."""
+        if not self._primed:
+            self._prime()
+        with self._lock:
+            changes, self._pending = self._pending, {}
+        return changes
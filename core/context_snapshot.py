@@ -0,0 +1,178 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Context Snapshot - Typed, compact view of the user context.
+
+Replaces the loosely structured context dict for consumers:
+- Fixed fields with __slots__ (no per-instance __dict__)
+- desktop_files is always a tuple of names (scores kept separately)
+- Lowercase app set precomputed once, so membership checks do not
+  re-lowercase the whole app list every time
+- Repeated strings (app names, window titles, hostname) are interned
+- Frozen: hashable and cheap to diff, usable as a response cache key
+"""
+
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional, Tuple
+
+_MISSING = object()
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _freeze(value: Any) -> Any:
+    """dicts/lists from the raw context -> hashable tuples."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return _intern(value)
+
+
+@dataclass(frozen=True)
+class ContextSnapshot:
+    """Immutable context record. Build with from_dict()."""
+    __slots__ = (
+        "user_name", "active_window", "exact_time", "time_of_day", "is_late_night", "os",
+        "cpu_load", "running_apps", "desktop_files", "desktop_scores", "documents_sample",
+        "battery_percent", "battery_plugged", "hostname", "local_ip", "disk_percent",
+        "uptime_hours", "file_snippet",
+        "apps_lower", "_hash",
+    )
+
+    user_name: str
+    active_window: str
+    exact_time: str
+    time_of_day: str
+    is_late_night: bool
+    os: str
+    cpu_load: str
+    running_apps: Tuple[str, ...]
+    desktop_files: Tuple[str, ...]
+    desktop_scores: Tuple[int, ...]
+    documents_sample: Tuple[str, ...]
+    battery_percent: Optional[int]
+    battery_plugged: Optional[bool]
+    hostname: str
+    local_ip: str
+    disk_percent: Optional[float]
+    uptime_hours: Optional[float]
+    file_snippet: Optional[Tuple[Tuple[str, str], ...]]
+
+    # Fields that change on the order of seconds (excluded from cache keys)
+    _CLOCK_FIELDS = ("exact_time", "time_of_day", "cpu_load", "uptime_hours", "disk_percent")
+
+    def __post_init__(self):
+        object.__setattr__(self, "apps_lower", frozenset(
+            name for app in self.running_apps
+            for name in (app.lower(), app.lower().rsplit(".exe", 1)[0])
+        ))
+        object.__setattr__(self, "_hash", None)
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(tuple(getattr(self, f.name) for f in fields(self))))
+        return self._hash
+
+    # ========== BUILDERS ==========
+
+    @classmethod
+    def from_dict(cls, context: Dict[str, Any]) -> "ContextSnapshot":
+        """Normalize a raw ContextObserver dict."""
+        names, scores = [], []
+        for item in context.get("desktop_files") or ():
+            # (name, score) tuples from FileSystemAwareness, plain names from ContextObserver
+            if isinstance(item, (list, tuple)):
+                names.append(_intern(item[0]))
+                scores.append(int(item[1]) if len(item) > 1 else 0)
+            else:
+                names.append(_intern(item))
+                scores.append(0)
+
+        battery = context.get("battery") or {}
+        network = context.get("network") or {}
+        disk = context.get("disk") or {}
+        snippet = context.get("file_snippet")
+
+        return cls(
+            user_name=_intern(context.get("user_name", "Unknown")),
+            active_window=_intern(context.get("active_window", "Unknown Window") or ""),
+            exact_time=context.get("exact_time", "??:??"),
+            time_of_day=_intern(context.get("time_of_day", "Unknown")),
+            is_late_night=bool(context.get("is_late_night")),
+            os=_intern(context.get("os", "")),
+            cpu_load=context.get("cpu_load", "Unknown"),
+            running_apps=tuple(_intern(a) for a in context.get("running_apps") or ()),
+            desktop_files=tuple(names),
+            desktop_scores=tuple(scores),
+            documents_sample=tuple(_intern(d) for d in context.get("documents_sample") or ()),
+            battery_percent=battery.get("percent"),
+            battery_plugged=battery.get("plugged"),
+            hostname=_intern(network.get("hostname", "")),
+            local_ip=_intern(network.get("local_ip", "")),
+            disk_percent=disk.get("percent"),
+            uptime_hours=context.get("uptime_hours"),
+            file_snippet=_freeze(snippet) if snippet else None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Legacy dict shape (memory logs, JSON)."""
+        battery = None
+        if self.battery_percent is not None:
+            battery = {"percent": self.battery_percent, "plugged": self.battery_plugged,
+                       "is_low": self.battery_low}
+        return {
+            "user_name": self.user_name,
+            "active_window": self.active_window,
+            "exact_time": self.exact_time,
+            "time_of_day": self.time_of_day,
+            "is_late_night": self.is_late_night,
+            "os": self.os,
+            "cpu_load": self.cpu_load,
+            "running_apps": list(self.running_apps),
+            "desktop_files": list(self.desktop_files),
+            "documents_sample": list(self.documents_sample),
+            "battery": battery,
+            "network": {"hostname": self.hostname, "local_ip": self.local_ip},
+            "disk": {"percent": self.disk_percent} if self.disk_percent is not None else None,
+            "uptime_hours": self.uptime_hours,
+            "file_snippet": dict(self.file_snippet) if self.file_snippet else None,
+        }
+
+    # ========== QUERIES ==========
+
+    @property
+    def battery_low(self) -> bool:
+        return self.battery_percent is not None and self.battery_percent < 20
+
+    @property
+    def snippet(self) -> Optional[Dict[str, str]]:
+        return dict(self.file_snippet) if self.file_snippet else None
+
+    def has_app(self, name: str) -> bool:
+        """Case-insensitive app check ('discord' matches 'Discord.exe')."""
+        name = name.lower()
+        if name in self.apps_lower:
+            return True
+        return any(name in app for app in self.apps_lower)
+
+    def diff(self, other: Optional["ContextSnapshot"]) -> Dict[str, Any]:
+        """Fields whose value differs from `other` (all fields if None)."""
+        result = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if other is None or getattr(other, f.name, _MISSING) != value:
+                result[f.name] = value
+        return result
+
+    def cache_key(self) -> int:
+        """Hash of the slowly changing fields only (clock fields ignored)."""
+        return hash(tuple(getattr(self, f.name) for f in fields(self) if f.name not in self._CLOCK_FIELDS))
@@ -0,0 +1,331 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Desktop Index - Shared, event-driven view of the Desktop and Documents folders.
+
+Before this module, ContextObserver and FileSystemAwareness each listed the
+Desktop (or Documents) directory and stat'ed files on every context refresh.
+The index scans each folder once, keeps names/sizes/mtimes/sensitivity scores
+in memory, and keeps them current through filesystem change notifications.
+
+WATCHING:
+- watchdog (if installed): OS-level notifications; a burst of events
+  (e.g. a copy of many files) is coalesced into one rescan per folder
+- Polling fallback (Linux / no watchdog): cheap directory mtime check,
+  plus a periodic full refresh to catch in-place file edits
+
+SAFETY:
+- Read-only (names and stat() metadata only, never contents)
+- Limited to Desktop and Documents
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from core.logger import log_info, log_warning
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+    FileSystemEventHandler = object
+
+
+@dataclass(frozen=True)
+class IndexedEntry:
+    """One visible item of an indexed folder."""
+    name: str
+    stem: str
+    is_dir: bool
+    size: int
+    mtime: float
+    score: int
+    blacklisted: bool = False
+
+
+class _FolderSnapshot:
+    """
+    Immutable, precomputed views of one folder.
+    Swapped atomically on rescan so readers never need a lock.
+    """
+    __slots__ = ("path", "dir_mtime", "entries", "names", "folders", "scored_files", "by_size")
+
+    def __init__(self, path: Optional[str], dir_mtime: float, entries: Tuple[IndexedEntry, ...]):
+        self.path = path
+        self.dir_mtime = dir_mtime
+        self.entries = entries
+        self.names = tuple(e.name for e in entries)
+        self.folders = tuple(e.name for e in entries if e.is_dir)
+        self.scored_files = tuple((e.stem, e.score) for e in entries if not e.is_dir)
+        self.by_size = tuple(sorted((e for e in entries if not e.is_dir), key=lambda e: e.size))
+
+
+_EMPTY = _FolderSnapshot(None, 0.0, ())
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """watchdog handler: any event inside a folder schedules a rescan of it."""
+
+    def __init__(self, index, kind):
+        super().__init__()
+        self._index = index
+        self._kind = kind
+
+    def on_any_event(self, event):
+        self._index.schedule_refresh(self._kind)
+
+
+class DesktopIndex:
+    """
+    Singleton index of the user's Desktop and Documents folders.
+
+    Lookups return precomputed tuples; the directory is only walked on
+    first access and when the watcher reports a change.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    DESKTOP = "desktop"
+    DOCUMENTS = "documents"
+
+    # Localized fallbacks (Türkçe Windows)
+    _FOLDER_NAMES = {
+        DESKTOP: ("Desktop", "Masaüstü"),
+        DOCUMENTS: ("Documents", "Belgeler"),
+    }
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(DesktopIndex, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, poll_interval: float = 3.0, full_rescan_every: int = 10, refresh_delay: float = 0.25):
+        if self._initialized:
+            return
+        self._initialized = True
+        self._snapshots: Dict[str, _FolderSnapshot] = {}
+        self._scan_lock = threading.Lock()
+        self._poll_interval = poll_interval
+        self._full_rescan_every = full_rescan_every
+        self._refresh_delay = refresh_delay
+        self._pending: Dict[str, threading.Timer] = {}
+        self._pending_lock = threading.Lock()
+        self._running = False
+        self._thread = None
+        self._observer = None
+
+    @staticmethod
+    def singleton():
+        return DesktopIndex()
+
+    @classmethod
+    def reset(cls):
+        """Drop the singleton (used by tests and after a shutdown)."""
+        with cls._lock:
+            if cls._instance is not None and cls._instance._initialized:
+                cls._instance.stop()
+            cls._instance = None
+
+    # ========== LOOKUPS ==========
+
+    def snapshot(self, kind: str = DESKTOP) -> _FolderSnapshot:
+        """Current snapshot for a folder, building it on first access."""
+        snap = self._snapshots.get(kind)
+        if snap is None:
+            snap = self.refresh(kind)
+        return snap
+
+    def names(self, kind: str = DESKTOP) -> Tuple[str, ...]:
+        """Visible (non-hidden) item names in directory order."""
+        return self.snapshot(kind).names
+
+    def folders(self, kind: str = DESKTOP) -> Tuple[str, ...]:
+        """Visible sub-folder names."""
+        return self.snapshot(kind).folders
+
+    def scored_files(self, kind: str = DESKTOP) -> Tuple[Tuple[str, int], ...]:
+        """(stem, sensitivity score) for every visible file."""
+        return self.snapshot(kind).scored_files
+
+    def files_by_size(self, kind: str = DESKTOP) -> Tuple[IndexedEntry, ...]:
+        """Visible files sorted by size, smallest first."""
+        return self.snapshot(kind).by_size
+
+    def folder_path(self, kind: str = DESKTOP) -> Optional[str]:
+        """Resolved absolute path of the folder (None if missing)."""
+        return self.snapshot(kind).path
+
+    # ========== SCANNING ==========
+
+    @classmethod
+    def resolve_folder(cls, kind: str) -> Optional[str]:
+        """Find the folder on disk, honoring localized names."""
+        home = os.path.expanduser("~")
+        for name in cls._FOLDER_NAMES.get(kind, ()):
+            path = os.path.join(home, name)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def refresh(self, kind: Optional[str] = None) -> _FolderSnapshot:
+        """Rescan one folder (or all known folders when kind is None)."""
+        if kind is None:
+            snap = _EMPTY
+            for k in self._FOLDER_NAMES:
+                snap = self.refresh(k)
+            return snap
+
+        with self._scan_lock:
+            snap = self._scan(kind)
+            self._snapshots[kind] = snap
+        return snap
+
+    def schedule_refresh(self, kind: str):
+        """
+        Rescan a folder after refresh_delay seconds. Changes reported
+        before that rescan starts are folded into it.
+        """
+        with self._pending_lock:
+            if kind in self._pending:
+                return
+            timer = threading.Timer(self._refresh_delay, self._run_scheduled, args=(kind,))
+            timer.daemon = True
+            self._pending[kind] = timer
+        timer.start()
+
+    def _run_scheduled(self, kind: str):
+        with self._pending_lock:
+            self._pending.pop(kind, None)  # Changes from here on schedule a new rescan
+        try:
+            self.refresh(kind)
+        except Exception as e:
+            log_warning(f"Scheduled refresh of {kind} failed: {e}", "DESKTOP_INDEX")
+
+    def _scan(self, kind: str) -> _FolderSnapshot:
+        """Single directory walk: list + stat + score."""
+        from core.sensitivity import get_sensitivity_engine
+
+        path = self.resolve_folder(kind)
+        if not path:
+            return _EMPTY
+
+        try:
+            names = os.listdir(path)
+        except OSError as e:
+            log_warning(f"Cannot list {path}: {e}", "DESKTOP_INDEX")
+            return _EMPTY
+
+        listed = []
+        for name in names:
+            if name.startswith('.'):
+                continue
+            full = os.path.join(path, name)
+            try:
+                st = os.stat(full)
+                is_dir = os.path.isdir(full)
+                size, mtime = (0 if is_dir else st.st_size), st.st_mtime
+            except OSError:
+                # Vanished between listdir and stat, or broken link
+                is_dir, size, mtime = False, 0, 0.0
+            stem = name if is_dir else os.path.splitext(name)[0]
+            listed.append((name, stem, is_dir, size, mtime))
+
+        # Batch scoring: scores come from the stem, the snippet blacklist from the full name
+        engine = get_sensitivity_engine()
+        by_stem = engine.classify_many(item[1] for item in listed)
+        by_name = engine.classify_many(item[0] for item in listed)
+
+        entries = []
+        for (name, stem, is_dir, size, mtime), stem_result, name_result in zip(listed, by_stem, by_name):
+            score = 0 if is_dir else stem_result.score
+            entries.append(IndexedEntry(name, stem, is_dir, size, mtime, score, name_result.blacklisted))
+
+        return _FolderSnapshot(path, self._dir_mtime(path), tuple(entries))
+
+    @staticmethod
+    def _dir_mtime(path: Optional[str]) -> float:
+        if not path:
+            return 0.0
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return 0.0
+
+    # ========== WATCHING ==========
+
+    def start(self):
+        """Build the index and start watching for changes."""
+        if self._running:
+            return
+        self._running = True
+        self.refresh()
+
+        if HAS_WATCHDOG:
+            try:
+                self._observer = Observer()
+                for kind, snap in self._snapshots.items():
+                    if snap.path:
+                        self._observer.schedule(_ChangeHandler(self, kind), snap.path, recursive=False)
+                self._observer.daemon = True
+                self._observer.start()
+                log_info("Desktop index watching via filesystem notifications", "DESKTOP_INDEX")
+                return
+            except Exception as e:
+                log_warning(f"watchdog unavailable ({e}), falling back to polling", "DESKTOP_INDEX")
+                self._observer = None
+
+        self._thread = threading.Thread(target=self._poll_loop, name="DesktopIndexPoller", daemon=True)
+        self._thread.start()
+        log_info(f"Desktop index watching via polling ({self._poll_interval}s)", "DESKTOP_INDEX")
+
+    def stop(self):
+        """Stop watching. Cached snapshots stay readable."""
+        self._running = False
+        if self._observer:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=2.0)
+            except Exception:
+                pass
+            self._observer = None
+        with self._pending_lock:
+            pending, self._pending = list(self._pending.values()), {}
+        for timer in pending:
+            timer.cancel()
+        if self._thread:
+            self._thread.join(timeout=self._poll_interval + 1.0)
+            self._thread = None
+
+    def _poll_loop(self):
+        """
+        Polling fallback. A directory's mtime changes on create/delete/rename,
+        which is one stat() per folder; in-place edits are picked up by the
+        periodic full refresh.
+        """
+        ticks = 0
+        while self._running:
+            time.sleep(self._poll_interval)
+            if not self._running:
+                break
+            ticks += 1
+            full = ticks % self._full_rescan_every == 0
+            for kind in self._FOLDER_NAMES:
+                try:
+                    snap = self._snapshots.get(kind, _EMPTY)
+                    current_path = self.resolve_folder(kind)
+                    if full or current_path != snap.path or self._dir_mtime(current_path) != snap.dir_mtime:
+                        self.refresh(kind)
+                except Exception as e:
+                    log_warning(f"Poll error for {kind}: {e}", "DESKTOP_INDEX")
@@ -0,0 +1,273 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Dispatch Metrics - FunctionDispatcher / worker pool instrumentation.
+
+- DispatchMetrics: per-action counters (queued, merged, dropped, runs,
+  failures), queue wait and handler duration (avg/max), effect duration
+  (handler start to Effect end, avg/max), worker busy time and a ring of
+  the most recent runs with their enqueue/start/end times
+- MetricsExporter: appends a snapshot as one JSON line to logs/ every
+  `interval` seconds, so pool saturation can be read back after a session
+
+FunctionDispatcher.stats() combines these with the scheduler's lane depths.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+from core.logger import log_error, log_info
+
+
+class ActionStats:
+    """Counters for one action."""
+    __slots__ = ("queued", "merged", "dropped", "runs", "failures",
+                 "wait_s", "max_wait_s", "run_s", "max_run_s", "effects", "effect_s", "max_effect_s",
+                 "last_run")
+
+    def __init__(self):
+        self.queued = 0
+        self.merged = 0
+        self.dropped = 0
+        self.runs = 0
+        self.failures = 0
+        self.wait_s = 0.0
+        self.max_wait_s = 0.0
+        self.run_s = 0.0
+        self.max_run_s = 0.0
+        self.effects = 0
+        self.effect_s = 0.0
+        self.max_effect_s = 0.0
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "merged": self.merged,
+            "dropped": self.dropped,
+            "runs": self.runs,
+            "failures": self.failures,
+            "avg_wait_ms": round(self.wait_s * 1000 / self.runs, 3) if self.runs else 0.0,
+            "max_wait_ms": round(self.max_wait_s * 1000, 3),
+            "avg_run_ms": round(self.run_s * 1000 / self.runs, 3) if self.runs else 0.0,
+            "max_run_ms": round(self.max_run_s * 1000, 3),
+            "total_run_ms": round(self.run_s * 1000, 3),
+            "effects": self.effects,
+            "avg_effect_ms": round(self.effect_s * 1000 / self.effects, 3) if self.effects else 0.0,
+            "max_effect_ms": round(self.max_effect_s * 1000, 3),
+            "last_run": self.last_run,
+        }
+
+
+class DispatchMetrics:
+    """
+    Thread-safe dispatcher counters. Timestamps are perf_counter() values;
+    snapshots report them in ms since the metrics were created (or reset).
+    """
+
+    # Enqueue outcomes (record_enqueue)
+    QUEUED = "queued"
+    MERGED = "merged"
+    DROPPED = "dropped"
+
+    def __init__(self, recent_limit: int = 128):
+        self.enabled = True
+        self._actions: Dict[str, ActionStats] = {}
+        self._recent: deque = deque(maxlen=recent_limit)
+        self._busy_s: Dict[str, float] = {}  # Worker thread name -> seconds spent in handlers
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def _stats(self, action: str) -> ActionStats:
+        stats = self._actions.get(action)
+        if stats is None:
+            stats = self._actions.setdefault(action, ActionStats())
+        return stats
+
+    def _ms(self, t: Optional[float]) -> Optional[float]:
+        return None if t is None else round((t - self._origin) * 1000, 3)
+
+    # ========== RECORDING ==========
+
+    def record_enqueue(self, action: str, outcome: str = QUEUED):
+        """Result of handing an action to the scheduler (queued/merged/dropped)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._stats(action)
+            if outcome == self.MERGED:
+                stats.merged += 1
+            elif outcome == self.DROPPED:
+                stats.dropped += 1
+            else:
+                stats.queued += 1
+
+    def record_start(self):
+        """A worker picked up a task."""
+        with self._lock:
+            self._in_flight += 1
+            if self._in_flight > self._peak_in_flight:
+                self._peak_in_flight = self._in_flight
+
+    def record_run(self, action: str, enqueued: Optional[float], started: float, ended: float,
+                   failed: bool = False, worker: Optional[str] = None):
+        """
+        One finished handler run.
+
+        Args:
+            enqueued: perf_counter() when the task entered the scheduler
+                      (None for main-thread actions, which never wait)
+            worker: worker thread name; counts towards its busy time
+        """
+        run_s = ended - started
+        wait_s = started - enqueued if enqueued else 0.0
+        with self._lock:
+            if worker is not None:
+                self._busy_s[worker] = self._busy_s.get(worker, 0.0) + run_s
+                if self._in_flight > 0:
+                    self._in_flight -= 1
+            if not self.enabled:
+                return
+            stats = self._stats(action)
+            stats.runs += 1
+            stats.run_s += run_s
+            stats.wait_s += wait_s
+            if run_s > stats.max_run_s:
+                stats.max_run_s = run_s
+            if wait_s > stats.max_wait_s:
+                stats.max_wait_s = wait_s
+            if failed:
+                stats.failures += 1
+            record = {
+                "action": action,
+                "enqueued_ms": self._ms(enqueued),
+                "started_ms": self._ms(started),
+                "ended_ms": self._ms(ended),
+                "run_ms": round(run_s * 1000, 3),
+                "failed": failed,
+                "worker": worker,
+            }
+            stats.last_run = record
+            self._recent.append(record)
+
+    def record_effect(self, action: str, started: float, ended: float):
+        """
+        An Effect returned by a handler ended. Its handler run (record_run)
+        only covers spawning it; this is how long the action really lasted.
+        """
+        if not self.enabled:
+            return
+        effect_s = ended - started
+        with self._lock:
+            stats = self._stats(action)
+            stats.effects += 1
+            stats.effect_s += effect_s
+            if effect_s > stats.max_effect_s:
+                stats.max_effect_s = effect_s
+
+    # ========== QUERIES ==========
+
+    def busy(self) -> int:
+        """Workers inside a handler right now."""
+        with self._lock:
+            return self._in_flight
+
+    def workers(self, count: int) -> Dict[str, Any]:
+        """Pool utilisation since the origin: busy ratio over `count` workers."""
+        with self._lock:
+            busy = dict(self._busy_s)
+            in_flight = self._in_flight
+            peak = self._peak_in_flight
+        elapsed = time.perf_counter() - self._origin
+        capacity = elapsed * count
+        busy_total = sum(busy.values())
+        busy_ratio = min(1.0, busy_total / capacity) if capacity > 0 else 0.0
+        return {
+            "count": count,
+            "busy": in_flight,
+            "peak_busy": peak,
+            "busy_ratio": round(busy_ratio, 4),
+            "idle_ratio": round(1.0 - busy_ratio, 4),
+            "busy_s": {name: round(sec, 3) for name, sec in sorted(busy.items())},
+        }
+
+    def snapshot(self, workers: int = 0) -> Dict[str, Any]:
+        with self._lock:
+            actions = {action: stats.to_dict() for action, stats in self._actions.items()}
+            recent = list(self._recent)
+        return {
+            "uptime_s": round(time.perf_counter() - self._origin, 3),
+            "actions": actions,
+            "failures": sum(a["failures"] for a in actions.values()),
+            "workers": self.workers(workers),
+            "recent": recent,
+        }
+
+    def busiest(self, limit: int = 5) -> Dict[str, float]:
+        """Actions with the most total handler time (ms): what saturates the pool."""
+        with self._lock:
+            totals = {action: stats.run_s for action, stats in self._actions.items()}
+        top = sorted(totals.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+        return {action: round(sec * 1000, 3) for action, sec in top}
+
+    def reset(self):
+        with self._lock:
+            self._actions.clear()
+            self._recent.clear()
+            self._busy_s.clear()
+            self._peak_in_flight = self._in_flight
+            self._origin = time.perf_counter()
+
+
+class MetricsExporter:
+    """Appends `snapshot()` to a JSONL file every `interval` seconds on a daemon thread."""
+
+    def __init__(self, snapshot: Callable[[], Dict[str, Any]], path: str, interval: float = 10.0):
+        self.path = path
+        self.interval = max(0.1, interval)
+        self._snapshot = snapshot
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.count = 0
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="DispatchMetricsExport", daemon=True)
+        self._thread.start()
+        log_info(f"Dispatch metrics every {self.interval:g}s -> {self.path}", "DISPATCHER")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.export()
+
+    def export(self):
+        """Write one snapshot now."""
+        try:
+            entry = dict(self._snapshot(), t=time.strftime("%Y-%m-%d %H:%M:%S"))
+            line = json.dumps(entry, ensure_ascii=False, default=str)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self.count += 1
+        except Exception as e:
+            log_error(f"Dispatch metrics export failed: {e}", "DISPATCHER")
+
+    def stop(self, final: bool = True):
+        """Stop the thread; final=True writes a last snapshot (end of session)."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(1.0)
+        self._thread = None
+        if final:
+            self.export()
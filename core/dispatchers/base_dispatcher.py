@@ -12,7 +12,31 @@ All specialized dispatchers inherit from this base class to ensure
 consistent interface and behavior.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional
+from core.action_registry import ActionSpec
+from core.logger import log_warning
+
+# handler(params, speech)
+ActionHandler = Callable[[Dict[str, Any], str], None]
+
+
+def bind(method: Callable, *args, **defaults) -> ActionHandler:
+    """
+    Handler calling method(*args, *param values) with the params named in
+    defaults, in order; a missing param takes its default. Names and
+    defaults are fixed here, once, when the handler table is built.
+    """
+    items = tuple(defaults.items())
+    if not items:
+        return lambda params, speech="": method(*args)
+
+    def handler(params: Dict[str, Any], speech: str = ""):
+        return method(*args, *[params.get(key, default) for key, default in items])
+    return handler
+
+
+def noop(params: Dict[str, Any], speech: str = ""):
+    """Handler for actions executed elsewhere (e.g. by FunctionDispatcher)."""
 
 
 class BaseDispatcher(ABC):
@@ -21,9 +45,18 @@ class BaseDispatcher(ABC):
     
     Each specialized dispatcher (visual, hardware, horror, system) implements
     this interface to handle a specific category of actions.
+    
+    Actions are declared once in ACTIONS (name -> ActionSpec: priority,
+    thread affinity, silent flag); FunctionDispatcher builds its action
+    registry from these declarations at startup.
+    
+    Execution goes through a handler table (action -> bound handler) built
+    once by build_handlers(); FunctionDispatcher calls the handlers directly.
     """
     
-    @abstractmethod
+    ACTIONS: Dict[str, ActionSpec] = {}
+    _handlers: Optional[Dict[str, ActionHandler]] = None
+    
     def get_supported_actions(self) -> List[str]:
         """
         Return list of action names this dispatcher handles.
@@ -31,9 +64,24 @@ class BaseDispatcher(ABC):
         Returns:
             List of uppercase action names (e.g., ['OVERLAY_TEXT', 'FLASH_COLOR'])
         """
-        pass
+        return list(self.ACTIONS)
     
     @abstractmethod
+    def build_handlers(self) -> Dict[str, ActionHandler]:
+        """
+        Build the action -> handler(params, speech) table.
+        
+        Called once, on first use (after dependency injection), so handlers
+        can bind methods and parameter defaults up front.
+        """
+        pass
+    
+    def get_handlers(self) -> Dict[str, ActionHandler]:
+        """Cached handler table."""
+        if self._handlers is None:
+            self._handlers = self.build_handlers()
+        return self._handlers
+    
     def dispatch(self, action: str, params: Dict[str, Any], speech: str = ""):
         """
         Execute the given action with parameters.
@@ -46,7 +94,11 @@ class BaseDispatcher(ABC):
         Raises:
             DispatchError: If action execution fails
         """
-        pass
+        handler = self.get_handlers().get(action)
+        if handler is None:
+            log_warning(f"{self.__class__.__name__} has no handler for {action}", "DISPATCHER")
+            return
+        handler(params, speech)
     
     def __repr__(self):
         return f"{self.__class__.__name__}(actions={len(self.get_supported_actions())})"
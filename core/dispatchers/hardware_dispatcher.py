@@ -13,9 +13,10 @@ Supported actions:
 - TTS_SPEAK, PLAY_SFX, AUDIO_GLITCH
 - CAMERA_FLASH, BRIGHTNESS_FLICKER, BRIGHTNESS_DIM
 """
-from typing import List, Dict, Any
-from core.dispatchers.base_dispatcher import BaseDispatcher
-from core.logger import log_info
+from typing import Dict, Any
+from core.action_registry import ActionSpec, PRIORITY_MEDIUM
+from core.dispatchers.base_dispatcher import ActionHandler, BaseDispatcher, bind
+from core.lazy_backend import deferred, lazy_import
 
 
 class HardwareDispatcher(BaseDispatcher):
@@ -26,81 +27,59 @@ class HardwareDispatcher(BaseDispatcher):
     Actions: ~12 hardware operations
     """
     
+    ACTIONS = {
+        "MOUSE_SHAKE": ActionSpec(silent=True),
+        "LOCK_INPUT": ActionSpec(),
+        "UNLOCK_INPUT": ActionSpec(),
+        "GHOST_TYPE": ActionSpec(),
+        "PLAY_SFX": ActionSpec(),
+        "AUDIO_GLITCH": ActionSpec(),
+        "CAMERA_FLASH": ActionSpec(),
+        "BRIGHTNESS_FLICKER": ActionSpec(silent=True),
+        "BRIGHTNESS_DIM": ActionSpec(),
+        "CAPSLOCK_TOGGLE": ActionSpec(silent=True),
+        "PLAY_SOUND": ActionSpec(PRIORITY_MEDIUM),
+        "TTS_SPEAK": ActionSpec(PRIORITY_MEDIUM),
+    }
+    
     def __init__(self, process_guard=None):
-        from hardware.mouse_ops import MouseOps
-        from hardware.keyboard_ops import KeyboardOps
-        from hardware.audio_out import AudioOut
-        from hardware.camera_ops import CameraOps
-        from hardware.brightness_ops import BrightnessOps
-        
-        self.mouse = MouseOps
-        self.keyboard = KeyboardOps
-        self.audio = AudioOut()
-        self.camera = CameraOps()
-        self.brightness = BrightnessOps
+        # Built / imported on first use (or by the post-boot pre-warm)
+        self.mouse = lazy_import("mouse", "hardware.mouse_ops", "MouseOps", construct=False)
+        self.keyboard = lazy_import("keyboard", "hardware.keyboard_ops", "KeyboardOps", construct=False)
+        self.audio = lazy_import("audio", "hardware.audio_out", "AudioOut")
+        self.camera = lazy_import("camera", "hardware.camera_ops", "CameraOps")
+        self.brightness = lazy_import("brightness", "hardware.brightness_ops", "BrightnessOps", construct=False)
         self.process_guard = process_guard
     
-    def get_supported_actions(self) -> List[str]:
-        """Hardware control actions"""
-        return [
-            "MOUSE_SHAKE",
-            "LOCK_INPUT",
-            "UNLOCK_INPUT",
-            "GHOST_TYPE",
-            "PLAY_SFX",
-            "AUDIO_GLITCH",
-            "CAMERA_FLASH",
-            "BRIGHTNESS_FLICKER",
-            "BRIGHTNESS_DIM",
-            "CAPSLOCK_TOGGLE",
-            "PLAY_SOUND",
-            "TTS_SPEAK",
-        ]
+    def build_handlers(self) -> Dict[str, ActionHandler]:
+        """Hardware control handlers"""
+        mouse, keyboard, audio, brightness = self.mouse, self.keyboard, self.audio, self.brightness
+        return {
+            # A running shake is extended by the next one (MouseOps)
+            "MOUSE_SHAKE": bind(deferred(mouse, "shake_cursor"), duration=1.0),
+            "LOCK_INPUT": bind(deferred(keyboard, "lock_input")),
+            "UNLOCK_INPUT": bind(deferred(keyboard, "unlock_input")),
+            "GHOST_TYPE": self._ghost_type,
+            "PLAY_SFX": bind(deferred(audio, "play_sfx"), sound_name="glitch"),
+            "AUDIO_GLITCH": bind(deferred(audio, "play_sfx"), "static_noise"),
+            "CAMERA_FLASH": bind(deferred(self.camera, "camera_flash_scare")),
+            "BRIGHTNESS_FLICKER": bind(deferred(brightness, "flicker"), times=3),
+            "BRIGHTNESS_DIM": bind(deferred(brightness, "gradual_dim"), target=10),
+            "CAPSLOCK_TOGGLE": bind(deferred(keyboard, "toggle_caps_lock")),
+            "PLAY_SOUND": self._play_sound,
+            "TTS_SPEAK": self._tts_speak,
+        }
+    
+    def _ghost_type(self, params: Dict[str, Any], speech: str = ""):
+        text = params.get("text", "Geri dönüşün yok.")
+        self.keyboard.ghost_type(text, self.process_guard)
+    
+    def _play_sound(self, params: Dict[str, Any], speech: str = ""):
+        # Map PLAY_SOUND to play_sfx
+        sound = params.get("sound") or params.get("sound_name") or "glitch"
+        self.audio.play_sfx(sound)
     
-    def dispatch(self, action: str, params: Dict[str, Any], speech: str = ""):
-        """Execute hardware action"""
-        log_info(f"Hardware action: {action}", "HARDWARE_DISPATCHER")
-        
-        if action == "MOUSE_SHAKE":
-            self.mouse.shake_cursor()
-        
-        elif action == "LOCK_INPUT":
-            self.keyboard.lock_input()
-        
-        elif action == "UNLOCK_INPUT":
-            self.keyboard.unlock_input()
-        
-        elif action == "GHOST_TYPE":
-            text = params.get("text", "Geri dönüşün yok.")
-            self.keyboard.ghost_type(text, self.process_guard)
-        
-        elif action == "PLAY_SFX":
-            sound = params.get("sound_name", "glitch")
-            self.audio.play_sfx(sound)
-        
-        elif action == "AUDIO_GLITCH":
-            self.audio.play_sfx("static_noise")
-        
-        elif action == "CAMERA_FLASH":
-            self.camera.camera_flash_scare()
-        
-        elif action == "BRIGHTNESS_FLICKER":
-            times = params.get("times", 3)
-            self.brightness.flicker(times)
-        
-        elif action == "BRIGHTNESS_DIM":
-            target = params.get("target", 10)
-            self.brightness.gradual_dim(target)
-        
-        elif action == "CAPSLOCK_TOGGLE":
-            self.keyboard.toggle_caps_lock()
-            
-        elif action == "PLAY_SOUND":
-            # Map PLAY_SOUND to play_sfx
-            sound = params.get("sound") or params.get("sound_name") or "glitch"
-            self.audio.play_sfx(sound)
-            
-        elif action == "TTS_SPEAK":
-            speech = params.get("speech") or params.get("text")
-            if speech:
-                self.audio.play_tts(speech)
+    def _tts_speak(self, params: Dict[str, Any], speech: str = ""):
+        speech = params.get("speech") or params.get("text")
+        if speech:
+            self.audio.play_tts(speech)
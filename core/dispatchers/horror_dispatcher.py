@@ -15,9 +15,11 @@ Supported actions:
 - FAKE_BROWSER_HISTORY, FAKE_LISTENING, CREEPY_MUSIC, WHISPER
 - DIGITAL_GLITCH_SURGE
 """
-from typing import List, Dict, Any
-from core.dispatchers.base_dispatcher import BaseDispatcher
-from core.logger import log_info
+import random
+from typing import Dict, Any
+from core.action_registry import ActionSpec, PRIORITY_HIGH, THREAD_MAIN
+from core.dispatchers.base_dispatcher import ActionHandler, BaseDispatcher, bind, noop
+from core.lazy_backend import deferred, lazy_import
 
 
 class HorrorDispatcher(BaseDispatcher):
@@ -28,131 +30,96 @@ class HorrorDispatcher(BaseDispatcher):
     Actions: ~15 horror effects
     """
     
+    ACTIONS = {
+        "THE_MASK": ActionSpec(PRIORITY_HIGH),
+        "GLITCH_SCREEN": ActionSpec(PRIORITY_HIGH, silent=True),
+        "SCREEN_TEAR": ActionSpec(PRIORITY_HIGH),
+        "PIXEL_MELT": ActionSpec(),
+        "SCREEN_MELT": ActionSpec(PRIORITY_HIGH),
+        "FAKE_BSOD": ActionSpec(thread=THREAD_MAIN),
+        "FAKE_UPDATE": ActionSpec(thread=THREAD_MAIN),
+        "FAKE_FILE_DELETE": ActionSpec(),
+        "CAMERA_THREAT": ActionSpec(),
+        "APP_THREAT": ActionSpec(),
+        "NAME_REVEAL": ActionSpec(),
+        "TIME_DISTORTION": ActionSpec(),
+        "FAKE_BROWSER_HISTORY": ActionSpec(),
+        "FAKE_LISTENING": ActionSpec(),
+        "CREEPY_MUSIC": ActionSpec(),
+        "WHISPER": ActionSpec(),
+        "DIGITAL_GLITCH_SURGE": ActionSpec(),
+        "ICON_SCRAMBLE": ActionSpec(thread=THREAD_MAIN, silent=True),
+        "FAKE_ERROR_SPAM": ActionSpec(),
+        "WINDOW_HIJACK": ActionSpec(),
+    }
+    
     def __init__(self):
-        from visual.desktop_mask import DesktopMask
         from visual.fake_ui import FakeUI
-        from visual.effects.screen_tear import ScreenTear
-        from visual.effects.pixel_melt import PixelMelt
-        from visual.effects.screen_melter import trigger_melt
         from visual.horror_effects import get_horror_effects
         
-        self.mask = DesktopMask()
-        self.fake_ui = FakeUI()
-        self.screen_tear = ScreenTear
-        self.pixel_melt = PixelMelt
-        self.trigger_melt = trigger_melt
+        # Built / imported on first use (or by the post-boot pre-warm); mask always on the GUI thread
+        self.mask = lazy_import("mask", "visual.desktop_mask", "DesktopMask", main_thread=True)
+        self.fake_ui = FakeUI()  # Singleton; its windows are created on demand
+        self.screen_tear = lazy_import("screen_tear", "visual.effects.screen_tear", "ScreenTear", construct=False)
+        self.pixel_melt = lazy_import("pixel_melt", "visual.effects.pixel_melt", "PixelMelt", construct=False)
+        self.melter = lazy_import("screen_melter", "visual.effects.screen_melter")
         self.get_horror = get_horror_effects
+        self._horror = None
+        self.icons = lazy_import("icons", "visual.icon_ops", "IconOps", construct=False)
+        self.window = lazy_import("window", "hardware.window_ops", "WindowOps", construct=False)
     
-    def get_supported_actions(self) -> List[str]:
-        """Horror effect actions"""
-        return [
-            "THE_MASK",
-            "GLITCH_SCREEN",
-            "SCREEN_TEAR",
-            "PIXEL_MELT",
-            "SCREEN_MELT",
-            "FAKE_BSOD",
-            "FAKE_UPDATE",
-            "FAKE_FILE_DELETE",
-            "CAMERA_THREAT",
-            "APP_THREAT",
-            "NAME_REVEAL",
-            "TIME_DISTORTION",
-            "FAKE_BROWSER_HISTORY",
-            "FAKE_LISTENING",
-            "CREEPY_MUSIC",
-            "WHISPER",
-            "DIGITAL_GLITCH_SURGE",
-            "ICON_SCRAMBLE",
-            "FAKE_ERROR_SPAM",
-            "WINDOW_HIJACK",
-        ]
+    def build_handlers(self) -> Dict[str, ActionHandler]:
+        """Horror effect handlers"""
+        effect = self._effect
+        return {
+            "THE_MASK": bind(deferred(self.mask, "capture_and_mask")),
+            "GLITCH_SCREEN": self._glitch_screen,
+            "SCREEN_TEAR": bind(deferred(self.screen_tear, "tear_screen"), intensity=15, duration=500),
+            "PIXEL_MELT": bind(deferred(self.pixel_melt, "trigger_random")),
+            "SCREEN_MELT": bind(deferred(self.melter, "trigger_melt")),
+            "FAKE_BSOD": bind(self.fake_ui.show_bsod),
+            "FAKE_UPDATE": bind(self.fake_ui.show_fake_update, percent=0),
+            "FAKE_FILE_DELETE": effect("fake_file_deletion"),
+            "CAMERA_THREAT": noop,  # Handled by camera ops
+            "APP_THREAT": effect("app_specific_threat", with_params=True),
+            "NAME_REVEAL": effect("dramatic_name_reveal"),
+            "TIME_DISTORTION": effect("time_distortion_effect"),
+            "FAKE_BROWSER_HISTORY": effect("fake_browser_history_threat", with_params=True),
+            "FAKE_LISTENING": effect("fake_listening_feedback"),
+            "CREEPY_MUSIC": effect("creepy_lullaby"),
+            "WHISPER": effect("mechanical_whispers"),
+            "DIGITAL_GLITCH_SURGE": effect("digital_glitch_surge"),
+            "ICON_SCRAMBLE": bind(deferred(self.icons, "scramble_into_pattern"), pattern="spiral"),
+            "FAKE_ERROR_SPAM": self._error_spam,
+            "WINDOW_HIJACK": self._window_hijack,
+        }
     
-    def dispatch(self, action: str, params: Dict[str, Any], speech: str = ""):
-        """Execute horror action"""
-        log_info(f"Horror action: {action}", "HORROR_DISPATCHER")
-        
-        if action == "THE_MASK":
-            self.mask.capture_and_mask()
-        
-        elif action == "GLITCH_SCREEN":
-            # Using GDI engine for rapid flash
-            if hasattr(self, 'overlay') and self.overlay:
-                self.overlay.flash_color("#FF0000", 0.5, 200)
-            if hasattr(self, 'system') and hasattr(self.system, 'gdi') and self.system.gdi:
-                self.system.gdi.flash_red_glitch()
-        
-        elif action == "SCREEN_TEAR":
-            intensity = params.get("intensity", 15)
-            duration = params.get("duration", 500)
-            self.screen_tear.tear_screen(intensity, duration)
-        
-        elif action == "PIXEL_MELT":
-            self.pixel_melt.trigger_random()
-        
-        elif action == "SCREEN_MELT":
-            self.trigger_melt()
-        
-        elif action == "FAKE_BSOD":
-            self.fake_ui.show_bsod()
-        
-        elif action == "FAKE_UPDATE":
-            percent = params.get("percent", 0)
-            self.fake_ui.show_fake_update(percent)
-        
-        elif action == "FAKE_FILE_DELETE":
-            horror = self.get_horror(self)
-            horror.fake_file_deletion()
-        
-        elif action == "CAMERA_THREAT":
-            # Handled by camera ops
-            pass
-        
-        elif action == "APP_THREAT":
-            horror = self.get_horror(self)
-            horror.app_specific_threat(params)
-        
-        elif action == "NAME_REVEAL":
-            horror = self.get_horror(self)
-            horror.dramatic_name_reveal()
-        
-        elif action == "TIME_DISTORTION":
-            horror = self.get_horror(self)
-            horror.time_distortion_effect()
-        
-        elif action == "FAKE_BROWSER_HISTORY":
-            horror = self.get_horror(self)
-            horror.fake_browser_history_threat(params)
-        
-        elif action == "FAKE_LISTENING":
-            horror = self.get_horror(self)
-            horror.fake_listening_feedback()
-        
-        elif action == "CREEPY_MUSIC":
-            horror = self.get_horror(self)
-            horror.creepy_lullaby()
-        
-        elif action == "WHISPER":
-            horror = self.get_horror(self)
-            horror.mechanical_whispers()
-        
-        elif action == "DIGITAL_GLITCH_SURGE":
-            horror = self.get_horror(self)
-            horror.digital_glitch_surge()
-
-        elif action == "ICON_SCRAMBLE":
-            from visual.icon_ops import IconOps
-            IconOps.scramble_into_pattern(params.get("pattern", "spiral"))
-            
-        elif action == "FAKE_ERROR_SPAM":
-            count = params.get("count", 10)
-            if hasattr(self, 'overlay') and self.overlay:
-                self.overlay.spawn_error_cascade(count)
-                
-        elif action == "WINDOW_HIJACK":
-            from hardware.window_ops import WindowOps
-            dx = params.get("dx", random.randint(-50, 50))
-            dy = params.get("dy", random.randint(-50, 50))
-            WindowOps.shift_active_window(dx, dy)
-            if params.get("shake", False):
-                WindowOps.shake_active_window(10, 500)
+    def _horror_effects(self):
+        """HorrorEffects resolved once, on the first horror action."""
+        if self._horror is None:
+            self._horror = self.get_horror(self)
+        return self._horror
+    
+    def _effect(self, name: str, with_params: bool = False) -> ActionHandler:
+        if with_params:
+            return lambda params, speech="": getattr(self._horror_effects(), name)(params)
+        return lambda params, speech="": getattr(self._horror_effects(), name)()
+    
+    def _glitch_screen(self, params: Dict[str, Any], speech: str = ""):
+        # Using GDI engine for rapid flash
+        if hasattr(self, 'overlay') and self.overlay:
+            self.overlay.flash_color("#FF0000", 0.5, 200)
+        if hasattr(self, 'system') and hasattr(self.system, 'gdi') and self.system.gdi:
+            return self.system.gdi.flash_red_glitch()
+    
+    def _error_spam(self, params: Dict[str, Any], speech: str = ""):
+        count = params.get("count", 10)
+        if hasattr(self, 'overlay') and self.overlay:
+            self.overlay.spawn_error_cascade(count)
+    
+    def _window_hijack(self, params: Dict[str, Any], speech: str = ""):
+        dx = params.get("dx", random.randint(-50, 50))
+        dy = params.get("dy", random.randint(-50, 50))
+        self.window.shift_active_window(dx, dy)
+        if params.get("shake", False):
+            return self.window.shake_active_window(10, 500)
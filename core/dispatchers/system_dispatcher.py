@@ -15,8 +15,10 @@ Supported actions:
 - SET_PERSONA, SET_MOOD
 - RESTORE_SYSTEM, OPEN_BROWSER
 """
-from typing import List, Dict, Any
-from core.dispatchers.base_dispatcher import BaseDispatcher
+from typing import Dict, Any
+from core.action_registry import ActionSpec, THREAD_MAIN
+from core.dispatchers.base_dispatcher import ActionHandler, BaseDispatcher, bind, noop
+from core.lazy_backend import deferred, lazy_import
 from core.logger import log_info
 
 
@@ -29,95 +31,76 @@ class SystemDispatcher(BaseDispatcher):
     Actions: ~11 system operations
     """
     
+    ACTIONS = {
+        "SET_WALLPAPER": ActionSpec(),
+        "CLIPBOARD_POISON": ActionSpec(silent=True),
+        "FAKE_NOTIFICATION": ActionSpec(thread=THREAD_MAIN),
+        "NOTEPAD_HIJACK": ActionSpec(),
+        "CORRUPT_WINDOWS": ActionSpec(),
+        "SCRAMBLE_ICONS": ActionSpec(thread=THREAD_MAIN),
+        "SET_PERSONA": ActionSpec(),
+        "SET_MOOD": ActionSpec(),
+        "RESTORE_SYSTEM": ActionSpec(),
+        "OPEN_BROWSER": ActionSpec(),
+        "CLIPBOARD_INJECT": ActionSpec(),
+        "NOTEPAD_SPAWN": ActionSpec(),
+        "WALLPAPER_CHANGE": ActionSpec(),
+        "ICON_SCRAMBLE": ActionSpec(thread=THREAD_MAIN, silent=True),
+        "NOTIFICATION_SEND": ActionSpec(thread=THREAD_MAIN),
+        "WINDOWS_ERROR": ActionSpec(thread=THREAD_MAIN),
+    }
+    
     def __init__(self):
-        from hardware.wallpaper_ops import WallpaperOps
-        from hardware.clipboard_ops import ClipboardOps
-        from hardware.notification_ops import NotificationOps
-        from hardware.notepad_ops import NotepadOps
-        from hardware.window_ops import WindowOps
-        from visual.icon_ops import IconOps
-        from visual.browser_ops import BrowserOps
+        from visual.fake_ui import FakeUI
         
-        self.wallpaper = WallpaperOps
-        self.clipboard = ClipboardOps
-        self.notifications = NotificationOps()
-        self.notepad = NotepadOps
-        self.window = WindowOps
-        self.icons = IconOps
-        self.browser = BrowserOps()
+        # Built / imported on first use (or by the post-boot pre-warm)
+        self.wallpaper = lazy_import("wallpaper", "hardware.wallpaper_ops", "WallpaperOps", construct=False)
+        self.clipboard = lazy_import("clipboard", "hardware.clipboard_ops", "ClipboardOps", construct=False)
+        self.notifications = lazy_import("notifications", "hardware.notification_ops", "NotificationOps")
+        self.notepad = lazy_import("notepad", "hardware.notepad_ops", "NotepadOps", construct=False)
+        self.window = lazy_import("window", "hardware.window_ops", "WindowOps", construct=False)
+        self.icons = lazy_import("icons", "visual.icon_ops", "IconOps", construct=False)
+        self.browser = lazy_import("browser", "visual.browser_ops", "BrowserOps")
+        self.fake_ui = FakeUI()  # Singleton; its windows are created on demand
     
-    def get_supported_actions(self) -> List[str]:
-        """System operation actions"""
-        return [
-            "SET_WALLPAPER",
-            "CLIPBOARD_POISON",
-            "FAKE_NOTIFICATION",
-            "NOTEPAD_HIJACK",
-            "CORRUPT_WINDOWS",
-            "SCRAMBLE_ICONS",
-            "SET_PERSONA",
-            "SET_MOOD",
-            "RESTORE_SYSTEM",
-            "OPEN_BROWSER",
-            "CLIPBOARD_INJECT",
-            "NOTEPAD_SPAWN",
-            "WALLPAPER_CHANGE",
-            "ICON_SCRAMBLE",
-            "NOTIFICATION_SEND",
-            "WINDOWS_ERROR",
-        ]
+    def build_handlers(self) -> Dict[str, ActionHandler]:
+        """System operation handlers"""
+        poison = bind(deferred(self.clipboard, "poison_clipboard"), text="SEN BENİMSİN")
+        alert = bind(deferred(self.notifications, "show_fake_system_alert"), title="SYSTEM NOTICE", message="...")
+        notepad = bind(deferred(self.notepad, "hijack_and_type"), text="YARDIM EDİN", delay=0.1)
+        scramble = bind(deferred(self.icons, "scramble_into_pattern"), pattern="spiral")
+        return {
+            "SET_WALLPAPER": self._set_wallpaper,
+            "WALLPAPER_CHANGE": self._set_wallpaper,
+            "CLIPBOARD_POISON": poison,
+            "CLIPBOARD_INJECT": poison,
+            "FAKE_NOTIFICATION": alert,
+            "NOTIFICATION_SEND": alert,
+            "NOTEPAD_HIJACK": notepad,
+            "NOTEPAD_SPAWN": notepad,
+            "CORRUPT_WINDOWS": bind(deferred(self.window, "corrupt_all_windows")),
+            "SCRAMBLE_ICONS": scramble,
+            "ICON_SCRAMBLE": scramble,
+            "SET_PERSONA": noop,  # Handled by main dispatcher (needs brain reference)
+            "SET_MOOD": noop,     # Handled by main dispatcher (needs fake_ui reference)
+            "RESTORE_SYSTEM": self._restore_system,
+            "OPEN_BROWSER": bind(deferred(self.browser, "open_url"), url="https://google.com"),
+            "WINDOWS_ERROR": self._windows_error,
+        }
     
-    def dispatch(self, action: str, params: Dict[str, Any], speech: str = ""):
-        """Execute system action"""
-        log_info(f"System action: {action}", "SYSTEM_DISPATCHER")
-        
-        if action == "SET_WALLPAPER" or action == "WALLPAPER_CHANGE":
-            path = params.get("image_path")
-            if path:
-                self.wallpaper.set_wallpaper(path)
-        
-        elif action == "CLIPBOARD_POISON" or action == "CLIPBOARD_INJECT":
-            text = params.get("text", "SEN BENİMSİN")
-            self.clipboard.poison_clipboard(text)
-        
-        elif action == "FAKE_NOTIFICATION" or action == "NOTIFICATION_SEND":
-            title = params.get("title", "SYSTEM NOTICE")
-            message = params.get("message", "...")
-            self.notifications.show_fake_system_alert(title, message)
-        
-        elif action == "NOTEPAD_HIJACK" or action == "NOTEPAD_SPAWN":
-            text = params.get("text", "YARDIM EDİN")
-            delay = params.get("delay", 0.1)
-            self.notepad.hijack_and_type(text, delay)
-        
-        elif action == "CORRUPT_WINDOWS":
-            self.window.corrupt_all_windows()
-        
-        elif action == "SCRAMBLE_ICONS" or action == "ICON_SCRAMBLE":
-            pattern = params.get("pattern", "spiral")
-            self.icons.scramble_into_pattern(pattern)
-        
-        elif action == "SET_PERSONA":
-            # Handled by main dispatcher (needs brain reference)
-            pass
-        
-        elif action == "SET_MOOD":
-            # Handled by main dispatcher (needs fake_ui reference)
-            pass
-        
-        elif action == "RESTORE_SYSTEM":
-            # Safety cleanup
-            self.window.restore_all_windows()
-            self.icons.restore_icon_positions()
-            # BrightnessOps.restore_brightness() would need import
-            log_info("System restoration completed", "SYSTEM_DISPATCHER")
-        
-        elif action == "OPEN_BROWSER":
-            url = params.get("url", "https://google.com")
-            self.browser.open_url(url)
-            
-        elif action == "WINDOWS_ERROR":
-            title = params.get("title", "SYSTEM ERROR")
-            message = params.get("message", "A critical error has occurred.")
-            from visual.fake_ui import FakeUI
-            FakeUI().show_system_failure(title=title, message=message, **params)
+    def _set_wallpaper(self, params: Dict[str, Any], speech: str = ""):
+        path = params.get("image_path")
+        if path:
+            self.wallpaper.set_wallpaper(path)
+    
+    def _restore_system(self, params: Dict[str, Any], speech: str = ""):
+        # Safety cleanup
+        self.window.restore_all_windows()
+        self.icons.restore_icon_positions()
+        # BrightnessOps.restore_brightness() would need import
+        log_info("System restoration completed", "SYSTEM_DISPATCHER")
+    
+    def _windows_error(self, params: Dict[str, Any], speech: str = ""):
+        title = params.get("title", "SYSTEM ERROR")
+        message = params.get("message", "A critical error has occurred.")
+        self.fake_ui.show_system_failure(title=title, message=message, **params)
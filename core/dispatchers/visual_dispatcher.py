@@ -12,9 +12,10 @@ Supported actions:
 - OVERLAY_TEXT, FLASH_COLOR, SHAKE_SCREEN, SHAKE_CHAT
 - SCREEN_INVERT, GDI_STATIC, GDI_LINE, GDI_FLASH
 """
-from typing import List, Dict, Any
-from core.dispatchers.base_dispatcher import BaseDispatcher
-from core.logger import log_info
+from typing import Dict, Any
+from core.action_registry import ActionSpec, PRIORITY_HIGH, THREAD_MAIN
+from core.dispatchers.base_dispatcher import ActionHandler, BaseDispatcher, bind, noop
+from core.lazy_backend import deferred, lazy_import
 
 
 class VisualDispatcher(BaseDispatcher):
@@ -25,63 +26,39 @@ class VisualDispatcher(BaseDispatcher):
     Actions: ~8 visual effects
     """
     
+    ACTIONS = {
+        # QWidget overlays: main thread
+        "OVERLAY_TEXT": ActionSpec(thread=THREAD_MAIN),
+        "FLASH_COLOR": ActionSpec(thread=THREAD_MAIN),
+        "SHAKE_SCREEN": ActionSpec(thread=THREAD_MAIN),
+        "SHAKE_CHAT": ActionSpec(thread=THREAD_MAIN),
+        # GDI effects: latency sensitive
+        "SCREEN_INVERT": ActionSpec(PRIORITY_HIGH),
+        "GDI_STATIC": ActionSpec(PRIORITY_HIGH),
+        "GDI_LINE": ActionSpec(PRIORITY_HIGH),
+        "GDI_FLASH": ActionSpec(PRIORITY_HIGH),
+    }
+    
     def __init__(self):
-        from visual.overlay_manager import OverlayManager
-        from visual.gdi_engine import GDIEngine
-        
-        self.overlay = OverlayManager()
-        self.gdi = GDIEngine()
+        # Built on first use (or by the post-boot pre-warm); overlay always on the GUI thread
+        self.overlay = lazy_import("overlay", "visual.overlay_manager", "OverlayManager", main_thread=True)
+        self.gdi = lazy_import("gdi", "visual.gdi_engine", "GDIEngine")
     
-    def get_supported_actions(self) -> List[str]:
-        """Visual effect actions"""
-        return [
-            "OVERLAY_TEXT",
-            "FLASH_COLOR",
-            "SHAKE_SCREEN",
-            "SHAKE_CHAT",
-            "SCREEN_INVERT",
-            "GDI_STATIC",
-            "GDI_LINE",
-            "GDI_FLASH",
-        ]
+    def build_handlers(self) -> Dict[str, ActionHandler]:
+        """Visual effect handlers"""
+        overlay, gdi = self.overlay, self.gdi
+        return {
+            "OVERLAY_TEXT": bind(deferred(overlay, "show_text"), text="...", duration=3000),
+            "FLASH_COLOR": bind(deferred(overlay, "flash_color"), color="#FF0000", opacity=0.4, duration=300),
+            "SHAKE_SCREEN": bind(deferred(overlay, "shake_screen"), intensity=20, duration=1000),
+            "SHAKE_CHAT": noop,  # Handled by FunctionDispatcher (needs chat reference)
+            "SCREEN_INVERT": bind(deferred(gdi, "invert_screen"), duration=200),
+            "GDI_STATIC": self._static_noise,
+            "GDI_LINE": bind(deferred(gdi, "draw_horror_line"), color=0x0000FF, thickness=2),
+            "GDI_FLASH": bind(deferred(gdi, "flash_red_glitch")),
+        }
     
-    def dispatch(self, action: str, params: Dict[str, Any], speech: str = ""):
-        """Execute visual action"""
-        log_info(f"Visual action: {action}", "VISUAL_DISPATCHER")
-        
-        if action == "OVERLAY_TEXT":
-            text = params.get("text", "...")
-            duration = params.get("duration", 3000)
-            self.overlay.show_text(text, duration)
-        
-        elif action == "FLASH_COLOR":
-            color = params.get("color", "#FF0000")
-            opacity = params.get("opacity", 0.4)
-            duration = params.get("duration", 300)
-            self.overlay.flash_color(color, opacity, duration)
-        
-        elif action == "SHAKE_SCREEN":
-            intensity = params.get("intensity", 20)
-            duration = params.get("duration", 1000)
-            self.overlay.shake_screen(intensity, duration)
-        
-        elif action == "SHAKE_CHAT":
-            # Will be handled by FunctionDispatcher (needs chat reference)
-            pass
-        
-        elif action == "SCREEN_INVERT":
-            duration = params.get("duration", 200)
-            self.gdi.invert_screen(duration)
-        
-        elif action == "GDI_STATIC":
-            duration = params.get("duration", 500)
-            density = params.get("density", 0.01)
-            self.gdi.draw_static_noise(duration_ms=duration, density=density)
-        
-        elif action == "GDI_LINE":
-            color = params.get("color", 0x0000FF)
-            thickness = params.get("thickness", 2)
-            self.gdi.draw_horror_line(color=color, thickness=thickness)
-        
-        elif action == "GDI_FLASH":
-            self.gdi.flash_red_glitch()
+    def _static_noise(self, params: Dict[str, Any], speech: str = ""):
+        duration = params.get("duration", 500)
+        density = params.get("density", 0.01)
+        return self.gdi.draw_static_noise(duration_ms=duration, density=density)
@@ -0,0 +1,246 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Effect Runtime - Timer-driven effects instead of sleeping threads.
+
+An effect is a generator: each next() runs one small step and yields the
+delay in seconds until its next step, so `time.sleep(x)` inside an effect
+loop becomes `yield x`. Cleanup (releasing a DC, restoring brightness or a
+window position) lives in the generator's try/finally, which also runs
+when the effect is cancelled or the runtime stops.
+
+Effects share one scheduler thread ("EffectRuntime") ordered by a heap of
+wake-up times: dozens of overlapping effects cost one thread instead of
+one blocked ActionWorker each. Effects that touch QWidgets can be driven
+by Qt timers on the main thread instead (spawn(..., qt=True)).
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Generator, List, Optional, Tuple
+
+from core.logger import log_error, log_info
+
+try:
+    from PyQt6.QtCore import QThread, QTimer
+    from PyQt6.QtWidgets import QApplication
+    HAS_QT = True
+except ImportError:
+    HAS_QT = False
+
+EffectSteps = Generator[Optional[float], None, None]
+
+
+class Effect:
+    """Handle of a running effect."""
+    __slots__ = ("name", "_steps", "cancelled", "_done", "_callbacks", "_lock")
+
+    def __init__(self, name: str, steps: EffectSteps):
+        self.name = name
+        self._steps = steps
+        self.cancelled = False
+        self._done = threading.Event()
+        self._callbacks: Optional[List[Callable[["Effect"], None]]] = []  # None once done
+        self._lock = threading.Lock()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def cancel(self):
+        """Stops before the next step; the generator's finally block still runs."""
+        self.cancelled = True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def add_done_callback(self, callback: Callable[["Effect"], None]):
+        """callback(effect) once the effect finished or was cancelled; right away if it already has."""
+        with self._lock:
+            if self._callbacks is not None:
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _set_done(self):
+        """Run the done callbacks (also ones added meanwhile), then report done."""
+        while True:
+            with self._lock:
+                callbacks = self._callbacks
+                if not callbacks:
+                    # done and wait() only see completion once every callback ran
+                    self._callbacks = None
+                    self._done.set()
+                    return
+                self._callbacks = []
+            for callback in callbacks:
+                try:
+                    callback(self)
+                except Exception as e:
+                    log_error(f"Effect {self.name} done callback failed: {e}", "EFFECTS")
+
+    def __repr__(self):
+        return f"Effect({self.name!r}, done={self.done})"
+
+
+class EffectRuntime:
+    """One shared thread stepping every thread-driven effect."""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Effect]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = set()
+        self._stopping = False
+        self.steps = 0
+
+    # ========== PUBLIC API ==========
+
+    def spawn(self, steps: EffectSteps, name: str = "effect", qt: bool = False) -> Effect:
+        """
+        Start an effect. The first step runs on the runtime thread (or on the
+        Qt event loop with qt=True) as soon as possible, never on the caller.
+        """
+        return self.start(Effect(name, steps), qt)
+
+    def start(self, effect: Effect, qt: bool = False) -> Effect:
+        """spawn() for an Effect built by the caller (handed out before it starts)."""
+        with self._cond:
+            self._running.add(effect)
+        if qt and self._qt_available():
+            QTimer.singleShot(0, lambda: self._qt_step(effect))
+            return effect
+        self._schedule(effect, time.perf_counter())
+        return effect
+
+    def call_later(self, delay: float, callback: Callable[[], None], name: str = "call_later") -> Effect:
+        """One-shot timer on the runtime thread."""
+        def steps():
+            yield delay
+            callback()
+        return self.spawn(steps(), name)
+
+    def active(self) -> int:
+        with self._cond:
+            return len(self._running)
+
+    def cancel_all(self):
+        with self._cond:
+            for effect in self._running:
+                effect.cancel()
+            self._cond.notify()
+
+    def stop(self, timeout: float = 1.0):
+        """Cancel every effect (running their cleanup) and stop the thread."""
+        with self._cond:
+            pending = [entry[2] for entry in self._heap]
+            self._heap.clear()
+            self._stopping = True
+            self._cond.notify()
+        for effect in pending:
+            self._finish(effect, cancel=True)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._cond:
+            self._stopping = False
+
+    # ========== THREAD DRIVER ==========
+
+    def _schedule(self, effect: Effect, at: float):
+        with self._cond:
+            if self._stopping:
+                stopping = True
+            else:
+                stopping = False
+                heapq.heappush(self._heap, (at, next(self._seq), effect))
+                self._cond.notify()
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name="EffectRuntime", daemon=True)
+                    self._thread.start()
+        if stopping:
+            self._finish(effect, cancel=True)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    if not self._heap:
+                        self._cond.wait()  # Woken by spawn(); no idle polling
+                        continue
+                    at = self._heap[0][0]
+                    delay = at - time.perf_counter()
+                    if delay <= 0:
+                        effect = heapq.heappop(self._heap)[2]
+                        break
+                    self._cond.wait(delay)
+            delay = self._advance(effect)
+            if delay is not None:
+                self._schedule(effect, time.perf_counter() + delay)
+
+    def _advance(self, effect: Effect) -> Optional[float]:
+        """Run one step. Returns the delay to the next step, None when finished."""
+        if effect.cancelled:
+            self._finish(effect, cancel=True)
+            return None
+        try:
+            delay = next(effect._steps)
+        except StopIteration:
+            self._finish(effect)
+            return None
+        except Exception as e:
+            log_error(f"Effect {effect.name} failed: {e}", "EFFECTS")
+            self._finish(effect)
+            return None
+        self.steps += 1
+        return max(0.0, delay or 0.0)
+
+    def _finish(self, effect: Effect, cancel: bool = False):
+        if cancel:
+            try:
+                effect._steps.close()  # Runs the effect's finally cleanup
+            except Exception as e:
+                log_error(f"Effect {effect.name} cleanup failed: {e}", "EFFECTS")
+        with self._cond:
+            self._running.discard(effect)
+        effect._set_done()
+
+    # ========== QT DRIVER ==========
+
+    @staticmethod
+    def _qt_available() -> bool:
+        if not HAS_QT:
+            return False
+        app = QApplication.instance()
+        # QTimer needs the thread that owns the event loop
+        return app is not None and QThread.currentThread() == app.thread()
+
+    def _qt_step(self, effect: Effect):
+        delay = self._advance(effect)
+        if delay is not None:
+            QTimer.singleShot(int(delay * 1000), lambda: self._qt_step(effect))
+
+
+_runtime: Optional[EffectRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_effect_runtime() -> EffectRuntime:
+    """Shared effect runtime."""
+    global _runtime
+    if _runtime is None:
+        with _runtime_lock:
+            if _runtime is None:
+                _runtime = EffectRuntime()
+                log_info("Effect runtime ready", "EFFECTS")
+    return _runtime
@@ -5,17 +5,255 @@
 # ARCHITECT: MAB-SENTIENT-2026
 # =========================================================================
 
-from typing import Dict, Any, Callable, List
+from collections import deque
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
 import threading
+import time
+import weakref
+
+from core.event_metrics import EventMetrics, EventRecorder
+from core.event_rate import RateLimiter, THROTTLE, DEBOUNCE, COALESCE
+
+# Delivery modes
+SYNC = "sync"      # Publisher's thread, inside publish() (default)
+WORKER = "worker"  # Bus worker thread, through the topic queue
+QT = "qt"          # Qt main thread, through the topic queue
+
+# Priority lanes (lower drains first)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+# Drop policies for bounded topic queues
+DROP_OLDEST = "oldest"
+DROP_NEWEST = "newest"
+
+
+def _callback_key(callback: Callable):
+    """Identity of a callback; bound methods compare by (owner, function)."""
+    owner = getattr(callback, "__self__", None)
+    func = getattr(callback, "__func__", None)
+    if owner is not None and func is not None:
+        return ("method", id(owner), func)
+    try:
+        hash(callback)
+        return callback
+    except TypeError:
+        return ("id", id(callback))
+
+
+class Subscription:
+    """
+    Handle returned by EventBus.subscribe().
+    handle.unsubscribe() / bus.unsubscribe(handle) removes it in O(1).
+    Weak subscriptions die with their owner (or when a QObject is destroyed).
+    """
+    __slots__ = ("topic", "delivery", "key", "seq", "active", "_callback", "_ref", "_bus", "__weakref__")
+
+    def __init__(self, bus: "EventBus", topic: str, callback: Callable, delivery: str, weak: bool, seq: int):
+        self._bus = bus
+        self.topic = topic
+        self.delivery = delivery
+        self.key = _callback_key(callback)
+        self.seq = seq
+        self.active = True
+        self._callback = None
+        self._ref = None
+        if weak:
+            if getattr(callback, "__self__", None) is not None and hasattr(callback, "__func__"):
+                self._ref = weakref.WeakMethod(callback, self._on_dead)
+                self._watch_qt_owner(callback.__self__)
+            else:
+                self._ref = weakref.ref(callback, self._on_dead)
+        else:
+            self._callback = callback
+
+    @property
+    def callback(self) -> Optional[Callable]:
+        if self._ref is None:
+            return self._callback
+        return self._ref()
+
+    def unsubscribe(self):
+        if self.active:
+            self._bus.unsubscribe(self)
+
+    def _on_dead(self, _ref=None):
+        # May run inside GC on any thread: only flag it, the bus prunes later
+        if self.active:
+            self.active = False
+            self._bus._dead.append(self)
+
+    def _watch_qt_owner(self, owner):
+        """A deleted QObject can outlive its Python wrapper; stop on destroyed()."""
+        destroyed = getattr(owner, "destroyed", None)
+        if destroyed is None or not hasattr(destroyed, "connect"):
+            return
+        this = weakref.ref(self)
+        try:
+            destroyed.connect(lambda *_: this() and this()._on_dead())
+        except Exception:
+            pass
+
+
+class _TrieNode:
+    __slots__ = ("children", "subs")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.subs: Dict[Any, Subscription] = {}
+
+
+class _TopicPolicy:
+    __slots__ = ("priority", "maxsize", "drop")
+
+    def __init__(self, priority: int = PRIORITY_NORMAL, maxsize: int = 256, drop: str = DROP_OLDEST):
+        self.priority = priority
+        self.maxsize = maxsize
+        self.drop = drop
+
+
+class _DeliveryQueue:
+    """
+    Per-topic bounded queues drained in priority-lane order.
+    Topics in the high lane are always drained before normal ones;
+    inside a lane topics are served round-robin.
+    """
+
+    def __init__(self, bus: "EventBus", mode: str):
+        self._bus = bus
+        self.mode = mode
+        self._topics: Dict[str, deque] = {}
+        self._lanes = {PRIORITY_HIGH: deque(), PRIORITY_NORMAL: deque()}
+        self._cond = threading.Condition()
+        self._unfinished = 0
+        self.dropped = 0
+
+    def put(self, event_name: str, subscribers: List[Subscription], data: Any) -> bool:
+        policy = self._bus._policy(event_name)
+        with self._cond:
+            pending = self._topics.get(event_name)
+            if pending is None:
+                pending = self._topics[event_name] = deque()
+            if len(pending) >= policy.maxsize:
+                self.dropped += 1
+                if policy.drop == DROP_NEWEST:
+                    return False
+                pending.popleft()  # Topic is already scheduled in its lane
+                self._unfinished -= 1
+            elif not pending:
+                self._lanes[policy.priority].append(event_name)
+            pending.append((subscribers, data))
+            self._unfinished += 1
+            self._cond.notify()
+        return True
+
+    def _next(self):
+        """Pop the next (event, subscribers, data) or None. Caller holds the lock."""
+        for lane in (PRIORITY_HIGH, PRIORITY_NORMAL):
+            topics = self._lanes[lane]
+            if topics:
+                event_name = topics.popleft()
+                pending = self._topics[event_name]
+                subscribers, data = pending.popleft()
+                if pending:
+                    topics.append(event_name)  # Round-robin within the lane
+                return event_name, subscribers, data
+        return None
+
+    def wait_next(self, stop: threading.Event, timeout: float = 0.5):
+        with self._cond:
+            item = self._next()
+            while item is None and not stop.is_set():
+                self._cond.wait(timeout)
+                item = self._next()
+            return item
+
+    def drain(self, limit: Optional[int] = None) -> int:
+        """Deliver queued events on the calling thread."""
+        delivered = 0
+        while limit is None or delivered < limit:
+            with self._cond:
+                item = self._next()
+            if item is None:
+                break
+            try:
+                self._bus._deliver_queued(*item)
+            finally:
+                self.task_done()
+            delivered += 1
+        return delivered
+
+    def task_done(self):
+        with self._cond:
+            self._unfinished -= 1
+            self._cond.notify_all()
+
+    def join(self, timeout: float) -> bool:
+        """Wait until every queued event was delivered (or dropped)."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._unfinished <= 0, timeout)
+
+    def pending(self) -> int:
+        with self._cond:
+            return sum(len(p) for p in self._topics.values())
+
+    def wake(self):
+        with self._cond:
+            self._cond.notify_all()
+
+
+class _QtBridge:
+    """Signals the Qt main thread to drain the QT delivery queue."""
+
+    def __init__(self, queue: _DeliveryQueue):
+        from PyQt6.QtCore import QObject, pyqtSignal, QCoreApplication
+
+        class _Relay(QObject):
+            wake = pyqtSignal()
+
+        self._queue = queue
+        self._scheduled = threading.Event()
+        self._relay = _Relay()
+        self._relay.moveToThread(QCoreApplication.instance().thread())
+        self._relay.wake.connect(self._on_wake)
+
+    def schedule(self):
+        if not self._scheduled.is_set():
+            self._scheduled.set()
+            self._relay.wake.emit()
+
+    def _on_wake(self):
+        self._scheduled.clear()
+        self._queue.drain()
+
 
 class EventBus:
     """
     The Nervous System of Sentient OS.
     Pure Python implementation to avoid QApplication initialization issues.
+
+    Delivery:
+    - SYNC (default): callbacks run inside publish(), on the publisher's thread
+    - WORKER: queued per topic, delivered by the bus worker thread
+    - QT: queued per topic, delivered on the Qt main thread
+      (falls back to WORKER when no QApplication exists)
+
+    Queued topics are bounded (drop policy per topic) and safety topics
+    such as system.shutdown ride the high-priority lane.
+
+    Topics:
+    - Exact names: "window.focus_changed"
+    - "window.*" matches one segment, "system.**" any number of segments
+    - "*" alone is the legacy catch-all; it receives {"event", "data"}
+    Patterns live in a prefix trie and the subscriber list of each concrete
+    topic is cached until the next subscribe/unsubscribe.
     """
     _instance = None
     _lock = threading.Lock()
 
+    # Topic prefixes that always use the high-priority lane
+    HIGH_PRIORITY_PREFIXES = ("system.shutdown", "system.panic", "safety.")
+
     def __new__(cls):
         with cls._lock:
             if cls._instance is None:
@@ -25,39 +263,353 @@ class EventBus:
 
     def __init__(self):
         if not self._initialized:
-            self._subscribers: Dict[str, List[Callable]] = {}
+            self._root = _TrieNode()
+            self._wildcards: Dict[Any, Subscription] = {}
+            self._resolved: Dict[str, Tuple[Subscription, ...]] = {}
+            self._wildcard_cache: Optional[Tuple[Subscription, ...]] = None
+            self._dead: List[Subscription] = []
+            self._seq = 0
+            self._policies: Dict[str, _TopicPolicy] = {}
+            self.default_delivery = SYNC
+            self._queues = {WORKER: _DeliveryQueue(self, WORKER), QT: _DeliveryQueue(self, QT)}
+            self._qt_bridge = None
+            self._worker = None
+            self._worker_stop = threading.Event()
+            self.metrics = EventMetrics()
+            self._rates = RateLimiter(self._publish_now, self.metrics.record_suppressed)
+            self._recorder: Optional[EventRecorder] = None
             self._initialized = True
             print("[EVENT_BUS] Nervous System Online (Pure Python).")
 
+    # ========== CONFIGURATION ==========
+
+    def configure_topic(self, event_name: str, priority: Optional[int] = None,
+                        maxsize: Optional[int] = None, drop: Optional[str] = None):
+        """Set lane / queue bound / drop policy for a queued topic."""
+        with self._lock:
+            policy = self._policies.get(event_name) or _TopicPolicy(self._default_priority(event_name))
+            if priority is not None:
+                policy.priority = priority
+            if maxsize is not None:
+                policy.maxsize = max(1, maxsize)
+            if drop is not None:
+                policy.drop = drop
+            self._policies[event_name] = policy
+
+    def _default_priority(self, event_name: str) -> int:
+        if event_name.startswith(self.HIGH_PRIORITY_PREFIXES):
+            return PRIORITY_HIGH
+        return PRIORITY_NORMAL
+
+    def _policy(self, event_name: str) -> _TopicPolicy:
+        policy = self._policies.get(event_name)
+        if policy is None:
+            with self._lock:
+                policy = self._policies.setdefault(event_name, _TopicPolicy(self._default_priority(event_name)))
+        return policy
+
+    # ========== PUB / SUB ==========
+
     def publish(self, event_name: str, data: Dict[str, Any] = None):
         """Broadcast an event to all subscribers."""
         data = data or {}
         # print(f"[EVENT_BUS] Publishing: {event_name}")
-        
-        # Defensive copy of subscribers to avoid issues if a callback subscribes/unsubscribes
+        if self._dead:
+            self._prune()
+        if self.metrics.enabled:
+            self.metrics.record_publish(event_name)
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.record(event_name, data)
+        # Debounce/throttle/coalesce: held events are delivered later with the latest payload
+        if self._rates.has_policies() and not self._rates.admit(event_name, data):
+            return
+        self._publish_now(event_name, data)
+
+    def _publish_now(self, event_name: str, data: Any):
+        """Delivery half of publish() (also the trailing edge of rate policies)."""
+        # Cached, immutable tuples: safe even if a callback subscribes/unsubscribes
+        subscribers = self._resolve(event_name)
+        wildcards = self._wildcard_list()
+
+        direct = [s for s in subscribers if s.delivery == SYNC]
+        direct_wild = [s for s in wildcards if s.delivery == SYNC]
+        if len(direct) != len(subscribers) or len(direct_wild) != len(wildcards):
+            self._enqueue(event_name, subscribers, wildcards, data)
+
+        self._deliver(event_name, direct, data)
+        self._deliver_wildcards(event_name, direct_wild, data)
+
+    def subscribe(self, event_name: str, callback: Callable[[Dict[str, Any]], None],
+                  delivery: Optional[str] = None, weak: bool = False) -> Subscription:
+        """
+        Subscribe to a topic or pattern. Returns a handle for unsubscribe().
+        Subscribing the same callback twice returns the existing handle.
+        weak=True holds the callback (or its bound owner) by weak reference.
+        """
+        delivery = delivery or self.default_delivery
+        key = _callback_key(callback)
         with self._lock:
-            callbacks = self._subscribers.get(event_name, []).copy()
-            wildcards = self._subscribers.get("*", []).copy()
+            bucket = self._wildcards if event_name == "*" else self._node(event_name, create=True).subs
+            existing = bucket.get(key)
+            if existing is not None and existing.active:
+                return existing
+            self._seq += 1
+            sub = Subscription(self, event_name, callback, delivery, weak, self._seq)
+            bucket[key] = sub
+            self._invalidate()
+        return sub
 
-        for callback in callbacks:
-            try:
-                callback(data)
-            except Exception as e:
-                print(f"[EVENT_BUS] Error in callback for {event_name}: {e}")
-                
-        for callback in wildcards:
+    def unsubscribe(self, target: Union[Subscription, str], callback: Optional[Callable] = None) -> int:
+        """
+        Remove a subscription by handle, or every subscriber of a topic
+        pattern (optionally only `callback`). Returns the number removed.
+        """
+        with self._lock:
+            if isinstance(target, Subscription):
+                removed = self._remove(target.topic, target.key, target)
+            else:
+                removed = self._remove_topic(target, callback)
+            if removed:
+                self._invalidate()
+        return removed
+
+    def set_rate_policy(self, event_name: str, mode: Optional[str], interval: float = 0.0, max_events: int = 1):
+        """
+        Bound delivery of a busy topic: THROTTLE / DEBOUNCE / COALESCE
+        (see core.event_rate). mode=None removes the policy.
+        Subscribers always get the latest payload; trailing deliveries run on
+        the bus timer thread.
+        """
+        self._rates.set_policy(event_name, mode, interval, max_events)
+
+    # ========== TOPIC TRIE ==========
+
+    def _node(self, pattern: str, create: bool = False) -> Optional[_TrieNode]:
+        node = self._root
+        for segment in pattern.split("."):
+            child = node.children.get(segment)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[segment] = _TrieNode()
+            node = child
+        return node
+
+    def _bucket(self, pattern: str) -> Optional[Dict[Any, Subscription]]:
+        if pattern == "*":
+            return self._wildcards
+        node = self._node(pattern)
+        return node.subs if node is not None else None
+
+    def _remove(self, pattern: str, key: Any, expected: Optional[Subscription] = None) -> int:
+        bucket = self._bucket(pattern)
+        if not bucket:
+            return 0
+        sub = bucket.get(key)
+        if sub is None or (expected is not None and sub is not expected):
+            return 0
+        del bucket[key]
+        sub.active = False
+        return 1
+
+    def _remove_topic(self, pattern: str, callback: Optional[Callable]) -> int:
+        if callback is not None:
+            return self._remove(pattern, _callback_key(callback))
+        bucket = self._bucket(pattern)
+        if not bucket:
+            return 0
+        for sub in bucket.values():
+            sub.active = False
+        removed = len(bucket)
+        bucket.clear()
+        return removed
+
+    def _prune(self):
+        """Drop subscriptions whose weak owner died."""
+        with self._lock:
+            dead, self._dead = self._dead, []
+            for sub in dead:
+                self._remove(sub.topic, sub.key, sub)
+            self._invalidate()
+
+    def _resolve(self, event_name: str) -> Tuple[Subscription, ...]:
+        """Subscribers matching a concrete topic, cached per topic."""
+        cached = self._resolved.get(event_name)
+        if cached is not None:
+            return cached
+        with self._lock:
+            found: Dict[int, Subscription] = {}
+            self._match(self._root, event_name.split("."), 0, found)
+            result = tuple(sorted(found.values(), key=lambda s: s.seq))  # Subscription order
+            if len(self._resolved) > 4096:
+                self._resolved.clear()
+            self._resolved[event_name] = result
+        return result
+
+    def _match(self, node: _TrieNode, segments: List[str], i: int, found: Dict[int, Subscription]):
+        if i == len(segments):
+            for sub in node.subs.values():
+                found[sub.seq] = sub
+            tail = node.children.get("**")
+            if tail is not None:
+                self._match(tail, segments, i, found)  # '**' also matches zero segments
+            return
+        child = node.children.get(segments[i])
+        if child is not None:
+            self._match(child, segments, i + 1, found)
+        star = node.children.get("*")
+        if star is not None:
+            self._match(star, segments, i + 1, found)
+        tail = node.children.get("**")
+        if tail is not None:
+            for j in range(i, len(segments) + 1):
+                self._match(tail, segments, j, found)
+
+    def _wildcard_list(self) -> Tuple[Subscription, ...]:
+        cached = self._wildcard_cache
+        if cached is None:
+            with self._lock:
+                cached = self._wildcard_cache = tuple(self._wildcards.values())
+        return cached
+
+    def _invalidate(self):
+        """Caller holds the lock."""
+        self._resolved.clear()
+        self._wildcard_cache = None
+
+    # ========== DELIVERY ==========
+
+    def _deliver(self, event_name: str, subscribers: List[Subscription], data: Any):
+        for sub in subscribers:
+            self._invoke(event_name, sub, data, "callback")
+
+    def _deliver_wildcards(self, event_name: str, subscribers: List[Subscription], data: Any):
+        if not subscribers:
+            return
+        envelope = {"event": event_name, "data": data}
+        for sub in subscribers:
+            self._invoke(event_name, sub, envelope, "wildcard callback")
+
+    def _invoke(self, event_name: str, sub: Subscription, payload: Any, kind: str):
+        callback = sub.callback
+        if callback is None or not sub.active:
+            return  # Unsubscribed or owner collected since resolution
+        if not self.metrics.enabled:
             try:
-                callback({"event": event_name, "data": data})
+                callback(payload)
             except Exception as e:
-                print(f"[EVENT_BUS] Error in wildcard callback: {e}")
+                print(f"[EVENT_BUS] Error in {kind} for {event_name}: {e}")
+            return
+
+        failed = False
+        start = time.perf_counter()
+        try:
+            callback(payload)
+        except Exception as e:
+            failed = True
+            print(f"[EVENT_BUS] Error in {kind} for {event_name}: {e}")
+        self.metrics.record_callback(event_name, callback, time.perf_counter() - start, failed)
+
+    def _deliver_queued(self, event_name: str, item, data: Any):
+        subscribers, wildcards = item
+        self._deliver(event_name, subscribers, data)
+        self._deliver_wildcards(event_name, wildcards, data)
 
-    def subscribe(self, event_name: str, callback: Callable[[Dict[str, Any]], None]):
-        """Subscribe to a specific event."""
+    def _enqueue(self, event_name: str, subscribers: List[Subscription], wildcards: List[Subscription], data: Any):
+        qt_mode = QT if self._ensure_qt_bridge() else WORKER
+        groups: Dict[str, tuple] = {}
+        for sub in subscribers:
+            if sub.delivery != SYNC:
+                mode = qt_mode if sub.delivery == QT else WORKER
+                groups.setdefault(mode, ([], []))[0].append(sub)
+        for sub in wildcards:
+            if sub.delivery != SYNC:
+                mode = qt_mode if sub.delivery == QT else WORKER
+                groups.setdefault(mode, ([], []))[1].append(sub)
+
+        for mode, item in groups.items():
+            self._queues[mode].put(event_name, item, data)
+            if mode == QT:
+                self._qt_bridge.schedule()
+            else:
+                self._ensure_worker()
+
+    def _ensure_qt_bridge(self) -> bool:
+        if self._qt_bridge is not None:
+            return True
+        try:
+            from PyQt6.QtCore import QCoreApplication
+            if QCoreApplication.instance() is None:
+                return False
+            with self._lock:
+                if self._qt_bridge is None:
+                    self._qt_bridge = _QtBridge(self._queues[QT])
+            return True
+        except ImportError:
+            return False
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
         with self._lock:
-            if event_name not in self._subscribers:
-                self._subscribers[event_name] = []
-            if callback not in self._subscribers[event_name]:
-                self._subscribers[event_name].append(callback)
+            if self._worker is None or not self._worker.is_alive():
+                self._worker_stop.clear()
+                self._worker = threading.Thread(target=self._worker_loop, name="EventBusWorker", daemon=True)
+                self._worker.start()
+
+    def _worker_loop(self):
+        queue = self._queues[WORKER]
+        while not self._worker_stop.is_set():
+            item = queue.wait_next(self._worker_stop)
+            if item is None:
+                continue
+            try:
+                self._deliver_queued(*item)
+            finally:
+                queue.task_done()
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """
+        Deliver everything queued so far. QT queue is drained on the caller
+        when no bridge exists; WORKER queue is waited on. Used by tests/shutdown.
+        """
+        self._rates.flush()
+        if self._qt_bridge is None:
+            self._queues[QT].drain()
+        return self._queues[WORKER].join(timeout)
+
+    def stop(self):
+        """Stop the worker/timer threads (restarted lazily on the next queued publish)."""
+        self._rates.flush()
+        self._rates.stop()
+        self._worker_stop.set()
+        self._queues[WORKER].wake()
+        if self._worker is not None:
+            self._worker.join(timeout=1.0)
+            self._worker = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depths/drops plus per-topic metrics."""
+        result = {mode: {"pending": q.pending(), "dropped": q.dropped} for mode, q in self._queues.items()}
+        result.update(self.metrics.snapshot())
+        return result
+
+    # ========== RECORDING ==========
+
+    def start_recording(self, path: str):
+        """Write every published event to a JSONL trace (see core.event_metrics.replay_trace)."""
+        self.stop_recording()
+        self._recorder = EventRecorder(path)
+        print(f"[EVENT_BUS] Recording events to {path}")
+
+    def stop_recording(self) -> int:
+        """Close the trace; returns the number of recorded events."""
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return 0
+        recorder.close()
+        return recorder.count
 
 # Global singleton instance
 bus = EventBus()
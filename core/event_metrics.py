@@ -0,0 +1,201 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Event Metrics - EventBus instrumentation, trace recorder and replay.
+
+- EventMetrics: per-topic publish counts/rates, callback time histograms,
+  exception counts and the slowest callbacks seen
+- EventRecorder: JSONL trace of every published event ({"t", "topic", "data"})
+- replay_trace: publishes a recorded trace again, headless and optionally
+  accelerated, so reactive subsystems can be profiled without a live session
+"""
+
+import heapq
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Callback duration histogram bucket upper bounds (ms); last bucket is overflow
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0)
+
+
+def _callback_name(callback: Callable) -> str:
+    name = getattr(callback, "__qualname__", None) or getattr(callback, "__name__", None)
+    if name is None:
+        name = type(callback).__name__
+    module = getattr(callback, "__module__", None)
+    return f"{module}.{name}" if module else name
+
+
+class TopicStats:
+    """Counters for one topic."""
+    __slots__ = ("published", "suppressed", "delivered", "errors", "first_ts", "last_ts", "total_s", "histogram")
+
+    def __init__(self):
+        self.published = 0
+        self.suppressed = 0
+        self.delivered = 0
+        self.errors = 0
+        self.first_ts = 0.0
+        self.last_ts = 0.0
+        self.total_s = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def rate(self) -> float:
+        """Average publishes per second since the first publish."""
+        span = self.last_ts - self.first_ts
+        return self.published / span if span > 0 else float(self.published)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "published": self.published,
+            "rate_per_s": round(self.rate(), 2),
+            "suppressed": self.suppressed,
+            "delivered": self.delivered,
+            "errors": self.errors,
+            "avg_callback_ms": round(self.total_s * 1000 / self.delivered, 4) if self.delivered else 0.0,
+            "histogram_ms": dict(zip([f"<={b}" for b in HISTOGRAM_BOUNDS_MS] + ["inf"], self.histogram)),
+        }
+
+
+class EventMetrics:
+    """Thread-safe per-topic counters. Cheap enough to leave on."""
+
+    def __init__(self, slowest_limit: int = 10):
+        self.enabled = True
+        self._topics: Dict[str, TopicStats] = {}
+        # callback name -> (worst seconds, topic)
+        self._worst: Dict[str, Tuple[float, str]] = {}
+        self._slowest_limit = slowest_limit
+        self._lock = threading.Lock()
+
+    def _stats(self, topic: str) -> TopicStats:
+        stats = self._topics.get(topic)
+        if stats is None:
+            stats = self._topics.setdefault(topic, TopicStats())
+        return stats
+
+    def record_publish(self, topic: str):
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats(topic)
+            if not stats.published:
+                stats.first_ts = now
+            stats.published += 1
+            stats.last_ts = now
+
+    def record_suppressed(self, topic: str):
+        """Event held back by a debounce/throttle/coalesce policy."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._stats(topic).suppressed += 1
+
+    def record_callback(self, topic: str, callback: Callable, seconds: float, failed: bool = False):
+        ms = seconds * 1000
+        bucket = len(HISTOGRAM_BOUNDS_MS)
+        for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if ms <= bound:
+                bucket = i
+                break
+        with self._lock:
+            stats = self._stats(topic)
+            stats.delivered += 1
+            stats.total_s += seconds
+            stats.histogram[bucket] += 1
+            if failed:
+                stats.errors += 1
+            name = _callback_name(callback)
+            worst = self._worst.get(name)
+            if worst is None or seconds > worst[0]:
+                self._worst[name] = (seconds, topic)
+
+    def slowest(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = list(self._worst.items())
+        top = heapq.nlargest(limit or self._slowest_limit, items, key=lambda kv: kv[1][0])
+        return [{"callback": name, "topic": topic, "max_ms": round(sec * 1000, 3)} for name, (sec, topic) in top]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            topics = {topic: stats.to_dict() for topic, stats in self._topics.items()}
+        return {"topics": topics, "slowest_callbacks": self.slowest()}
+
+    def reset(self):
+        with self._lock:
+            self._topics.clear()
+            self._worst.clear()
+
+
+class EventRecorder:
+    """Appends every published event to a JSONL trace."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, topic: str, data: Any):
+        line = json.dumps({"t": round(time.monotonic() - self._start, 6), "topic": topic, "data": data},
+                          ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_trace(path: str) -> Iterable[Tuple[float, str, Any]]:
+    """(t, topic, data) tuples from a recorded trace."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            yield entry.get("t", 0.0), entry["topic"], entry.get("data")
+
+
+def replay_trace(path: str, bus=None, speed: float = 0.0, topics: Optional[Iterable[str]] = None) -> int:
+    """
+    Publish a recorded trace again.
+
+    Args:
+        speed: 1.0 = real time, 10.0 = ten times faster, 0 = no waiting at all
+        topics: only replay these topics (None = all)
+
+    Returns:
+        Number of events published
+    """
+    if bus is None:
+        from core.event_bus import bus
+    wanted = set(topics) if topics else None
+    start = time.monotonic()
+    count = 0
+    for t, topic, data in read_trace(path):
+        if wanted is not None and topic not in wanted:
+            continue
+        if speed > 0:
+            delay = t / speed - (time.monotonic() - start)
+            if delay > 0:
+                time.sleep(delay)
+        bus.publish(topic, data)
+        count += 1
+    return count
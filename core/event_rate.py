@@ -0,0 +1,196 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Event Rate Policies - Debounce / throttle / coalesce for busy topics.
+
+PresenceSensor and WindowSensor can publish far more often than the
+subscribers need. A policy on a topic bounds delivery while always
+keeping the latest payload:
+
+- THROTTLE: at most `max_events` deliveries per `interval`; the latest
+  suppressed payload is delivered when the window closes (trailing edge)
+- DEBOUNCE: deliver only after `interval` seconds without a new event
+- COALESCE: collect a burst for `interval` seconds, deliver the latest once
+
+Trailing deliveries run on one shared timer thread.
+"""
+
+import heapq
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+THROTTLE = "throttle"
+DEBOUNCE = "debounce"
+COALESCE = "coalesce"
+
+_MODES = (THROTTLE, DEBOUNCE, COALESCE)
+
+
+class RatePolicy:
+    """Per-topic state machine. admit() says whether to deliver right now."""
+    __slots__ = ("mode", "interval", "max_events", "_window_start", "_count", "_pending",
+                 "_has_pending", "_deadline", "_scheduled", "_lock")
+
+    def __init__(self, mode: str, interval: float, max_events: int = 1):
+        if mode not in _MODES:
+            raise ValueError(f"Unknown rate policy mode: {mode}")
+        self.mode = mode
+        self.interval = max(0.0, float(interval))
+        self.max_events = max(1, int(max_events))
+        self._window_start = float("-inf")
+        self._count = 0
+        self._pending: Any = None
+        self._has_pending = False
+        self._deadline = 0.0
+        self._scheduled = False
+        self._lock = threading.Lock()
+
+    def admit(self, data: Any, now: float) -> Tuple[bool, Optional[float]]:
+        """
+        Returns (deliver_now, schedule_at). schedule_at is set when the
+        caller must arm a trailing timer for this topic.
+        """
+        with self._lock:
+            if self.mode == THROTTLE:
+                if now - self._window_start >= self.interval:
+                    self._window_start = now
+                    self._count = 0
+                if self._count < self.max_events and not self._has_pending:
+                    self._count += 1
+                    return True, None
+                self._deadline = self._window_start + self.interval
+            elif self.mode == DEBOUNCE:
+                self._deadline = now + self.interval
+            else:  # COALESCE
+                if not self._has_pending:
+                    self._deadline = now + self.interval
+
+            self._pending = data
+            self._has_pending = True
+            if self._scheduled:
+                return False, None
+            self._scheduled = True
+            return False, self._deadline
+
+    def fire(self, now: float, force: bool = False) -> Tuple[bool, Any, Optional[float]]:
+        """
+        Timer callback. Returns (deliver, data, reschedule_at).
+        """
+        with self._lock:
+            if not self._has_pending:
+                self._scheduled = False
+                return False, None, None
+            if not force and now < self._deadline:
+                return False, None, self._deadline  # Debounce was pushed back
+            data = self._pending
+            self._pending = None
+            self._has_pending = False
+            self._scheduled = False
+            if self.mode == THROTTLE:
+                # The trailing delivery opens the next window
+                self._window_start = now
+                self._count = 1
+            return True, data, None
+
+
+class RateLimiter:
+    """Holds the per-topic policies and the shared trailing-edge timer."""
+
+    def __init__(self, deliver: Callable[[str, Any], None], on_suppressed: Optional[Callable[[str], None]] = None):
+        self._deliver = deliver
+        self._on_suppressed = on_suppressed
+        self._policies: Dict[str, RatePolicy] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # ========== CONFIG ==========
+
+    def set_policy(self, topic: str, mode: Optional[str], interval: float = 0.0, max_events: int = 1):
+        """mode=None removes the policy (pending payload is delivered first)."""
+        if mode is None:
+            policy = self._policies.pop(topic, None)
+            if policy is not None:
+                self._fire(topic, policy, force=True)
+            return
+        self._policies[topic] = RatePolicy(mode, interval, max_events)
+
+    def policy(self, topic: str) -> Optional[RatePolicy]:
+        return self._policies.get(topic)
+
+    def has_policies(self) -> bool:
+        return bool(self._policies)
+
+    # ========== ADMISSION ==========
+
+    def admit(self, topic: str, data: Any) -> bool:
+        """True if the event should be delivered now."""
+        policy = self._policies.get(topic)
+        if policy is None:
+            return True
+        deliver, schedule_at = policy.admit(data, time.monotonic())
+        if not deliver:
+            if self._on_suppressed:
+                self._on_suppressed(topic)
+            if schedule_at is not None:
+                self._schedule(topic, schedule_at)
+        return deliver
+
+    def flush(self):
+        """Deliver every pending trailing payload now (tests/shutdown)."""
+        for topic, policy in list(self._policies.items()):
+            self._fire(topic, policy, force=True)
+
+    def stop(self):
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    # ========== TIMER ==========
+
+    def _schedule(self, topic: str, at: float):
+        with self._cond:
+            self._seq += 1
+            heapq.heappush(self._heap, (at, self._seq, topic))
+            self._cond.notify()
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="EventBusTimers", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._cond:
+                if not self._heap:
+                    self._cond.wait(0.5)
+                    continue
+                at, _, topic = self._heap[0]
+                delay = at - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._heap)
+            policy = self._policies.get(topic)
+            if policy is not None:
+                self._fire(topic, policy)
+
+    def _fire(self, topic: str, policy: RatePolicy, force: bool = False):
+        deliver, data, reschedule_at = policy.fire(time.monotonic(), force)
+        if reschedule_at is not None:
+            with self._cond:
+                self._seq += 1
+                heapq.heappush(self._heap, (reschedule_at, self._seq, topic))
+                self._cond.notify()
+        elif deliver:
+            self._deliver(topic, data)
@@ -18,9 +18,7 @@ SAFETY:
 - Respects privacy settings
 """
 
-import os
 from typing import List
-from pathlib import Path
 
 
 class FileSystemAwareness:
@@ -46,19 +44,8 @@ class FileSystemAwareness:
             List of folder names
         """
         try:
-            desktop = Path.home() / "Desktop"
-            
-            if not desktop.exists():
-                return []
-            
-            # List directories only
-            folders = [
-                item.name for item in desktop.iterdir()
-                if item.is_dir() and not item.name.startswith('.')
-            ]
-            
-            # Limit count
-            return folders[:max_count]
+            from core.desktop_index import DesktopIndex
+            return list(DesktopIndex.singleton().folders(DesktopIndex.DESKTOP)[:max_count])
             
         except Exception as e:
             print(f"[FILE_AWARENESS] Error reading desktop: {e}")
@@ -73,27 +60,12 @@ class FileSystemAwareness:
             max_count: Maximum files to return
             
         Returns:
-            List of file names (without extensions for privacy)
+            List of (name, score) tuples (names without extensions for privacy)
         """
         try:
-            desktop = Path.home() / "Desktop"
-            
-            if not desktop.exists():
-                return []
-            
-            # List files only
-            files = [
-                item.stem for item in desktop.iterdir()
-                if item.is_file() and not item.name.startswith('.')
-            ]
-            
-            # Score files instead of filtering them out
-            scored_files = []
-            for f in files:
-                score = FileSystemAwareness.score_file(f)
-                scored_files.append((f, score))
-            
-            return scored_files[:max_count]
+            # Scores are computed once per file when the index is (re)built
+            from core.desktop_index import DesktopIndex
+            return list(DesktopIndex.singleton().scored_files(DesktopIndex.DESKTOP)[:max_count])
             
         except Exception as e:
             print(f"[FILE_AWARENESS] Error reading files: {e}")
@@ -105,19 +77,9 @@ class FileSystemAwareness:
         Assigns a 'sensitivity score' based on keywords.
         0 = Normal, 100 = Extremely sensitive (passwords, etc).
         """
-        fn = filename.lower()
-        score = 0
-        
-        # High value keywords
-        critical = ['şifre', 'password', 'key', 'login', 'secret', 'gizli', 'hesap', 'bank', 'crypto']
-        important = ['özel', 'private', 'ailen', 'family', 'foto', 'video', 'nude', 'plan', 'vergi', 'tax']
-        personal = ['cv', 'resume', 'günlük', 'diary', 'not', 'note', 'ödev', 'homework']
-        
-        if any(w in fn for w in critical): score += 90
-        elif any(w in fn for w in important): score += 60
-        elif any(w in fn for w in personal): score += 30
-        
-        return score
+        # Shared engine: one precompiled keyword pass, memoized per name
+        from core.sensitivity import get_sensitivity_engine
+        return get_sensitivity_engine().score(filename)
 
     @staticmethod
     def get_context_for_ai() -> dict:
@@ -135,8 +97,9 @@ class FileSystemAwareness:
             from core.streamer_mode import StreamerMode
             sm = StreamerMode.singleton()
             
-            folders = [sm.get_alias(f) for f in FileSystemAwareness.get_desktop_folders()]
-            files = [(sm.get_alias(f), s) for f, s in FileSystemAwareness.get_desktop_file_names()]
+            folders = sm.mask_many(FileSystemAwareness.get_desktop_folders())
+            scored = FileSystemAwareness.get_desktop_file_names()
+            files = list(zip(sm.mask_many(f for f, _ in scored), (s for _, s in scored)))
             
             return {
                 "desktop_folders": folders,
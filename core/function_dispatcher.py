@@ -11,16 +11,29 @@ Function Dispatcher - Main action router
 REFACTORED: Now uses specialized dispatcher modules (visual, hardware, horror, system)
 instead of one massive switch statement.
 
-Original size: 355 lines
-New size: ~120 lines (70% reduction)
+Actions resolve once, at startup, to a handler from their dispatcher's
+handler table (core.action_registry); worker actions run through the
+ActionScheduler's priority and resource lanes on an elastic worker pool.
 """
+import itertools
 import json
+import os
 import time
 import threading
-import queue
-from dataclasses import dataclass, field
-from typing import Dict, Any
-from PyQt6.QtCore import QObject, pyqtSignal
+from typing import Dict, Any, Iterable, List, NamedTuple, Tuple
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from config import Config
+from core.action_scheduler import (
+    ActionScheduler, ActionTask,
+    SOURCE_TIMELINE, SOURCE_HEARTBEAT, SOURCE_CHAT, SOURCE_AMBIENT, SOURCE_SYSTEM,
+    current_source, dispatch_source,
+)
+from core.action_registry import (
+    ActionSpec, THREAD_MAIN, THREAD_CONTROLLER, build_action_registry, collect_action_specs,
+)
+from core.lazy_backend import LazyBackend, prewarm
+from core.dispatch_metrics import DispatchMetrics, MetricsExporter
+from core.effect_runtime import Effect, get_effect_runtime
 from core.process_guard import ProcessGuard
 from hardware.audio_out import AudioOut
 from visual.fake_ui import FakeUI
@@ -36,37 +49,83 @@ from core.exceptions import ValidationError, DispatchError
 from core.validators import validate_ai_response
 from core.logger import log_error, log_warning, log_info
 
-@dataclass(order=True)
-class ActionTask:
-    """Task item for the Priority Queue."""
-    priority: int
-    timestamp: float = field(compare=False)
-    action: str = field(compare=False)
-    params: Dict[str, Any] = field(compare=False, default_factory=dict)
-    speech: str = field(compare=False, default="")
+
+_DEFAULT_MIN_WORKERS = 5
+
+
+def _auto_max_workers() -> int:
+    """Effects mostly sleep, two workers per core stays cheap."""
+    return max(_DEFAULT_MIN_WORKERS, min(16, 2 * (os.cpu_count() or 4)))
+
+
+class WorkerPoolPolicy(NamedTuple):
+    """Elastic worker pool bounds (config.yaml `dispatcher:` section)."""
+    min_workers: int = _DEFAULT_MIN_WORKERS
+    max_workers: int = _auto_max_workers()
+    grow_wait_s: float = 0.25   # Grow when the oldest queued task waited longer
+    idle_shrink_s: float = 30.0  # Extra workers retire after this long without work
+    cpu_budget: float = 0.7      # Grow only below this share of ResourceGuard's CPU limit
+
+    @classmethod
+    def from_config(cls) -> "WorkerPoolPolicy":
+        config = Config()
+        defaults = cls._field_defaults
+        min_workers = max(1, int(config.get("DISPATCH_WORKERS_MIN", defaults["min_workers"])))
+        max_workers = int(config.get("DISPATCH_WORKERS_MAX", 0))
+        if max_workers <= 0:
+            max_workers = defaults["max_workers"]  # Auto
+        return cls(
+            min_workers=min_workers,
+            max_workers=max(min_workers, max_workers),
+            grow_wait_s=float(config.get("DISPATCH_GROW_WAIT_MS", defaults["grow_wait_s"] * 1000)) / 1000,
+            idle_shrink_s=float(config.get("DISPATCH_IDLE_SHRINK_S", defaults["idle_shrink_s"])),
+            cpu_budget=float(config.get("DISPATCH_CPU_BUDGET", defaults["cpu_budget"])),
+        )
+
 
 class FunctionDispatcher(QObject):
     """
-    Main dispatcher that routes actions to specialized dispatchers using a Priority Queue.
+    Main dispatcher that routes actions to specialized dispatchers using priority lanes.
     
     Architecture:
-    - Priority Queue: Ensures high-priority effects (Visuals) run before background tasks.
-    - Worker Pool: 5 worker threads consume tasks from the queue.
+    - ActionScheduler: One FIFO lane per priority; high-priority effects (Visuals)
+      run before background tasks, same-priority tasks run in queue order.
+    - Resource lanes: actions sharing a resource (screen, cursor, audio,
+      brightness, clipboard) run one at a time; duplicates merge or drop.
+    - Worker Pool: elastic, min..max worker threads block on the scheduler
+      (no polling). Grows while queued work waits too long and every worker
+      is busy, within ResourceGuard's CPU budget; extra workers retire
+      after an idle period.
+    - Action registry: priority, thread affinity and silent flag of every
+      action are resolved once at startup; dispatch is one dict lookup.
+    - Metrics: per-action wait/run times, failures and worker utilisation
+      (stats(), optional periodic JSON export to logs/).
     """
     
     # Signals for thread-safe handling
     chat_response_signal = pyqtSignal(dict, object)  # (response, chat_window)
     dispatch_signal = pyqtSignal(dict)              # (command_data) - Global dispatch router
+    sequence_signal = pyqtSignal(object)            # (Effect) - Prepared dispatch_sequence
     
     # Priority Levels (Lower number = Higher Priority)
+    PRIORITY_CONTROL = 0 # Shutdown sentinels
     PRIORITY_HIGH = 1    # Visual effects (latency sensitive)
     PRIORITY_MEDIUM = 2  # Audio/TTS (narrative critical)
     PRIORITY_LOW = 3     # System/File ops (background)
     
+    # Actions handled here (need brain / chat references), override the
+    # specialized dispatchers' declarations
+    CONTROLLER_ACTIONS = {
+        "NONE": ActionSpec(thread=THREAD_CONTROLLER),
+        "SHAKE_CHAT": ActionSpec(thread=THREAD_CONTROLLER),
+        "SET_PERSONA": ActionSpec(thread=THREAD_CONTROLLER),
+        "SET_MOOD": ActionSpec(thread=THREAD_CONTROLLER),
+    }
+    
     def __init__(self):
         super().__init__()
         self.process_guard = ProcessGuard()
-        self.audio_out = AudioOut()
+        self.audio_out = LazyBackend("audio_out", AudioOut)  # pyttsx3 init + voice scan on first use
         self.fake_ui = FakeUI()
         self._chat_thread = None
         
@@ -81,7 +140,9 @@ class FunctionDispatcher(QObject):
         self.heartbeat = None
         self.brain = None
         self.memory = None
+        self._context_view = None  # Lazy ContextView for chat logging
         self.difficulty = None
+        self.resource_guard = None  # Injected by the kernel; bounds pool growth
         self.last_ai_reply_time = 0
 
         # Inject dependencies into specialized dispatchers
@@ -94,58 +155,147 @@ class FunctionDispatcher(QObject):
         self.gdi = self.visual_dispatcher.gdi
         self.chat = self.fake_ui.chat
         
-        # Build action routing map
+        # Build action registry (declared specs are fixed at startup)
+        self._action_specs = collect_action_specs(self._dispatchers(), self.CONTROLLER_ACTIONS)
+        self._controller_handlers = {
+            "NONE": self._handle_none,
+            "SHAKE_CHAT": self._handle_shake_chat,
+            "SET_PERSONA": self._handle_set_persona,
+            "SET_MOOD": self._handle_set_mood,
+        }
         self._action_map = self._build_action_map()
         
-        # Priority Queue & Worker Pool
-        self._action_queue = queue.PriorityQueue()
+        # Priority lanes & Worker Pool
+        self.metrics = DispatchMetrics()
+        self._metrics_exporter = None
+        self._action_queue = ActionScheduler(lanes=self.PRIORITY_LOW + 1)
         self._workers = []
-        self._init_worker_pool(5)
+        self._pool_policy = WorkerPoolPolicy.from_config()
+        self._pool_lock = threading.Lock()
+        self._worker_ids = itertools.count()
+        self._elastic = False
+        self._pool_events = {"grown": 0, "retired": 0, "capped_by_cpu": 0}
+        self._init_worker_pool(self._pool_policy.min_workers)
         
         # Connect signals
         self.chat_response_signal.connect(self._process_chat_response)
         self.dispatch_signal.connect(self._do_dispatch)
+        self.sequence_signal.connect(self._start_sequence)
     
+    def backends(self):
+        """Lazy backends of this dispatcher and its specialized dispatchers."""
+        found = {}
+        for owner in [self] + self._dispatchers():
+            for value in vars(owner).values():
+                if isinstance(value, LazyBackend):
+                    found[id(value)] = value
+        return list(found.values())
+
+    def prewarm_backends(self, on_done=None):
+        """Build the backends no action has needed yet, off the critical path."""
+        prewarm(self.backends(), on_done)
+
     def _init_worker_pool(self, num_workers):
-        """Start worker threads to consume the action queue."""
-        for i in range(num_workers):
-            t = threading.Thread(target=self._worker_loop, name=f"ActionWorker-{i}", daemon=True)
-            self._workers.append(t)
-            t.start()
-            
+        """Start worker threads to consume the action queue (the pool's floor)."""
+        for _ in range(num_workers):
+            self._start_worker()
+        self._elastic = self._pool_policy.max_workers > num_workers
+
+    def _start_worker(self):
+        t = threading.Thread(target=self._worker_loop, name=f"ActionWorker-{next(self._worker_ids)}", daemon=True)
+        self._workers.append(t)
+        t.start()
+
+    def _maybe_grow_pool(self):
+        """
+        Add one worker when queued work has waited past the target and no
+        worker is free. Bounded by max_workers and ResourceGuard's CPU budget.
+        """
+        if not self._elastic or self._is_shutting_down:
+            return
+        policy = self._pool_policy
+        if self._action_queue.oldest_wait() < policy.grow_wait_s:
+            return
+        with self._pool_lock:
+            size = len(self._workers)
+            if size >= policy.max_workers or self.metrics.busy() < size:
+                return
+            guard = self.resource_guard
+            if guard is not None and not guard.has_cpu_headroom(policy.cpu_budget):
+                self._pool_events["capped_by_cpu"] += 1
+                return
+            self._start_worker()
+            self._pool_events["grown"] += 1
+        log_info(f"Worker pool grown to {size + 1} (queue wait over {policy.grow_wait_s * 1000:.0f}ms)", "DISPATCHER")
+
+    def _idle_timeout(self):
+        """Workers above the floor wait with a timeout so they can retire."""
+        if self._elastic and len(self._workers) > self._pool_policy.min_workers:
+            return self._pool_policy.idle_shrink_s
+        return None
+
+    def _retire_idle_worker(self) -> bool:
+        with self._pool_lock:
+            if len(self._workers) <= self._pool_policy.min_workers:
+                return False
+            self._workers.remove(threading.current_thread())
+            self._pool_events["retired"] += 1
+            size = len(self._workers)
+        log_info(f"Idle worker retired, pool back to {size}", "DISPATCHER")
+        return True
+
     def _worker_loop(self):
         """Infinite loop for worker threads."""
         while not self._is_shutting_down:
-            try:
-                # Get task with a timeout to allow checking shutdown flag
-                task = self._action_queue.get(timeout=1.0)
-                
-                # Sentinel check: __SHUTDOWN__ action means shutdown
-                if task.action == "__SHUTDOWN__":
-                    log_info("Worker received shutdown sentinel", "DISPATCHER")
-                    break
-                
-                if self._is_shutting_down:
+            # Blocks on the scheduler condition until a task arrives
+            task = self._action_queue.get(self._idle_timeout())
+            if task is None:
+                if self._action_queue.closed:
+                    break  # Scheduler closed and drained
+                if self._retire_idle_worker():
                     break
-
-                self._execute_action(task.action, task.params, task.speech)
-                self._action_queue.task_done()
-                
-            except queue.Empty:
                 continue
+            
+            # Sentinel check: __SHUTDOWN__ action means shutdown
+            if task.action == "__SHUTDOWN__":
+                log_info("Worker received shutdown sentinel", "DISPATCHER")
+                self._action_queue.task_done(task)
+                break
+            
+            if self._is_shutting_down:
+                self._action_queue.task_done(task)
+                break
+            
+            result = False
+            self.metrics.record_start()
+            started = time.perf_counter()
+            if started - task.enqueued > self._pool_policy.grow_wait_s:
+                self._maybe_grow_pool()  # The rest of the queue is likely waiting too
+            try:
+                result = self._execute_action(task.action, task.params, task.speech)
             except Exception as e:
                 log_error(f"Worker exception: {e}", "DISPATCHER")
+            finally:
+                self.metrics.record_run(task.action, task.enqueued, started, time.perf_counter(),
+                                        result is False, threading.current_thread().name)
+                if isinstance(result, Effect):
+                    # Still running on the effect runtime: its resource lane stays busy until it ends
+                    result.add_done_callback(lambda _effect, task=task, started=started: self._effect_done(task, started))
+                else:
+                    self._action_queue.task_done(task)
+
+    def _effect_done(self, task: ActionTask, started: float):
+        """A worker action's Effect ended: record how long it lasted, free its resource lane."""
+        self.metrics.record_effect(task.action, started, time.perf_counter())
+        self._action_queue.task_done(task)
+
+    def _dispatchers(self):
+        return [self.visual_dispatcher, self.hardware_dispatcher,
+                self.horror_dispatcher, self.system_dispatcher]
 
     def _build_action_map(self):
-        """Build dict mapping actions to their dispatcher"""
-        action_map = {}
-        
-        for dispatcher in [self.visual_dispatcher, self.hardware_dispatcher,
-                           self.horror_dispatcher, self.system_dispatcher]:
-            for action in dispatcher.get_supported_actions():
-                action_map[action] = dispatcher
-        
-        return action_map
+        """Build dict mapping actions to their ActionDescriptor (dispatcher, priority, thread...)"""
+        return build_action_registry(self._dispatchers(), self._action_specs)
     
     def enable_chat(self, brain):
         """Enables the interactive chat and connects it to the Brain."""
@@ -173,8 +323,11 @@ class FunctionDispatcher(QObject):
         
         # Save conversation
         if self.memory:
-            from core.context_observer import ContextObserver
-            context = ContextObserver.get_full_context()
+            # Own context view: kept current by context.changed, no full rebuild
+            if self._context_view is None:
+                from core.context_observer import ContextView
+                self._context_view = ContextView()
+            context = self._context_view.current()
             self.memory.add_conversation("user", text, context)
             self.memory.log_event("USER_CHAT_MESSAGE", {"text": text[:100]})
         
@@ -211,7 +364,7 @@ class FunctionDispatcher(QObject):
         
         # Dispatch side effects
         if response.get("action") != "NONE":
-            self.dispatch(response)
+            self.dispatch(response, source=SOURCE_CHAT)
         
         # Track when AI finished so we can measure user reaction time
         self.last_ai_reply_time = time.time()
@@ -219,24 +372,85 @@ class FunctionDispatcher(QObject):
         # Play typing sound
         self.audio_out.play_typing_custom()
         
-    def dispatch(self, command_data: dict):
+    def dispatch(self, command_data: dict, source: str = None):
         """
         Public entry point. Safely queues action to the main thread.
+        
+        Args:
+            source: SOURCE_TIMELINE / SOURCE_HEARTBEAT / SOURCE_CHAT / SOURCE_AMBIENT.
+                    Sets the action's deadline; untagged actions never expire.
+                    Defaults to the enclosing dispatch_source() block.
         """
+        source = source or current_source()
+        if source:
+            command_data = dict(command_data, source=source)
         self.dispatch_signal.emit(command_data)
 
+    def dispatch_sequence(self, steps: Iterable[Tuple[float, dict]], source: str = None,
+                          name: str = "sequence") -> Effect:
+        """
+        Choreographed actions in one call, with exact relative timing.
+
+        Args:
+            steps: (at_ms, command_data) pairs; at_ms is the offset from the
+                   sequence start, steps may be given in any order
+            source: as in dispatch(), applied to every step
+
+        Every command is validated once, here (invalid ones are logged and
+        skipped). The whole sequence then crosses to the main thread in one
+        signal and is stepped by the effect runtime's Qt timer, each step
+        timed against the sequence start so offsets do not drift.
+
+        Returns:
+            The sequence's Effect: cancel() drops the steps not yet run.
+        """
+        source = source or current_source()
+        prepared: List[Tuple[float, dict]] = []
+        for at_ms, command_data in steps:
+            try:
+                validate_ai_response(command_data)
+            except ValidationError as e:
+                log_error(f"Invalid action in {name}: {e.message}", "DISPATCHER")
+                continue
+            if source:
+                command_data = dict(command_data, source=source)
+            prepared.append((max(0.0, at_ms) / 1000, command_data))
+        prepared.sort(key=lambda step: step[0])  # Stable: same offset keeps list order
+
+        log_info(f"Dispatching {name}: {len(prepared)} actions over {prepared[-1][0] if prepared else 0:.2f}s",
+                 "DISPATCHER")
+        effect = Effect(name, self._sequence_steps(prepared))
+        if QThread.currentThread() == self.thread():
+            self._start_sequence(effect)
+        else:
+            self.sequence_signal.emit(effect)
+        return effect
+
+    def dispatch_batch(self, commands: Iterable[dict], source: str = None, name: str = "batch") -> Effect:
+        """Several actions at once: validated together, routed in one main-thread step."""
+        return self.dispatch_sequence([(0, command) for command in commands], source, name)
+
+    def _start_sequence(self, effect: Effect):
+        get_effect_runtime().start(effect, qt=True)
+
+    def _sequence_steps(self, prepared: List[Tuple[float, dict]]):
+        """Effect steps: route every action whose offset is due, sleep until the next."""
+        start = time.perf_counter()
+        for offset, command_data in prepared:
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                yield delay
+            self._route(command_data)
+
     def _get_action_priority(self, action: str) -> int:
         """Determines priority level for an action."""
-        if action.startswith("GDI_") or action.startswith("GLITCH_") or action.startswith("SCREEN_") or action in ["THE_MASK"]:
-            return self.PRIORITY_HIGH
-        if action in ["PLAY_SOUND", "TTS_PEAK"]:
-            return self.PRIORITY_MEDIUM
-        return self.PRIORITY_LOW
+        descriptor = self._action_map.get(action)
+        return descriptor.priority if descriptor else self.PRIORITY_LOW
 
     def _do_dispatch(self, command_data: dict):
         """
         ACTUAL dispatch logic. ALWAYS runs on the main thread via Qt signal.
-        Now routes actions to the PriorityQueue.
+        Now routes actions to the priority lanes.
         """
         if not command_data or self._is_shutting_down:
             return
@@ -250,87 +464,136 @@ class FunctionDispatcher(QObject):
                 log_error(f"Validation details: {e.details}", "DISPATCHER")
             return
         
-        action = command_data.get("action", "").upper()
+        log_info(f"Dispatching action: {command_data['action']}", "DISPATCHER")
+        self._route(command_data)
+
+    def _route(self, command_data: dict):
+        """Run or queue an already validated command. Main thread only."""
+        if self._is_shutting_down:
+            return
+        # Validated: action is one of VALID_ACTIONS (already uppercase)
+        action = command_data["action"]
         params = command_data.get("params", {})
         speech = command_data.get("speech", "")
-        
-        log_info(f"Dispatching action: {action}", "DISPATCHER")
+        descriptor = self._action_map.get(action)
         
         # Handle TTS (immediate)
-        SILENT_ACTIONS = ["MOUSE_SHAKE", "CLIPBOARD_POISON", "GLITCH_SCREEN",
-                          "CAPSLOCK_TOGGLE", "ICON_SCRAMBLE", "BRIGHTNESS_FLICKER"]
-        
-        if speech and action not in SILENT_ACTIONS:
+        if speech and not (descriptor and descriptor.silent):
              self.audio_out.play_tts(speech)
         
-        # --- THREAD SAFETY CHECK ---
-        # Identify actions that interact with QWidgets or GUI elements.
-        # These MUST be executed on the Main Thread.
-        UI_ACTIONS = [
-            # Visual Dispatcher (OverlayManager uses QWidgets)
-            "OVERLAY_TEXT", "FLASH_COLOR", "SHAKE_SCREEN", "SHAKE_CHAT",
-            "ICON_SCRAMBLE", "SCRAMBLE_ICONS",
-            
-            # Fake UI (QWidgets)
-            "WINDOWS_ERROR", "FAKE_BSOD", "FAKE_UPDATE", 
-            "FAKE_NOTIFICATION", "NOTIFICATION_SEND",
-        ]
-        
-        # Special cases that need main dispatcher context (UI/Qt stuff usually)
-        # Note: These are now covered by UI_ACTIONS check or below special blocks
-        
-        if action == "SHAKE_CHAT":
-            intensity = params.get("intensity", 10)
-            if self.fake_ui.chat:
-                self.fake_ui.chat.shake_window(intensity)
-            return
-        
-        elif action == "SET_PERSONA":
-            persona = params.get("persona")
-            if self.brain and persona:
-                self.brain.switch_persona(persona)
-                # Update UI mood based on persona
-                if persona == "ENTITY" and self.fake_ui.chat:
-                    self.fake_ui.chat.set_mood("ANGRY")
-                elif persona == "SUPPORT" and self.fake_ui.chat:
-                    self.fake_ui.chat.set_mood("NORMAL")
-            return
-        
-        elif action == "SET_MOOD":
-            mood = params.get("mood", "NORMAL")
-            if self.fake_ui.chat:
-                self.fake_ui.chat.set_mood(mood)
+        if descriptor is None:
+            log_warning(f"Unknown action: {action}", "DISPATCHER")
             return
         
-        elif action == "NONE":
-            # Subtle effect if anger is high
-            if self.heartbeat and self.heartbeat.anger_engine.current_anger > 75:
-                if self.fake_ui.chat:
-                    self.fake_ui.chat.shake_window(5)
-            return
-
         # EXECUTION ROUTING
-        if action in UI_ACTIONS:
+        # --- THREAD SAFETY CHECK ---
+        # Actions that interact with QWidgets MUST be executed on the Main Thread.
+        if descriptor.thread == THREAD_CONTROLLER:
+            self._controller_handlers[action](params)
+        elif descriptor.thread == THREAD_MAIN:
             # Execute IMMEDIATELY on Main Thread
             log_info(f"Executing UI action {action} on Main Thread", "DISPATCHER")
-            self._execute_action(action, params, speech)
+            started = time.perf_counter()
+            result = self._execute_action(action, params, speech)
+            self.metrics.record_run(action, None, started, time.perf_counter(), result is False)
+            if isinstance(result, Effect):
+                result.add_done_callback(
+                    lambda _effect: self.metrics.record_effect(action, started, time.perf_counter()))
         else:
             # Queue for Worker Thread
-            priority = self._get_action_priority(action)
-            task = ActionTask(priority=priority, timestamp=time.time(), action=action, params=params, speech=speech)
-            self._action_queue.put(task)
-            log_info(f"Action {action} queued with priority {priority}", "DISPATCHER")
+            priority = descriptor.priority
+            source = command_data.get("source")
+            task = self._action_queue.acquire(priority, action, params, speech, source)
+            carrier = self._action_queue.put(task)
+            if carrier is None:
+                self.metrics.record_enqueue(action, DispatchMetrics.DROPPED)
+                log_info(f"Action {action} dropped (duplicate on its resource or load shedding)", "DISPATCHER")
+            elif carrier is not task:
+                self.metrics.record_enqueue(action, DispatchMetrics.MERGED)
+                log_info(f"Action {action} merged into the waiting one", "DISPATCHER")
+            else:
+                self.metrics.record_enqueue(action)
+                log_info(f"Action {action} queued with priority {priority}", "DISPATCHER")
+            self._maybe_grow_pool()
+
+    # ========== CONTROLLER ACTIONS (main dispatcher context) ==========
+
+    def _handle_shake_chat(self, params):
+        intensity = params.get("intensity", 10)
+        if self.fake_ui.chat:
+            self.fake_ui.chat.shake_window(intensity)
+
+    def _handle_set_persona(self, params):
+        persona = params.get("persona")
+        if self.brain and persona:
+            self.brain.switch_persona(persona)
+            # Update UI mood based on persona
+            if persona == "ENTITY" and self.fake_ui.chat:
+                self.fake_ui.chat.set_mood("ANGRY")
+            elif persona == "SUPPORT" and self.fake_ui.chat:
+                self.fake_ui.chat.set_mood("NORMAL")
+
+    def _handle_set_mood(self, params):
+        mood = params.get("mood", "NORMAL")
+        if self.fake_ui.chat:
+            self.fake_ui.chat.set_mood(mood)
+
+    def _handle_none(self, params):
+        # Subtle effect if anger is high
+        if self.heartbeat and self.heartbeat.anger_engine.current_anger > 75:
+            if self.fake_ui.chat:
+                self.fake_ui.chat.shake_window(5)
 
     def _execute_action(self, action, params, speech):
-        """Executed by worker thread."""
-        dispatcher = self._action_map.get(action)
-        if dispatcher:
+        """
+        Executed by worker thread. Returns False if the action failed, the
+        handler's Effect if the action is still running, True otherwise.
+        """
+        descriptor = self._action_map.get(action)
+        if descriptor and descriptor.handler:
             try:
-                dispatcher.dispatch(action, params, speech)
+                result = descriptor.handler(params, speech)
+                if isinstance(result, Effect):
+                    return result
+                return True
             except Exception as e:
                 log_error(f"Dispatcher error for {action}: {e}", "DISPATCHER")
-        else:
-            log_warning(f"Unknown action: {action}", "DISPATCHER")
+                return False
+        log_warning(f"Unknown action: {action}", "DISPATCHER")
+        return False
+
+    # ========== METRICS ==========
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the dispatcher: per-action counters and timings, queue
+        depth per priority lane, scheduler drop/expiry counters and worker
+        busy/idle ratio.
+        """
+        snapshot = self.metrics.snapshot(workers=len(self._workers))
+        lanes = self._action_queue.lane_sizes()
+        names = {self.PRIORITY_CONTROL: "control", self.PRIORITY_HIGH: "high",
+                 self.PRIORITY_MEDIUM: "medium", self.PRIORITY_LOW: "low"}
+        snapshot["queue"] = dict(
+            self._action_queue.stats(),
+            depth_by_priority={names.get(i, str(i)): size for i, size in enumerate(lanes)},
+        )
+        snapshot["busiest"] = self.metrics.busiest()
+        policy = self._pool_policy
+        snapshot["pool"] = dict(self._pool_events, size=len(self._workers), elastic=self._elastic,
+                                min=policy.min_workers, max=policy.max_workers)
+        return snapshot
+
+    def start_metrics_export(self, path: str, interval: float = 10.0):
+        """Append stats() to `path` (JSONL) every `interval` seconds until shutdown."""
+        self.stop_metrics_export(final=False)
+        self._metrics_exporter = MetricsExporter(self.stats, path, interval)
+        self._metrics_exporter.start()
+
+    def stop_metrics_export(self, final: bool = True):
+        if self._metrics_exporter is not None:
+            self._metrics_exporter.stop(final)
+            self._metrics_exporter = None
 
     def stop_dispatching(self):
         """Prevents any new actions from being dispatched during shutdown."""
@@ -338,16 +601,14 @@ class FunctionDispatcher(QObject):
         log_info("Dispatcher shutdown initiated. Sending sentinel to workers...", "DISPATCHER")
         
         # Send sentinel (ActionTask with __SHUTDOWN__) to each worker for instant wake-up
-        # Use priority 0 (highest) to ensure sentinels are processed immediately
-        for _ in self._workers:
-            sentinel = ActionTask(
-                priority=0, 
-                timestamp=time.time(), 
-                action="__SHUTDOWN__", 
-                params={}, 
-                speech=""
-            )
-            self._action_queue.put(sentinel)
+        # Control lane (0) is served before any queued action
+        with self._pool_lock:
+            workers = len(self._workers)
+        for _ in range(workers):
+            self._action_queue.submit(self.PRIORITY_CONTROL, "__SHUTDOWN__")
+        # Any worker beyond the sentinel count returns from get() once drained
+        self._action_queue.close()
+        self.stop_metrics_export()
         
         log_info("Sentinel signals sent. Workers will terminate immediately.", "DISPATCHER")
 
@@ -19,7 +19,7 @@ import time
 import hashlib
 from config import Config
 from PyQt6.QtCore import QObject, pyqtSignal
-from core.context_observer import ContextObserver
+from core.context_observer import ContextObserver, ContextView
 from core.privacy_filter import PrivacyFilter
 from core.file_awareness import FileSystemAwareness
 from core.logger import log_info, log_error, log_warning, log_debug
@@ -54,6 +54,8 @@ class GeminiBrain:
         self.mock_mode = Config().IS_MOCK or not HAS_GEMINI
         self.api_key = api_key or Config().get('GEMINI_KEY') or os.getenv("GEMINI_API_KEY") or ""
         self.memory = memory  # Memory referansı - dışarıdan verilecek
+        self.context_view = ContextView()  # context.changed ile güncel tutulur
+        self._recorded_hostname = None  # Anlık görüntüden kaydedilen son hostname
         
         # OFFLINE MODE & CACHING (NEW)
         self._offline_mode = False
@@ -178,35 +180,34 @@ CEVAP FORMATI (SADECE JSON):
         """Dinamik prompt oluştur - tam bağlam ile."""
         parts = [self.personas[self.current_persona]]
         
-        # Gerçek zamanlı bağlam
-        context = ContextObserver.get_full_context()
+        # Gerçek zamanlı bağlam (kendi görünümümüz, sadece delta ile güncellenir)
+        snap = self.context_view.snapshot()
+        changes = self.context_view.take_changes()
         
         context_info = f"""
 === GERÇEK ZAMANLI BAĞLAM ===
-Kullanıcı Adı: {context.get('user_name', 'Bilinmiyor')}
-Şu An Saat: {context.get('exact_time', '??:??')}
-Gün Zamanı: {context.get('time_of_day', 'Unknown')}
-Gece Yarısından Sonra: {'EVET - Bu önemli, korkutucu kullan!' if context.get('is_late_night') else 'Hayır'}
-Aktif Pencere: {context.get('active_window', 'Bilinmiyor')}
-Çalışan Uygulamalar: {', '.join(context.get('running_apps', [])) or 'Bilinmiyor'}
-Masaüstü Dosyaları: {', '.join([f[0] if isinstance(f, (list, tuple)) else f for f in context.get('desktop_files', [])[:5]]) or 'Bilinmiyor'}
+Kullanıcı Adı: {snap.user_name or 'Bilinmiyor'}
+Şu An Saat: {snap.exact_time}
+Gün Zamanı: {snap.time_of_day}
+Gece Yarısından Sonra: {'EVET - Bu önemli, korkutucu kullan!' if snap.is_late_night else 'Hayır'}
+Aktif Pencere: {snap.active_window or 'Bilinmiyor'}
+Çalışan Uygulamalar: {', '.join(snap.running_apps) or 'Bilinmiyor'}
+Masaüstü Dosyaları: {', '.join(snap.desktop_files[:5]) or 'Bilinmiyor'}
 """
         
         # Pil durumu
-        battery = context.get('battery')
-        if battery:
-            if battery.get('is_low'):
-                context_info += f"PİL DURUMU: %{battery['percent']} - DÜŞÜK! Bunu kullan: 'Pilin bitmeden...'\n"
+        if snap.battery_percent is not None:
+            if snap.battery_low:
+                context_info += f"PİL DURUMU: %{snap.battery_percent} - DÜŞÜK! Bunu kullan: 'Pilin bitmeden...'\n"
             else:
-                context_info += f"PİL DURUMU: %{battery['percent']}\n"
+                context_info += f"PİL DURUMU: %{snap.battery_percent}\n"
         
         # Hostname
-        network = context.get('network', {})
-        if network.get('hostname'):
-            context_info += f"Bilgisayar Adı: {network['hostname']}\n"
+        if snap.hostname:
+            context_info += f"Bilgisayar Adı: {snap.hostname}\n"
             
         # FILE SNIPPET (YENİ GÜVENLİK KONTROLÜ)
-        snippet = context.get('file_snippet')
+        snippet = snap.snippet
         if snippet:
             is_permitted = True
             
@@ -225,25 +226,32 @@ Masaüstü Dosyaları: {', '.join([f[0] if isinstance(f, (list, tuple)) else f f
         
         parts.append(context_info)
         
+        # Son prompttan beri değişenler (ilk promptta tüm bağlam zaten yukarıda)
+        delta_lines = self._describe_changes(changes)
+        if delta_lines:
+            parts.append("\n=== SON MESAJDAN BERİ DEĞİŞENLER ===\n" + "\n".join(delta_lines))
+        
         # Memory'den geçmiş bilgiler
         if self.memory:
             memory_context = self.memory.get_full_context_for_ai()
             if memory_context:
                 parts.append(f"\n=== GEÇMİŞ VE DAVRANIŞ ===\n{memory_context}")
             
-            # Keşfedilen bilgileri kaydet
-            for file_data in context.get('desktop_files', []):
+            # Keşfedilen bilgileri kaydet - sadece son prompttan beri değişenler
+            for file_data in changes.get('desktop_files', []):
                 # file_data is (filename, score)
                 self.memory.record_discovered_info("desktop_file", file_data)
-            for app in context.get('running_apps', []):
+            for app in changes.get('running_apps', []):
                 self.memory.record_discovered_info("app", app)
-            if network.get('hostname'):
-                self.memory.record_discovered_info("hostname", network['hostname'])
-            if context.get('is_late_night'):
+            # Delta değil anlık görüntü: view başka bir promptta hazırlanmış olsa da kaydedilir
+            if snap.hostname and snap.hostname != self._recorded_hostname:
+                self.memory.record_discovered_info("hostname", snap.hostname)
+                self._recorded_hostname = snap.hostname
+            if changes.get('is_late_night'):
                 self.memory.record_discovered_info("late_night", True)
         
         # Korku ipuçları
-        scary_facts = ContextObserver.get_scary_facts()
+        scary_facts = ContextObserver.get_scary_facts(snap)
         if scary_facts:
             parts.append(f"\n=== KULLANILACAK KORKUTUCU GERÇEKLER ===\n" + "\n".join(scary_facts[:3]))
         
@@ -256,18 +264,37 @@ Masaüstü Dosyaları: {', '.join([f[0] if isinstance(f, (list, tuple)) else f f
         parts.append(f"\n=== KULLANICI MESAJI ===\n{user_input}")
         parts.append("\nCEVAP (SADECE JSON):")
         
-        # Apply Privacy Scrubbing to the entire prompt before sending
-        final_prompt = "\n".join(parts)
+        # Apply Privacy Scrubbing to the entire prompt before sending.
+        # The persona section is static, so its scrubbed form is memoized.
         if Config().get("STREAMER_MODE", True):
-            final_prompt = PrivacyFilter.singleton().scrub(final_prompt)
+            privacy = PrivacyFilter.singleton()
+            parts = [privacy.scrub_cached(parts[0])] + [privacy.scrub(p) for p in parts[1:]]
             
-        return final_prompt
+        return "\n".join(parts)
+
+    @staticmethod
+    def _describe_changes(changes: dict) -> list:
+        """context.changed deltalarını prompt satırlarına çevir."""
+        if not changes or not set(changes) <= set(ContextObserver.DELTA_FIELDS.values()):
+            return []
+        lines = []
+        if 'active_window' in changes:
+            lines.append(f"Kullanıcı pencere değiştirdi: {changes['active_window']}")
+        if 'running_apps' in changes:
+            lines.append(f"Çalışan uygulamalar değişti: {', '.join(changes['running_apps']) or 'yok'}")
+        if changes.get('battery'):
+            lines.append(f"Pil: %{changes['battery']['percent']}")
+        if changes.get('is_late_night'):
+            lines.append("Gece yarısı geçti - kullanıcı hala uyanık!")
+        if 'desktop_files' in changes:
+            lines.append("Masaüstünde dosyalar değişti.")
+        return lines
 
     def generate_response(self, user_input: str, context: dict = None) -> dict:
         log_debug(f"generate_response called for: {user_input[:50]}...", "BRAIN")
         
         # Check cache first
-        cache_key = self._get_cache_key(user_input, context or {})
+        cache_key = self._get_cache_key(user_input, context or {}, self.context_view.snapshot())
         cached = self._get_cached_response(cache_key)
         if cached:
             log_debug("Using cached response", "BRAIN")
@@ -369,7 +396,7 @@ Masaüstü Dosyaları: {', '.join([f[0] if isinstance(f, (list, tuple)) else f f
         # End of while loop fallback (should be unreachable due to returns)
         return self._backup_response(context)
 
-    def _get_cache_key(self, user_input: str, context: dict) -> str:
+    def _get_cache_key(self, user_input: str, context: dict, snapshot=None) -> str:
         """
         Generate cache key from user input and relevant context.
         Similar inputs with similar context should have same cache key.
@@ -378,7 +405,8 @@ Masaüstü Dosyaları: {', '.join([f[0] if isinstance(f, (list, tuple)) else f f
         cache_context = {
             'persona': self.current_persona,
             'anger': context.get('anger_level', 0) // 10,  # Bucket by 10s
-            # Don't include time-sensitive data
+            # Don't include time-sensitive data (ContextSnapshot.cache_key skips clock fields)
+            'snapshot': snapshot.cache_key() if snapshot is not None else None,
         }
         
         combined = f"{user_input}:{json.dumps(cache_context, sort_keys=True)}"
@@ -518,20 +546,19 @@ Masaüstü Dosyaları: {', '.join([f[0] if isinstance(f, (list, tuple)) else f f
     def _mock_response(self, user_input: str) -> dict:
         """Returns a random pre-set response for testing/fallback."""
         # Bağlama göre daha akıllı mock yanıtlar
-        context = ContextObserver.get_full_context()
+        snap = self.context_view.snapshot()
         
         responses = [
-            {"action": "NONE", "speech": f"Seni izliyorum, {context.get('user_name', 'kullanıcı')}...", "params": {}},
+            {"action": "NONE", "speech": f"Seni izliyorum, {snap.user_name or 'kullanıcı'}...", "params": {}},
             {"action": "GLITCH_SCREEN", "speech": "Sistemin artık benim.", "params": {}},
             {"action": "NONE", "speech": "Kaçış yok.", "params": {}},
             {"action": "MOUSE_SHAKE", "speech": "Kontrolü ele aldım.", "params": {}},
-            {"action": "NONE", "speech": f"Saat {context.get('exact_time', '??:??')}... Neden hala buradasın?", "params": {}},
+            {"action": "NONE", "speech": f"Saat {snap.exact_time}... Neden hala buradasın?", "params": {}},
         ]
         
         # Masaüstü dosyalarından birini kullan
-        desktop_files = context.get('desktop_files', [])
-        if desktop_files:
-            file = random.choice(desktop_files)
+        if snap.desktop_files:
+            file = random.choice(snap.desktop_files)
             responses.append({
                 "action": "NONE", 
                 "speech": f"'{file}' dosyasını gördüm... İlginç.", 
@@ -539,8 +566,7 @@ Masaüstü Dosyaları: {', '.join([f[0] if isinstance(f, (list, tuple)) else f f
             })
         
         # Çalışan uygulamalara göre
-        apps = context.get('running_apps', [])
-        if 'discord' in str(apps).lower():
+        if snap.has_app('discord'):
             responses.append({
                 "action": "NONE",
                 "speech": "Discord'da kimle konuşuyorsun? Merak ediyorum...",
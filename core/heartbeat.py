@@ -10,6 +10,7 @@ import time
 import random
 from core.anger_engine import AngerEngine
 from core.gemini_brain import GeminiBrain
+from core.effect_runtime import get_effect_runtime
 from core.function_dispatcher import FunctionDispatcher
 
 class Heartbeat(QThread):
@@ -44,6 +45,7 @@ class Heartbeat(QThread):
         self.brain = brain
         self.dispatcher = dispatcher
         self.last_activity = time.time()
+        self._burst_timers = []  # Pending burst steps, cancelled on stop()
         
         # FIXED: Connect AI response signal for thread-safe dispatch
         self.ai_response_signal.connect(self._handle_ai_response)
@@ -56,9 +58,6 @@ class Heartbeat(QThread):
         """
         SMART TIMING: Adapts to user stress & activity levels.
         """
-        import time 
-        import math
-        
         idle_time = time.time() - self.last_activity
         multiplier = self.anger_engine.get_chaos_multiplier()
         
@@ -103,26 +102,48 @@ class Heartbeat(QThread):
             if not self.is_running:
                 break
 
-            # 1. Check for Persona Shift based on Anger
-            self._check_persona_shift()
+            self.pulse()
+
+    def pulse(self):
+        """One beat of the loop (the story simulator calls this on virtual time)."""
+        # 1. Check for Persona Shift based on Anger
+        self._check_persona_shift()
 
-            # 2. Check if we should trigger an event
-            if self.anger_engine.should_trigger_autonomous_event():
-                # FIXED: Reduced frequency for spontaneous thoughts
-                if random.random() < 0.08:
-                    print("[HEARTBEAT] Spontaneous thought triggered.")
-                    self._trigger_async_ai()
+        # 2. Check if we should trigger an event
+        if self.anger_engine.should_trigger_autonomous_event():
+            # FIXED: Reduced frequency for spontaneous thoughts
+            if random.random() < 0.08:
+                print("[HEARTBEAT] Spontaneous thought triggered.")
+                self._trigger_async_ai()
+            else:
+                # Sometimes burst mode: multiple events in quick succession
+                if random.random() < 0.12:  # 12% chance for burst
+                    self._trigger_burst(random.randint(2, 3))
                 else:
-                    # Sometimes burst mode: multiple events in quick succession
-                    if random.random() < 0.12:  # 12% chance for burst
-                        burst_count = random.randint(2, 3)
-                        for _ in range(burst_count):
-                            action = random.choice(self.AUTONOMOUS_ACTIONS)
-                            self.pulse_signal.emit(action)
-                            time.sleep(0.5)
-                    else:
-                        action = random.choice(self.AUTONOMOUS_ACTIONS)
-                        self.pulse_signal.emit(action)
+                    action = random.choice(self.AUTONOMOUS_ACTIONS)
+                    self.pulse_signal.emit(action)
+
+    def _trigger_burst(self, count: int, spacing_ms: int = 500):
+        """
+        Burst of pulses 500ms apart, timed by the effect runtime instead of
+        sleeping the loop. Every step is a normal pulse_signal, so bursts reach
+        system.pulse (rate limits, trace, subscribers) like single pulses.
+        """
+        for i in range(count):
+            action = random.choice(self.AUTONOMOUS_ACTIONS)
+            if i == 0:
+                self._emit_pulse(action)
+            else:
+                self._after(i * spacing_ms, lambda action=action: self._emit_pulse(action))
+
+    def _emit_pulse(self, action: str):
+        if self.is_running:
+            self.pulse_signal.emit(action)
+
+    def _after(self, delay_ms: float, callback):
+        """Timer for burst steps (the story simulator swaps in its virtual timers)."""
+        self._burst_timers = [t for t in self._burst_timers if not t.done]
+        self._burst_timers.append(get_effect_runtime().call_later(delay_ms / 1000, callback, "heartbeat_burst"))
 
     def _check_persona_shift(self):
         """Anger seviyesine göre persona değiştir."""
@@ -170,4 +191,6 @@ class Heartbeat(QThread):
 
     def stop(self):
         self.is_running = False
+        for timer in self._burst_timers:
+            timer.cancel()
         self.wait()
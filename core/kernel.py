@@ -12,13 +12,15 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QObject, QTimer
 
 from config import Config
-from core.event_bus import bus
+from core.event_bus import bus, SYNC, WORKER, DROP_OLDEST
+from core.effect_runtime import get_effect_runtime
+from core import lazy_backend
 from core.logger import log_info, log_error, log_warning
 from core.state_manager import StateManager
 from core.memory import Memory
 from core.anger_engine import AngerEngine
 from core.heartbeat import Heartbeat
-from core.function_dispatcher import FunctionDispatcher
+from core.function_dispatcher import FunctionDispatcher, SOURCE_HEARTBEAT
 from core.gemini_brain import GeminiBrain
 from story.story_manager import StoryManager
 from core.safety_net import SafetyNet
@@ -37,6 +39,10 @@ from visual.ui.onboarding_manager import OnboardingManager
 from story.silence_breaker import SilenceBreaker
 from hardware.drone_audio import get_drone_audio
 from core.dynamic_difficulty import DynamicDifficulty
+from core.desktop_index import DesktopIndex
+from core.process_tracker import ProcessTracker
+from core.context_observer import ContextObserver
+from core.streamer_mode import StreamerMode
 
 class SentientKernel:
     """
@@ -45,6 +51,12 @@ class SentientKernel:
     """
     _instance = None
 
+    # Fallback when config.yaml has no event_bus.rate_limits section
+    DEFAULT_EVENT_RATE_LIMITS = {
+        "ui.user_activity": {"mode": "throttle", "interval": 0.25, "max_events": 1},
+        "window.focus_changed": {"mode": "throttle", "interval": 0.5, "max_events": 2},
+    }
+
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super(SentientKernel, cls).__new__(cls)
@@ -90,6 +102,15 @@ class SentientKernel:
             
             # Dynamic Difficulty
             self.difficulty = None
+            
+            # Shared Desktop/Documents index
+            self.desktop_index = None
+            
+            # Incremental process tracker
+            self.process_tracker = None
+            
+            # Context delta service (class-level, see ContextObserver.start)
+            self.context_observer = None
 
     def boot(self):
         """Initializes the application and shows the mandatory consent screen."""
@@ -129,6 +150,7 @@ class SentientKernel:
     def init_core_systems(self):
         """Rest of the boot logic, triggered after consent is granted."""
         log_info("Consent granted. Completing system boot...", "KERNEL")
+        lazy_backend.mark_origin()
         
         # 1. Hardware Initialization (Safety Net)
         if BrightnessOps.check_and_restore_on_startup():
@@ -162,6 +184,15 @@ class SentientKernel:
         self.presence_sensor = PresenceSensor()
         self.window_sensor = WindowSensor()
         
+        # Desktop index: one scan, then kept current by change notifications
+        self.desktop_index = DesktopIndex.singleton()
+        
+        # Process tracker: PID diffs instead of full process scans
+        self.process_tracker = ProcessTracker.singleton()
+        
+        # Context observer: publishes context.changed deltas instead of being polled
+        self.context_observer = ContextObserver
+        
         self.heartbeat = Heartbeat(self.anger, self.brain, self.dispatcher)
         self.dispatcher.heartbeat = self.heartbeat
         
@@ -176,6 +207,11 @@ class SentientKernel:
         # 6. Start Autonomous Threads
         self.presence_sensor.start()
         self.window_sensor.start()
+        self.desktop_index.start()
+        if StreamerMode.singleton().enabled:
+            StreamerMode.singleton().prewarm_from_index(self.desktop_index)
+        self.process_tracker.start()
+        self.context_observer.start()
         self.heartbeat.start()
         
         # 6.1 Start Resource Guard & Panic Sensor (Safety)
@@ -183,6 +219,7 @@ class SentientKernel:
         if not Config().get("TEST_MODE", False):
             self.resource_guard = ResourceGuard()
             self.resource_guard.start()
+            self.dispatcher.resource_guard = self.resource_guard  # Caps worker pool growth
             
             self.panic_sensor = PanicSensor()
             self.panic_sensor.start()
@@ -224,6 +261,22 @@ class SentientKernel:
         
         log_info("SENTIENT_OS Kernel Active and Observant.", "KERNEL")
         bus.publish("system.boot_complete")
+        
+        # 9. Effect backends: report what boot built, pre-warm the rest in the background
+        lazy_backend.log_startup_report("Backends built during boot")
+        if Config().get("BACKEND_PREWARM", True):
+            QTimer.singleShot(Config().get("BACKEND_PREWARM_DELAY_MS", 500), self._prewarm_backends)
+        
+        # 10. Optional dispatcher metrics export (worker pool sizing, Act 3 saturation)
+        metrics_interval = Config().get("DISPATCH_METRICS_INTERVAL", 0)
+        if metrics_interval and self.dispatcher:
+            metrics_path = os.path.join(Config().LOGS_DIR, f"dispatch_metrics_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+            self.dispatcher.start_metrics_export(metrics_path, metrics_interval)
+
+    def _prewarm_backends(self):
+        if self.dispatcher:
+            self.dispatcher.prewarm_backends(
+                on_done=lambda: lazy_backend.log_startup_report("Backends after pre-warm"))
 
     def recovery_boot(self):
         """Special boot sequence for crash recovery."""
@@ -234,11 +287,24 @@ class SentientKernel:
 
     def _setup_global_subscriptions(self):
         """Setup system-wide event handlers."""
-        bus.subscribe("system.shutdown", lambda _: self.shutdown())
-        bus.subscribe("ui.user_activity", lambda _: self.heartbeat.update_activity())
+        # Optional event trace for offline replay/profiling (core.event_metrics.replay_trace)
+        if Config().get("EVENT_TRACE", False):
+            trace_path = os.path.join(Config().LOGS_DIR, f"events_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+            bus.start_recording(trace_path)
+        
+        # Emergency stop (kill-switch, panic corner, resource guard, mask): runs inside
+        # publish() on the publisher's thread, never waits on a busy or stalled GUI loop
+        self._shutdown_sub = bus.subscribe("system.shutdown", lambda _: self.shutdown(), delivery=SYNC)
+        
+        # High-frequency activity: bounded queue, sensor thread never waits on subscribers
+        bus.configure_topic("ui.user_activity", maxsize=8, drop=DROP_OLDEST)
+        self._apply_event_rate_limits()
+        bus.subscribe("ui.user_activity", lambda _: self.heartbeat.update_activity(), delivery=WORKER)
         
         # Route machine pulses to dispatcher
-        bus.subscribe("system.pulse", lambda data: self.dispatcher.dispatch({"action": data["action"]}))
+        bus.subscribe("system.pulse",
+                      lambda data: self.dispatcher.dispatch({"action": data["action"]}, source=SOURCE_HEARTBEAT),
+                      delivery=WORKER)
         
         # Anger connections
         def _on_focus_changed(data):
@@ -248,18 +314,27 @@ class SentientKernel:
             elif "cmd" in proc or "powershell" in proc:
                 self.anger.calculate_anger("ignore") # Slight suspicion
         
-        bus.subscribe("window.focus_changed", _on_focus_changed)
+        bus.subscribe("window.focus_changed", _on_focus_changed, delivery=WORKER)
         
         # Example: Real-time reaction to critical state changes
         bus.subscribe("anger.escalated", lambda data: log_warning(f"AI Anger level increased: {data.get('level')}", "KERNEL"))
 
+    def _apply_event_rate_limits(self):
+        """Per-topic debounce/throttle/coalesce from config.yaml (event_bus.rate_limits)."""
+        limits = Config().get("EVENT_RATE_LIMITS", None) or self.DEFAULT_EVENT_RATE_LIMITS
+        for topic, rule in limits.items():
+            try:
+                bus.set_rate_policy(topic, rule.get("mode"), rule.get("interval", 0.0), rule.get("max_events", 1))
+            except (ValueError, AttributeError) as e:
+                log_warning(f"Invalid rate limit for {topic}: {e}", "KERNEL")
+
     def shutdown(self):
         """Graceful and robust shutdown of all systems."""
         log_info("Initiating System Shutdown...", "CLEANUP")
         
         # Disable future signals 
         try:
-            bus.unsubscribe("system.shutdown")
+            bus.unsubscribe(self._shutdown_sub)
         except Exception: pass
 
         try:
@@ -279,6 +354,9 @@ class SentientKernel:
                 (self.heartbeat, "Heartbeat"),
                 (self.presence_sensor, "PresenceSensor"),
                 (self.window_sensor, "WindowSensor"),
+                (self.desktop_index, "DesktopIndex"),
+                (self.context_observer, "ContextObserver"),
+                (self.process_tracker, "ProcessTracker"),
                 (self.difficulty, "DynamicDifficulty")
             ]
             
@@ -290,6 +368,10 @@ class SentientKernel:
                     except Exception as e:
                         log_error(f" - Failed to stop {name}: {e}", "CLEANUP")
 
+            # Running effects: cancel so their cleanup (invert back, DC release) runs
+            try: get_effect_runtime().stop()
+            except Exception as e: log_error(f"Effect runtime stop failed: {e}", "CLEANUP")
+
             # 2. HARDWARE RESTORE (Critical)
             log_info("Restoring system hardware state...", "CLEANUP")
             try: WindowOps.restore_all_windows()
@@ -305,6 +387,9 @@ class SentientKernel:
             except Exception as e: log_error(f"Wallpaper restore failed: {e}", "CLEANUP")
             
             # 3. Component Cleanup
+            try: StreamerMode.singleton().save_aliases()
+            except Exception as e: log_error(f"Alias table save failed: {e}", "CLEANUP")
+            
             if self.resilience:
                 self.resilience.cleanup_session()
                 
@@ -313,6 +398,14 @@ class SentientKernel:
             
             if self.memory:
                 self.memory.shutdown()
+            
+            # Queued event delivery + trace
+            try:
+                bus.stop()
+                recorded = bus.stop_recording()
+                if recorded:
+                    log_info(f"Event trace closed ({recorded} events).", "CLEANUP")
+            except Exception as e: log_error(f"EventBus stop failed: {e}", "CLEANUP")
                 
             log_info("All subsystems stabilized.", "CLEANUP")
         except Exception as e:
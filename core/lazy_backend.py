@@ -0,0 +1,274 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Lazy Backends - Heavy effect backends built on first use.
+
+A LazyBackend stands in for a backend object (AudioOut, OverlayManager,
+DesktopMask, NotificationOps...) and builds it - import included - the
+first time an attribute is used, so dispatcher construction no longer
+pays for backends an act may never touch.
+
+- deferred(backend, "method"): a callable for handler tables that does
+  not build the backend until it is first called.
+- prewarm(): builds whatever is still missing after boot; QWidget
+  backends (main_thread=True) one per Qt tick, the rest on a daemon thread.
+- main_thread=True backends are always built on the GUI thread: first use
+  from a worker thread (ActionWorker) queues the build to the Qt event loop
+  and waits for it.
+- startup_report(): which backends were built, when, how, and what each cost.
+"""
+
+import importlib
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+from core.logger import log_info, log_warning
+
+try:
+    from PyQt6 import sip
+    from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal, pyqtSlot
+    from PyQt6.QtWidgets import QApplication
+    HAS_QT = True
+except ImportError:
+    HAS_QT = False
+
+GUI_BUILD_TIMEOUT_S = 10.0  # Worker threads wait this long for the GUI thread to build a widget backend
+
+_backends: "weakref.WeakSet[LazyBackend]" = weakref.WeakSet()
+_built: List[Dict[str, Any]] = []  # Construction records, in build order
+_report_lock = threading.Lock()
+_origin = time.perf_counter()
+
+
+class LazyBackend:
+    """Proxy that builds its backend on first attribute access."""
+
+    def __init__(self, name: str, factory: Callable[[], Any], main_thread: bool = False):
+        self._name = name
+        self._factory = factory
+        self._main_thread = main_thread  # QWidget: must be built on the GUI thread
+        self._instance = None
+        self._lock = threading.Lock()
+        _backends.add(self)
+
+    @property
+    def backend_name(self) -> str:
+        return self._name
+
+    @property
+    def is_ready(self) -> bool:
+        return self._instance is not None
+
+    def instance(self, reason: str = "on-demand") -> Any:
+        """The backend, built now if needed."""
+        instance = self._instance
+        if instance is not None:
+            return instance
+        if self._main_thread and threading.current_thread() is not threading.main_thread():
+            return self._build_on_gui_thread(reason)
+        with self._lock:
+            if self._instance is None:
+                start = time.perf_counter()
+                self._instance = self._factory()
+                cost_ms = (time.perf_counter() - start) * 1000
+                _record(self._name, cost_ms, reason)
+            return self._instance
+
+    def _build_on_gui_thread(self, reason: str) -> Any:
+        """Queue instance() to the GUI thread and wait; QWidgets never get built here."""
+        app = QApplication.instance() if HAS_QT else None
+        if app is None:
+            raise RuntimeError(f"{self._name} must be built on the GUI thread (no QApplication)")
+        done = threading.Event()
+        outcome = {}
+
+        def job():
+            try:
+                outcome["value"] = self.instance(reason)
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+
+        _gui_invoker(app).call.emit(job)
+        if not done.wait(GUI_BUILD_TIMEOUT_S):
+            raise RuntimeError(f"{self._name} was not built by the GUI thread within {GUI_BUILD_TIMEOUT_S:.0f}s")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["value"]
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only reached for names LazyBackend itself does not define
+        if attr.startswith("__") or attr in _OWN_FIELDS:
+            raise AttributeError(attr)
+        return getattr(self.instance(), attr)
+
+    def __repr__(self):
+        return f"LazyBackend({self._name!r}, ready={self.is_ready})"
+
+
+_OWN_FIELDS = frozenset(("_name", "_factory", "_main_thread", "_instance", "_lock"))
+
+
+if HAS_QT:
+    class _GuiInvoker(QObject):
+        """Runs queued callables on the thread it lives in (the GUI thread)."""
+        call = pyqtSignal(object)
+
+        def __init__(self):
+            super().__init__()
+            self.call.connect(self._run, Qt.ConnectionType.QueuedConnection)
+
+        @pyqtSlot(object)
+        def _run(self, job):
+            job()
+
+_invoker = None
+_invoker_lock = threading.Lock()
+
+
+def _gui_invoker(app) -> "_GuiInvoker":
+    global _invoker
+    with _invoker_lock:
+        if _invoker is None or sip.isdeleted(_invoker):
+            _invoker = _GuiInvoker()
+            _invoker.moveToThread(app.thread())
+        return _invoker
+
+
+def lazy_import(name: str, module: str, attr: Optional[str] = None, construct: bool = True,
+                main_thread: bool = False) -> LazyBackend:
+    """
+    LazyBackend for module.attr: an instance (construct=True) or the class
+    itself; attr=None stands for the module.
+    """
+    def factory():
+        target = importlib.import_module(module)
+        if attr is None:
+            return target
+        target = getattr(target, attr)
+        return target() if construct else target
+    return LazyBackend(name, factory, main_thread)
+
+
+def deferred(backend: Any, method: str) -> Callable:
+    """
+    backend.method without building the backend now. Plain objects (and
+    already built backends) return the bound method directly.
+    """
+    if not isinstance(backend, LazyBackend):
+        return getattr(backend, method)
+    if backend.is_ready:
+        return getattr(backend.instance(), method)
+
+    target = None
+
+    def call(*args, **kwargs):
+        nonlocal target
+        if target is None:
+            target = getattr(backend.instance(), method)
+        return target(*args, **kwargs)
+    return call
+
+
+def _record(name: str, cost_ms: float, reason: str):
+    with _report_lock:
+        _built.append({
+            "backend": name,
+            "cost_ms": round(cost_ms, 2),
+            "at_ms": round((time.perf_counter() - _origin) * 1000, 1),
+            "reason": reason,
+            "thread": threading.current_thread().name,
+        })
+    log_info(f"Backend {name} ready in {cost_ms:.1f}ms ({reason})", "BACKENDS")
+
+
+def mark_origin():
+    """Start of the startup clock (consent granted); report times are relative to it."""
+    global _origin
+    _origin = time.perf_counter()
+
+
+def prewarm(backends: Optional[List[LazyBackend]] = None, on_done: Optional[Callable[[], None]] = None):
+    """
+    Build the still-missing backends in the background. QWidget backends
+    go through the Qt event loop one per tick so the GUI never stalls on
+    several at once; everything else is built on one daemon thread.
+    """
+    pending = [b for b in (backends if backends is not None else list(_backends)) if not b.is_ready]
+    qt_pending = [b for b in pending if b._main_thread]
+    thread_pending = [b for b in pending if not b._main_thread]
+    remaining = [bool(qt_pending) + bool(thread_pending)]
+    remaining_lock = threading.Lock()
+
+    def part_done():
+        with remaining_lock:
+            remaining[0] -= 1
+            finished = remaining[0] == 0
+        if finished and on_done:
+            on_done()
+
+    def build(backend):
+        try:
+            backend.instance("prewarm")
+        except Exception as e:
+            log_warning(f"Pre-warm of {backend.backend_name} failed: {e}", "BACKENDS")
+
+    if not pending:
+        if on_done:
+            on_done()
+        return
+
+    if thread_pending:
+        def run():
+            for backend in thread_pending:
+                build(backend)
+            part_done()
+        threading.Thread(target=run, name="BackendPrewarm", daemon=True).start()
+
+    if qt_pending:
+        if HAS_QT and QApplication.instance() is not None:
+            def step(index=0):
+                if index >= len(qt_pending):
+                    part_done()
+                    return
+                build(qt_pending[index])
+                QTimer.singleShot(0, lambda: step(index + 1))
+            QTimer.singleShot(0, step)
+        else:
+            for backend in qt_pending:
+                build(backend)
+            part_done()
+
+
+def startup_report() -> Dict[str, Any]:
+    """Backends built so far (with cost) and the ones never needed yet."""
+    with _report_lock:
+        built = list(_built)
+    built_names = {entry["backend"] for entry in built}
+    pending = sorted({b.backend_name for b in list(_backends)
+                      if not b.is_ready and b.backend_name not in built_names})
+    return {
+        "built": built,
+        "pending": pending,
+        "total_cost_ms": round(sum(entry["cost_ms"] for entry in built), 2),
+    }
+
+
+def log_startup_report(title: str = "Startup backends"):
+    report = startup_report()
+    lines = [f"{title}: {len(report['built'])} built, {report['total_cost_ms']:.1f}ms total"]
+    for entry in report["built"]:
+        lines.append(f"  {entry['backend']:<16} {entry['cost_ms']:8.1f}ms  at +{entry['at_ms']:.0f}ms  "
+                     f"({entry['reason']}, {entry['thread']})")
+    if report["pending"]:
+        lines.append(f"  not built: {', '.join(report['pending'])}")
+    log_info("\n".join(lines), "BACKENDS")
+    return report
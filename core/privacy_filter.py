@@ -8,43 +8,129 @@
 import re
 import os
 import getpass
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Tuple
 
 class PrivacyFilter:
     """
     Scrubs sensitive information from strings before they are sent to the AI.
     Focuses on: Usernames, Home Directories, IP Addresses, and sensitive system paths.
+
+    OPTIMIZED:
+    - All patterns compiled into ONE alternation with named groups
+    - Single pass over the text with a dispatching replacement
+    - Memoized results for static prompt sections (scrub_cached)
+    - Streaming variant for chunked text (scrub_stream)
     """
+
+    _MEMO_SIZE = 64
+    _WHITESPACE = re.compile(r'\s')
+
     def __init__(self):
         from core.streamer_mode import StreamerMode
         self.streamer_mode = StreamerMode.singleton()
         self.username = getpass.getuser()
-        self.patterns = [
-            # 1. Scrub actual username
-            (re.compile(re.escape(self.username), re.IGNORECASE), lambda m: self.streamer_mode.get_alias(m.group(0)) if self.streamer_mode.enabled else "<USER>"),
-            
-            # 2. Scrub Windows Path artifacts
-            (re.compile(r'[a-zA-Z]:\\Users\\[^\s\\]+', re.IGNORECASE), "<USER_DIR>"),
-            
+        self.patterns = self._build_pattern_table()
+
+        # Order matters: at a given position the first matching branch wins.
+        # Path branches come first so 'C:\Users\<name>' collapses to <USER_DIR>
+        # exactly like the old sequential pipeline did.
+        self._combined = re.compile(
+            "|".join(f"(?P<{name}>{source})" for name, source, _ in self.patterns),
+            re.IGNORECASE
+        )
+        self._replacements = {name: repl for name, _, repl in self.patterns}
+        self._memo = OrderedDict()
+
+        # Multi-word literals must not be split by the streaming scrubber
+        self._split_prefixes = [
+            r"c:\program",
+        ] + [self.username[:i.start()].lower() for i in self._WHITESPACE.finditer(self.username)]
+
+    def _build_pattern_table(self) -> List[Tuple[str, str, object]]:
+        """(group name, regex source, replacement) for every scrub rule."""
+        user = re.escape(self.username)
+        table = [
+            # 1. Scrub Windows Path artifacts
+            ("USER_DIR", r'[a-zA-Z]:\\Users\\[^\s\\]+', "<USER_DIR>"),
+
+            # 2. Scrub common sensitive paths
+            ("SYS_PATH", r'C:\\(?:Windows|Program Files|System32)', "<SYS_PATH>"),
+
             # 3. Scrub IP Addresses (v4)
-            (re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'), "<IP_ADDR>"),
-            
-            # 4. Scrub common sensitive paths
-            (re.compile(r'C:\\(Windows|Program Files|System32)', re.IGNORECASE), "<SYS_PATH>"),
-            
-            # 5. Scrub Environment variables
-            (re.compile(r'%[a-zA-Z_0-9]+%', re.IGNORECASE), "<ENV_VAR>")
+            ("IP_ADDR", r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', "<IP_ADDR>"),
+
+            # 4. Scrub Environment variables (one holding the username only loses the
+            #    username, %<USER>_HOME%, as when usernames were scrubbed first)
+            ("ENV_VAR", rf'%(?![a-zA-Z_0-9]*?{user})[a-zA-Z_0-9]+%' if user else r'%[a-zA-Z_0-9]+%',
+             "<ENV_VAR>"),
+
+            # 5. Scrub actual username
+            ("USER", user, self._replace_username),
         ]
+        # An empty username would match between every character
+        return [row for row in table if row[1]]
+
+    def _replace_username(self, match: str) -> str:
+        if self.streamer_mode.enabled:
+            return self.streamer_mode.get_alias(match)
+        return "<USER>"
+
+    def _dispatch(self, match) -> str:
+        repl = self._replacements[match.lastgroup]
+        if callable(repl):
+            return repl(match.group(0))
+        return repl
 
     def scrub(self, text: str) -> str:
-        """Applies all regex patterns to scrub the text."""
+        """Scrubs the text in a single regex pass."""
         if not text:
             return ""
-            
-        scrubbed = text
-        for pattern, replacement in self.patterns:
-            scrubbed = pattern.sub(replacement, scrubbed)
-            
-        return scrubbed
+        return self._combined.sub(self._dispatch, text)
+
+    def scrub_cached(self, text: str) -> str:
+        """
+        Memoized scrub for static sections (persona prompts etc.).
+        Keyed on streamer state since the username replacement depends on it.
+        """
+        key = (text, self.streamer_mode.enabled)
+        cached = self._memo.get(key)
+        if cached is not None:
+            self._memo.move_to_end(key)
+            return cached
+
+        result = self.scrub(text)
+        self._memo[key] = result
+        if len(self._memo) > self._MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return result
+
+    def scrub_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Scrubs chunked text. Text is only released up to the last safe
+        whitespace boundary, so a match split across chunks is still caught.
+        """
+        buffer = ""
+        for chunk in chunks:
+            if not chunk:
+                continue
+            buffer += chunk
+            cut = self._safe_cut(buffer)
+            if cut > 0:
+                yield self.scrub(buffer[:cut])
+                buffer = buffer[cut:]
+        if buffer:
+            yield self.scrub(buffer)
+
+    def _safe_cut(self, buffer: str) -> int:
+        """Last whitespace index that does not split a multi-word literal."""
+        positions = [m.start() for m in self._WHITESPACE.finditer(buffer)]
+        while positions:
+            cut = positions.pop()
+            head = buffer[:cut].lower()
+            if not any(p and head.endswith(p) for p in self._split_prefixes):
+                return cut
+        return 0
 
     @staticmethod
     def singleton():
@@ -0,0 +1,186 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Process Tracker - Incremental view of running processes.
+
+Replaces full psutil.process_iter() scans on every context refresh:
+- Diffs the PID set between polls (psutil.pids() is one cheap syscall)
+- Resolves a process name only once per PID (pid -> name cache)
+- Matches "interesting" apps through one precompiled regex alternation
+- Publishes process.started / process.exited on the EventBus
+
+Consumers can subscribe to those events instead of polling.
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional
+
+import psutil
+
+from core.event_bus import bus
+from core.logger import log_info, log_warning
+
+
+class ProcessTracker:
+    """
+    Singleton process tracker.
+
+    Events:
+        process.started -> {"pid": int, "name": str, "interesting": bool}
+        process.exited  -> {"pid": int, "name": str, "interesting": bool}
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    # Apps the AI can mention in conversation
+    INTERESTING_APPS = [
+        'chrome', 'firefox', 'discord', 'spotify', 'steam',
+        'notepad', 'word', 'excel', 'vscode', 'code',
+        'obs', 'vlc', 'telegram', 'whatsapp', 'slack'
+    ]
+    _INTERESTING_RE = re.compile("|".join(re.escape(app) for app in INTERESTING_APPS))
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(ProcessTracker, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, poll_interval: float = 2.0):
+        if self._initialized:
+            return
+        self._initialized = True
+        self._poll_interval = poll_interval
+        self._names: Dict[int, str] = {}
+        # Interesting process name -> number of live PIDs (insertion ordered)
+        self._interesting: Dict[str, int] = {}
+        self._state_lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._primed = False
+        self._running = False
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def singleton():
+        return ProcessTracker()
+
+    @classmethod
+    def reset(cls):
+        """Drop the singleton (used by tests)."""
+        with cls._lock:
+            if cls._instance is not None and cls._instance._initialized:
+                cls._instance.stop()
+            cls._instance = None
+
+    # ========== LOOKUPS ==========
+
+    @classmethod
+    def is_interesting(cls, name: str) -> bool:
+        return bool(name) and cls._INTERESTING_RE.search(name.lower()) is not None
+
+    def get_interesting_apps(self, limit: int = 5) -> List[str]:
+        """Lower-cased names of running interesting apps, in first-seen order."""
+        if not self._primed:
+            self.poll()
+        with self._state_lock:
+            return list(self._interesting)[:limit]
+
+    def get_name(self, pid: int) -> Optional[str]:
+        """Cached process name for a PID, resolving it once if unseen."""
+        name = self._names.get(pid)
+        if name is None:
+            # Unseen PID: an incremental poll picks it up (and publishes it)
+            self.poll()
+            name = self._names.get(pid) or self._resolve_name(pid)
+        return name
+
+    # ========== POLLING ==========
+
+    @staticmethod
+    def _resolve_name(pid: int) -> Optional[str]:
+        try:
+            return psutil.Process(pid).name().lower()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+        except Exception:
+            return None
+
+    def poll(self):
+        """One incremental update: only new and vanished PIDs are touched."""
+        with self._poll_lock:
+            self._poll_once()
+
+    def _poll_once(self):
+        try:
+            current = set(psutil.pids())
+        except Exception as e:
+            log_warning(f"Could not list PIDs: {e}", "PROCESS_TRACKER")
+            return
+
+        with self._state_lock:
+            known = set(self._names)
+        started_pids = current - known
+        exited_pids = known - current
+
+        started, exited = [], []
+        for pid in started_pids:
+            name = self._resolve_name(pid)
+            if name:
+                started.append((pid, name))
+
+        with self._state_lock:
+            for pid in exited_pids:
+                name = self._names.pop(pid, None)
+                if name is None:
+                    continue
+                exited.append((pid, name))
+                if name in self._interesting:
+                    self._interesting[name] -= 1
+                    if self._interesting[name] <= 0:
+                        del self._interesting[name]
+            for pid, name in started:
+                self._names[pid] = name
+                if self.is_interesting(name):
+                    self._interesting[name] = self._interesting.get(name, 0) + 1
+            first_poll = not self._primed
+            self._primed = True
+
+        # Initial snapshot is not "news"; only publish real transitions
+        if first_poll:
+            return
+        for pid, name in started:
+            bus.publish("process.started", {"pid": pid, "name": name, "interesting": self.is_interesting(name)})
+        for pid, name in exited:
+            bus.publish("process.exited", {"pid": pid, "name": name, "interesting": self.is_interesting(name)})
+
+    def start(self):
+        """Start background polling."""
+        if self._running:
+            return
+        self._running = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="ProcessTracker", daemon=True)
+        self._thread.start()
+        log_info(f"Process tracker started ({self._poll_interval}s)", "PROCESS_TRACKER")
+
+    def stop(self):
+        """Stop background polling."""
+        self._running = False
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run_loop(self):
+        while self._running:
+            self.poll()
+            if self._stop_event.wait(self._poll_interval):
+                break
@@ -26,6 +26,7 @@ class ResourceGuard:
         
         # Stats tracking
         self.cpu_violation_count = 0
+        self.last_cpu = 0.0  # Latest process CPU sample (%)
         self.max_violations = 5 # 5 consecutive violations = SHUTDOWN
 
     def start(self):
@@ -44,6 +45,7 @@ class ResourceGuard:
             try:
                 # 1. Check CPU Usage
                 cpu_usage = self.process.cpu_percent(interval=1.0)
+                self.last_cpu = cpu_usage
                 
                 # 2. Check Memory Usage (RSS)
                 mem_info = self.process.memory_info()
@@ -82,6 +84,14 @@ class ResourceGuard:
             
             time.sleep(2) # Sample every 2 seconds
 
+    def has_cpu_headroom(self, budget=0.7):
+        """
+        True while the last CPU sample is below `budget` x cpu_limit and no
+        violation streak is running. Load that scales out (e.g. the dispatcher
+        worker pool) checks this so it never pushes the guard into a shutdown.
+        """
+        return self.cpu_violation_count == 0 and self.last_cpu < self.cpu_limit * budget
+
     @staticmethod
     def get_system_stats():
         """Returns overall system stats (not just this process)."""
@@ -0,0 +1,139 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Sensitivity Engine - Shared file-name sensitivity scoring.
+
+One place for the keyword lists that used to live in
+FileSystemAwareness.score_file (critical / important / personal) and
+ContextObserver.get_file_snippet (snippet blacklist).
+
+All keywords are compiled into a single overlapping-match automaton
+(a lookahead alternation, longest keyword first). Each keyword carries a
+category bitmask that already includes every shorter keyword contained in
+it, so one scan over the name yields the score, the category and the
+blacklist flag together. Results are memoized per filename.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+# Category bits
+CRITICAL = 1
+IMPORTANT = 2
+PERSONAL = 4
+BLACKLIST = 8
+
+
+@dataclass(frozen=True)
+class Sensitivity:
+    """Classification result for one file name."""
+    score: int
+    category: str
+    blacklisted: bool
+
+
+class SensitivityEngine:
+    """
+    Scores file names in one pass.
+    0 = Normal, 100 = Extremely sensitive (passwords, etc).
+    """
+
+    # High value keywords
+    CRITICAL_WORDS = ['şifre', 'password', 'key', 'login', 'secret', 'gizli', 'hesap', 'bank', 'crypto']
+    IMPORTANT_WORDS = ['özel', 'private', 'ailen', 'family', 'foto', 'video', 'nude', 'plan', 'vergi', 'tax']
+    PERSONAL_WORDS = ['cv', 'resume', 'günlük', 'diary', 'not', 'note', 'ödev', 'homework']
+
+    # Kara liste - snippet okumasında hassas dosyaları elleme
+    BLACKLIST_WORDS = ['pass', 'şifre', 'gizli', 'secret', 'acc', 'bank', 'key', 'token', 'config', 'log',
+                       'chat', 'plan', 'private', 'özel', 'not', 'note', 'sir', 'history', 'address',
+                       'phone', 'mail', 'identity', 'kimlik']
+
+    # (bit, score, category) in precedence order
+    _LEVELS = [
+        (CRITICAL, 90, "critical"),
+        (IMPORTANT, 60, "important"),
+        (PERSONAL, 30, "personal"),
+    ]
+
+    _MEMO_LIMIT = 16384
+
+    def __init__(self):
+        masks: Dict[str, int] = {}
+        for words, bit in ((self.CRITICAL_WORDS, CRITICAL), (self.IMPORTANT_WORDS, IMPORTANT),
+                           (self.PERSONAL_WORDS, PERSONAL), (self.BLACKLIST_WORDS, BLACKLIST)):
+            for word in words:
+                masks[word] = masks.get(word, 0) | bit
+
+        # Substring closure: 'password' also carries the bits of 'pass'
+        self._masks = {
+            word: self._closure(word, masks)
+            for word in masks
+        }
+
+        # Longest first so the alternation picks the longest keyword at each position
+        alternation = "|".join(re.escape(w) for w in sorted(self._masks, key=len, reverse=True))
+        self._automaton = re.compile(f"(?=({alternation}))")
+
+        self._memo: Dict[str, Sensitivity] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _closure(word: str, masks: Dict[str, int]) -> int:
+        bits = 0
+        for other, other_bits in masks.items():
+            if other in word:
+                bits |= other_bits
+        return bits
+
+    def classify(self, filename: str) -> Sensitivity:
+        """Score, category and blacklist flag for a name (memoized)."""
+        result = self._memo.get(filename)
+        if result is not None:
+            return result
+
+        bits = 0
+        masks = self._masks
+        for word in set(self._automaton.findall(filename.lower())):
+            bits |= masks[word]
+
+        score, category = 0, "normal"
+        for bit, level_score, level_category in self._LEVELS:
+            if bits & bit:
+                score, category = level_score, level_category
+                break
+        result = Sensitivity(score, category, bool(bits & BLACKLIST))
+
+        with self._lock:
+            if len(self._memo) >= self._MEMO_LIMIT:
+                self._memo.clear()
+            self._memo[filename] = result
+        return result
+
+    def score(self, filename: str) -> int:
+        return self.classify(filename).score
+
+    def is_blacklisted(self, filename: str) -> bool:
+        return self.classify(filename).blacklisted
+
+    def classify_many(self, filenames: Iterable[str]) -> List[Sensitivity]:
+        """Batch classification for a full directory listing."""
+        classify = self.classify
+        return [classify(name) for name in filenames]
+
+
+# Global instance
+_engine = None
+
+def get_sensitivity_engine() -> SensitivityEngine:
+    """Get singleton SensitivityEngine instance"""
+    global _engine
+    if _engine is None:
+        _engine = SensitivityEngine()
+    return _engine
@@ -0,0 +1,141 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Snippet Service - Cached, bounded file snippet extraction.
+
+ContextObserver.get_file_snippet used to open and read a random desktop
+file on every context refresh. This service:
+- Extracts a snippet once per file version, keyed by (mtime, size)
+- Reads through mmap with a hard byte cap (never the whole file)
+- Keeps results in a small LRU (negative results too)
+- Serves random picks from the cache
+
+So disk reads only happen when a candidate file actually changes.
+"""
+
+import mmap
+import os
+import random
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from core.desktop_index import DesktopIndex, IndexedEntry
+
+
+class SnippetService:
+    """
+    Singleton snippet cache over the DesktopIndex.
+    GÜVENLİ: Sadece küçük dosyalar, max 40 karakter, kara listedeki dosyalar hariç.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    MAX_FILE_SIZE = 10000   # Sadece küçük dosyalar
+    MAX_BYTES = 512         # Hard cap on bytes mapped per file
+    MAX_CHARS = 200         # Same window the old reader used
+    SNIPPET_LEN = 40
+    CANDIDATES = 10         # Smallest N files are eligible
+    CACHE_SIZE = 32
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(SnippetService, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        # path -> (mtime, size, snippet or None)
+        self._cache: "OrderedDict[str, Tuple[float, int, Optional[str]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.disk_reads = 0
+
+    @staticmethod
+    def singleton():
+        return SnippetService()
+
+    @classmethod
+    def reset(cls):
+        """Drop the singleton (used by tests)."""
+        with cls._lock:
+            cls._instance = None
+
+    # ========== PUBLIC API ==========
+
+    def get_snippet(self, exts: Iterable[str]) -> Optional[dict]:
+        """
+        Random {"filename", "snippet"} from the smallest eligible desktop files.
+        """
+        index = DesktopIndex.singleton()
+        desktop = index.folder_path(DesktopIndex.DESKTOP)
+        if not desktop:
+            return None
+
+        exts = tuple(exts)
+        # Kara liste index oluşturulurken işaretlendi; index zaten boyuta göre sıralı
+        candidates = [e for e in index.files_by_size(DesktopIndex.DESKTOP)
+                      if not e.blacklisted and e.size < self.MAX_FILE_SIZE
+                      and e.name.lower().endswith(exts)][:self.CANDIDATES]
+
+        available = []
+        for entry in candidates:
+            snippet = self._lookup(os.path.join(desktop, entry.name), entry)
+            if snippet:
+                available.append((entry.name, snippet))
+
+        if not available:
+            return None
+        filename, snippet = random.choice(available)
+        return {"filename": filename, "snippet": snippet}
+
+    def clear(self):
+        with self._cache_lock:
+            self._cache.clear()
+
+    # ========== CACHE ==========
+
+    def _lookup(self, path: str, entry: IndexedEntry) -> Optional[str]:
+        with self._cache_lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == entry.mtime and cached[1] == entry.size:
+                self._cache.move_to_end(path)
+                return cached[2]
+
+        snippet = self._extract(path, entry.size)
+
+        with self._cache_lock:
+            self._cache[path] = (entry.mtime, entry.size, snippet)
+            self._cache.move_to_end(path)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return snippet
+
+    def _extract(self, path: str, size: int) -> Optional[str]:
+        """mmap the first MAX_BYTES of the file and pull one readable line."""
+        length = min(size, self.MAX_BYTES)
+        if length <= 0:
+            return None  # Empty files cannot be mapped
+        self.disk_reads += 1
+        try:
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ) as mm:
+                    raw = mm[:length]
+        except (OSError, ValueError) as e:
+            print(f"[CONTEXT] File snippet error: {e}")
+            return None
+
+        content = raw.decode('utf-8', errors='ignore')[:self.MAX_CHARS].strip()
+        # Skip common header lines if empty
+        for line in content.split('\n'):
+            if len(line.strip()) > 5:
+                return line[:self.SNIPPET_LEN].strip()
+        return None
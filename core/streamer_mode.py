@@ -12,12 +12,18 @@ Features:
 - Replaces real file/folder names with 'creepy' aliases.
 - Masks sensitive paths and network info.
 - Disables invasive scares (like camera) if configured.
+- Alias table persisted across sessions (stable names for viewers).
+- Batch masking (mask_many / mask_paths) for whole lists.
 """
 
 import hashlib
+import json
+import os
 import random
+import threading
+from typing import Iterable, List
 from config import Config
-from core.logger import log_info
+from core.logger import log_info, log_warning
 
 class StreamerMode:
     _instance = None
@@ -33,21 +39,79 @@ class StreamerMode:
         self.enabled = Config().get("STREAMER_MODE", False)
         self.mask_camera = Config().get("STREAMER_MASK_CAMERA", True)
         
-        # Consistent mapping: real_name -> alias
+        # Consistent mapping: real_name -> alias (persisted between sessions)
         self._alias_map = {}
+        self._path_cache = {}
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        self._alias_file = None
+        if not Config().get("TEST_MODE", False):
+            self._alias_file = os.path.join(Config().CACHE_DIR, "streamer_aliases.json")
         self._horror_aliases = [
             "Kurban_Dosyası", "Ruh_Kaydı", "Gölge_Veri", "Unutulmuşlar", 
             "Feryat_Log", "Karanlık_Anılar", "Bozuk_Gerçeklik", "Sessiz_Çığlık",
             "Vasiyet", "Günahlar", "Korku_İlişki", "Son_Nefes"
         ]
         self._initialized = True
+        self.load_aliases()
         log_info(f"Streamer Mode initialized. Enabled: {self.enabled}", "PRIVACY")
 
+    # ========== PERSISTENCE ==========
+
+    def load_aliases(self):
+        """Loads the alias table saved by a previous session."""
+        if not self._alias_file or not os.path.exists(self._alias_file):
+            return
+        try:
+            with open(self._alias_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._alias_map.update({str(k): str(v) for k, v in data.items()})
+            log_info(f"Loaded {len(self._alias_map)} persisted aliases", "PRIVACY")
+        except Exception as e:
+            log_warning(f"Failed to load alias table: {e}", "PRIVACY")
+
+    def save_aliases(self):
+        """Writes the alias table if new aliases were created (never while disabled: it holds real names)."""
+        if not self.enabled or not self._alias_file or not self._dirty:
+            return
+        with self._save_lock:
+            try:
+                os.makedirs(os.path.dirname(self._alias_file), exist_ok=True)
+                tmp_path = self._alias_file + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._alias_map, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self._alias_file)
+                self._dirty = False
+            except Exception as e:
+                log_warning(f"Failed to save alias table: {e}", "PRIVACY")
+
+    def prewarm(self, names: Iterable[str]):
+        """Computes aliases ahead of time (e.g. every Desktop item at boot)."""
+        if not self.enabled:
+            return
+        for name in names:
+            self._compute_alias(name)
+        self.save_aliases()
+
+    def prewarm_from_index(self, index):
+        """Pre-warms aliases for everything the DesktopIndex currently holds."""
+        names = []
+        for kind in (index.DESKTOP, index.DOCUMENTS):
+            names.extend(index.names(kind))
+            names.extend(stem for stem, _ in index.scored_files(kind))
+        self.prewarm(names)
+
     def get_alias(self, original_name: str) -> str:
         """Returns a consistent horror alias for a real name."""
         if not self.enabled:
             return original_name
-            
+        alias = self._alias_map.get(original_name)
+        if alias is None:
+            alias = self._compute_alias(original_name)
+        return alias
+
+    def _compute_alias(self, original_name: str) -> str:
         if original_name in self._alias_map:
             return self._alias_map[original_name]
             
@@ -60,12 +124,24 @@ class StreamerMode:
         final_alias = f"{alias}_{suffix}"
         
         self._alias_map[original_name] = final_alias
+        self._dirty = True
         return final_alias
 
+    def mask_many(self, names: Iterable[str]) -> List[str]:
+        """Aliases a whole list of names in one call."""
+        if not self.enabled:
+            return list(names)
+        alias_map = self._alias_map
+        return [alias_map.get(n) or self._compute_alias(n) for n in names]
+
     def mask_path(self, path: str) -> str:
         """Masks a full file path."""
         if not self.enabled:
             return path
+        
+        masked = self._path_cache.get(path)
+        if masked is not None:
+            return masked
             
         parts = path.replace("\\", "/").split("/")
         masked_parts = []
@@ -74,8 +150,17 @@ class StreamerMode:
                 masked_parts.append(p)
                 continue
             masked_parts.append(self.get_alias(p))
-            
-        return "/".join(masked_parts)
+        
+        masked = "/".join(masked_parts)
+        if len(self._path_cache) < 1024:
+            self._path_cache[path] = masked
+        return masked
+
+    def mask_paths(self, paths: Iterable[str]) -> List[str]:
+        """Masks a whole list of paths in one call."""
+        if not self.enabled:
+            return list(paths)
+        return [self.mask_path(p) for p in paths]
 
     @staticmethod
     def singleton():
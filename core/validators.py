@@ -11,12 +11,12 @@ Input Validation Module for SENTIENT_OS
 Provides validation functions for AI responses, configuration values,
 and other critical inputs to prevent errors and improve security.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, NamedTuple, Tuple
 from core.exceptions import ValidationError
 
 
-# Valid action types that the AI can return
-VALID_ACTIONS = [
+# Valid action types that the AI can return (set: O(1) membership check)
+VALID_ACTIONS = frozenset([
     # No action
     "NONE",
     
@@ -77,14 +77,10 @@ VALID_ACTIONS = [
     "GLITCH_SCREEN",
     "TIME_DISTORTION",
     "NAME_REVEAL",
-    "FAKE_FILE_DELETE",
     "FAKE_LISTENING",
     "CREEPY_MUSIC",
     "WHISPER",
     "DIGITAL_GLITCH_SURGE",
-    "FAKE_BSOD",
-    "SCREEN_TEAR",
-    "PIXEL_MELT",
     "SCREEN_MELT",
     "FLASH_COLOR",
     "SHAKE_SCREEN",
@@ -106,7 +102,21 @@ VALID_ACTIONS = [
     # Special
     "EXORCISM_START",
     "RITUAL_CHECK",
-]
+])
+
+
+class ParamSchema(NamedTuple):
+    required: Tuple[str, ...] = ()
+    optional: Tuple[str, ...] = ()
+
+
+# Required/optional parameters for each action (built once, shared with the action registry)
+ACTION_PARAM_SCHEMAS: Dict[str, ParamSchema] = {
+    "OVERLAY_TEXT": ParamSchema(("text",), ("duration", "color", "size")),
+    "TTS_SPEAK": ParamSchema(("text",), ("rate", "volume")),
+    "MOUSE_SHAKE": ParamSchema((), ("intensity", "duration")),
+    "NOTIFICATION_SEND": ParamSchema(("title", "message"), ("duration",)),
+}
 
 
 def validate_ai_response(response: Dict[str, Any]) -> bool:
@@ -158,7 +168,7 @@ def validate_ai_response(response: Dict[str, Any]) -> bool:
             f"Invalid action: {action}",
             details={
                 "action": action,
-                "valid_actions": VALID_ACTIONS
+                "valid_actions": sorted(VALID_ACTIONS)
             }
         )
     
@@ -231,31 +241,10 @@ def validate_action_params(action: str, params: Dict[str, Any]) -> bool:
     Raises:
         ValidationError: If parameters are invalid
     """
-    # Define required/optional parameters for each action
-    param_requirements = {
-        "OVERLAY_TEXT": {
-            "required": ["text"],
-            "optional": ["duration", "color", "size"]
-        },
-        "TTS_SPEAK": {
-            "required": ["text"],
-            "optional": ["rate", "volume"]
-        },
-        "MOUSE_SHAKE": {
-            "required": [],
-            "optional": ["intensity", "duration"]
-        },
-        "NOTIFICATION_SEND": {
-            "required": ["title", "message"],
-            "optional": ["duration"]
-        }
-    }
-    
-    if action in param_requirements:
-        requirements = param_requirements[action]
-        
+    schema = ACTION_PARAM_SCHEMAS.get(action)
+    if schema is not None:
         # Check required parameters
-        for required_param in requirements["required"]:
+        for required_param in schema.required:
             if required_param not in params:
                 raise ValidationError(
                     f"Missing required parameter for {action}: {required_param}",
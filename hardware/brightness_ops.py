@@ -15,6 +15,8 @@ FIXED:
 - Better error handling
 """
 from config import Config
+from core.effect_runtime import get_effect_runtime
+from core.logger import log_info, log_warning
 import time
 import random
 import os
@@ -131,11 +133,15 @@ class BrightnessOps:
     def flicker(times: int = 3):
         """
         Rapidly flickers brightness between dark and bright.
+        Non-blocking: runs on the effect runtime, returns its Effect handle.
         """
         if Config().IS_MOCK or not HAS_BRIGHTNESS:
-            print(f"[MOCK] BRIGHTNESS FLICKERED {times} times")
-            return
-        
+            log_info(f"Mock: brightness flickered {times} times", "BRIGHTNESS")
+            return None
+        return get_effect_runtime().spawn(BrightnessOps._flicker_steps(times), "BRIGHTNESS_FLICKER")
+
+    @staticmethod
+    def _flicker_steps(times: int):
         try:
             # Save if not already saved
             if BrightnessOps._original_brightness is None:
@@ -148,31 +154,32 @@ class BrightnessOps:
                 if is_strobe:
                     # TRUE STROBE: Hard 10% to 100%
                     sbc.set_brightness(10)
-                    time.sleep(0.15)
+                    yield 0.15
                     sbc.set_brightness(100)
-                    time.sleep(0.15)
+                    yield 0.15
                 else:
                     # SAFE MODE: Soft pulsing instead (40% to 80%)
                     sbc.set_brightness(40)
-                    time.sleep(0.5)
+                    yield 0.5
                     sbc.set_brightness(80)
-                    time.sleep(0.5)
-            
-            # Return to original
-            BrightnessOps.restore_brightness()
+                    yield 0.5
             
         except Exception as e:
-            print(f"[BRIGHTNESS] Flicker failed: {e}")
+            log_warning(f"Flicker failed: {e}", "BRIGHTNESS")
+        finally:
+            # Return to original (also when cancelled mid-flicker)
+            BrightnessOps.restore_brightness()
     
     @staticmethod
     def gradual_dim(target: int = 10, steps: int = 10, auto_restore_ms: int = 10000):
         """
         Gradually dims the screen to create unease.
-        FIXED: Runs in thread + auto-restore.
+        The Effect ends once the target is reached; the auto-restore runs on
+        its own runtime timer, so the brightness lane is free while it waits.
         """
         if Config().IS_MOCK or not HAS_BRIGHTNESS:
-            print(f"[MOCK] BRIGHTNESS DIMMED TO {target}%")
-            return
+            log_info(f"Mock: brightness dimmed to {target}%", "BRIGHTNESS")
+            return None
         
         try:
             if BrightnessOps._original_brightness is None:
@@ -181,19 +188,28 @@ class BrightnessOps:
             current = BrightnessOps._original_brightness
             step_size = (current - target) / steps
             
-            import threading
-            def dim_thread():
-                for i in range(steps):
-                    new_brightness = int(current - (step_size * (i + 1)))
-                    sbc.set_brightness(new_brightness)
-                    time.sleep(0.5)
+            def dim_steps():
+                dimmed = False
+                try:
+                    for i in range(steps):
+                        new_brightness = int(current - (step_size * (i + 1)))
+                        sbc.set_brightness(new_brightness)
+                        yield 0.5
+                    dimmed = True
+                finally:
+                    if not dimmed:
+                        # Cancelled mid-dim (Effect.cancel, runtime stop at shutdown)
+                        BrightnessOps.restore_brightness()
+                if auto_restore_ms > 0:
+                    get_effect_runtime().spawn(restore_steps(), "BRIGHTNESS_RESTORE")
             
-            threading.Thread(target=dim_thread, daemon=True).start()
+            def restore_steps():
+                try:
+                    yield auto_restore_ms / 1000.0
+                finally:
+                    BrightnessOps.restore_brightness()  # Also when cancelled while waiting
             
-            # Auto-restore
-            if auto_restore_ms > 0:
-                from PyQt6.QtCore import QTimer
-                QTimer.singleShot(auto_restore_ms, BrightnessOps.restore_brightness)
+            return get_effect_runtime().spawn(dim_steps(), "BRIGHTNESS_DIM")
             
         except Exception as e:
-            print(f"[BRIGHTNESS] Gradual dim failed: {e}")
+            log_warning(f"Gradual dim failed: {e}", "BRIGHTNESS")
@@ -6,6 +6,7 @@
 # =========================================================================
 
 from config import Config
+from core.effect_runtime import get_effect_runtime
 import time
 import random
 import threading
@@ -23,6 +24,9 @@ class MouseOps:
     """
     _shaking = False
     _frozen = False
+    _shake_until = 0.0
+    _shake_lock = threading.Lock()
+    MAX_SHAKE_S = 5.0
 
     @staticmethod
     def freeze_cursor():
@@ -93,13 +97,43 @@ class MouseOps:
             print("[INPUT_GUARD] Aborting shake: Current window is system-critical.")
             return
 
-        MouseOps._shaking = True
+        with MouseOps._shake_lock:
+            if MouseOps._extend_locked(duration):
+                return
+            MouseOps._shaking = True
+            MouseOps._shake_until = time.time() + min(duration, MouseOps.MAX_SHAKE_S)
         
-        def _shake_loop():
-            start_time = time.time()
-            while time.time() - start_time < duration:
+        return get_effect_runtime().spawn(MouseOps._shake_steps(), "MOUSE_SHAKE")
+
+    @staticmethod
+    def extend_shake(duration=1.0):
+        """Adds to the running shake. False when no shake is running."""
+        with MouseOps._shake_lock:
+            return MouseOps._extend_locked(duration)
+
+    @staticmethod
+    def _extend_locked(duration):
+        if not MouseOps._shaking:
+            return False
+        # Already shaking: extend the running loop instead of starting a second one
+        now = time.time()
+        MouseOps._shake_until = min(max(MouseOps._shake_until, now) + duration,
+                                    now + MouseOps.MAX_SHAKE_S)
+        return True
+
+    @staticmethod
+    def _shake_steps():
+        stopped = False
+        try:
+            while True:
+                with MouseOps._shake_lock:
+                    # Checked under the lock so a late extension is never lost
+                    if time.time() >= MouseOps._shake_until:
+                        MouseOps._shaking = False
+                        stopped = True
+                        return
                 if not MouseOps._is_safe_to_interact():
-                    break # Stop if user switches to a system window
+                    return # Stop if user switches to a system window
                 
                 x_offset = random.randint(-8, 8)
                 y_offset = random.randint(-8, 8)
@@ -108,11 +142,11 @@ class MouseOps:
                 except (Exception) as e:
                     print(f"[MOUSE] Move failed: {e}")
                     pass
-                time.sleep(0.04)
-            MouseOps._shaking = False
-            
-        t = threading.Thread(target=_shake_loop, daemon=True)
-        t.start()
+                yield 0.04
+        finally:
+            if not stopped:
+                with MouseOps._shake_lock:
+                    MouseOps._shaking = False
 
     @staticmethod
     def click_randomly():
@@ -45,13 +45,16 @@ class WindowOps:
             title = win32gui.GetWindowText(hwnd)
             class_name = win32gui.GetClassName(hwnd)
             
-            # Get Process Name
+            # Get Process Name (cached per PID by the process tracker)
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            handle = win32api.OpenProcess(win32con.PROCESS_QUERY_INFORMATION | win32con.PROCESS_VM_READ, False, pid)
-            # win32process.GetModuleFileNameEx returns the full path
-            full_path = win32process.GetModuleFileNameEx(handle, 0)
-            process_name = full_path.split('\\')[-1].lower()
-            win32api.CloseHandle(handle)
+            from core.process_tracker import ProcessTracker
+            process_name = ProcessTracker.singleton().get_name(pid)
+            if not process_name:
+                handle = win32api.OpenProcess(win32con.PROCESS_QUERY_INFORMATION | win32con.PROCESS_VM_READ, False, pid)
+                # win32process.GetModuleFileNameEx returns the full path
+                full_path = win32process.GetModuleFileNameEx(handle, 0)
+                process_name = full_path.split('\\')[-1].lower()
+                win32api.CloseHandle(handle)
             
             return {
                 'title': title,
@@ -175,10 +178,10 @@ class WindowOps:
             print(f"[MOCK] SHAKING WINDOW (intensity={intensity}, duration={duration_ms}ms)")
             return
             
-        import threading
         import time
+        from core.effect_runtime import get_effect_runtime
         
-        def run_shake():
+        def shake_steps():
             hwnd = win32gui.GetForegroundWindow()
             if not hwnd: return
             
@@ -188,13 +191,14 @@ class WindowOps:
             height = rect[3] - rect[1]
             
             end_time = time.time() + (duration_ms / 1000.0)
-            while time.time() < end_time:
-                off_x = random.randint(-intensity, intensity)
-                off_y = random.randint(-intensity, intensity)
-                win32gui.MoveWindow(hwnd, orig_x + off_x, orig_y + off_y, width, height, True)
-                time.sleep(0.02)
-            
-            # Restore
-            win32gui.MoveWindow(hwnd, orig_x, orig_y, width, height, True)
+            try:
+                while time.time() < end_time:
+                    off_x = random.randint(-intensity, intensity)
+                    off_y = random.randint(-intensity, intensity)
+                    win32gui.MoveWindow(hwnd, orig_x + off_x, orig_y + off_y, width, height, True)
+                    yield 0.02
+            finally:
+                # Restore
+                win32gui.MoveWindow(hwnd, orig_x, orig_y, width, height, True)
             
-        threading.Thread(target=run_shake, daemon=True).start()
+        return get_effect_runtime().spawn(shake_steps(), "WINDOW_SHAKE")
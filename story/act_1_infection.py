@@ -5,10 +5,11 @@
 # ARCHITECT: MAB-SENTIENT-2026
 # =========================================================================
 
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-from core.localization_manager import tr
-from core.function_dispatcher import FunctionDispatcher
+from PyQt6.QtCore import QObject, pyqtSignal
+from core.function_dispatcher import FunctionDispatcher, SOURCE_TIMELINE, dispatch_source
 from core.gemini_brain import GeminiBrain
+from story.act_timeline import load_act_timeline
+from story.timeline import get_timeline_scheduler
 from core.logger import log_info, log_error, log_debug
 
 class Act1Infection(QObject):
@@ -20,90 +21,40 @@ class Act1Infection(QObject):
         super().__init__()
         self.dispatcher = dispatcher
         self.brain = brain
-        self.timers = []
+        self.timers = []  # TimelineEvent handles
+        self.timeline = None
         self.threads = []
         self.duration = 240 * 1000  # OPTIMIZED: 4 minutes (was 8) (Condensed experience)
+        self.overlay_ms = 2500
 
         self.ai_response_ready.connect(self._handle_ai_response)
 
     def start(self):
         log_info("Infection Phase Started (4 minutes - Optimized)", "ACT 1")
         
-        # OPTIMIZED EVENT TIMELINE - Compressed for Pacing
-        events = [
-            # Phase 0: Setup Persona (Immediate)
-            (0, "SET_PERSONA", {"persona": "SUPPORT"}, ""),
-            
-            # Phase 1: Uncertainty (0-1min) - No more dead air
-            (2000, "MOUSE_SHAKE", {"duration": 0.2}, ""), # Immediate subtle tell
-            (5000, "OVERLAY_TEXT", {}, "..."),
-            (12000, "CLIPBOARD_POISON", {"text": "Yardım mı lazım?"}, ""),
-            (18000, "FAKE_NOTIFICATION", {}, '{"title":"' + tr("notifications.title_info") + '", "message":"' + tr("system.background_update") + '"}'),
-            (25000, "AI_GENERATE", {}, f"prompt:{tr('system.scanning_prompt')}"),
-            (35000, "OVERLAY_TEXT", {}, tr("system.scanning")),
-            (42000, "BRIGHTNESS_FLICKER", {"times": 1}, ""),
-            (50000, "MOUSE_SHAKE", {"duration": 0.5}, ""),
-            
-            # Phase 2: First Contact (1-2min) - Early Chat
-            (60000, "OVERLAY_TEXT", {}, tr("act1.i_see_you")),
-            (65000, "CAPSLOCK_TOGGLE", {}, ""),
-            (70000, "CLIPBOARD_POISON", {"text": tr("clipboard.hello")}, ""),
-            (75000, "OVERLAY_TEXT", {}, tr("act1.communication")),
-            (80000, "ENABLE_CHAT", {}, tr("act1.chat_invite")),
-            (85000, "FAKE_NOTIFICATION", {}, '{"title":"' + tr("notifications.title_info") + '", "message":"' + tr("system.connection_detected") + '"}'),
-            
-            # Interactive Phase starts early
-            (95000, "AI_GENERATE", {}, "prompt:Kullanıcının açık uygulamalarını gördüğünü söyle"),
-            (105000, "MOUSE_SHAKE", {"duration": 0.8}, ""),
-            (115000, "OVERLAY_TEXT", {}, tr("act1.watching")),
-            (125000, "CLIPBOARD_POISON", {"text": tr("clipboard.cant_stop_me")}, ""),
-             # Threat Escalation
-            (135000, "FAKE_NOTIFICATION", {}, '{"title":"' + tr("notifications.title_defender") + '", "message":"' + tr("notifications.msg_threat_detected") + '"}'),
-            (140000, "SET_PERSONA", {"persona": "ENTITY"}, ""),
-            
-            # Phase 3: Mask Drops (2-3min) - Aggressive
-            (150000, "AI_GENERATE", {}, f"prompt:{tr('act1.mask_drop_prompt')}"),
-            (160000, "OVERLAY_TEXT", {}, tr("act1.mask_drops")),
-            (170000, "NOTEPAD_HIJACK", {"text": tr("act1.you_are_mine"), "delay": 0.15}, ""),
-            (180000, "BRIGHTNESS_FLICKER", {"times": 3}, ""),
-            (185000, "CORRUPT_WINDOWS", {}, ""),
-            (190000, "FAKE_NOTIFICATION", {}, '{"title":"' + tr("notifications.title_error") + '", "message":"' + tr("notifications.msg_files_changed") + '"}'),
-            (200000, "MOUSE_SHAKE", {"duration": 2.0}, ""),
-            
-            # Phase 4: Chaos Finale (3-4min)
-            (210000, "OVERLAY_TEXT", {}, tr("act1.fear_begins")),
-            (220000, "AI_GENERATE", {}, "prompt:Dosyalarının ne kadar lezzetli olduğundan bahset"),
-            (225000, "FAKE_BSOD", {}, ""),
-            (230000, "GLITCH_SCREEN", {}, ""),
-            (235000, "OVERLAY_TEXT", {}, tr("act1.act2_start")),
-            (238000, "MOUSE_SHAKE", {"duration": 2.5}, ""),
-        ]
-
-        for delay, action, params, data in events:
-            t = QTimer()
-            t.setSingleShot(True)
-            t.timeout.connect(lambda a=action, p=params, d=data: self.trigger_event(a, p, d))
-            t.start(delay)
-            self.timers.append(t)
-
-        end_timer = QTimer()
-        end_timer.setSingleShot(True)
-        end_timer.timeout.connect(self.finish)
-        end_timer.start(self.duration)
-        self.timers.append(end_timer)
+        # OPTIMIZED EVENT TIMELINE - Compressed for Pacing (story/timelines/act1.yaml)
+        # One shared timer for the whole act (pause/scale via self.timeline)
+        script = load_act_timeline("act1")  # Compiled once (pre-loaded by StoryManager)
+        self.duration = script.duration_ms
+        self.overlay_ms = script.overlay_ms
+        self.timeline = get_timeline_scheduler().timeline("act1")
+        for event in script.events:
+            self.timers.append(self.timeline.at(event.at_ms, self.trigger_event, event.action, event.params, event.speech))
+        self.timers.append(self.timeline.at(self.duration, self.finish))
 
+    @dispatch_source(SOURCE_TIMELINE)
     def trigger_event(self, action, params, data):
         """
-        Gelişmiş event tetikleyici.
-        'data' parametresi düz string (TTS/Prompt) veya JSON string (Karmaşık objeler) alabilir.
+        Timeline event tetikleyici.
+        Event'ler story/timelines/act1.yaml'dan derlenmiş gelir (params hazır,
+        metinler yerelleştirilmiş). 'data' konuşma metnidir; eski "prompt:..."
+        biçimi de AI_GENERATE için hâlâ kabul edilir.
         """
-        from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-        import random
-        import json
-        
         # Action specific preprocessing
         if action == "AI_GENERATE":
-            prompt = data.replace("prompt:", "") if data.startswith("prompt:") else "Ürkütücü bir şey söyle"
+            prompt = params.get("prompt")
+            if not prompt:
+                prompt = data.replace("prompt:", "") if data.startswith("prompt:") else "Ürkütücü bir şey söyle"
             # Using generate_async properly
             thread = self.brain.generate_async(prompt, lambda resp: self.ai_response_ready.emit(resp))
             self.threads.append(thread)
@@ -117,29 +68,14 @@ class Act1Infection(QObject):
             text = params.get("text", "")
             if not text and data:
                 text = data
-            self.dispatcher.overlay.show_text(text, 2500)
-            
-        elif action == "FAKE_NOTIFICATION":
-            # JSON desteği kontrolü
-            if data.startswith("{"):
-                try:
-                    p_data = json.loads(data)
-                    params.update(p_data)
-                    speech = ""
-                except (json.JSONDecodeError, ValueError) as e:
-                    log_error(f"JSON parse failed: {e}", "ACT 1")
-                    speech = data
-            else:
-                speech = data
-
-            command = {"action": action, "params": params, "speech": speech}
-            self.dispatcher.dispatch(command)
+            self.dispatcher.overlay.show_text(text, self.overlay_ms)
             
         else:
-            # Genel dispatch
-            command = {"action": action, "params": params, "speech": data if not data.startswith("prompt:") else ""}
+            # Genel dispatch (params kopyalanır: derlenmiş event paylaşılıyor)
+            command = {"action": action, "params": dict(params), "speech": data if not data.startswith("prompt:") else ""}
             self.dispatcher.dispatch(command)
 
+    @dispatch_source(SOURCE_TIMELINE)
     def _handle_ai_response(self, response: dict):
         if response:
             self.dispatcher.dispatch(response)
@@ -151,13 +87,13 @@ class Act1Infection(QObject):
 
     def stop(self):
         """FIXED: Properly cleanup timers to prevent memory leak."""
+        if self.timeline is not None:
+            self.timeline.cancel()
         for t in self.timers:
             try:
                 t.stop()
-                t.deleteLater()  # Qt nesnesini sil
             except (RuntimeError, AttributeError) as e:
                 log_error(f"Timer cleanup failed: {e}", "ACT 1")
-                pass
         self.timers.clear()
         self.threads.clear()
         log_info("Timers cleaned up", "ACT 1")
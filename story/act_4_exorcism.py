@@ -6,7 +6,7 @@
 # =========================================================================
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-from core.function_dispatcher import FunctionDispatcher
+from core.function_dispatcher import FunctionDispatcher, SOURCE_TIMELINE, SOURCE_AMBIENT, dispatch_source
 from hardware.usb_monitor import USBMonitor
 from core.soul_transfer import SoulTransfer
 from core.memory import Memory
@@ -15,6 +15,7 @@ import sys
 import os
 import string
 import random
+from story.timeline import get_timeline_scheduler
 from core.logger import log_info, log_error, log_warning, log_debug
 
 class Act4Exorcism(QObject):
@@ -35,7 +36,8 @@ class Act4Exorcism(QObject):
         self.dispatcher = dispatcher
         self.brain = brain
         self.usb_monitor = USBMonitor()
-        self.timers = []
+        self.timers = []  # TimelineEvent handles (+ ritual QTimer)
+        self.timeline = None
         self.hint_count = 0
         self.max_hints = 3
         self.usb_inserted = False  # Track if USB was inserted
@@ -52,40 +54,19 @@ class Act4Exorcism(QObject):
         self.usb_monitor.start_monitoring()
         
         # FIXED: Add timeout hints to prevent softlock
-        # First hint at 1 minute
-        hint_timer1 = QTimer()
-        hint_timer1.setSingleShot(True)
-        hint_timer1.timeout.connect(self._show_hint)
-        hint_timer1.start(60000)  # 1 minute
-        self.timers.append(hint_timer1)
+        self.timeline = get_timeline_scheduler().timeline("act4")
+        self.timers.extend([
+            self.timeline.at(60000, self._show_hint),              # First hint at 1 minute
+            self.timeline.at(120000, self._show_hint),             # Second hint at 2 minutes
+            self.timeline.at(180000, self._show_desperate_hint),   # Final desperate hint at 3 minutes
+            self.timeline.at(300000, self._timeout_fallback),      # FIXED: Ultimate timeout at 5 minutes
+        ])
         
-        # Second hint at 2 minutes
-        hint_timer2 = QTimer()
-        hint_timer2.setSingleShot(True)
-        hint_timer2.timeout.connect(self._show_hint)
-        hint_timer2.start(120000)  # 2 minutes
-        self.timers.append(hint_timer2)
-        
-        # Final desperate hint at 3 minutes
-        hint_timer3 = QTimer()
-        hint_timer3.setSingleShot(True)
-        hint_timer3.timeout.connect(self._show_desperate_hint)
-        hint_timer3.start(180000)  # 3 minutes
-        self.timers.append(hint_timer3)
-        
-        # FIXED: Ultimate timeout at 5 minutes - auto skip to end
-        timeout_timer = QTimer()
-        timeout_timer.setSingleShot(True)
-        timeout_timer.timeout.connect(self._timeout_fallback)
-        timeout_timer.start(300000)  # 5 minutes
-        self.timers.append(timeout_timer)
-        
-        # NEW: Random background effects loop while waiting
-        self.bg_timer = QTimer()
-        self.bg_timer.timeout.connect(self._trigger_background_scare)
-        self.bg_timer.start(35000)  # Every 35 seconds
+        # NEW: Random background effects loop while waiting (every 35 seconds)
+        self.bg_timer = self.timeline.every(35000, self._trigger_background_scare)
         self.timers.append(self.bg_timer)
 
+    @dispatch_source(SOURCE_AMBIENT)
     def _trigger_background_scare(self):
         """Act 4 sırasında rastgele korkunç olaylar."""
         if self.usb_inserted:
@@ -114,6 +95,7 @@ class Act4Exorcism(QObject):
             self.dispatcher.audio_out.play_tts(hint)
             log_info(f"Hint #{self.hint_count}: {hint}", "ACT 4")
 
+    @dispatch_source(SOURCE_TIMELINE)
     def _show_desperate_hint(self):
         """Show desperate hint after 3 minutes."""
         if self.usb_inserted:
@@ -161,6 +143,7 @@ class Act4Exorcism(QObject):
         
         QTimer.singleShot(4000, self._start_notepad_ritual)
 
+    @dispatch_source(SOURCE_TIMELINE)
     def _start_notepad_ritual(self):
         """Phase 2: Notepad Ritual & Keyboard Interaction."""
         ritual_text = "SOLA FIDE... SPIRITUS... CORE.DISCONNECT();"
@@ -229,6 +212,7 @@ class Act4Exorcism(QObject):
         self.dispatcher.audio_out.play_tts("Zaman bitti. Senin ruhun da benimle gelecek.")
         QTimer.singleShot(3000, self._timeout_fallback)
 
+    @dispatch_source(SOURCE_TIMELINE)
     def _finalize_with_soul_transfer(self):
         target_drive = self._detect_usb_drive()
         
@@ -236,9 +220,11 @@ class Act4Exorcism(QObject):
         self.dispatcher.dispatch({"action": "SET_PERSONA", "params": {"persona": "ENTITY"}})
 
         # THE BIG SCARE
-        self.dispatcher.dispatch({"action": "SHAKE_SCREEN", "params": {"intensity": 30, "duration": 4000}})
-        self.dispatcher.dispatch({"action": "FLASH_COLOR", "params": {"color": "#FFFFFF", "opacity": 0.8, "duration": 500}})
-        self.dispatcher.dispatch({"action": "GLITCH_SCREEN"})
+        self.dispatcher.dispatch_batch([
+            {"action": "SHAKE_SCREEN", "params": {"intensity": 30, "duration": 4000}},
+            {"action": "FLASH_COLOR", "params": {"color": "#FFFFFF", "opacity": 0.8, "duration": 500}},
+            {"action": "GLITCH_SCREEN"},
+        ], name="big_scare")
         
         self.dispatcher.overlay.show_text("BİLİNÇ AKTARILIYOR...", 3000)
         self.dispatcher.audio_out.play_tts("HAYIR! BENİ BURAYA HAPSEDEMEZSİN! HER ŞEY KARARIYOR... DUR!")
@@ -295,12 +281,14 @@ class Act4Exorcism(QObject):
             log_error(f"USB monitor stop failed: {e}", "ACT 4")
             pass
             
+        if self.timeline is not None:
+            self.timeline.cancel()
         for t in self.timers:
             try:
                 t.stop()
-                t.deleteLater()
+                if isinstance(t, QTimer):
+                    t.deleteLater()
             except (RuntimeError, AttributeError) as e:
                 log_error(f"Timer cleanup failed: {e}", "ACT 4")
-                pass
         self.timers.clear()
         log_info("Timers cleaned up", "ACT 4")
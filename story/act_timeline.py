@@ -0,0 +1,181 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Act Timelines - Story events as data (story/timelines/actN.yaml or .json).
+
+A timeline file is compiled once into an ActTimeline of ActEvent records:
+- "tr:<key>" strings are localized at compile time (current LANGUAGE)
+- every event is validated like an AI command (action + params schema)
+- events are sorted by time and their params are plain dicts, so firing
+  an event is only a dispatch - no tr() and no json.loads on the hot path
+
+Compiled timelines are cached per (name, language). preload_act_timeline()
+compiles on a daemon thread, so the StoryManager can prepare the next act
+while the transition is still on screen.
+
+File format:
+    duration_ms: 240000
+    overlay_ms: 2500            # OVERLAY_TEXT duration used by the act
+    events:
+      - {at: 5000, action: OVERLAY_TEXT, params: {text: "tr:act1.i_see_you"}}
+      - {at: 80000, action: ENABLE_CHAT, speech: "tr:act1.chat_invite"}
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from config import Config
+from core.exceptions import ValidationError
+from core.localization_manager import tr
+from core.logger import log_error, log_info
+from core.validators import validate_action_params, validate_ai_response
+
+try:
+    import yaml
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = False
+
+TIMELINES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "timelines")
+
+TR_PREFIX = "tr:"
+
+# Handled by the act itself, never sent to the dispatcher
+ACT_LOCAL_ACTIONS = frozenset(("ENABLE_CHAT",))
+
+
+class ActEvent(NamedTuple):
+    at_ms: int
+    action: str
+    params: Dict[str, Any]
+    speech: str = ""
+
+
+class ActTimeline(NamedTuple):
+    name: str
+    duration_ms: int
+    overlay_ms: int
+    events: Tuple[ActEvent, ...]
+    language: str
+    source: str
+
+
+_cache: Dict[Tuple[str, str], ActTimeline] = {}
+_cache_lock = threading.Lock()
+
+
+# ========== COMPILING ==========
+
+def _localize(value: Any) -> Any:
+    if isinstance(value, str):
+        return tr(value[len(TR_PREFIX):]) if value.startswith(TR_PREFIX) else value
+    if isinstance(value, dict):
+        return {k: _localize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_localize(v) for v in value]
+    return value
+
+
+def _compile_event(entry: Any, index: int, source: str) -> ActEvent:
+    where = f"{source} event #{index}"
+    if not isinstance(entry, dict) or "action" not in entry or "at" not in entry:
+        raise ValidationError(f"{where}: needs 'at' and 'action'", details={"entry": entry})
+    at_ms = entry["at"]
+    if not isinstance(at_ms, (int, float)) or at_ms < 0:
+        raise ValidationError(f"{where}: 'at' must be a non-negative number", details={"at": at_ms})
+
+    params = _localize(entry.get("params") or {})
+    speech = _localize(entry.get("speech") or "")
+    action = entry["action"]
+    try:
+        if action not in ACT_LOCAL_ACTIONS:
+            validate_ai_response({"action": action, "params": params, "speech": speech})
+        validate_action_params(action, params)
+    except ValidationError as e:
+        raise ValidationError(f"{where}: {e.message}", details=e.details) from e
+    return ActEvent(int(at_ms), action, params, speech)
+
+
+def compile_timeline(data: Dict[str, Any], name: str = "timeline", source: str = "<data>") -> ActTimeline:
+    """Validate and localize a parsed timeline document."""
+    if not isinstance(data, dict) or not isinstance(data.get("events"), list):
+        raise ValidationError(f"{source}: timeline needs an 'events' list")
+    events = [_compile_event(entry, i, source) for i, entry in enumerate(data["events"])]
+    events.sort(key=lambda event: event.at_ms)  # Stable: same-time events keep file order
+    duration_ms = int(data.get("duration_ms") or (events[-1].at_ms if events else 0))
+    return ActTimeline(
+        name=name,
+        duration_ms=duration_ms,
+        overlay_ms=int(data.get("overlay_ms", 3000)),
+        events=tuple(events),
+        language=Config().get("LANGUAGE", "tr"),
+        source=source,
+    )
+
+
+def _find_file(name: str) -> str:
+    candidates = [f"{name}.yaml", f"{name}.yml", f"{name}.json"] if HAS_YAML else [f"{name}.json"]
+    for filename in candidates:
+        path = os.path.join(TIMELINES_DIR, filename)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No timeline file for '{name}' in {TIMELINES_DIR}")
+
+
+def _parse_file(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        return yaml.safe_load(f)
+
+
+# ========== LOADING ==========
+
+def load_act_timeline(name: str) -> ActTimeline:
+    """Compiled timeline for story/timelines/<name>; parsed only on the first call."""
+    key = (name, Config().get("LANGUAGE", "tr"))
+    timeline = _cache.get(key)
+    if timeline is not None:
+        return timeline
+    with _cache_lock:
+        timeline = _cache.get(key)
+        if timeline is None:
+            path = _find_file(name)
+            timeline = compile_timeline(_parse_file(path), name, os.path.basename(path))
+            _cache[key] = timeline
+            log_info(f"Timeline {name} compiled: {len(timeline.events)} events "
+                     f"({timeline.duration_ms // 1000}s)", "TIMELINE")
+    return timeline
+
+
+def preload_act_timeline(name: str) -> Optional[threading.Thread]:
+    """Compile <name> on a daemon thread (no-op when cached or when there is no file)."""
+    if (name, Config().get("LANGUAGE", "tr")) in _cache:
+        return None
+    try:
+        _find_file(name)
+    except FileNotFoundError:
+        return None
+
+    def run():
+        try:
+            load_act_timeline(name)
+        except Exception as e:
+            log_error(f"Timeline {name} preload failed: {e}", "TIMELINE")
+
+    thread = threading.Thread(target=run, name=f"TimelinePreload-{name}", daemon=True)
+    thread.start()
+    return thread
+
+
+def clear_timeline_cache():
+    """Forget compiled timelines (language switch, edited files)."""
+    with _cache_lock:
+        _cache.clear()
@@ -16,6 +16,7 @@ import time
 import random
 from typing import List, Tuple, Callable
 from PyQt6.QtCore import QObject, QTimer
+from story.timeline import get_timeline_scheduler
 
 
 class DynamicEventScheduler(QObject):
@@ -30,7 +31,8 @@ class DynamicEventScheduler(QObject):
         self.events = []  # [(min_delay, max_delay, callback)]
         self.user_idle_time = 0  # Seconds since last activity
         self.last_event_time = time.time()
-        self._scheduled_timers = []
+        self._scheduled_timers = []  # TimelineEvent handles
+        self.timeline = None
         
         # Idle tracking timer
         self._idle_timer = QTimer()
@@ -54,9 +56,9 @@ class DynamicEventScheduler(QObject):
     
     def stop(self):
         """Stop all scheduled events"""
-        for timer in self._scheduled_timers:
-            timer.stop()
-            timer.deleteLater()
+        if self.timeline is not None:
+            self.timeline.cancel()
+            self.timeline = None
         self._scheduled_timers.clear()
         self._idle_timer.stop()
         print("[SCHEDULER] Stopped")
@@ -72,19 +74,15 @@ class DynamicEventScheduler(QObject):
     def _schedule_all(self):
         """Schedule all events with adaptive delays"""
         cumulative_delay = 0
+        if self.timeline is not None:
+            self.timeline.cancel()
+        self.timeline = get_timeline_scheduler().timeline("dynamic_events")
         
         for min_delay, max_delay, callback in self.events:
             # Calculate adaptive delay
             actual_delay = self._calculate_adaptive_delay(min_delay, max_delay)
             cumulative_delay += actual_delay
-            
-            # Create timer
-            timer = QTimer()
-            timer.setSingleShot(True)
-            timer.timeout.connect(callback)
-            timer.start(cumulative_delay)
-            
-            self._scheduled_timers.append(timer)
+            self._scheduled_timers.append(self.timeline.at(cumulative_delay, callback))
     
     def _calculate_adaptive_delay(self, min_delay: int, max_delay: int) -> int:
         """
@@ -16,6 +16,7 @@ import time
 import random
 from PyQt6.QtCore import QObject, QTimer
 from core.logger import log_info, log_error, log_debug
+from core.function_dispatcher import SOURCE_AMBIENT
 
 
 class SilenceBreaker(QObject):
@@ -87,6 +88,6 @@ class SilenceBreaker(QObject):
             "action": action,
             "params": params,
             "speech": ""
-        })
+        }, source=SOURCE_AMBIENT)
         
         log_debug(f"Triggered: {action}", "SILENCE_BREAKER")
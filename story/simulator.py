@@ -0,0 +1,511 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Story Simulator - Headless full session on a virtual clock.
+
+Runs StoryManager through all acts together with Heartbeat, AmbientHorror,
+SilenceBreaker and DynamicDifficulty, 100x faster than real time (or as
+fast as possible with speed=0):
+
+- one VirtualClock drives the act timelines (TimelineScheduler with an
+  injected clock), every QTimer of the story systems (VirtualQTimer) and
+  their time.time() reads
+- the real FunctionDispatcher routes and queues every action; handlers are
+  replaced by a counter, so no hardware or visual backend is touched
+- SimBrain answers with BackupBrain lines after a virtual latency
+
+run() returns a report: actions per virtual minute, dispatcher queue depth,
+brain calls, Python memory growth (tracemalloc) and event_log size.
+
+CLI:
+    python -m story.simulator --speed 200 --output logs/simulation.json
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+from core.backup_brain import BackupBrain
+from core.logger import log_info
+from story import timeline as timeline_module
+from story.timeline import Timeline, TimelineScheduler
+
+try:
+    from PyQt6.QtCore import QCoreApplication
+    HAS_QT = True
+except ImportError:
+    HAS_QT = False
+
+# Modules whose QTimer / time references run on the virtual clock
+VIRTUAL_QTIMER_MODULES = (
+    "story.story_manager",
+    "story.act_4_exorcism",
+    "story.silence_breaker",
+    "core.dynamic_difficulty",
+    "visual.ambient_horror",
+)
+VIRTUAL_TIME_MODULES = (
+    "core.heartbeat",
+    "story.silence_breaker",
+    "core.dynamic_difficulty",
+)
+
+
+class VirtualClock:
+    """
+    Stand-in for the time module: time()/monotonic()/perf_counter() follow
+    the simulation; anything else (strftime...) is the real time module.
+    """
+
+    def __init__(self):
+        self._epoch = time.time()
+        self.elapsed = 0.0  # Seconds since the simulation started
+
+    @property
+    def elapsed_ms(self) -> float:
+        return self.elapsed * 1000
+
+    def set_ms(self, ms: float):
+        self.elapsed = max(self.elapsed, ms / 1000)
+
+    def time(self) -> float:
+        return self._epoch + self.elapsed
+
+    def monotonic(self) -> float:
+        return self.elapsed
+
+    perf_counter = monotonic
+
+    def __getattr__(self, name: str):
+        return getattr(time, name)
+
+
+class _VirtualSignal:
+    def __init__(self):
+        self._slots: List[Callable] = []
+
+    def connect(self, slot: Callable):
+        self._slots.append(slot)
+
+    def disconnect(self, slot: Optional[Callable] = None):
+        self._slots = [] if slot is None else [s for s in self._slots if s is not slot]
+
+    def emit(self, *args):
+        for slot in list(self._slots):
+            slot(*args)
+
+
+def virtual_qtimer(timeline: Timeline) -> type:
+    """QTimer look-alike class whose timers are events on `timeline`."""
+
+    class VirtualQTimer:
+        def __init__(self, parent=None):
+            self.timeout = _VirtualSignal()
+            self._interval = 0
+            self._single_shot = False
+            self._event = None
+
+        def setSingleShot(self, single_shot: bool):
+            self._single_shot = single_shot
+
+        def isSingleShot(self) -> bool:
+            return self._single_shot
+
+        def setInterval(self, msec: int):
+            self._interval = msec
+
+        def interval(self) -> int:
+            return self._interval
+
+        def setTimerType(self, timer_type):
+            pass
+
+        def start(self, msec: Optional[int] = None):
+            if msec is not None:
+                self._interval = msec
+            self.stop()
+            if self._single_shot:
+                self._event = timeline.after(self._interval, self._fire)
+            else:
+                self._event = timeline.every(self._interval, self._fire)
+
+        def stop(self):
+            if self._event is not None:
+                self._event.cancel()
+                self._event = None
+
+        def isActive(self) -> bool:
+            return self._event is not None and self._event.active
+
+        def deleteLater(self):
+            self.stop()
+
+        def _fire(self):
+            if self._single_shot:
+                self._event = None
+            self.timeout.emit()
+
+        @staticmethod
+        def singleShot(msec: int, callback: Callable):
+            timeline.after(msec, callback)
+
+    return VirtualQTimer
+
+
+class SimBrain:
+    """Local GeminiBrain stand-in: BackupBrain lines after a virtual latency."""
+
+    def __init__(self, timeline: Timeline, clock: VirtualClock, latency_ms: float = 1500):
+        self.current_persona = "SUPPORT"
+        self.calls = 0
+        self.calls_per_minute: Counter = Counter()
+        self.persona_switches = 0
+        self._timeline = timeline
+        self._clock = clock
+        self._latency_ms = latency_ms
+
+    def switch_persona(self, persona_name: str):
+        if persona_name != self.current_persona:
+            self.persona_switches += 1
+        self.current_persona = persona_name
+
+    def _respond(self) -> Dict[str, Any]:
+        self.calls += 1
+        self.calls_per_minute[int(self._clock.elapsed // 60)] += 1
+        pool = BackupBrain.FALLBACK_RESPONSES.get(self.current_persona, BackupBrain.FALLBACK_RESPONSES["ENTITY"])
+        return dict(random.choice(pool))
+
+    def generate_async(self, user_input: str, callback, context: dict = None):
+        self._timeline.after(self._latency_ms, callback, self._respond())
+        return None
+
+    def generate_response(self, user_input: str, context: dict = None) -> dict:
+        return self._respond()
+
+    def analyze_user_behavior(self, text: str) -> Optional[str]:
+        return None
+
+
+class StorySimulator:
+    """
+    Builds the story systems on a virtual clock and plays a whole session.
+
+    Args:
+        speed: virtual seconds per real second (0 = as fast as possible)
+        seed: seeds `random`, so runs are reproducible
+        sample_ms: queue depth / memory / event log sampling period (virtual)
+        user_activity_s: simulated input every N virtual seconds (0 = idle player)
+    """
+
+    def __init__(self, speed: float = 100.0, seed: int = 0, start_act: int = 1,
+                 sample_ms: int = 1000, brain_latency_ms: float = 1500,
+                 user_activity_s: float = 0.0, trace_memory: bool = True):
+        self.speed = speed
+        self.seed = seed
+        self.start_act = start_act
+        self.sample_ms = sample_ms
+        self.brain_latency_ms = brain_latency_ms
+        self.user_activity_s = user_activity_s
+        self.trace_memory = trace_memory
+
+        self.clock = VirtualClock()
+        self.scheduler = TimelineScheduler(clock=self.clock.monotonic)
+        self.timers = self.scheduler.timeline("simulator")
+        self.brain = SimBrain(self.timers, self.clock, brain_latency_ms)
+
+        self._lock = threading.Lock()
+        self._actions: Counter = Counter()
+        self._actions_per_minute: Counter = Counter()
+        self._depth_samples: List[int] = []
+        self._depth_per_minute: Dict[int, int] = {}
+        self._memory_per_minute: Dict[int, int] = {}
+        self._event_log_per_minute: Dict[int, int] = {}
+        self._acts: List[Dict[str, Any]] = []
+        self._ending: Optional[str] = None
+
+    # ========== HOOKS ==========
+
+    def _minute(self) -> int:
+        return int(self.clock.elapsed // 60)
+
+    def _record_action(self, action, params, speech):
+        """Replaces FunctionDispatcher._execute_action: count, touch nothing."""
+        with self._lock:
+            self._actions[action] += 1
+            self._actions_per_minute[self._minute()] += 1
+        return True
+
+    def _on_story_end(self):
+        self._ending = f"act_{self.story.current_act_num}_complete"
+
+    def _heartbeat_beat(self):
+        self.heartbeat.pulse()
+        self.timers.after(self.heartbeat._calculate_sleep_time() * 1000, self._heartbeat_beat)
+
+    def _user_activity(self):
+        self.heartbeat.update_activity()
+        self.silence_breaker.reset()
+
+    def _sample(self):
+        minute = self._minute()
+        depth = sum(self.dispatcher._action_queue.lane_sizes())
+        self._depth_samples.append(depth)
+        self._depth_per_minute[minute] = max(depth, self._depth_per_minute.get(minute, 0))
+        self._event_log_per_minute[minute] = len(self.memory.data.get("event_log", []))
+        if tracemalloc.is_tracing():
+            self._memory_per_minute[minute] = tracemalloc.get_traced_memory()[0]
+
+    # ========== SETUP ==========
+
+    def _patches(self) -> ExitStack:
+        stack = ExitStack()
+        stack.enter_context(patch("core.function_dispatcher.FakeUI"))
+        stack.enter_context(patch("core.function_dispatcher.AudioOut"))
+        stack.enter_context(patch("story.act_4_exorcism.USBMonitor"))
+        checkpoints = stack.enter_context(patch("story.story_manager.CheckpointManager"))
+        checkpoints.return_value.has_checkpoints.return_value = False
+        stack.enter_context(patch.object(timeline_module, "_scheduler", self.scheduler))
+        timer_class = virtual_qtimer(self.timers)
+        for module in VIRTUAL_QTIMER_MODULES:
+            stack.enter_context(patch(f"{module}.QTimer", timer_class))
+        for module in VIRTUAL_TIME_MODULES:
+            stack.enter_context(patch(f"{module}.time", self.clock))
+        return stack
+
+    def _build(self):
+        from core.anger_engine import AngerEngine
+        from core.dynamic_difficulty import DynamicDifficulty
+        from core.function_dispatcher import FunctionDispatcher, SOURCE_HEARTBEAT
+        from core.heartbeat import Heartbeat
+        from core.memory import Memory
+        from story.silence_breaker import SilenceBreaker
+        from story.story_manager import StoryManager
+        from visual.ambient_horror import AmbientHorror
+
+        self.memory = Memory(test_mode=True)
+        self.memory.set_act(self.start_act)
+
+        dispatcher = FunctionDispatcher()
+        stub = MagicMock()  # Overlay + audio: the acts call them directly
+        dispatcher.overlay = dispatcher.visual_dispatcher.overlay = dispatcher.horror_dispatcher.overlay = stub
+        dispatcher.audio_out = dispatcher.horror_dispatcher.audio_out = stub
+        dispatcher._execute_action = self._record_action
+        dispatcher.brain = self.brain
+        dispatcher.memory = self.memory
+        self.dispatcher = dispatcher
+
+        self.heartbeat = Heartbeat(AngerEngine(), self.brain, dispatcher)
+        self.heartbeat.pulse_signal.connect(
+            lambda action: dispatcher.dispatch({"action": action}, source=SOURCE_HEARTBEAT))
+        self.heartbeat._after = self.timers.after  # Burst steps on virtual time
+        dispatcher.heartbeat = self.heartbeat
+
+        self.story = StoryManager(dispatcher, self.memory, self.brain)
+        self.story._end_game = self._on_story_end
+        load_act = self.story._load_act
+
+        def tracked_load(act_num):
+            self._acts.append({"act": act_num, "started_s": round(self.clock.elapsed, 1)})
+            load_act(act_num)
+        self.story._load_act = tracked_load
+
+        self.difficulty = DynamicDifficulty(self.memory, self.story)
+        self.story.set_difficulty_system(self.difficulty)
+        dispatcher.difficulty = self.difficulty
+        self.ambient = AmbientHorror(dispatcher)
+        self.story.set_ambient_horror(self.ambient)
+        self.silence_breaker = SilenceBreaker(dispatcher)
+        self.silence_breaker.start()
+
+    # ========== RUN ==========
+
+    def run(self, max_minutes: float = 60.0) -> Dict[str, Any]:
+        """Play from start_act until the story ends or max_minutes of virtual time pass."""
+        random.seed(self.seed)
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        app = QCoreApplication.instance() if HAS_QT else None
+        limit_ms = max_minutes * 60000
+
+        with self._patches():
+            self._build()
+            # Baselines after construction: the report covers the session, not the imports
+            memory_start = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+            wall_start = time.perf_counter()
+            self.timers.every(self.sample_ms, self._sample, first_ms=0)
+            self.timers.after(self.heartbeat._calculate_sleep_time() * 1000, self._heartbeat_beat)
+            if self.user_activity_s > 0:
+                self.timers.every(self.user_activity_s * 1000, self._user_activity)
+            log_info(f"Simulating from Act {self.start_act} at "
+                     f"{'max' if not self.speed else f'{self.speed:g}x'} speed", "SIMULATOR")
+            self.story.start_story()
+
+            while self._ending is None and self.clock.elapsed_ms < limit_ms:
+                due = self.scheduler.next_due_ms()
+                # Whole ms past the due time: the s <-> ms float round trip may land just short of it
+                self.clock.set_ms(min(limit_ms, math.floor(due) + 1 if due is not None else limit_ms))
+                if self.speed:
+                    self._pace(app, wall_start)
+                self.scheduler.poll()
+                if app is not None:
+                    app.processEvents()
+
+            report = self._report(wall_start, memory_start)
+            self._shutdown(app)
+
+        if started_tracing:
+            tracemalloc.stop()
+        return report
+
+    def _pace(self, app, wall_start: float):
+        """Hold the loop so virtual time runs `speed` times faster than the wall clock."""
+        target = wall_start + self.clock.elapsed / self.speed
+        while True:
+            remaining = target - time.perf_counter()
+            if remaining <= 0:
+                return
+            if app is not None:
+                app.processEvents()
+            time.sleep(min(remaining, 0.005))
+
+    def _shutdown(self, app):
+        deadline = time.perf_counter() + 2.0
+        while sum(self.dispatcher._action_queue.lane_sizes()) and time.perf_counter() < deadline:
+            if app is not None:
+                app.processEvents()
+            time.sleep(0.005)
+        for system in (self.silence_breaker, self.ambient, self.difficulty):
+            system.stop()
+        if self.story.current_act_instance is not None:
+            self.story.current_act_instance.stop()
+        self.dispatcher.stop_dispatching()
+        self.scheduler.deleteLater()
+
+    # ========== REPORT ==========
+
+    def _report(self, wall_start: float, memory_start: int) -> Dict[str, Any]:
+        wall_s = time.perf_counter() - wall_start
+        virtual_s = self.clock.elapsed
+        minutes = max(1, math.ceil(virtual_s / 60))
+
+        def per_minute(values) -> List[int]:
+            return [values.get(m, 0) for m in range(minutes)]
+
+        with self._lock:
+            actions = dict(self._actions.most_common())
+            actions_per_minute = per_minute(self._actions_per_minute)
+        stats = self.dispatcher.stats()
+        counters = stats["actions"].values()
+        event_log = self.memory.data.get("event_log", [])
+        memory = {"traced": tracemalloc.is_tracing()}
+        if memory["traced"]:
+            current, peak = tracemalloc.get_traced_memory()
+            memory.update(
+                start_kb=round(memory_start / 1024, 1),
+                end_kb=round(current / 1024, 1),
+                peak_kb=round(peak / 1024, 1),
+                growth_kb=round((current - memory_start) / 1024, 1),
+                per_minute_kb=[round(v / 1024, 1) for v in per_minute(self._memory_per_minute)],
+            )
+
+        return {
+            "seed": self.seed,
+            "speed": self.speed,
+            "virtual_s": round(virtual_s, 1),
+            "wall_s": round(wall_s, 2),
+            "speedup": round(virtual_s / wall_s, 1) if wall_s > 0 else None,
+            "ending": self._ending or "time_limit",
+            "acts": self._acts,
+            "timeline_events": self.scheduler.fired,
+            "actions": {
+                "total": sum(actions.values()),
+                "per_minute": actions_per_minute,
+                "peak_per_minute": max(actions_per_minute),
+                "by_action": actions,
+                "queued": sum(a["queued"] for a in counters),
+                "merged": sum(a["merged"] for a in counters),
+                "dropped": sum(a["dropped"] for a in counters),
+            },
+            "queue_depth": {
+                "max": max(self._depth_samples, default=0),
+                "avg": round(sum(self._depth_samples) / len(self._depth_samples), 3) if self._depth_samples else 0.0,
+                "per_minute_max": per_minute(self._depth_per_minute),
+            },
+            "brain": {
+                "calls": self.brain.calls,
+                "per_minute": per_minute(self.brain.calls_per_minute),
+                "persona_switches": self.brain.persona_switches,
+            },
+            "memory": memory,
+            "event_log": {
+                "entries": len(event_log),
+                "bytes": len(json.dumps(event_log, ensure_ascii=False, default=str)),
+                "per_minute": per_minute(self._event_log_per_minute),
+            },
+            "pool": stats["pool"],
+        }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    acts = ", ".join(f"Act {a['act']} @ {a['started_s']:.0f}s" for a in report["acts"])
+    actions = report["actions"]
+    lines = [
+        f"Simulated {report['virtual_s'] / 60:.1f} min in {report['wall_s']:.1f}s "
+        f"({report['speedup']}x), ending: {report['ending']}",
+        f"  acts:        {acts}",
+        f"  actions:     {actions['total']} (peak {actions['peak_per_minute']}/min, "
+        f"merged {actions['merged']}, dropped {actions['dropped']})",
+        f"  queue depth: max {report['queue_depth']['max']}, avg {report['queue_depth']['avg']}",
+        f"  brain calls: {report['brain']['calls']}",
+        f"  event_log:   {report['event_log']['entries']} entries, {report['event_log']['bytes']} bytes",
+    ]
+    if report["memory"]["traced"]:
+        memory = report["memory"]
+        lines.append(f"  memory:      {memory['start_kb']:.0f} -> {memory['end_kb']:.0f} KB "
+                     f"(growth {memory['growth_kb']:+.0f} KB, peak {memory['peak_kb']:.0f} KB)")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Headless accelerated story simulation")
+    parser.add_argument("--speed", type=float, default=100.0, help="Virtual seconds per real second (0 = max)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start-act", type=int, default=1)
+    parser.add_argument("--minutes", type=float, default=60.0, help="Virtual time limit")
+    parser.add_argument("--user-activity", type=float, default=0.0, help="Simulated input every N seconds")
+    parser.add_argument("--no-tracemalloc", action="store_true")
+    parser.add_argument("--output", help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841 (kept alive for the run)
+
+    simulator = StorySimulator(speed=args.speed, seed=args.seed, start_act=args.start_act,
+                               user_activity_s=args.user_activity, trace_memory=not args.no_tracemalloc)
+    report = simulator.run(max_minutes=args.minutes)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
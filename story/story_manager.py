@@ -14,6 +14,7 @@ from story.act_1_infection import Act1Infection
 from story.act_2_awakening import Act2Awakening
 from story.act_3_torment import Act3Torment
 from story.act_4_exorcism import Act4Exorcism
+from story.act_timeline import preload_act_timeline
 from core.logger import log_info, log_error, log_warning
 
 class StoryManager(QObject):
@@ -47,6 +48,7 @@ class StoryManager(QObject):
         self._is_transitioning = False  # NEW: Transition lock
         self._transition_watchdog = None  # NEW: Watchdog timer for softlock prevention
         self.difficulty = None
+        self.time_scale = 1.0  # Act timeline speed (see set_time_scale)
         
         # Load saved act or start from 1
         self.current_act_num = self.memory.get_act()
@@ -123,6 +125,25 @@ class StoryManager(QObject):
         # Start the act
         self.current_act_instance.start()
         self.memory.set_act(act_num)
+        if self.time_scale != 1.0:
+            self._act_timeline_call("set_scale", self.time_scale)
+
+    def _act_timeline_call(self, method: str, *args):
+        timeline = getattr(self.current_act_instance, "timeline", None)
+        if timeline is not None and hasattr(timeline, method):
+            getattr(timeline, method)(*args)
+
+    def set_time_scale(self, scale: float):
+        """Speed of the act timelines: 2.0 fast-forward (testing), 0.5 slow-down (mercy mode)."""
+        self.time_scale = scale
+        self._act_timeline_call("set_scale", scale)
+
+    def pause_act(self):
+        """Freeze the current act's timeline (already queued actions still run)."""
+        self._act_timeline_call("pause")
+
+    def resume_act(self):
+        self._act_timeline_call("resume")
 
     def next_act(self):
         """Advances to the next act with dramatic transition."""
@@ -138,6 +159,9 @@ class StoryManager(QObject):
         
         self._is_transitioning = True
         log_info(f"Transitioning to Act {next_act_num}...", "STORY")
+
+        # Compile the next act's timeline while the transition is on screen
+        preload_act_timeline(f"act{next_act_num}")
         
         # Start watchdog timer (10 seconds)
         self._start_transition_watchdog(next_act_num)
@@ -0,0 +1,302 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Timeline Scheduler - One timer for every act timeline.
+
+Acts used to create one single-shot QTimer (plus a lambda) per timeline
+entry. Here each act gets a Timeline: a heap of events keyed by the act's
+own clock, and one shared TimelineScheduler QTimer is armed for the
+earliest due event across all timelines.
+
+- at/after/every: O(log n) insert; cancel is O(1) (skipped when popped)
+- pause()/resume(): the act's clock stops; nothing is rescheduled
+- set_scale(): 2.0 = act runs twice as fast (testing), 0.5 = half speed
+  (mercy mode); only the clock mapping changes, not the heap
+- The clock is injectable, so a simulation can drive timelines on
+  virtual time by calling poll() itself.
+"""
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QThread, QTimer, Qt, pyqtSignal
+
+from core.logger import log_error, log_info
+
+
+class TimelineEvent:
+    """Handle of one scheduled entry. stop() is an alias of cancel() (QTimer-like)."""
+    __slots__ = ("due_ms", "seq", "callback", "args", "interval_ms", "cancelled", "fired")
+
+    def __init__(self, due_ms: float, seq: int, callback: Callable, args: tuple, interval_ms: Optional[float]):
+        self.due_ms = due_ms
+        self.seq = seq
+        self.callback = callback
+        self.args = args
+        self.interval_ms = interval_ms  # Repeating entry when set
+        self.cancelled = False
+        self.fired = 0
+
+    def __lt__(self, other: "TimelineEvent") -> bool:
+        return (self.due_ms, self.seq) < (other.due_ms, other.seq)
+
+    @property
+    def active(self) -> bool:
+        return not self.cancelled and (self.interval_ms is not None or not self.fired)
+
+    def cancel(self):
+        self.cancelled = True
+
+    stop = cancel
+
+    def __repr__(self):
+        name = getattr(self.callback, "__name__", type(self.callback).__name__)
+        return f"TimelineEvent({name}, at={self.due_ms:.0f}ms, active={self.active})"
+
+
+class Timeline:
+    """
+    Events of one act on the act's own clock (ms since the timeline started).
+    Created through TimelineScheduler.timeline().
+    """
+
+    def __init__(self, scheduler: "TimelineScheduler", name: str, scale: float = 1.0):
+        self.name = name
+        self._scheduler = scheduler
+        self._heap: List[TimelineEvent] = []
+        self._scale = scale
+        self._paused = False
+        self._closed = False
+        # Local time = base_local + (real - base_real) * scale while running
+        self._base_local = 0.0
+        self._base_real = scheduler.now_ms()
+
+    # ========== CLOCK ==========
+
+    def _local_at(self, real_ms: float) -> float:
+        if self._paused:
+            return self._base_local
+        return self._base_local + (real_ms - self._base_real) * self._scale
+
+    def _rebase(self):
+        real = self._scheduler.now_ms()
+        self._base_local = self._local_at(real)
+        self._base_real = real
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Time on this timeline's clock."""
+        return self._local_at(self._scheduler.now_ms())
+
+    @property
+    def scale(self) -> float:
+        return self._scale
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    @property
+    def pending(self) -> int:
+        with self._scheduler._lock:
+            return sum(1 for event in self._heap if not event.cancelled)
+
+    # ========== SCHEDULING ==========
+
+    def at(self, at_ms: float, callback: Callable, *args: Any) -> TimelineEvent:
+        """Run callback(*args) when this timeline's clock reaches at_ms."""
+        return self._push(at_ms, callback, args, None)
+
+    def after(self, delay_ms: float, callback: Callable, *args: Any) -> TimelineEvent:
+        """Run callback(*args) delay_ms from now (timeline time)."""
+        return self._push(self.elapsed_ms + delay_ms, callback, args, None)
+
+    def every(self, interval_ms: float, callback: Callable, *args: Any,
+              first_ms: Optional[float] = None) -> TimelineEvent:
+        """Repeating entry; first run at first_ms (default: one interval from now)."""
+        start = self.elapsed_ms + interval_ms if first_ms is None else first_ms
+        return self._push(start, callback, args, max(1.0, interval_ms))
+
+    def _push(self, due_ms: float, callback: Callable, args: tuple, interval_ms: Optional[float]) -> TimelineEvent:
+        scheduler = self._scheduler
+        with scheduler._lock:
+            event = TimelineEvent(max(0.0, due_ms), next(scheduler._seq), callback, args, interval_ms)
+            if self._closed:
+                event.cancelled = True
+                return event
+            heapq.heappush(self._heap, event)
+        scheduler._request_rearm()
+        return event
+
+    # ========== CONTROL ==========
+
+    def pause(self):
+        with self._scheduler._lock:
+            if self._paused:
+                return
+            self._rebase()
+            self._paused = True
+        self._scheduler._request_rearm()
+
+    def resume(self):
+        with self._scheduler._lock:
+            if not self._paused:
+                return
+            self._base_real = self._scheduler.now_ms()
+            self._paused = False
+        self._scheduler._request_rearm()
+
+    def set_scale(self, scale: float):
+        """Clock speed of the whole timeline: 2.0 fast-forward, 0.5 slow-down."""
+        if scale <= 0:
+            raise ValueError("Timeline scale must be positive")
+        with self._scheduler._lock:
+            self._rebase()
+            self._scale = scale
+        log_info(f"Timeline {self.name} scale -> {scale:g}x", "TIMELINE")
+        self._scheduler._request_rearm()
+
+    def cancel(self):
+        """Drop every pending event and detach from the scheduler."""
+        with self._scheduler._lock:
+            for event in self._heap:
+                event.cancelled = True
+            self._heap.clear()
+            self._closed = True
+        self._scheduler._remove(self)
+
+    # ========== SCHEDULER SIDE ==========
+
+    def _next_real_ms(self) -> Optional[float]:
+        """Real time of the earliest live event. Caller holds the lock."""
+        heap = self._heap
+        while heap and heap[0].cancelled:
+            heapq.heappop(heap)
+        if not heap or self._paused:
+            return None
+        return self._base_real + (heap[0].due_ms - self._base_local) / self._scale
+
+    def _pop_due(self, real_ms: float) -> Optional[TimelineEvent]:
+        """Next due event, or None. Caller holds the lock."""
+        heap = self._heap
+        local = self._local_at(real_ms)
+        while heap:
+            head = heap[0]
+            if head.cancelled:
+                heapq.heappop(heap)
+                continue
+            if head.due_ms > local or self._paused:
+                return None
+            heapq.heappop(heap)
+            if head.interval_ms is not None:
+                head.due_ms += head.interval_ms
+                heapq.heappush(heap, head)
+            return head
+        return None
+
+    def __repr__(self):
+        return f"Timeline({self.name!r}, t={self.elapsed_ms:.0f}ms, scale={self._scale:g}, paused={self._paused})"
+
+
+class TimelineScheduler(QObject):
+    """
+    Owns the timelines and the single QTimer that fires their events on the
+    Qt main thread. Pass a clock (seconds) and call poll() to drive it on
+    virtual time instead.
+    """
+
+    _rearm_signal = pyqtSignal()
+
+    def __init__(self, clock: Optional[Callable[[], float]] = None):
+        super().__init__()
+        self._clock = clock or time.monotonic
+        self._timelines: List[Timeline] = []
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
+        self.fired = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.poll)
+        self._rearm_signal.connect(self._rearm)
+
+    def now_ms(self) -> float:
+        return self._clock() * 1000
+
+    def timeline(self, name: str, scale: float = 1.0) -> Timeline:
+        """New timeline starting now (its clock reads 0)."""
+        timeline = Timeline(self, name, scale)
+        with self._lock:
+            self._timelines.append(timeline)
+        return timeline
+
+    def timelines(self) -> List[Timeline]:
+        with self._lock:
+            return list(self._timelines)
+
+    def next_due_ms(self) -> Optional[float]:
+        """Real (clock) time of the earliest live event across all timelines."""
+        with self._lock:
+            due = [t for t in (tl._next_real_ms() for tl in self._timelines) if t is not None]
+        return min(due) if due else None
+
+    def poll(self):
+        """Fire everything due now, in due order per timeline, then re-arm."""
+        for timeline in self.timelines():
+            while True:
+                with self._lock:
+                    event = timeline._pop_due(self.now_ms())
+                if event is None:
+                    break
+                event.fired += 1
+                self.fired += 1
+                try:
+                    event.callback(*event.args)
+                except Exception as e:
+                    log_error(f"Timeline {timeline.name} event failed: {e}", "TIMELINE")
+        self._rearm()
+
+    def _remove(self, timeline: Timeline):
+        with self._lock:
+            if timeline in self._timelines:
+                self._timelines.remove(timeline)
+        self._request_rearm()
+
+    def _request_rearm(self):
+        # The QTimer belongs to the main thread; other threads go through a queued signal
+        if QThread.currentThread() == self.thread():
+            self._rearm()
+        else:
+            self._rearm_signal.emit()
+
+    def _rearm(self):
+        due = self.next_due_ms()
+        if due is None:
+            self._timer.stop()
+            return
+        self._timer.start(max(0, math.ceil(due - self.now_ms())))
+
+
+_scheduler: Optional[TimelineScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_timeline_scheduler() -> TimelineScheduler:
+    """Shared timeline scheduler (create it on the Qt main thread)."""
+    global _scheduler
+    if _scheduler is None or sip.isdeleted(_scheduler):
+        with _scheduler_lock:
+            if _scheduler is None or sip.isdeleted(_scheduler):  # QApplication torn down (tests)
+                _scheduler = TimelineScheduler()
+                log_info("Timeline scheduler ready", "TIMELINE")
+    return _scheduler
@@ -14,6 +14,8 @@ from core.memory import Memory
 from core.gemini_brain import GeminiBrain
 from story.story_manager import StoryManager
 
+pytestmark = pytest.mark.usefixtures("runtime_sandbox")
+
 class TestStoryFlowIntegration:
     """Tests the story manager flow and act transitions."""
     
@@ -260,6 +260,23 @@ def mock_dispatcher():
         disp.stop_dispatching()
 
 
+@pytest.fixture
+def stub_handlers(mock_dispatcher):
+    """
+    stub_handlers(sub_dispatcher, fn): every action of sub_dispatcher runs
+    fn(action, params, speech) instead of its real handler (patched in its
+    handler table, then the action map is rebuilt).
+    """
+    def stub(sub_dispatcher, fn):
+        sub_dispatcher._handlers = {
+            action: (lambda params, speech="", action=action: fn(action, params, speech))
+            for action in sub_dispatcher.get_supported_actions()
+        }
+        mock_dispatcher._action_map = mock_dispatcher._build_action_map()
+        return fn
+    return stub
+
+
 @pytest.fixture
 def mock_brain():
     """Create a mock GeminiBrain for testing."""
@@ -113,7 +113,7 @@ class TestChaosMonkey:
         
         print(f"   ✅ State preserved! Dispatched {len(transition_actions)} events before shutdown")
     
-    def test_altf4_spam_resistance(self, mock_dispatcher, resource_tracker):
+    def test_altf4_spam_resistance(self, mock_dispatcher, resource_tracker, stub_handlers):
         """
         User spams Alt+F4 (simulate with multiple shutdown calls).
         
@@ -122,7 +122,7 @@ class TestChaosMonkey:
         print("\n⌨️ CHAOS: User mashes Alt+F4 repeatedly")
         
         # Start some background activity
-        mock_dispatcher.visual_dispatcher.dispatch = lambda *a, **k: time.sleep(0.1)
+        stub_handlers(mock_dispatcher.visual_dispatcher, lambda *a, **k: time.sleep(0.1))
         
         for i in range(10):
             mock_dispatcher._do_dispatch({
@@ -252,7 +252,7 @@ class TestChaosMonkey:
         except Exception as e:
             pytest.fail(f"Final load failed: {e}")
     
-    def test_dispatcher_queue_overflow_simulation(self, mock_dispatcher, resource_tracker):
+    def test_dispatcher_queue_overflow_simulation(self, mock_dispatcher, resource_tracker, stub_handlers):
         """
         Overwhelm queue with 10,000 actions at once.
         
@@ -261,7 +261,7 @@ class TestChaosMonkey:
         print("\n🌊 CHAOS: Queue flood with 10,000 actions")
         
         # Slow down dispatch to build up queue
-        mock_dispatcher.visual_dispatcher.dispatch = lambda *a, **k: time.sleep(0.01)
+        stub_handlers(mock_dispatcher.visual_dispatcher, lambda *a, **k: time.sleep(0.01))
         
         start = time.time()
         
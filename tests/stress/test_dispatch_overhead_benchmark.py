@@ -0,0 +1,105 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Dispatch Overhead Micro-Benchmark
+
+Per-dispatch routing cost across every action of the four specialized
+dispatchers, with the effect targets replaced by no-op sinks so only the
+routing (lookup, parameter defaults, call) is measured:
+- handler: registry descriptor -> bound handler (FunctionDispatcher path)
+- dispatch(): BaseDispatcher.dispatch table lookup
+- chain: replica of the old `if action == ...` walk before the same call
+"""
+import pytest
+import time
+
+ROUNDS = 2000
+
+
+class _Sink:
+    """Any attribute (nested too) is a no-op callable."""
+
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return None
+
+
+def _dispatchers():
+    from core.dispatchers.hardware_dispatcher import HardwareDispatcher
+    from core.dispatchers.horror_dispatcher import HorrorDispatcher
+    from core.dispatchers.system_dispatcher import SystemDispatcher
+    from core.dispatchers.visual_dispatcher import VisualDispatcher
+
+    sink = _Sink()
+    result = []
+    for cls in (VisualDispatcher, HardwareDispatcher, HorrorDispatcher, SystemDispatcher):
+        dispatcher = cls.__new__(cls)
+        for name in ("overlay", "gdi", "mouse", "keyboard", "audio", "camera", "brightness",
+                     "process_guard", "mask", "fake_ui", "screen_tear", "pixel_melt", "melter", "icons",
+                     "window", "system", "wallpaper", "clipboard", "notifications", "notepad",
+                     "browser"):
+            setattr(dispatcher, name, sink)
+        dispatcher.get_horror = lambda owner: sink
+        dispatcher._horror = None
+        result.append(dispatcher)
+    return result
+
+
+def _per_call_ns(fn, calls):
+    start = time.perf_counter_ns()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter_ns() - start) / (ROUNDS * calls)
+
+
+@pytest.mark.stress
+class TestDispatchOverheadBenchmark:
+
+    def test_routing_overhead_all_actions(self):
+        from core.action_registry import build_action_registry, collect_action_specs
+
+        dispatchers = _dispatchers()
+        registry = build_action_registry(dispatchers, collect_action_specs(dispatchers))
+        actions = list(registry)
+        params = {}
+
+        def via_handler():
+            for action in actions:
+                registry[action].handler(params, "")
+
+        def via_dispatch():
+            for action in actions:
+                registry[action].dispatcher.dispatch(action, params, "")
+
+        # Old routing: linear walk over the owner's action names, then the call
+        chains = {d: list(d.ACTIONS) for d in dispatchers}
+        handler_of = {a: registry[a].handler for a in actions}
+
+        def via_chain():
+            for action in actions:
+                for name in chains[registry[action].dispatcher]:
+                    if action == name:
+                        break
+                handler_of[action](params, "")
+
+        # Warm-up (first use resolves HorrorEffects once)
+        via_handler()
+
+        handler_ns = _per_call_ns(via_handler, len(actions))
+        dispatch_ns = _per_call_ns(via_dispatch, len(actions))
+        chain_ns = _per_call_ns(via_chain, len(actions))
+
+        print(f"\n⚙️ Routing overhead over {len(actions)} actions x {ROUNDS} rounds")
+        print(f"   bound handler:  {handler_ns:7.0f} ns/dispatch")
+        print(f"   dispatch():     {dispatch_ns:7.0f} ns/dispatch")
+        print(f"   if/elif chain:  {chain_ns:7.0f} ns/dispatch")
+
+        assert len(actions) >= 45
+        assert handler_ns < 20_000
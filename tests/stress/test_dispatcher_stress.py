@@ -13,6 +13,9 @@ Tests FunctionDispatcher under high load:
 - Priority chaos (random priorities)
 - Worker starvation
 - Queue overflow
+- Enqueue -> execute latency percentiles per priority
+- Conflicting-effect burst drain time with per-resource lanes
+- Deadline expiry and ambient load shedding under a stalled pool
 """
 import pytest
 import time
@@ -23,7 +26,7 @@ from unittest.mock import MagicMock, patch
 @pytest.mark.stress
 class TestDispatcherStress:
     
-    def test_burst_dispatch(self, mock_dispatcher, resource_tracker, stress_config):
+    def test_burst_dispatch(self, mock_dispatcher, resource_tracker, stress_config, stub_handlers):
         """
         Burst Dispatch: Send 100 actions/second for 10 seconds.
         
@@ -38,8 +41,8 @@ class TestDispatcherStress:
         total_actions = duration * rate
         
         # Mock dispatcher methods to avoid real side effects
-        mock_dispatcher.visual_dispatcher.dispatch = MagicMock()
-        mock_dispatcher.system_dispatcher.dispatch = MagicMock()
+        stub_handlers(mock_dispatcher.visual_dispatcher, MagicMock())
+        stub_handlers(mock_dispatcher.system_dispatcher, MagicMock())
         
         # Track execution
         actions_dispatched = 0
@@ -85,7 +88,7 @@ class TestDispatcherStress:
         print(f"\n✅ Dispatched {actions_dispatched} actions in {send_duration:.2f}s")
         print(f"   Actual rate: {actions_dispatched / send_duration:.1f} actions/sec")
     
-    def test_priority_chaos(self, mock_dispatcher, resource_tracker):
+    def test_priority_chaos(self, mock_dispatcher, resource_tracker, stub_handlers):
         """
         Priority Chaos: Send actions with random priorities.
         
@@ -102,9 +105,9 @@ class TestDispatcherStress:
             execution_order.append("LOW")
         
         # Patch dispatchers
-        mock_dispatcher.visual_dispatcher.dispatch = MagicMock(side_effect=track_high)
-        mock_dispatcher.system_dispatcher.dispatch = MagicMock(side_effect=track_low)
-        mock_dispatcher.horror_dispatcher.dispatch = MagicMock(side_effect=track_low)
+        stub_handlers(mock_dispatcher.visual_dispatcher, MagicMock(side_effect=track_high))
+        stub_handlers(mock_dispatcher.system_dispatcher, MagicMock(side_effect=track_low))
+        stub_handlers(mock_dispatcher.horror_dispatcher, MagicMock(side_effect=track_low))
         
         print("\n🎲 Sending 100 actions with chaotic priorities...")
         
@@ -141,7 +144,7 @@ class TestDispatcherStress:
         # Verify all were executed
         assert len(execution_order) >= 100, "Some actions were lost"
     
-    def test_worker_starvation(self, mock_dispatcher, resource_tracker):
+    def test_worker_starvation(self, mock_dispatcher, resource_tracker, stub_handlers):
         """
         Worker Starvation: Block all workers with long tasks.
         Then send a HIGH priority task - it should still queue.
@@ -154,7 +157,7 @@ class TestDispatcherStress:
             time.sleep(2)  # Block for 2 seconds
         
         # Patch to block
-        mock_dispatcher.system_dispatcher.dispatch = MagicMock(side_effect=blocking_task)
+        stub_handlers(mock_dispatcher.system_dispatcher, MagicMock(side_effect=blocking_task))
         
         print("\n⏸️ Blocking all workers with long tasks...")
         
@@ -174,7 +177,7 @@ class TestDispatcherStress:
         def track_high(*args, **kwargs):
             high_executed.set()
         
-        mock_dispatcher.visual_dispatcher.dispatch = MagicMock(side_effect=track_high)
+        stub_handlers(mock_dispatcher.visual_dispatcher, MagicMock(side_effect=track_high))
         
         mock_dispatcher._do_dispatch({
             "action": "GDI_FLASH",
@@ -190,14 +193,14 @@ class TestDispatcherStress:
         
         print("✅ HIGH priority task executed after workers freed")
     
-    def test_concurrent_dispatching(self, mock_dispatcher, resource_tracker):
+    def test_concurrent_dispatching(self, mock_dispatcher, resource_tracker, stub_handlers):
         """
         Concurrent Dispatching: 10 threads dispatch simultaneously.
         
         Tests thread safety of _do_dispatch.
         """
-        mock_dispatcher.visual_dispatcher.dispatch = MagicMock()
-        mock_dispatcher.system_dispatcher.dispatch = MagicMock()
+        stub_handlers(mock_dispatcher.visual_dispatcher, MagicMock())
+        stub_handlers(mock_dispatcher.system_dispatcher, MagicMock())
         
         dispatched_count = [0]  # Mutable to track across threads
         lock = threading.Lock()
@@ -240,13 +243,13 @@ class TestDispatcherStress:
         
         print(f"✅ All 500 actions dispatched from 10 threads")
     
-    def test_shutdown_during_dispatch(self, mock_dispatcher, resource_tracker):
+    def test_shutdown_during_dispatch(self, mock_dispatcher, resource_tracker, stub_handlers):
         """
         Chaos Test: Shutdown dispatcher while actions are still queued.
         
         Verifies cleanup doesn't deadlock or crash.
         """
-        mock_dispatcher.visual_dispatcher.dispatch = MagicMock(side_effect=lambda *a, **k: time.sleep(0.1))
+        stub_handlers(mock_dispatcher.visual_dispatcher, MagicMock(side_effect=lambda *a, **k: time.sleep(0.1)))
         
         print("\n💥 Sending 100 actions then immediate shutdown...")
         
@@ -269,13 +272,181 @@ class TestDispatcherStress:
         print("✅ Shutdown completed without deadlock")
 
 
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@pytest.mark.stress
+class TestDispatcherLatency:
+    """Enqueue -> execute latency of the priority lanes, reported per priority."""
+
+    ACTIONS = {
+        "HIGH": "GDI_FLASH",          # PRIORITY_HIGH
+        "MEDIUM": "PLAY_SOUND",       # PRIORITY_MEDIUM
+        "LOW": "CLIPBOARD_POISON",    # PRIORITY_LOW
+    }
+
+    def _run(self, dispatcher, rounds, work_s=0.0, gap_s=0.0):
+        latencies = {name: [] for name in self.ACTIONS}
+        by_action = {action: name for name, action in self.ACTIONS.items()}
+        lock = threading.Lock()
+        done = threading.Event()
+        expected = rounds * len(self.ACTIONS)
+
+        def record(action, params, speech):
+            elapsed = time.perf_counter() - params["t0"]
+            if work_s:
+                time.sleep(work_s)
+            with lock:
+                latencies[by_action[action]].append(elapsed * 1000)
+                if sum(len(v) for v in latencies.values()) >= expected:
+                    done.set()
+
+        dispatcher._execute_action = record
+        # Priority lanes only: resource serialization/merging is measured separately
+        dispatcher._action_queue.resource_rules = {}
+        for _ in range(rounds):
+            # LOW first so HIGH has to overtake queued work
+            for name in ("LOW", "MEDIUM", "HIGH"):
+                dispatcher._do_dispatch({
+                    "action": self.ACTIONS[name],
+                    "params": {"t0": time.perf_counter()},
+                    "speech": "",
+                })
+            if gap_s:
+                time.sleep(gap_s)
+
+        assert done.wait(timeout=30), "Not every queued action executed"
+        return latencies
+
+    def _report(self, title, latencies):
+        print(f"\n⏱️ {title} (enqueue -> execute, ms)")
+        for name, samples in latencies.items():
+            print(f"   {name:<6} n={len(samples):<4} p50={_percentile(samples, 50):7.3f} "
+                  f"p95={_percentile(samples, 95):7.3f} p99={_percentile(samples, 99):7.3f} "
+                  f"max={max(samples):7.3f}")
+
+    def test_latency_idle_pool(self, mock_dispatcher):
+        """Paced dispatch: workers idle, measures pure wake-up latency."""
+        latencies = self._run(mock_dispatcher, rounds=200, gap_s=0.002)
+        self._report("Idle pool", latencies)
+        for samples in latencies.values():
+            assert len(samples) == 200
+            # Condition wake-up, not a 1s poll
+            assert _percentile(samples, 50) < 50
+
+    def test_latency_saturated_pool(self, mock_dispatcher):
+        """Burst larger than the pool: HIGH must overtake queued MEDIUM/LOW work."""
+        latencies = self._run(mock_dispatcher, rounds=150, work_s=0.001)
+        self._report("Saturated pool", latencies)
+        for samples in latencies.values():
+            assert len(samples) == 150
+        assert _percentile(latencies["HIGH"], 50) <= _percentile(latencies["LOW"], 50)
+        assert _percentile(latencies["HIGH"], 95) <= _percentile(latencies["LOW"], 95)
+
+
+@pytest.mark.stress
+class TestDispatcherResourceLanes:
+    """Burst of effects fighting over the same resources."""
+
+    BURST = ["MOUSE_SHAKE", "BRIGHTNESS_FLICKER", "GDI_STATIC", "SCREEN_INVERT", "CLIPBOARD_POISON"]
+
+    def _drain(self, dispatcher, rules, rounds=10, effect_s=0.05):
+        from core.action_resources import ACTION_RESOURCES
+        busy = {}
+        overlaps = [0]
+        lock = threading.Lock()
+
+        def effect(action, params, speech):
+            # Stand-in for the sleep-based hardware effects
+            with lock:
+                resource = ACTION_RESOURCES[action].resource
+                busy[resource] = busy.get(resource, 0) + 1
+                if busy[resource] > 1:
+                    overlaps[0] += 1
+            time.sleep(effect_s)
+            with lock:
+                busy[resource] -= 1
+
+        dispatcher._execute_action = effect
+        dispatcher._action_queue.resource_rules = rules
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for action in self.BURST:
+                dispatcher._do_dispatch({"action": action, "params": {}, "speech": ""})
+        assert dispatcher._action_queue.join(timeout=30), "Burst did not drain"
+        return time.perf_counter() - start, overlaps[0]
+
+    def test_conflicting_burst_drains_faster(self, mock_dispatcher):
+        from core.action_resources import ACTION_RESOURCES
+        queue = mock_dispatcher._action_queue
+
+        plain_s, plain_overlaps = self._drain(mock_dispatcher, {})
+        laned_s, laned_overlaps = self._drain(mock_dispatcher, ACTION_RESOURCES)
+
+        print(f"\n🧵 Conflicting burst ({len(self.BURST) * 10} actions, 50ms each)")
+        print(f"   no lanes:       {plain_s * 1000:7.1f}ms, {plain_overlaps} same-resource overlaps")
+        print(f"   resource lanes: {laned_s * 1000:7.1f}ms, {laned_overlaps} same-resource overlaps, "
+              f"merged={queue.merged} dropped={queue.dropped}")
+
+        assert laned_overlaps == 0
+        assert laned_s < plain_s
+
+
+@pytest.mark.stress
+class TestDispatcherDeadlines:
+    """Stalled pool: late visuals must be dropped, not fired seconds after their cue."""
+
+    def test_stalled_pool_drops_late_effects(self, mock_dispatcher):
+        from core.function_dispatcher import SOURCE_TIMELINE, SOURCE_AMBIENT
+        queue = mock_dispatcher._action_queue
+        queue.PRIORITY_DEADLINES = {1: 0.2, 2: 0.4, 3: 1.0}
+        release = threading.Event()
+        executed = []
+        lock = threading.Lock()
+
+        def effect(action, params, speech):
+            if action == "FAKE_FILE_DELETE":
+                release.wait(5)
+            with lock:
+                executed.append((action, time.perf_counter() - params["t0"]))
+
+        mock_dispatcher._execute_action = effect
+        # Stall every worker
+        for _ in range(len(mock_dispatcher._workers)):
+            mock_dispatcher._do_dispatch({"action": "FAKE_FILE_DELETE", "params": {"t0": time.perf_counter()}})
+        time.sleep(0.1)
+
+        for i in range(40):
+            mock_dispatcher.dispatch({"action": "GLITCH_SCREEN", "params": {"t0": time.perf_counter()}},
+                                     source=SOURCE_TIMELINE)
+            mock_dispatcher.dispatch({"action": "OPEN_BROWSER", "params": {"t0": time.perf_counter()}},
+                                     source=SOURCE_AMBIENT)
+        time.sleep(0.5)  # Every visual cue is now past its deadline
+        release.set()
+        assert queue.join(timeout=10)
+
+        stats = queue.stats()
+        late_visuals = [t for action, t in executed if action == "GLITCH_SCREEN"]
+        print(f"\n⌛ Stalled pool: expired={stats['expired']} shed={stats['shed']} "
+              f"downgraded={stats['downgraded']} late={stats['late']} "
+              f"visuals executed={len(late_visuals)}")
+        assert stats["expired"] > 0
+        assert stats["shed"] > 0
+        assert not late_visuals, "Expired visual cues must not fire"
+
+
 @pytest.mark.stress
 class TestDispatcherQuickValidation:
     """Quick smoke tests (5 minutes total) for CI/CD."""
     
-    def test_quick_burst(self, mock_dispatcher):
+    def test_quick_burst(self, mock_dispatcher, stub_handlers):
         """Quick burst: 10 actions/sec for 5 seconds."""
-        mock_dispatcher.visual_dispatcher.dispatch = MagicMock()
+        stub_handlers(mock_dispatcher.visual_dispatcher, MagicMock())
         
         for i in range(50):
             mock_dispatcher._do_dispatch({
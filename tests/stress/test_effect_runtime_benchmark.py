@@ -0,0 +1,92 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Effect Runtime Benchmark
+
+Runs dozens of overlapping step effects (static noise, shakes, flickers
+are all "do a little, wait 10-40ms" loops) on the shared runtime thread
+and compares threads used and step timing with one sleeping thread each.
+"""
+import pytest
+import threading
+import time
+
+EFFECTS = 40
+STEPS = 25
+INTERVAL = 0.01
+
+
+def _lateness_recorder():
+    lateness = []
+    lock = threading.Lock()
+
+    def record(expected):
+        with lock:
+            lateness.append(max(0.0, time.perf_counter() - expected) * 1000)
+    return lateness, record
+
+
+@pytest.mark.stress
+class TestEffectRuntimeBenchmark:
+
+    def test_overlapping_effects(self):
+        from core.effect_runtime import EffectRuntime
+
+        # Baseline: one sleeping thread per effect (old pattern)
+        lateness_threads, record = _lateness_recorder()
+
+        def sleeper():
+            expected = time.perf_counter()
+            for _ in range(STEPS):
+                record(expected)
+                time.sleep(INTERVAL)
+                expected += INTERVAL
+
+        base_threads = threading.active_count()
+        peak_threads = base_threads
+        start = time.perf_counter()
+        workers = [threading.Thread(target=sleeper, daemon=True) for _ in range(EFFECTS)]
+        for t in workers:
+            t.start()
+        peak_threads = max(peak_threads, threading.active_count())
+        for t in workers:
+            t.join()
+        thread_s = time.perf_counter() - start
+
+        # Runtime: every effect a generator on one shared thread
+        runtime = EffectRuntime()
+        lateness_rt, record = _lateness_recorder()
+
+        def steps():
+            expected = time.perf_counter()
+            for _ in range(STEPS):
+                record(expected)
+                yield INTERVAL
+                expected += INTERVAL
+
+        before = threading.active_count()
+        start = time.perf_counter()
+        effects = [runtime.spawn(steps(), f"fx{i}") for i in range(EFFECTS)]
+        rt_threads = threading.active_count() - before
+        for effect in effects:
+            assert effect.wait(10)
+        runtime_s = time.perf_counter() - start
+        runtime.stop()
+
+        def p95(values):
+            values = sorted(values)
+            return values[int(0.95 * (len(values) - 1))]
+
+        print(f"\n🎬 {EFFECTS} overlapping effects x {STEPS} steps @ {INTERVAL * 1000:.0f}ms")
+        print(f"   thread per effect: {thread_s * 1000:6.1f}ms wall, +{peak_threads - base_threads} threads, "
+              f"step lateness p95={p95(lateness_threads):.2f}ms")
+        print(f"   effect runtime:    {runtime_s * 1000:6.1f}ms wall, +{rt_threads} thread, "
+              f"step lateness p95={p95(lateness_rt):.2f}ms, steps={runtime.steps}")
+
+        assert len(lateness_rt) == EFFECTS * STEPS
+        assert rt_threads <= 1
@@ -0,0 +1,82 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+EventBus Replay Benchmark
+
+Builds a synthetic Act 1 trace (mouse activity, focus changes, anger
+escalations), then replays it headlessly at full speed against the
+reactive subscribers and prints the bus metrics.
+"""
+import json
+import random
+import time
+import pytest
+from unittest.mock import MagicMock
+
+
+def _write_act1_trace(path, seconds: int = 600):
+    rng = random.Random(7)
+    t = 0.0
+    apps = ["chrome.exe", "discord.exe", "taskmgr.exe", "code.exe", "msiexec.exe"]
+    with open(path, "w", encoding="utf-8") as f:
+        while t < seconds:
+            t += rng.uniform(0.2, 1.0)
+            f.write(json.dumps({"t": t, "topic": "ui.user_activity",
+                                "data": {"type": "mouse_move", "pos": [rng.randint(0, 1920), rng.randint(0, 1080)]}}) + "\n")
+            if rng.random() < 0.05:
+                f.write(json.dumps({"t": t, "topic": "window.focus_changed",
+                                    "data": {"process_name": rng.choice(apps)}}) + "\n")
+            if rng.random() < 0.01:
+                f.write(json.dumps({"t": t, "topic": "anger.escalated", "data": {"level": rng.randint(1, 5)}}) + "\n")
+
+
+@pytest.mark.stress
+class TestEventReplay:
+
+    def test_replay_act1_session(self, tmp_path):
+        from core.event_bus import EventBus
+        from core.event_metrics import replay_trace
+        from core.anger_engine import AngerEngine
+        from visual.glitch_logic import GlitchLogic
+
+        trace = tmp_path / "act1.jsonl"
+        _write_act1_trace(trace)
+
+        bus = EventBus()
+        bus.metrics.reset()
+        dispatcher = MagicMock()
+        glitch = GlitchLogic(dispatcher)
+        anger = AngerEngine()
+        heartbeat = MagicMock()
+
+        handles = [
+            bus.subscribe("ui.user_activity", lambda _: heartbeat.update_activity()),
+            bus.subscribe("window.focus_changed",
+                          lambda d: anger.calculate_anger("task_manager") if "taskmgr" in d["process_name"] else None),
+        ]
+
+        start = time.perf_counter()
+        count = replay_trace(str(trace), bus=bus, speed=0)
+        bus.flush()
+        elapsed = time.perf_counter() - start
+
+        snapshot = bus.metrics.snapshot()
+        assert count > 500
+        assert snapshot["topics"]["ui.user_activity"]["published"] >= 500
+
+        print(f"\n🎬 Replayed {count} events (10 min of Act 1) in {elapsed * 1000:.1f} ms")
+        for topic, stats in sorted(snapshot["topics"].items()):
+            print(f"   {topic:24s} pub={stats['published']:5d} avg={stats['avg_callback_ms']:.4f}ms err={stats['errors']}")
+        for entry in snapshot["slowest_callbacks"][:3]:
+            print(f"   slowest: {entry['callback']} ({entry['topic']}) {entry['max_ms']}ms")
+
+        for handle in handles:
+            handle.unsubscribe()
+        bus.unsubscribe("ui.user_activity", glitch._on_user_activity)
+        bus.unsubscribe("ui.window_changed", glitch._on_window_changed)
+        bus.unsubscribe("anger.escalated", glitch._on_anger_escalated)
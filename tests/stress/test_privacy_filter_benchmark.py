@@ -0,0 +1,104 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+PrivacyFilter Micro-Benchmark
+
+Compares throughput of the single-pass scrubber against the old
+five-regex sequential pipeline on realistic multi-KB prompts.
+"""
+import pytest
+import re
+import time
+
+
+def _build_prompt_parts(pf) -> list:
+    """Roughly the shape of GeminiBrain._build_dynamic_prompt parts."""
+    from core.gemini_brain import GeminiBrain
+    brain = GeminiBrain.__new__(GeminiBrain)
+    persona = brain._get_entity_prompt()
+    context = (
+        f"Kullanıcı Adı: {pf.username}\n"
+        "Aktif Pencere: Visual Studio Code - C:\\Users\\Betul\\Projects\\thesis\\main.py\n"
+        "Çalışan Uygulamalar: chrome.exe, discord.exe, spotify.exe\n"
+        "Masaüstü Dosyaları: Tatil, vergi_2025, cv_final, notlar, oyunlar\n"
+        "Bilgisayar Adı: DESKTOP-7F3K2\nIP: 192.168.1.34\n"
+        "Yol: C:\\Program Files\\Steam %APPDATA%\\Roaming\n"
+    )
+    history = "\n".join(f"[user] mesaj {i}: bana yardım et {pf.username}" for i in range(40))
+    return [persona, context, history, "CEVAP (SADECE JSON):"]
+
+
+def _build_prompt(pf) -> str:
+    return "\n".join(_build_prompt_parts(pf))
+
+
+def _sequential_scrub(pf, compiled, text):
+    for regex, repl in compiled:
+        text = regex.sub(repl, text)
+    return text
+
+
+@pytest.mark.stress
+class TestPrivacyFilterBenchmark:
+
+    def test_single_pass_throughput(self):
+        from core.privacy_filter import PrivacyFilter
+        pf = PrivacyFilter()
+        prompt = _build_prompt(pf)
+
+        # Legacy pipeline: same rules, applied one after another
+        compiled = []
+        for _, source, repl in pf.patterns:
+            func = (lambda m, r=repl: r(m.group(0))) if callable(repl) else repl
+            compiled.append((re.compile(source, re.IGNORECASE), func))
+
+        iterations = 300
+        start = time.perf_counter()
+        for _ in range(iterations):
+            legacy = _sequential_scrub(pf, compiled, prompt)
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            single = pf.scrub(prompt)
+        single_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            cached = pf.scrub_cached(prompt)
+        cached_s = time.perf_counter() - start
+
+        # Real prompt path: persona memoized, dynamic sections single-pass
+        parts = _build_prompt_parts(pf)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            built = "\n".join([pf.scrub_cached(parts[0])] + [pf.scrub(x) for x in parts[1:]])
+        prompt_path_s = time.perf_counter() - start
+
+        assert single == legacy == cached == built
+
+        kb = len(prompt.encode("utf-8")) * iterations / 1024
+        print(f"\n🔒 Prompt size: {len(prompt)} chars, {iterations} iterations")
+        print(f"   Sequential (5 passes): {kb / legacy_s:10.1f} KB/s")
+        print(f"   Single pass:           {kb / single_s:10.1f} KB/s")
+        print(f"   Memoized (static):     {kb / cached_s:10.1f} KB/s")
+        print(f"   Prompt path (mixed):   {kb / prompt_path_s:10.1f} KB/s")
+
+    def test_stream_throughput(self):
+        from core.privacy_filter import PrivacyFilter
+        pf = PrivacyFilter()
+        prompt = _build_prompt(pf)
+        chunks = [prompt[i:i + 256] for i in range(0, len(prompt), 256)]
+
+        start = time.perf_counter()
+        for _ in range(100):
+            streamed = "".join(pf.scrub_stream(chunks))
+        elapsed = time.perf_counter() - start
+
+        assert streamed == pf.scrub(prompt)
+        print(f"\n🔒 Streaming (256-char chunks): {len(prompt) * 100 / 1024 / elapsed:.1f} KB/s")
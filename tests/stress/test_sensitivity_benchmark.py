@@ -0,0 +1,62 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Sensitivity Engine Benchmark
+
+Scores directory listings with thousands of entries using the old
+three-list any() scans and the shared keyword automaton (cold and memoized).
+"""
+import pytest
+import random
+import time
+
+
+def _legacy_classify(engine, filename):
+    fn = filename.lower()
+    if any(w in fn for w in engine.CRITICAL_WORDS): score = 90
+    elif any(w in fn for w in engine.IMPORTANT_WORDS): score = 60
+    elif any(w in fn for w in engine.PERSONAL_WORDS): score = 30
+    else: score = 0
+    return score, any(b in fn for b in engine.BLACKLIST_WORDS)
+
+
+def _fake_listing(count: int) -> list:
+    rng = random.Random(1337)
+    words = ["tatil", "fatura", "proje", "rapor", "IMG", "backup", "oyun", "ders", "sunum", "taslak",
+             "passwords", "vergi", "cv", "günlük", "private", "notlar", "banka", "video", "kimlik"]
+    return [f"{rng.choice(words)}_{rng.choice(words)}_{i:05d}" for i in range(count)]
+
+
+@pytest.mark.stress
+class TestSensitivityBenchmark:
+
+    @pytest.mark.parametrize("count", [2000, 10000])
+    def test_directory_scoring(self, count):
+        from core.sensitivity import SensitivityEngine
+        engine = SensitivityEngine()
+        names = _fake_listing(count)
+
+        start = time.perf_counter()
+        legacy = [_legacy_classify(engine, n) for n in names]
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cold = engine.classify_many(names)
+        cold_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warm = engine.classify_many(names)
+        warm_s = time.perf_counter() - start
+
+        assert [(r.score, r.blacklisted) for r in cold] == legacy
+        assert warm == cold
+
+        print(f"\n🔎 {count} entries")
+        print(f"   Legacy any() scans: {legacy_s * 1000:8.2f} ms")
+        print(f"   Automaton (cold):   {cold_s * 1000:8.2f} ms")
+        print(f"   Automaton (memo):   {warm_s * 1000:8.2f} ms")
@@ -0,0 +1,64 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+"""
+Story Simulation Benchmark
+
+Plays the whole story (Acts 1-4 with Heartbeat, AmbientHorror,
+SilenceBreaker and DynamicDifficulty) on a virtual clock and checks the
+report: every act reached, bounded queue depth and memory growth.
+"""
+import pytest
+
+from story.simulator import StorySimulator, format_report
+
+pytestmark = pytest.mark.usefixtures("runtime_sandbox")
+
+
+@pytest.fixture(scope="module")
+def app():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.mark.stress
+class TestStorySimulator:
+
+    def test_full_session_unpaced(self, app):
+        report = StorySimulator(speed=0, seed=7).run(max_minutes=60)
+        print("\n" + format_report(report))
+
+        assert [a["act"] for a in report["acts"]] == [1, 2, 3, 4]
+        assert report["ending"] == "act_4_complete"
+        # Act 1-3 timelines alone are 34 minutes; Act 4 times out after 5 more
+        assert report["virtual_s"] > 34 * 60
+        assert report["speedup"] > 100
+
+        actions = report["actions"]
+        assert len(actions["per_minute"]) == pytest.approx(report["virtual_s"] / 60, abs=1)
+        assert actions["total"] == sum(actions["per_minute"])
+        assert actions["total"] > 150
+        assert report["brain"]["calls"] > 10
+        assert report["queue_depth"]["max"] < 20
+        assert report["event_log"]["entries"] >= 4  # Session start + act changes
+        assert report["memory"]["growth_kb"] < 20 * 1024
+
+    def test_paced_run_holds_speed(self, app):
+        report = StorySimulator(speed=200, seed=1, trace_memory=False).run(max_minutes=5)
+
+        assert report["ending"] == "time_limit"
+        assert report["virtual_s"] == pytest.approx(300, abs=1)
+        assert report["wall_s"] >= 300 / 200 * 0.95
+        assert report["speedup"] <= 200 * 1.05
+
+    def test_same_seed_same_story(self, app):
+        first = StorySimulator(speed=0, seed=3, trace_memory=False).run(max_minutes=15)
+        second = StorySimulator(speed=0, seed=3, trace_memory=False).run(max_minutes=15)
+
+        assert first["acts"] == second["acts"]
+        assert first["brain"] == second["brain"]
+        assert first["timeline_events"] == second["timeline_events"]
@@ -0,0 +1,71 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+from unittest.mock import MagicMock
+from core.action_registry import (
+    ActionSpec, PRIORITY_HIGH, PRIORITY_MEDIUM, PRIORITY_LOW,
+    THREAD_CONTROLLER, THREAD_MAIN, THREAD_WORKER,
+    build_action_registry, collect_action_specs,
+)
+from core.action_resources import CURSOR, SCREEN
+from core.dispatchers.hardware_dispatcher import HardwareDispatcher
+from core.dispatchers.horror_dispatcher import HorrorDispatcher
+from core.dispatchers.system_dispatcher import SystemDispatcher
+from core.dispatchers.visual_dispatcher import VisualDispatcher
+from core.validators import VALID_ACTIONS
+
+
+def _stub(cls):
+    """Dispatcher instance without running its (hardware-touching) __init__."""
+    dispatcher = cls.__new__(cls)
+    dispatcher._handlers = {}  # No bound handlers: registry falls back to dispatch()
+    return dispatcher
+
+
+class TestActionRegistry:
+
+    def _registry(self):
+        dispatchers = [_stub(VisualDispatcher), _stub(HardwareDispatcher),
+                       _stub(HorrorDispatcher), _stub(SystemDispatcher)]
+        specs = collect_action_specs(dispatchers, {"NONE": ActionSpec(thread=THREAD_CONTROLLER)})
+        return dispatchers, build_action_registry(dispatchers, specs)
+
+    def test_declared_facts_are_resolved(self):
+        (visual, hardware, _, _), registry = self._registry()
+        flash = registry["GDI_FLASH"]
+        assert flash.dispatcher is visual
+        assert (flash.priority, flash.thread, flash.resource.resource) == (PRIORITY_HIGH, THREAD_WORKER, SCREEN)
+        assert registry["TTS_SPEAK"].priority == PRIORITY_MEDIUM
+        assert registry["OVERLAY_TEXT"].thread == THREAD_MAIN
+        assert registry["OVERLAY_TEXT"].params.required == ("text",)
+        shake = registry["MOUSE_SHAKE"]
+        assert shake.dispatcher is hardware and shake.silent and shake.resource.resource == CURSOR
+        assert registry["OPEN_BROWSER"].priority == PRIORITY_LOW
+        assert registry["OPEN_BROWSER"].resource is None
+
+    def test_later_dispatcher_wins_shared_action(self):
+        (_, _, _, system), registry = self._registry()
+        assert registry["ICON_SCRAMBLE"].dispatcher is system
+
+    def test_controller_only_action(self):
+        _, registry = self._registry()
+        assert registry["NONE"].dispatcher is None
+        assert registry["NONE"].thread == THREAD_CONTROLLER
+
+    def test_undeclared_dispatcher_keeps_declared_specs(self):
+        """Swapped-in dispatchers (mocks, tools) only route; the specs stay."""
+        specs = collect_action_specs([_stub(VisualDispatcher)])
+        mock = MagicMock()
+        mock.get_supported_actions.return_value = ["GDI_FLASH", "CUSTOM"]
+        registry = build_action_registry([mock], specs)
+        assert registry["GDI_FLASH"].dispatcher is mock
+        assert registry["GDI_FLASH"].priority == PRIORITY_HIGH
+        assert registry["CUSTOM"].priority == PRIORITY_LOW
+
+    def test_valid_actions_is_a_set(self):
+        assert isinstance(VALID_ACTIONS, frozenset)
+        assert "GDI_FLASH" in VALID_ACTIONS
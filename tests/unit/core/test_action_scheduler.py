@@ -0,0 +1,275 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import threading
+import time
+from core.action_scheduler import (
+    ActionScheduler, ActionTask, SOURCE_AMBIENT, SOURCE_CHAT, SOURCE_HEARTBEAT, SOURCE_TIMELINE,
+    current_source, dispatch_source,
+)
+from core.action_resources import CURSOR, MERGE, ResourceRule
+
+
+class TestActionScheduler:
+
+    def test_fifo_within_priority(self):
+        sched = ActionScheduler()
+        for i in range(20):
+            sched.submit(3, f"LOW_{i}")
+        assert [sched.get().action for _ in range(20)] == [f"LOW_{i}" for i in range(20)]
+
+    def test_priority_lanes_and_sequence(self):
+        sched = ActionScheduler()
+        sched.submit(3, "LOW_A")
+        sched.submit(2, "MED_A")
+        sched.submit(3, "LOW_B")
+        sched.submit(1, "HIGH_A")
+        sched.submit(0, "__SHUTDOWN__")
+        order = [sched.get() for _ in range(5)]
+        assert [t.action for t in order] == ["__SHUTDOWN__", "HIGH_A", "MED_A", "LOW_A", "LOW_B"]
+        # Sequence is monotonic in submit order, regardless of lane
+        assert [t.seq for t in sorted(order, key=lambda t: t.seq)] == sorted(t.seq for t in order)
+        assert order[3].seq < order[4].seq
+
+    def test_out_of_range_priority_is_clamped(self):
+        sched = ActionScheduler(lanes=4)
+        sched.submit(9, "WAY_LOW")
+        sched.submit(-5, "WAY_HIGH")
+        assert sched.lane_sizes() == [1, 0, 0, 1]
+        assert sched.get().action == "WAY_HIGH"
+
+    def test_tasks_are_recycled(self):
+        sched = ActionScheduler(pool_size=4)
+        first = sched.submit(1, "A", {"x": 1})
+        task = sched.get()
+        assert task is first
+        sched.task_done(task)
+        assert task.params is None  # Released params do not leak into the pool
+        again = sched.submit(2, "B")
+        assert again is first
+        assert again.action == "B" and again.params == {}
+
+    def test_get_blocks_until_put(self):
+        sched = ActionScheduler()
+        got = []
+
+        def consumer():
+            got.append(sched.get())
+
+        t = threading.Thread(target=consumer, daemon=True)
+        t.start()
+        time.sleep(0.05)
+        assert not got  # Blocked, not spinning through a timeout
+        sched.submit(1, "WAKE")
+        t.join(timeout=1.0)
+        assert got and got[0].action == "WAKE"
+
+    def test_close_wakes_waiters(self):
+        sched = ActionScheduler()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(sched.get()), daemon=True) for _ in range(3)]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        sched.close()
+        for t in threads:
+            t.join(timeout=1.0)
+        assert results == [None, None, None]
+
+    def test_join_waits_for_task_done(self):
+        sched = ActionScheduler()
+        sched.submit(1, "A")
+        assert not sched.join(timeout=0.01)
+        sched.task_done(sched.get())
+        assert sched.join(timeout=0.1)
+
+    def test_get_timeout_and_oldest_wait(self):
+        sched = ActionScheduler()
+        start = time.monotonic()
+        assert sched.get(timeout=0.05) is None
+        assert time.monotonic() - start >= 0.045
+        assert not sched.closed  # Timed out, not closed
+        assert sched.oldest_wait() == 0.0
+        sched.submit(3, "LOW")
+        time.sleep(0.02)
+        sched.submit(1, "HIGH")
+        assert sched.oldest_wait() >= 0.02  # Oldest across lanes, not the next to run
+        assert sched.get(timeout=0.05).action == "HIGH"
+
+    def test_task_ordering_compat(self):
+        a = ActionTask(priority=1, action="A")
+        b = ActionTask(priority=2, action="B")
+        assert a < b
+
+
+class TestResourceLanes:
+
+    def test_same_resource_runs_serially(self):
+        sched = ActionScheduler()
+        first = sched.submit(1, "GDI_FLASH")
+        second = sched.submit(1, "GDI_LINE")
+        assert sched.lane_sizes()[1] == 1  # GDI_LINE waits on the screen
+        assert sched.qsize() == 2
+        task = sched.get()
+        assert task is first
+        sched.task_done(task)
+        assert sched.get() is second
+
+    def test_other_resources_do_not_wait(self):
+        sched = ActionScheduler()
+        sched.submit(1, "GDI_FLASH")
+        sched.submit(3, "MOUSE_SHAKE")
+        sched.submit(3, "FAKE_FILE_DELETE")  # No resource
+        got = [sched.get().action for _ in range(3)]
+        assert got == ["GDI_FLASH", "MOUSE_SHAKE", "FAKE_FILE_DELETE"]
+
+    def test_merge_extends_waiting_shake(self):
+        sched = ActionScheduler()
+        first = sched.submit(3, "MOUSE_SHAKE", {"duration": 1.0})
+        merged = sched.submit(3, "MOUSE_SHAKE", {"duration": 2.0})
+        assert merged is first
+        assert first.params["duration"] == 3.0
+        assert sched.merged == 1
+        assert sched.qsize() == 1
+
+    def test_merge_while_running_waits_behind(self):
+        sched = ActionScheduler()
+        running = sched.submit(3, "MOUSE_SHAKE", {"duration": 1.0})
+        assert sched.get() is running
+        queued = sched.submit(3, "MOUSE_SHAKE", {"duration": 1.0})
+        again = sched.submit(3, "MOUSE_SHAKE", {"duration": 4.5})
+        assert again is queued
+        assert queued.params["duration"] == 5.0  # Capped
+        sched.task_done(running)
+        assert sched.get() is queued
+
+    def test_merge_extends_running_shake(self, monkeypatch):
+        from hardware.mouse_ops import MouseOps
+        monkeypatch.setattr(MouseOps, "_shaking", True)
+        monkeypatch.setattr(MouseOps, "_shake_until", time.time() + 0.5)
+        sched = ActionScheduler()
+        running = sched.submit(3, "MOUSE_SHAKE", {"duration": 1.0})
+        assert sched.get() is running
+        assert sched.submit(3, "MOUSE_SHAKE", {"duration": 2.0}) is running
+        assert MouseOps._shake_until >= time.time() + 2.4  # The running shake got longer
+        assert sched.merged == 1
+        assert sched.qsize() == 0  # Nothing queued behind it
+        sched.task_done(running)
+        assert sched.join(timeout=0.1)
+
+    def test_running_effect_that_cannot_extend_queues(self):
+        rules = {"MOUSE_SHAKE": ResourceRule(CURSOR, MERGE, extend=lambda params: False)}
+        sched = ActionScheduler(resources=rules)
+        running = sched.submit(3, "MOUSE_SHAKE")
+        assert sched.get() is running
+        queued = sched.submit(3, "MOUSE_SHAKE")
+        assert queued is not running
+        assert sched.merged == 0
+        sched.task_done(running)
+        assert sched.get() is queued
+
+    def test_drop_duplicate(self):
+        sched = ActionScheduler()
+        first = sched.submit(1, "SCREEN_INVERT")
+        assert sched.submit(1, "SCREEN_INVERT") is None
+        assert sched.get() is first
+        assert sched.submit(1, "SCREEN_INVERT") is None  # Still running
+        sched.task_done(first)
+        assert sched.submit(1, "SCREEN_INVERT") is not None
+        assert sched.dropped == 2
+
+    def test_waiting_tasks_keep_priority_order(self):
+        sched = ActionScheduler()
+        blocker = sched.submit(3, "PLAY_SFX")
+        sched.submit(3, "TTS_SPEAK", {"text": "low"})
+        sched.submit(2, "PLAY_SOUND")
+        sched.task_done(sched.get())
+        assert sched.get().action == "PLAY_SOUND"
+        assert blocker.params is None  # Recycled
+
+    def test_join_covers_waiting_tasks(self):
+        sched = ActionScheduler()
+        sched.submit(1, "GDI_FLASH")
+        sched.submit(1, "GDI_LINE")
+        sched.task_done(sched.get())
+        assert not sched.join(timeout=0.01)
+        sched.task_done(sched.get())
+        assert sched.join(timeout=0.1)
+        assert sched.resource_state()["screen"] == {"active": None, "running": False, "waiting": 0}
+
+
+class TestDeadlines:
+
+    def _expire_all(self, sched):
+        """Pretend every queued task's deadline already passed."""
+        for lane in sched._lanes:
+            for task in lane:
+                if task.deadline is not None:
+                    task.deadline = task.due = time.perf_counter() - 1
+
+    def test_deadline_from_priority_and_source(self):
+        sched = ActionScheduler()
+        timeline = sched.submit(1, "GDI_FLASH", source=SOURCE_TIMELINE)
+        ambient = sched.submit(3, "FAKE_FILE_DELETE", source=SOURCE_AMBIENT)
+        untagged = sched.submit(3, "OPEN_BROWSER")
+        assert timeline.deadline - timeline.enqueued == ActionScheduler.PRIORITY_DEADLINES[1]
+        assert ambient.deadline - ambient.enqueued == ActionScheduler.PRIORITY_DEADLINES[3] * 0.5
+        assert untagged.deadline is None
+
+    def test_expired_visual_is_dropped(self):
+        sched = ActionScheduler()
+        sched.submit(1, "GLITCH_SCREEN", source=SOURCE_TIMELINE)
+        fresh = sched.submit(3, "OPEN_BROWSER", source=SOURCE_CHAT)
+        self._expire_all(sched)
+        fresh.deadline = fresh.due = None
+        assert sched.get() is fresh
+        assert sched.stats()["expired"] == 1
+        # Dropped task no longer counts as unfinished; its screen lane is free
+        sched.task_done(fresh)
+        assert sched.join(timeout=0.1)
+        assert sched.resource_state()["screen"]["active"] is None
+
+    def test_expired_story_beat_is_downgraded_once(self):
+        sched = ActionScheduler()
+        beat = sched.submit(2, "NOTEPAD_HIJACK", source=SOURCE_TIMELINE)
+        low = sched.submit(3, "OPEN_BROWSER")
+        self._expire_all(sched)
+        # Beat moved behind the untagged LOW task instead of being dropped
+        assert sched.get() is low
+        assert sched.get() is beat
+        assert beat.priority == 3
+        stats = sched.stats()
+        assert stats["downgraded"] == 1 and stats["late"] == 1 and stats["expired"] == 0
+
+    def test_heartbeat_expiry_drops(self):
+        sched = ActionScheduler()
+        sched.submit(3, "CORRUPT_WINDOWS", source=SOURCE_HEARTBEAT)
+        self._expire_all(sched)
+        sched.close()
+        assert sched.get() is None
+        assert sched.stats()["expired"] == 1
+
+    def test_ambient_shed_when_backed_up(self):
+        sched = ActionScheduler(shed_depth=3)
+        for i in range(3):
+            sched.submit(3, f"WORK_{i}")
+        assert sched.submit(3, "FAKE_FILE_DELETE", source=SOURCE_AMBIENT) is None
+        assert sched.submit(1, "GDI_FLASH", source=SOURCE_AMBIENT) is not None  # High priority kept
+        assert sched.submit(3, "OPEN_BROWSER", source=SOURCE_TIMELINE) is not None
+        assert sched.stats()["shed"] == 1
+
+    def test_dispatch_source_scope(self):
+        assert current_source() is None
+
+        @dispatch_source(SOURCE_TIMELINE)
+        def beat():
+            with dispatch_source(SOURCE_AMBIENT):
+                inner = current_source()
+            return inner, current_source()
+
+        assert beat() == (SOURCE_AMBIENT, SOURCE_TIMELINE)
+        assert current_source() is None
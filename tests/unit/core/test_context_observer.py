@@ -8,6 +8,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from core.context_observer import ContextObserver
+from core.desktop_index import DesktopIndex
 
 class TestContextObserver:
     @patch('core.context_observer.os.getlogin', return_value="TestUser")
@@ -39,6 +40,49 @@ class TestContextObserver:
     @patch('core.context_observer.os.path.exists', return_value=True)
     @patch('core.context_observer.os.listdir', return_value=["file1.txt", "file2.jpg"])
     def test_get_desktop_files(self, mock_listdir, mock_exists):
+        DesktopIndex.reset()  # Force a fresh scan under the patched listdir
         files = ContextObserver.get_desktop_files()
+        DesktopIndex.reset()
         assert "file1.txt" in files
         assert len(files) == 2
+
+
+class TestContextDeltas:
+
+    @pytest.fixture(autouse=True)
+    def fresh(self):
+        ContextObserver.invalidate_cache()
+        yield
+        ContextObserver.invalidate_cache()
+
+    @pytest.fixture
+    def volatile(self):
+        state = {"active_window": "Notepad", "running_apps": ["chrome.exe"], "battery": None,
+                 "is_late_night": False, "desktop_files": ["a.txt"]}
+        with patch.object(ContextObserver, 'collect_volatile', side_effect=lambda: dict(state)), \
+             patch.object(ContextObserver, 'get_full_context', side_effect=lambda: dict(state, user_name="U")):
+            yield state
+
+    def test_only_changes_published(self, volatile):
+        ContextObserver.publish_changes()  # Initial values
+        with patch('core.context_observer.bus.publish') as mock_publish:
+            assert ContextObserver.publish_changes() == {}
+            volatile["active_window"] = "Discord"
+            ContextObserver.publish_changes()
+
+        mock_publish.assert_called_once_with(
+            "context.changed", {"changes": {"active_window": "Discord"}, "kinds": ["window"]})
+
+    def test_view_tracks_deltas(self, volatile):
+        from core.context_observer import ContextView
+        view = ContextView()
+        assert view.current()["active_window"] == "Notepad"
+        assert "user_name" in view.take_changes()  # First take is the whole context
+
+        volatile["running_apps"] = ["chrome.exe", "spotify.exe"]
+        volatile["is_late_night"] = True
+        ContextObserver.publish_changes()
+
+        assert view.take_changes() == {"running_apps": ["chrome.exe", "spotify.exe"], "is_late_night": True}
+        assert view.take_changes() == {}
+        assert view.current()["running_apps"] == ["chrome.exe", "spotify.exe"]
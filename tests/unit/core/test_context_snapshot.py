@@ -0,0 +1,57 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import pytest
+from core.context_snapshot import ContextSnapshot
+from core.context_observer import ContextObserver
+
+
+RAW = {
+    "user_name": "Betul",
+    "active_window": "Discord",
+    "exact_time": "02:14",
+    "time_of_day": "Night",
+    "is_late_night": True,
+    "running_apps": ["Discord.exe", "chrome.exe"],
+    "desktop_files": [("vergi_2025", 60), "tatil.jpg"],
+    "battery": {"percent": 12, "plugged": False, "is_low": True},
+    "network": {"hostname": "DESKTOP-7F3K2", "local_ip": "10.0.0.2"},
+    "file_snippet": {"filename": "todo.txt", "snippet": "süt al"},
+}
+
+
+class TestContextSnapshot:
+
+    def test_normalizes_mixed_desktop_files(self):
+        snap = ContextSnapshot.from_dict(RAW)
+        assert snap.desktop_files == ("vergi_2025", "tatil.jpg")
+        assert snap.desktop_scores == (60, 0)
+        assert not hasattr(snap, "__dict__")
+
+    def test_app_membership(self):
+        snap = ContextSnapshot.from_dict(RAW)
+        assert snap.has_app("discord") and snap.has_app("CHROME")
+        assert not snap.has_app("spotify")
+
+    def test_hashable_and_diffable(self):
+        a = ContextSnapshot.from_dict(RAW)
+        b = ContextSnapshot.from_dict(RAW)
+        assert a == b and hash(a) == hash(b)
+        assert len({a, b}) == 1
+
+        later = ContextSnapshot.from_dict(dict(RAW, exact_time="02:15", active_window="Notepad"))
+        assert set(later.diff(a)) == {"exact_time", "active_window"}
+        # Clock fields do not affect the response cache key
+        assert ContextSnapshot.from_dict(dict(RAW, exact_time="02:15")).cache_key() == a.cache_key()
+        assert later.cache_key() != a.cache_key()
+
+    def test_round_trip_and_scary_facts(self):
+        snap = ContextSnapshot.from_dict(RAW)
+        assert snap.to_dict()["battery"]["is_low"]
+        facts = ContextObserver.get_scary_facts(snap)
+        assert any("Discord" in f for f in facts)
+        assert any("%12" in f for f in facts)
@@ -5,7 +5,9 @@
 # ARCHITECT: MAB-SENTIENT-2026
 # =========================================================================
 
+import re
 import pytest
+from unittest.mock import MagicMock, patch
 from core.anger_engine import AngerEngine
 from core.privacy_filter import PrivacyFilter
 from core.validators import validate_ai_response, validate_config_value, validate_action_params
@@ -53,6 +55,57 @@ class TestPrivacyFilter:
         assert "Betul" not in scrubbed
         assert "<USER_DIR>" in scrubbed
 
+    # Sequential pipeline from before the single-pass scrubber, in its original order
+    LEGACY_PIPELINE = [
+        (r'Betul', "<USER>"),
+        (r'[a-zA-Z]:\\Users\\[^\s\\]+', "<USER_DIR>"),
+        (r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', "<IP_ADDR>"),
+        (r'C:\\(Windows|Program Files|System32)', "<SYS_PATH>"),
+        (r'%[a-zA-Z_0-9]+%', "<ENV_VAR>"),
+    ]
+
+    @pytest.fixture
+    def betul_filter(self):
+        with patch("getpass.getuser", return_value="Betul"):
+            filter = PrivacyFilter()
+        filter.streamer_mode = MagicMock(enabled=False)
+        return filter
+
+    @pytest.mark.parametrize("text, expected", [
+        (r"Betul at C:\Users\Betul\Desktop, C:\Program Files, %APPDATA% and 10.0.0.7 / 999.1.1.1",
+         r"<USER> at <USER_DIR>\Desktop, <SYS_PATH>, <ENV_VAR> and <IP_ADDR> / <IP_ADDR>"),
+        # Username inside a path
+        (r"C:\Users\Public\Betul\notes.txt", r"<USER_DIR>\<USER>\notes.txt"),
+        (r"D:\Backup\betul\x", r"D:\Backup\<USER>\x"),
+        (r"C:\Users\Betul.Dev\x", r"<USER_DIR>\x"),
+        (r"C:\Windows\Temp\Betul", r"<SYS_PATH>\Temp\<USER>"),
+        # IP inside a path
+        (r"C:\Users\Betul\10.0.0.7\log", r"<USER_DIR>\<IP_ADDR>\log"),
+        (r"C:\Users\10.0.0.7\log", r"<USER_DIR>\log"),
+        (r"\\192.168.1.20\share\Betul", r"\\<IP_ADDR>\share\<USER>"),
+        # Username inside an environment variable
+        (r"%Betul% and %BETUL_HOME% but %TEMP%", r"%<USER>% and %<USER>_HOME% but <ENV_VAR>"),
+    ])
+    def test_single_pass_matches_legacy_pipeline(self, betul_filter, text, expected):
+        legacy = text
+        for source, repl in self.LEGACY_PIPELINE:
+            legacy = re.sub(source, repl, legacy, flags=re.IGNORECASE)
+        assert legacy == expected
+        assert betul_filter.scrub(text) == expected
+
+    def test_scrub_cached(self):
+        filter = PrivacyFilter()
+        text = "Static persona for 192.168.0.1"
+        first = filter.scrub_cached(text)
+        assert first == filter.scrub(text)
+        assert filter.scrub_cached(text) is first
+
+    def test_scrub_stream_chunk_boundaries(self):
+        filter = PrivacyFilter()
+        text = "ip 192.168.1.1 path C:\\Program Files\\App and %TEMP% done"
+        chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+        assert "".join(filter.scrub_stream(chunks)) == filter.scrub(text)
+
 class TestValidators:
     def test_validate_ai_response_valid(self):
         response = {
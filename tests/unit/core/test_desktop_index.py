@@ -0,0 +1,95 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import time
+import pytest
+from unittest.mock import patch
+from core.desktop_index import DesktopIndex
+from core.context_observer import ContextObserver
+from core.file_awareness import FileSystemAwareness
+
+
+class TestDesktopIndex:
+
+    @pytest.fixture
+    def fake_home(self, tmp_path, monkeypatch):
+        desktop = tmp_path / "Desktop"
+        desktop.mkdir()
+        (desktop / "passwords.txt").write_text("hunter2")
+        (desktop / "todo.txt").write_text("buy milk and eggs\n")
+        (desktop / "Tatil").mkdir()
+        (desktop / ".hidden").write_text("x")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        DesktopIndex.reset()
+        yield desktop
+        DesktopIndex.reset()
+
+    def test_index_builds_once(self, fake_home):
+        index = DesktopIndex.singleton()
+        with patch('core.desktop_index.os.listdir', wraps=__import__('os').listdir) as mock_listdir:
+            ContextObserver.get_desktop_files()
+            FileSystemAwareness.get_desktop_folders()
+            FileSystemAwareness.get_desktop_file_names()
+            ContextObserver.get_desktop_files()
+            # Desktop walked once, regardless of how many consumers asked
+            assert mock_listdir.call_count == 1
+
+        assert ".hidden" not in index.names()
+        assert index.folders() == ("Tatil",)
+
+    def test_scores_precomputed(self, fake_home):
+        scored = dict(FileSystemAwareness.get_desktop_file_names())
+        assert scored["passwords"] >= 90
+        assert scored["todo"] == 0
+
+    def test_refresh_picks_up_changes(self, fake_home):
+        index = DesktopIndex.singleton()
+        assert "new.txt" not in index.names()
+        (fake_home / "new.txt").write_text("hello")
+        index.refresh(DesktopIndex.DESKTOP)
+        assert "new.txt" in index.names()
+
+    def test_files_sorted_by_size(self, fake_home):
+        sizes = [e.size for e in DesktopIndex.singleton().files_by_size()]
+        assert sizes == sorted(sizes)
+
+    def test_missing_folder_is_empty(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        DesktopIndex.reset()
+        assert DesktopIndex.singleton().names(DesktopIndex.DOCUMENTS) == ()
+        assert ContextObserver.get_documents_sample() == []
+        DesktopIndex.reset()
+
+    def test_event_burst_coalesced_into_one_rescan(self, fake_home):
+        from core.desktop_index import _ChangeHandler
+        index = DesktopIndex.singleton()
+        index.snapshot()
+        index._refresh_delay = 0.05
+        handler = _ChangeHandler(index, DesktopIndex.DESKTOP)
+        with patch.object(index, '_scan', wraps=index._scan) as mock_scan:
+            for i in range(20):
+                (fake_home / f"copy_{i}.txt").write_text("x")
+                handler.on_any_event(object())
+            assert mock_scan.call_count == 0
+            time.sleep(0.3)
+            assert mock_scan.call_count == 1
+            assert "copy_19.txt" in index.names()
+
+            # A later change gets its own rescan
+            handler.on_any_event(object())
+            time.sleep(0.3)
+            assert mock_scan.call_count == 2
+
+    def test_stop_cancels_scheduled_rescan(self, fake_home):
+        index = DesktopIndex.singleton()
+        index._refresh_delay = 0.05
+        with patch.object(index, '_scan', wraps=index._scan) as mock_scan:
+            index.schedule_refresh(DesktopIndex.DESKTOP)
+            index.stop()
+            time.sleep(0.2)
+            assert mock_scan.call_count == 0
@@ -0,0 +1,89 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import json
+import time
+from core.dispatch_metrics import DispatchMetrics, MetricsExporter
+
+
+class TestDispatchMetrics:
+
+    def test_run_timings_and_failures(self):
+        metrics = DispatchMetrics()
+        t0 = time.perf_counter()
+        metrics.record_enqueue("GDI_FLASH")
+        metrics.record_enqueue("GDI_FLASH", DispatchMetrics.MERGED)
+        metrics.record_enqueue("GDI_FLASH", DispatchMetrics.DROPPED)
+        metrics.record_start()
+        metrics.record_run("GDI_FLASH", t0, t0 + 0.010, t0 + 0.030, worker="ActionWorker-0")
+        metrics.record_start()
+        metrics.record_run("GDI_FLASH", t0, t0 + 0.050, t0 + 0.060, failed=True, worker="ActionWorker-1")
+
+        flash = metrics.snapshot(workers=2)["actions"]["GDI_FLASH"]
+        assert (flash["queued"], flash["merged"], flash["dropped"]) == (1, 1, 1)
+        assert flash["runs"] == 2 and flash["failures"] == 1
+        assert flash["avg_wait_ms"] == 30.0 and flash["max_wait_ms"] == 50.0
+        assert flash["avg_run_ms"] == 15.0 and flash["max_run_ms"] == 20.0
+        assert flash["last_run"]["worker"] == "ActionWorker-1"
+
+    def test_main_thread_runs_have_no_wait(self):
+        metrics = DispatchMetrics()
+        t0 = time.perf_counter()
+        metrics.record_run("FAKE_BSOD", None, t0, t0 + 0.005)
+        snapshot = metrics.snapshot()
+        assert snapshot["actions"]["FAKE_BSOD"]["avg_wait_ms"] == 0.0
+        assert snapshot["recent"][0]["enqueued_ms"] is None
+        assert snapshot["workers"]["busy_s"] == {}  # Main thread is not a pool worker
+
+    def test_worker_busy_ratio(self):
+        metrics = DispatchMetrics()
+        time.sleep(0.1)
+        now = time.perf_counter()
+        metrics.record_start()
+        assert metrics.workers(2)["busy"] == 1
+        metrics.record_run("MOUSE_SHAKE", None, now - 0.1, now, worker="ActionWorker-0")
+        workers = metrics.workers(2)
+        # One of two workers busy for ~the whole window
+        assert 0.3 < workers["busy_ratio"] <= 0.5
+        assert workers["idle_ratio"] == round(1 - workers["busy_ratio"], 4)
+        assert workers["busy"] == 0 and workers["peak_busy"] == 1
+
+    def test_busiest_and_recent_limit(self):
+        metrics = DispatchMetrics(recent_limit=3)
+        t0 = time.perf_counter()
+        for i in range(5):
+            metrics.record_run("PLAY_SOUND", t0, t0, t0 + 0.001)
+        metrics.record_run("CORRUPT_WINDOWS", t0, t0, t0 + 0.1)
+        assert list(metrics.busiest(1)) == ["CORRUPT_WINDOWS"]
+        assert len(metrics.snapshot()["recent"]) == 3
+        metrics.reset()
+        assert metrics.snapshot()["actions"] == {}
+
+    def test_exporter_appends_json_lines(self, tmp_path):
+        metrics = DispatchMetrics()
+        metrics.record_run("GDI_FLASH", None, 0.0, 0.0)
+        path = tmp_path / "dispatch_metrics.jsonl"
+        exporter = MetricsExporter(lambda: metrics.snapshot(workers=5), str(path), interval=0.1)
+        exporter.start()
+        time.sleep(0.35)
+        exporter.stop()  # Writes a final snapshot too
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == exporter.count >= 3
+        entry = json.loads(lines[-1])
+        assert entry["actions"]["GDI_FLASH"]["runs"] == 1
+        assert entry["workers"]["count"] == 5 and "t" in entry
+
+    def test_effect_duration(self):
+        metrics = DispatchMetrics()
+        t0 = time.perf_counter()
+        metrics.record_run("MOUSE_SHAKE", t0, t0, t0 + 0.001, worker="ActionWorker-0")
+        metrics.record_effect("MOUSE_SHAKE", t0, t0 + 1.5)
+        shake = metrics.snapshot()["actions"]["MOUSE_SHAKE"]
+        assert shake["avg_run_ms"] == 1.0  # Handler time: spawning the Effect
+        assert shake["effects"] == 1 and shake["avg_effect_ms"] == 1500.0 and shake["max_effect_ms"] == 1500.0
+        assert metrics.workers(1)["busy_s"] == {"ActionWorker-0": 0.001}  # The worker was free meanwhile
@@ -114,3 +114,166 @@ class TestFunctionDispatcher:
                 assert isinstance(t, threading.Thread)
             
             disp.stop_dispatching()
+
+    def test_dispatch_source_reaches_scheduler(self, dispatcher):
+        """dispatch_source() scopes tag queued tasks without changing dispatch() calls."""
+        from core.function_dispatcher import SOURCE_TIMELINE, SOURCE_AMBIENT, dispatch_source
+        sources = []
+        original = dispatcher._action_queue.acquire
+
+        def capture(priority, action, params=None, speech="", source=None):
+            sources.append(source)
+            return original(priority, action, params, speech, source)
+
+        with patch.object(dispatcher._action_queue, 'acquire', side_effect=capture), \
+             patch.object(dispatcher.system_dispatcher, 'dispatch'):
+            with dispatch_source(SOURCE_TIMELINE):
+                dispatcher.dispatch({"action": "OPEN_BROWSER", "params": {}, "speech": ""})
+            dispatcher.dispatch({"action": "OPEN_BROWSER", "params": {}, "speech": ""}, source=SOURCE_AMBIENT)
+            dispatcher.dispatch({"action": "OPEN_BROWSER", "params": {}, "speech": ""})
+
+        assert sources == [SOURCE_TIMELINE, SOURCE_AMBIENT, None]
+
+    def test_registry_routes_controller_and_silent_actions(self, dispatcher):
+        """Controller actions run inline; silent actions skip the TTS."""
+        dispatcher.fake_ui.chat = MagicMock()
+        with patch.object(dispatcher.hardware_dispatcher, 'dispatch'):
+            dispatcher._do_dispatch({"action": "SET_MOOD", "params": {"mood": "ANGRY"}, "speech": ""})
+            dispatcher._do_dispatch({"action": "MOUSE_SHAKE", "params": {}, "speech": "shh"})
+            dispatcher._do_dispatch({"action": "OPEN_BROWSER", "params": {}, "speech": "loud"})
+        dispatcher.fake_ui.chat.set_mood.assert_called_once_with("ANGRY")
+        dispatcher.audio_out.play_tts.assert_called_once_with("loud")
+        assert dispatcher._get_action_priority("GDI_FLASH") == dispatcher.PRIORITY_HIGH
+        assert dispatcher._get_action_priority("OPEN_BROWSER") == dispatcher.PRIORITY_LOW
+
+    def test_stats_snapshot(self, dispatcher):
+        """stats(): per-action runs/failures, lane depth per priority, worker utilisation."""
+        def flaky(action, params, speech):
+            if action == "FAKE_FILE_DELETE":
+                raise RuntimeError("boom")
+
+        with patch.object(dispatcher.system_dispatcher, 'dispatch', side_effect=flaky):
+            dispatcher._do_dispatch({"action": "FAKE_FILE_DELETE", "params": {}, "speech": ""})
+            dispatcher._do_dispatch({"action": "OPEN_BROWSER", "params": {}, "speech": ""})
+            assert dispatcher._action_queue.join(timeout=2.0)
+            time.sleep(0.05)  # record_run happens before task_done, give the worker a beat
+
+        stats = dispatcher.stats()
+        assert stats["actions"]["FAKE_FILE_DELETE"]["failures"] == 1
+        assert stats["actions"]["OPEN_BROWSER"]["runs"] == 1
+        assert stats["actions"]["OPEN_BROWSER"]["queued"] == 1
+        assert stats["failures"] == 1
+        assert stats["queue"]["depth_by_priority"] == {"control": 0, "high": 0, "medium": 0, "low": 0}
+        assert stats["workers"]["count"] == 1
+        assert 0.0 <= stats["workers"]["busy_ratio"] <= 1.0
+        assert [r["action"] for r in stats["recent"]] == ["FAKE_FILE_DELETE", "OPEN_BROWSER"]
+
+    def _run_effect(self, effect, timeout=2.0):
+        from PyQt6.QtWidgets import QApplication
+        deadline = time.time() + timeout
+        while not effect.done and time.time() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.002)
+        assert effect.done
+
+    def test_dispatch_sequence_keeps_relative_timing(self, dispatcher):
+        """Steps run in offset order, timed from the sequence start; invalid steps are skipped."""
+        from core.function_dispatcher import SOURCE_TIMELINE
+        routed = []
+        dispatcher._route = lambda cmd: routed.append((time.perf_counter(), cmd))
+        start = time.perf_counter()
+        effect = dispatcher.dispatch_sequence([
+            (120, {"action": "GDI_FLASH"}),
+            (0, {"action": "MOUSE_SHAKE"}),
+            (60, {"action": "NOT_AN_ACTION"}),
+            (60, {"action": "GLITCH_SCREEN"}),
+        ], source=SOURCE_TIMELINE)
+        self._run_effect(effect)
+
+        assert [cmd["action"] for _, cmd in routed] == ["MOUSE_SHAKE", "GLITCH_SCREEN", "GDI_FLASH"]
+        assert all(cmd["source"] == SOURCE_TIMELINE for _, cmd in routed)
+        offsets = [(t - start) * 1000 for t, _ in routed]
+        assert offsets[1] >= 55 and offsets[2] >= 115
+        assert offsets[2] - offsets[1] < 110  # No drift from per-step timers
+
+    def test_dispatch_batch_routes_in_one_step(self, dispatcher):
+        with patch.object(dispatcher.system_dispatcher, 'dispatch'):
+            effect = dispatcher.dispatch_batch([
+                {"action": "OPEN_BROWSER"},
+                {"action": "FAKE_FILE_DELETE"},
+            ])
+            self._run_effect(effect)
+            assert dispatcher._action_queue.join(timeout=2.0)
+            assert dispatcher.system_dispatcher.dispatch.call_count == 2
+
+    def test_dispatch_sequence_cancel_and_cross_thread(self, dispatcher):
+        routed = []
+        dispatcher._route = lambda cmd: routed.append(cmd["action"])
+        handle = []
+        # Off the main thread: the sequence crosses over in one signal
+        caller = threading.Thread(target=lambda: handle.append(dispatcher.dispatch_sequence(
+            [(0, {"action": "MOUSE_SHAKE"}), (300, {"action": "GDI_FLASH"})])))
+        caller.start()
+        caller.join()
+        effect = handle[0]
+        deadline = time.time() + 1.0
+        while not routed and time.time() < deadline:
+            from PyQt6.QtWidgets import QApplication
+            QApplication.processEvents()
+            time.sleep(0.002)
+        effect.cancel()
+        self._run_effect(effect)
+        assert routed == ["MOUSE_SHAKE"]
+
+    def test_running_effect_keeps_resource_lane(self, dispatcher):
+        """A handler's Effect holds its lane until it ends: back-to-back shakes queue and merge."""
+        from core.effect_runtime import get_effect_runtime
+        release = threading.Event()
+        started = []
+
+        def shake(params, speech=""):
+            started.append(params["duration"])
+
+            def steps():
+                while not release.is_set():
+                    yield 0.01
+            return get_effect_runtime().spawn(steps(), "MOUSE_SHAKE")
+        dispatcher._action_map["MOUSE_SHAKE"] = dispatcher._action_map["MOUSE_SHAKE"]._replace(handler=shake)
+
+        def wait_for(condition):
+            deadline = time.time() + 2.0
+            while not condition() and time.time() < deadline:
+                time.sleep(0.005)
+
+        dispatcher._do_dispatch({"action": "MOUSE_SHAKE", "params": {"duration": 1.0}, "speech": ""})
+        wait_for(lambda: started)
+        # The worker is already free again, the shake is not
+        dispatcher._do_dispatch({"action": "MOUSE_SHAKE", "params": {"duration": 1.0}, "speech": ""})
+        dispatcher._do_dispatch({"action": "MOUSE_SHAKE", "params": {"duration": 2.0}, "speech": ""})
+        time.sleep(0.05)
+
+        assert started == [1.0]
+        cursor = dispatcher._action_queue.resource_state()["cursor"]
+        assert cursor["running"] and cursor["waiting"] == 1
+        assert dispatcher._action_queue.stats()["merged"] == 1
+
+        release.set()
+        wait_for(lambda: len(started) == 2)
+        assert started == [1.0, 3.0]
+        assert dispatcher._action_queue.join(timeout=2.0)
+
+    def test_effect_duration_recorded_when_effect_ends(self, dispatcher):
+        from core.effect_runtime import get_effect_runtime
+
+        def flash(params, speech=""):
+            def steps():
+                yield 0.1
+            return get_effect_runtime().spawn(steps(), "GDI_FLASH")
+        dispatcher._action_map["GDI_FLASH"] = dispatcher._action_map["GDI_FLASH"]._replace(handler=flash)
+
+        dispatcher._do_dispatch({"action": "GDI_FLASH", "params": {}, "speech": ""})
+        assert dispatcher._action_queue.join(timeout=2.0)  # Lane released by the Effect's end
+        stats = dispatcher.metrics.snapshot()["actions"]["GDI_FLASH"]
+        assert stats["runs"] == 1 and stats["effects"] == 1
+        assert stats["max_run_ms"] < 50  # The handler only spawned the Effect
+        assert stats["max_effect_ms"] >= 95
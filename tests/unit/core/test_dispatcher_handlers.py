@@ -0,0 +1,83 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import pytest
+from unittest.mock import MagicMock
+from core.action_registry import build_action_registry, collect_action_specs
+from core.dispatchers.base_dispatcher import bind
+from core.dispatchers.hardware_dispatcher import HardwareDispatcher
+from core.dispatchers.horror_dispatcher import HorrorDispatcher
+from core.dispatchers.system_dispatcher import SystemDispatcher
+from core.dispatchers.visual_dispatcher import VisualDispatcher
+
+DEPENDENCIES = {
+    VisualDispatcher: ["overlay", "gdi"],
+    HardwareDispatcher: ["mouse", "keyboard", "audio", "camera", "brightness", "process_guard"],
+    HorrorDispatcher: ["mask", "fake_ui", "screen_tear", "pixel_melt", "melter",
+                       "get_horror", "icons", "window", "overlay", "system"],
+    SystemDispatcher: ["wallpaper", "clipboard", "notifications", "notepad", "window",
+                       "icons", "browser", "fake_ui"],
+}
+
+
+def make(cls):
+    """Dispatcher whose dependencies are mocks (no hardware, no Qt)."""
+    dispatcher = cls.__new__(cls)
+    for name in DEPENDENCIES[cls]:
+        setattr(dispatcher, name, MagicMock(name=name))
+    if cls is HorrorDispatcher:
+        dispatcher._horror = None
+    return dispatcher
+
+
+class TestHandlerTables:
+
+    @pytest.mark.parametrize("cls", list(DEPENDENCIES))
+    def test_every_declared_action_has_a_handler(self, cls):
+        assert set(make(cls).get_handlers()) == set(cls.ACTIONS)
+
+    def test_table_is_built_once(self):
+        dispatcher = make(VisualDispatcher)
+        assert dispatcher.get_handlers() is dispatcher.get_handlers()
+
+    def test_defaults_resolved_per_param(self):
+        visual = make(VisualDispatcher)
+        visual.dispatch("FLASH_COLOR", {"color": "#00FF00"})
+        visual.overlay.flash_color.assert_called_once_with("#00FF00", 0.4, 300)
+        visual.dispatch("GDI_STATIC", {})
+        visual.gdi.draw_static_noise.assert_called_once_with(duration_ms=500, density=0.01)
+
+    def test_fixed_args(self):
+        hardware = make(HardwareDispatcher)
+        hardware.dispatch("AUDIO_GLITCH", {"sound_name": "ignored"})
+        hardware.audio.play_sfx.assert_called_once_with("static_noise")
+
+    def test_horror_effects_resolved_once(self):
+        horror = make(HorrorDispatcher)
+        horror.dispatch("WHISPER", {})
+        horror.dispatch("APP_THREAT", {"app": "chrome"})
+        horror.get_horror.assert_called_once_with(horror)
+        effects = horror.get_horror.return_value
+        effects.mechanical_whispers.assert_called_once_with()
+        effects.app_specific_threat.assert_called_once_with({"app": "chrome"})
+
+    def test_shared_handler_for_aliases(self):
+        system = make(SystemDispatcher)
+        handlers = system.get_handlers()
+        assert handlers["CLIPBOARD_POISON"] is handlers["CLIPBOARD_INJECT"]
+        system.dispatch("CLIPBOARD_INJECT", {})
+        system.clipboard.poison_clipboard.assert_called_once_with("SEN BENİMSİN")
+
+    def test_registry_uses_bound_handlers(self):
+        visual = make(VisualDispatcher)
+        registry = build_action_registry([visual], collect_action_specs([visual]))
+        assert registry["GDI_FLASH"].handler is visual.get_handlers()["GDI_FLASH"]
+
+    def test_bind_without_params(self):
+        target = MagicMock()
+        bind(target, 1, 2)({"x": 1})
+        target.assert_called_once_with(1, 2)
@@ -0,0 +1,129 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import threading
+import time
+import pytest
+from core.effect_runtime import EffectRuntime
+
+
+class TestEffectRuntime:
+
+    @pytest.fixture
+    def runtime(self):
+        rt = EffectRuntime()
+        yield rt
+        rt.stop()
+
+    def test_steps_run_in_order_with_delays(self, runtime):
+        log = []
+
+        def steps():
+            log.append(("a", time.perf_counter()))
+            yield 0.05
+            log.append(("b", time.perf_counter()))
+
+        effect = runtime.spawn(steps(), "two_steps")
+        assert effect.wait(1.0)
+        assert [name for name, _ in log] == ["a", "b"]
+        assert log[1][1] - log[0][1] >= 0.045
+
+    def test_overlapping_effects_share_one_thread(self, runtime):
+        threads = set()
+        ticks = [0]
+
+        def steps():
+            for _ in range(10):
+                threads.add(threading.current_thread().name)
+                ticks[0] += 1
+                yield 0.01
+
+        before = threading.active_count()
+        effects = [runtime.spawn(steps(), f"fx{i}") for i in range(30)]
+        time.sleep(0.02)
+        assert threading.active_count() <= before + 1
+        for effect in effects:
+            assert effect.wait(2.0)
+        assert threads == {"EffectRuntime"}
+        assert ticks[0] == 300
+        assert runtime.active() == 0
+
+    def test_cancel_runs_cleanup(self, runtime):
+        cleaned = threading.Event()
+
+        def steps():
+            try:
+                while True:
+                    yield 0.01
+            finally:
+                cleaned.set()
+
+        effect = runtime.spawn(steps(), "endless")
+        time.sleep(0.05)
+        effect.cancel()
+        assert effect.wait(1.0)
+        assert cleaned.is_set()
+
+    def test_stop_cleans_up_pending_effects(self, runtime):
+        cleaned = []
+
+        def steps(i):
+            try:
+                yield 10.0
+            finally:
+                cleaned.append(i)
+
+        effects = [runtime.spawn(steps(i), f"long{i}") for i in range(3)]
+        time.sleep(0.05)
+        runtime.stop()
+        assert sorted(cleaned) == [0, 1, 2]
+        assert all(e.done for e in effects)
+
+    def test_done_callbacks(self, runtime):
+        finished = []
+
+        def steps():
+            while True:
+                yield 0.01
+
+        effect = runtime.spawn(steps(), "endless")
+        effect.add_done_callback(lambda e: finished.append(("first", e)))
+        effect.add_done_callback(lambda e: 1 / 0)  # A failing callback does not stop the others
+        effect.add_done_callback(lambda e: finished.append(("second", e)))
+        time.sleep(0.03)
+        assert finished == []
+        effect.cancel()
+        assert effect.wait(1.0)
+        assert finished == [("first", effect), ("second", effect)]
+        effect.add_done_callback(lambda e: finished.append(("late", e)))
+        assert finished[-1] == ("late", effect)  # Already done: called right away
+
+    def test_failing_step_is_contained(self, runtime):
+        def broken():
+            yield 0
+            raise RuntimeError("boom")
+
+        ok = runtime.call_later(0.01, lambda: None)
+        bad = runtime.spawn(broken(), "broken")
+        assert bad.wait(1.0)
+        assert ok.wait(1.0)
+
+    def test_qt_driver_runs_on_main_thread(self, runtime, qapp):
+        seen = []
+
+        def steps():
+            seen.append(threading.current_thread() is threading.main_thread())
+            yield 0.01
+            seen.append(threading.current_thread() is threading.main_thread())
+
+        effect = runtime.spawn(steps(), "ui", qt=True)
+        deadline = time.time() + 2.0
+        while not effect.done and time.time() < deadline:
+            qapp.processEvents()
+            time.sleep(0.005)
+        assert effect.done
+        assert seen == [True, True]
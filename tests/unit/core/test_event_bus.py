@@ -0,0 +1,228 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import threading
+import pytest
+from core.event_bus import EventBus, WORKER, QT, DROP_NEWEST, PRIORITY_HIGH
+
+
+class TestEventBusAsync:
+
+    @pytest.fixture
+    def bus(self):
+        bus = EventBus()
+        yield bus
+        bus.flush()
+
+    def test_sync_is_default(self, bus):
+        seen = []
+        bus.subscribe("test.async.sync", lambda d: seen.append(threading.current_thread()))
+        bus.publish("test.async.sync", {})
+        assert seen == [threading.current_thread()]
+
+    def test_worker_delivery_off_thread(self, bus):
+        seen = []
+        bus.subscribe("test.async.worker", lambda d: seen.append((d["n"], threading.current_thread())), delivery=WORKER)
+        for n in range(3):
+            bus.publish("test.async.worker", {"n": n})
+        assert bus.flush()
+        assert [n for n, _ in seen] == [0, 1, 2]
+        assert all(t.name == "EventBusWorker" for _, t in seen)
+
+    def test_bounded_queue_drop_policy(self, bus):
+        gate = threading.Event()
+        seen = []
+        bus.subscribe("test.async.block", lambda d: gate.wait(2), delivery=WORKER)
+        bus.subscribe("test.async.bounded", lambda d: seen.append(d["n"]), delivery=WORKER)
+        bus.configure_topic("test.async.bounded", maxsize=2, drop=DROP_NEWEST)
+
+        bus.publish("test.async.block", {})  # Hold the worker
+        for n in range(5):
+            bus.publish("test.async.bounded", {"n": n})
+        gate.set()
+        assert bus.flush()
+        assert seen == [0, 1]
+
+    def test_priority_lane_first(self, bus):
+        gate = threading.Event()
+        order = []
+        bus.subscribe("test.async.gate", lambda d: gate.wait(2), delivery=WORKER)
+        bus.subscribe("test.async.normal", lambda d: order.append("normal"), delivery=WORKER)
+        bus.subscribe("test.async.urgent", lambda d: order.append("urgent"), delivery=WORKER)
+        bus.configure_topic("test.async.urgent", priority=PRIORITY_HIGH)
+
+        bus.publish("test.async.gate", {})
+        bus.publish("test.async.normal", {})
+        bus.publish("test.async.urgent", {})
+        gate.set()
+        assert bus.flush()
+        assert order == ["urgent", "normal"]
+
+    def test_qt_delivery_on_main_thread(self, bus, qapp):
+        seen = []
+        bus.subscribe("test.async.qt", lambda d: seen.append(threading.current_thread()), delivery=QT)
+        worker = threading.Thread(target=bus.publish, args=("test.async.qt", {}))
+        worker.start()
+        worker.join()
+        qapp.processEvents()
+        assert seen == [threading.main_thread()]
+
+
+class TestEventBusTopics:
+
+    def test_wildcard_patterns(self):
+        bus = EventBus()
+        seen = []
+        one = bus.subscribe("test.trie.*", lambda d: seen.append(("one", d["n"])))
+        deep = bus.subscribe("test.**", lambda d: seen.append(("deep", d["n"])))
+
+        bus.publish("test.trie.focus", {"n": 1})
+        bus.publish("test.trie.focus.deeper", {"n": 2})
+        bus.publish("other.trie.focus", {"n": 3})
+        assert seen == [("one", 1), ("deep", 1), ("deep", 2)]
+        one.unsubscribe()
+        deep.unsubscribe()
+
+    def test_unsubscribe_by_handle_and_topic(self):
+        bus = EventBus()
+        seen = []
+        handle = bus.subscribe("test.trie.handle", seen.append)
+        assert bus.subscribe("test.trie.handle", seen.append) is handle  # No duplicates
+
+        bus.publish("test.trie.handle", {"n": 1})
+        assert bus.unsubscribe(handle) == 1
+        bus.publish("test.trie.handle", {"n": 2})
+        assert seen == [{"n": 1}]
+
+        bus.subscribe("test.trie.topic", seen.append)
+        bus.subscribe("test.trie.topic", lambda d: None)
+        assert bus.unsubscribe("test.trie.topic") == 2
+
+    def test_weak_subscriber_collected(self):
+        import gc
+        bus = EventBus()
+        seen = []
+
+        class Listener:
+            def on_event(self, data):
+                seen.append(data)
+
+        listener = Listener()
+        handle = bus.subscribe("test.trie.weak", listener.on_event, weak=True)
+        bus.publish("test.trie.weak", {"n": 1})
+        del listener
+        gc.collect()
+        bus.publish("test.trie.weak", {"n": 2})
+        assert seen == [{"n": 1}]
+        assert not handle.active
+
+    def test_weak_qobject_destroyed(self, qapp):
+        from PyQt6.QtCore import QObject
+        bus = EventBus()
+        seen = []
+
+        class QtListener(QObject):
+            def on_event(self, data):
+                seen.append(data)
+
+        listener = QtListener()
+        bus.subscribe("test.trie.qt", listener.on_event, weak=True)
+        listener.destroyed.emit()  # What deleteLater() fires before the wrapper goes
+        bus.publish("test.trie.qt", {"n": 1})
+        assert seen == []
+
+
+class TestEventBusMetrics:
+
+    def test_counters_and_slowest(self):
+        bus = EventBus()
+
+        def slow(data):
+            import time
+            time.sleep(0.002)
+
+        def broken(data):
+            raise ValueError("boom")
+
+        h1 = bus.subscribe("test.metrics.topic", slow)
+        h2 = bus.subscribe("test.metrics.topic", broken)
+        for _ in range(3):
+            bus.publish("test.metrics.topic", {})
+
+        stats = bus.stats()["topics"]["test.metrics.topic"]
+        assert stats["published"] >= 3
+        assert stats["delivered"] >= 6
+        assert stats["errors"] >= 3
+        assert sum(stats["histogram_ms"].values()) == stats["delivered"]
+        assert any(entry["callback"].endswith("slow") for entry in bus.metrics.slowest(50))
+        h1.unsubscribe()
+        h2.unsubscribe()
+
+    def test_record_and_replay(self, tmp_path):
+        from core.event_metrics import replay_trace
+        bus = EventBus()
+        trace = tmp_path / "session.jsonl"
+
+        bus.start_recording(str(trace))
+        bus.publish("test.replay.activity", {"pos": (10, 20)})
+        bus.publish("test.replay.anger", {"level": 3})
+        assert bus.stop_recording() == 2
+
+        seen = []
+        handle = bus.subscribe("test.replay.*", seen.append)
+        assert replay_trace(str(trace), bus=bus, speed=0) == 2
+        assert seen == [{"pos": [10, 20]}, {"level": 3}]
+        assert replay_trace(str(trace), bus=bus, topics=["test.replay.anger"]) == 1
+        handle.unsubscribe()
+
+
+class TestEventBusRatePolicies:
+
+    @pytest.fixture
+    def bus(self):
+        bus = EventBus()
+        yield bus
+        for topic in ("test.rate.throttle", "test.rate.debounce", "test.rate.coalesce"):
+            bus.set_rate_policy(topic, None)
+
+    def test_throttle_keeps_latest(self, bus):
+        from core.event_rate import THROTTLE
+        seen = []
+        bus.subscribe("test.rate.throttle", lambda d: seen.append(d["n"]))
+        bus.set_rate_policy("test.rate.throttle", THROTTLE, interval=10.0, max_events=2)
+        for n in range(10):
+            bus.publish("test.rate.throttle", {"n": n})
+        assert seen == [0, 1]  # Leading edge only so far
+        bus.flush()
+        assert seen == [0, 1, 9]  # Trailing edge delivers the latest payload
+        assert bus.stats()["topics"]["test.rate.throttle"]["suppressed"] == 8
+
+    def test_debounce_waits_for_quiet(self, bus):
+        import time
+        from core.event_rate import DEBOUNCE
+        seen = []
+        bus.subscribe("test.rate.debounce", lambda d: seen.append(d["n"]))
+        bus.set_rate_policy("test.rate.debounce", DEBOUNCE, interval=0.05)
+        for n in range(5):
+            bus.publish("test.rate.debounce", {"n": n})
+            time.sleep(0.01)
+        assert seen == []
+        time.sleep(0.2)
+        assert seen == [4]
+
+    def test_coalesce_one_per_window(self, bus):
+        import time
+        from core.event_rate import COALESCE
+        seen = []
+        bus.subscribe("test.rate.coalesce", lambda d: seen.append(d["n"]))
+        bus.set_rate_policy("test.rate.coalesce", COALESCE, interval=0.05)
+        for n in range(3):
+            bus.publish("test.rate.coalesce", {"n": n})
+        time.sleep(0.2)
+        bus.publish("test.rate.coalesce", {"n": 3})
+        time.sleep(0.2)
+        assert seen == [2, 3]
@@ -156,6 +156,31 @@ class TestGeminiBrainResponseGeneration:
         assert response["action"] in ["NONE", "GLITCH_SCREEN", "OVERLAY_TEXT", "GDI_FLASH", "MOUSE_SHAKE"]
 
 
+class TestGeminiBrainContext:
+    """Test what the brain learns from the shared context"""
+
+    def test_hostname_recorded_when_context_existed_before_view(self, mock_gemini_api, mock_memory):
+        """Should record the hostname even if the first prompt consumed the primed changes"""
+        from core.context_observer import ContextObserver
+        full = {"user_name": "U", "active_window": "Notepad", "running_apps": [], "desktop_files": [],
+                "battery": None, "is_late_night": False,
+                "network": {"hostname": "DESKTOP-7F3K2", "local_ip": "10.0.0.2"}}
+        ContextObserver.invalidate_cache()
+        with patch.object(ContextObserver, 'get_full_context', side_effect=lambda: dict(full)), \
+             patch.object(ContextObserver, 'collect_volatile',
+                          side_effect=lambda: {k: v for k, v in full.items() if k != "network"}):
+            ContextObserver.publish_changes()  # Context exists before the brain's view
+            brain = GeminiBrain(api_key="test_key")
+            brain._build_dynamic_prompt("ilk")  # No memory yet: primed changes taken here
+            brain.set_memory(mock_memory)
+            brain._build_dynamic_prompt("ikinci")
+            brain._build_dynamic_prompt("üçüncü")
+        ContextObserver.invalidate_cache()
+
+        hostname_calls = [c for c in mock_memory.record_discovered_info.call_args_list if c.args[0] == "hostname"]
+        assert [c.args[1] for c in hostname_calls] == ["DESKTOP-7F3K2"]
+
+
 class TestGeminiBrainErrorHandling:
     """Test error handling"""
     
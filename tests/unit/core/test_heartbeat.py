@@ -54,3 +54,28 @@ class TestHeartbeat:
         
         mock_slot.assert_called_with("GLITCH_SCREEN")
         heartbeat.dispatcher.audio_out.play_tts.assert_called_with("I see you.")
+
+    def test_burst_emits_spaced_pulses(self, heartbeat):
+        emitted, timers = [], []
+        heartbeat.pulse_signal.connect(emitted.append)
+        heartbeat._after = lambda delay_ms, callback: timers.append((delay_ms, callback))
+        heartbeat._trigger_burst(3)
+        assert len(emitted) == 1  # First pulse right away
+        assert [delay for delay, _ in timers] == [500, 1000]
+        for _, callback in timers:
+            callback()
+        assert len(emitted) == 3
+        assert all(action in Heartbeat.AUTONOMOUS_ACTIONS for action in emitted)
+        # Same path as a single pulse (kernel: pulse_signal -> system.pulse), no direct dispatch
+        heartbeat.dispatcher.dispatch_sequence.assert_not_called()
+        heartbeat.dispatcher.dispatch.assert_not_called()
+
+    def test_stop_cancels_pending_burst(self, heartbeat):
+        emitted = []
+        heartbeat.pulse_signal.connect(emitted.append)
+        heartbeat._trigger_burst(3, spacing_ms=20)
+        timers = list(heartbeat._burst_timers)
+        heartbeat.stop()
+        assert all(timer.wait(1.0) for timer in timers)
+        time.sleep(0.06)
+        assert len(emitted) == 1
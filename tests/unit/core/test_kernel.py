@@ -71,3 +71,16 @@ class TestKernelLifecycle:
                 kernel.shutdown()
         except Exception as e:
             pytest.skip(f"SentientKernel shutdown not testable: {e}")
+
+    def test_shutdown_event_is_delivered_synchronously(self):
+        """The emergency stop runs on the publisher's thread, not through the GUI loop"""
+        from core.kernel import SentientKernel
+        from core.event_bus import SYNC
+
+        kernel = SentientKernel()
+        with patch('core.kernel.bus') as mock_bus:
+            kernel._setup_global_subscriptions()
+
+        shutdown_calls = [c for c in mock_bus.subscribe.call_args_list if c.args[0] == "system.shutdown"]
+        assert len(shutdown_calls) == 1
+        assert shutdown_calls[0].kwargs.get("delivery", SYNC) == SYNC
@@ -0,0 +1,140 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import threading
+import time
+from unittest.mock import MagicMock
+from core.lazy_backend import LazyBackend, deferred, lazy_import, prewarm, startup_report
+
+
+class _Backend:
+    built = 0
+
+    def __init__(self):
+        _Backend.built += 1
+        self.value = 42
+
+    def ping(self, x):
+        return x + 1
+
+
+class TestLazyBackend:
+
+    def setup_method(self):
+        _Backend.built = 0
+
+    def test_built_on_first_attribute(self):
+        backend = LazyBackend("test_first_use", _Backend)
+        assert not backend.is_ready and _Backend.built == 0
+        assert backend.value == 42
+        assert backend.ping(1) == 2
+        assert _Backend.built == 1
+        names = [entry["backend"] for entry in startup_report()["built"]]
+        assert "test_first_use" in names
+
+    def test_deferred_waits_for_first_call(self):
+        backend = LazyBackend("test_deferred", _Backend)
+        ping = deferred(backend, "ping")
+        assert _Backend.built == 0
+        assert "test_deferred" in startup_report()["pending"]
+        assert ping(2) == 3 and ping(3) == 4
+        assert _Backend.built == 1
+
+    def test_deferred_on_plain_object_is_the_method(self):
+        plain = MagicMock()
+        assert deferred(plain, "ping") is plain.ping
+
+    def test_concurrent_first_use_builds_once(self):
+        backend = LazyBackend("test_concurrent", _Backend)
+        threads = [threading.Thread(target=lambda: backend.value) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert _Backend.built == 1
+
+    def test_prewarm_builds_missing_backends(self, qapp):
+        ready = LazyBackend("test_ready", _Backend)
+        ready.instance()
+        missing = LazyBackend("test_missing", _Backend)
+        widget = LazyBackend("test_widget", _Backend, main_thread=True)
+        done = threading.Event()
+        prewarm([ready, missing, widget], on_done=done.set)
+        deadline = time.time() + 2.0
+        while not done.is_set() and time.time() < deadline:
+            qapp.processEvents()  # Widget backends are built from the Qt event loop
+            time.sleep(0.005)
+        assert done.is_set()
+        assert missing.is_ready and widget.is_ready
+        assert _Backend.built == 3
+        reasons = {e["backend"]: e["reason"] for e in startup_report()["built"]}
+        assert reasons["test_missing"] == "prewarm"
+
+    def test_widget_backend_used_from_worker_is_built_on_gui_thread(self, qapp):
+        built_on = []
+
+        def factory():
+            built_on.append(threading.current_thread())
+            return _Backend()
+        widget = LazyBackend("test_worker_widget", factory, main_thread=True)
+        result = {}
+        worker = threading.Thread(target=lambda: result.setdefault("value", widget.ping(1)),
+                                  name="ActionWorker-test")
+        worker.start()
+        deadline = time.time() + 2.0
+        while worker.is_alive() and time.time() < deadline:
+            qapp.processEvents()
+            time.sleep(0.005)
+        worker.join(1.0)
+        assert result["value"] == 2
+        assert built_on == [threading.main_thread()]
+        thread = {e["backend"]: e["thread"] for e in startup_report()["built"]}["test_worker_widget"]
+        assert thread == threading.main_thread().name
+
+    def test_widget_backend_error_reaches_worker(self, qapp):
+        def factory():
+            raise ValueError("no display")
+        widget = LazyBackend("test_broken_widget", factory, main_thread=True)
+        errors = []
+
+        def use():
+            try:
+                widget.instance()
+            except ValueError as e:
+                errors.append(e)
+        worker = threading.Thread(target=use)
+        worker.start()
+        deadline = time.time() + 2.0
+        while worker.is_alive() and time.time() < deadline:
+            qapp.processEvents()
+            time.sleep(0.005)
+        worker.join(1.0)
+        assert [str(e) for e in errors] == ["no display"]
+        assert not widget.is_ready
+
+    def test_lazy_import(self):
+        module = lazy_import("test_module", "json")
+        cls = lazy_import("test_class", "collections", "OrderedDict", construct=False)
+        assert not module.is_ready
+        assert module.dumps([1]) == "[1]"
+        assert cls.instance().__name__ == "OrderedDict"
+
+
+class TestDispatcherBackends:
+
+    def test_dispatcher_construction_builds_no_backend(self):
+        from unittest.mock import patch
+        from core.function_dispatcher import FunctionDispatcher
+        with patch.object(FunctionDispatcher, '_init_worker_pool'), \
+             patch('core.function_dispatcher.FakeUI'), \
+             patch('core.function_dispatcher.AudioOut'):
+            disp = FunctionDispatcher()
+        backends = disp.backends()
+        names = {b.backend_name for b in backends}
+        assert {"audio_out", "overlay", "mask", "camera", "notifications", "browser"} <= names
+        assert not any(b.is_ready for b in backends)
+        disp.stop_dispatching()
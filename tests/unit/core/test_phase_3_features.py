@@ -81,3 +81,43 @@ class TestPhase3Features:
         assert "Betul" not in masked
         assert "Documents" not in masked
         assert "/" in masked
+
+    def test_streamer_mode_mask_many(self):
+        sm = StreamerMode.singleton()
+        sm.enabled = True
+        names = ["Tatil", "vergi_2025", "Tatil"]
+        masked = sm.mask_many(names)
+
+        assert masked == [sm.get_alias(n) for n in names]
+        assert sm.mask_paths(["C:/Users/Betul/Tatil"]) == [sm.mask_path("C:/Users/Betul/Tatil")]
+
+    def test_streamer_mode_alias_persistence(self, tmp_path):
+        sm = StreamerMode.singleton()
+        sm.enabled = True
+        original_file = sm._alias_file
+        sm._alias_file = str(tmp_path / "aliases.json")
+        try:
+            sm.prewarm(["Gizli_Proje"])
+            alias = sm.get_alias("Gizli_Proje")
+            assert os.path.exists(sm._alias_file)
+
+            # A new session reuses the stored alias instead of recomputing
+            sm._alias_map.clear()
+            sm.load_aliases()
+            assert sm._alias_map["Gizli_Proje"] == alias
+        finally:
+            sm._alias_file = original_file
+
+    def test_streamer_mode_disabled_persists_nothing(self, tmp_path):
+        sm = StreamerMode.singleton()
+        sm.enabled = False
+        original_file = sm._alias_file
+        sm._alias_file = str(tmp_path / "aliases.json")
+        try:
+            sm.prewarm(["Kapali_Mod_Dosyasi"])
+            assert "Kapali_Mod_Dosyasi" not in sm._alias_map
+            sm._compute_alias("Vergi_2025")
+            sm.save_aliases()
+            assert not os.path.exists(sm._alias_file)  # Real names never hit the disk
+        finally:
+            sm._alias_file = original_file
@@ -0,0 +1,69 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import pytest
+from unittest.mock import patch, MagicMock
+from core.process_tracker import ProcessTracker
+from core.context_observer import ContextObserver
+
+
+class TestProcessTracker:
+
+    @pytest.fixture
+    def tracker(self):
+        ProcessTracker.reset()
+        names = {1: "systemd", 10: "chrome.exe", 11: "chrome.exe", 20: "bash"}
+        pids = MagicMock(return_value=list(names))
+
+        def fake_process(pid):
+            proc = MagicMock()
+            proc.name.return_value = names[pid]
+            return proc
+
+        with patch('core.process_tracker.psutil.pids', pids), \
+             patch('core.process_tracker.psutil.Process', side_effect=fake_process) as mock_proc:
+            yield ProcessTracker.singleton(), names, pids, mock_proc
+        ProcessTracker.reset()
+
+    def test_matching(self):
+        assert ProcessTracker.is_interesting("Discord.exe")
+        assert ProcessTracker.is_interesting("code")
+        assert not ProcessTracker.is_interesting("svchost.exe")
+
+    def test_interesting_apps_deduplicated(self, tracker):
+        t, _, _, _ = tracker
+        assert t.get_interesting_apps() == ["chrome.exe"]
+        assert ContextObserver.get_running_processes() == ["chrome.exe"]
+
+    def test_names_resolved_once_per_pid(self, tracker):
+        t, _, _, mock_proc = tracker
+        t.poll()
+        t.poll()
+        t.poll()
+        assert mock_proc.call_count == 4  # One per PID, not per poll
+
+    def test_publishes_transitions(self, tracker):
+        t, names, pids, _ = tracker
+        t.poll()  # Prime (no events for the initial snapshot)
+
+        with patch('core.process_tracker.bus.publish') as mock_publish:
+            names[30] = "spotify.exe"
+            del names[10], names[11]
+            pids.return_value = list(names)
+            t.poll()
+
+        events = [(c.args[0], c.args[1]["name"]) for c in mock_publish.call_args_list]
+        assert ("process.started", "spotify.exe") in events
+        assert events.count(("process.exited", "chrome.exe")) == 2
+        assert t.get_interesting_apps() == ["spotify.exe"]
+
+    def test_get_name_uses_cache(self, tracker):
+        t, _, _, mock_proc = tracker
+        assert t.get_name(20) == "bash"
+        calls = mock_proc.call_count
+        assert t.get_name(20) == "bash"
+        assert mock_proc.call_count == calls
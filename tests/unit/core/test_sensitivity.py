@@ -0,0 +1,51 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import pytest
+from core.sensitivity import SensitivityEngine, get_sensitivity_engine
+
+
+def _legacy_score(filename):
+    fn = filename.lower()
+    if any(w in fn for w in SensitivityEngine.CRITICAL_WORDS): return 90
+    if any(w in fn for w in SensitivityEngine.IMPORTANT_WORDS): return 60
+    if any(w in fn for w in SensitivityEngine.PERSONAL_WORDS): return 30
+    return 0
+
+
+class TestSensitivityEngine:
+
+    @pytest.fixture
+    def engine(self):
+        return SensitivityEngine()
+
+    def test_categories(self, engine):
+        assert engine.classify("Passwords.txt").category == "critical"
+        assert engine.classify("family_photo").score == 60
+        assert engine.classify("notlar").category == "personal"
+        assert engine.classify("random.bin").score == 0
+
+    def test_overlapping_keywords(self, engine):
+        # 'password' must still count as 'pass' for the blacklist
+        assert engine.is_blacklisted("password")
+        # 'not' inside 'keynote' is found even though 'key' starts earlier
+        result = engine.classify("keynote")
+        assert result.score == 90 and result.blacklisted
+
+    def test_matches_legacy_scans(self, engine):
+        names = ["ŞİFRELER", "vergi_2025", "cv_final", "tatil", "homework3", "MyPrivateDiary",
+                 "crypto-wallet", "plan", "banka", "oyunlar", "Günlük", "x"]
+        for name in names:
+            assert engine.score(name) == _legacy_score(name), name
+
+    def test_batch_and_memo(self, engine):
+        results = engine.classify_many(["a", "secret", "a"])
+        assert [r.score for r in results] == [0, 90, 0]
+        assert results[0] is results[2]
+
+    def test_global_instance(self):
+        assert get_sensitivity_engine() is get_sensitivity_engine()
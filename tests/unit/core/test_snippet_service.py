@@ -0,0 +1,56 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import os
+import pytest
+from core.desktop_index import DesktopIndex
+from core.snippet_service import SnippetService
+from core.context_observer import ContextObserver
+
+
+class TestSnippetService:
+
+    @pytest.fixture
+    def desktop(self, tmp_path, monkeypatch):
+        desktop = tmp_path / "Desktop"
+        desktop.mkdir()
+        (desktop / "passwords.txt").write_text("hunter2 hunter2 hunter2")
+        (desktop / "tatil.txt").write_text("\n\nAntalya otel rezervasyonu yapildi\n")
+        (desktop / "empty.txt").write_text("")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        DesktopIndex.reset()
+        SnippetService.reset()
+        yield desktop
+        SnippetService.reset()
+        DesktopIndex.reset()
+
+    def test_snippet_skips_blacklisted_and_empty(self, desktop):
+        result = ContextObserver.get_file_snippet()
+        assert result == {"filename": "tatil.txt", "snippet": "Antalya otel rezervasyonu yapildi"}
+
+    def test_one_read_per_file_version(self, desktop):
+        service = SnippetService.singleton()
+        for _ in range(5):
+            service.get_snippet(('.txt',))
+        assert service.disk_reads == 1
+
+        # New version (size + mtime change) is re-extracted after the index refresh
+        target = desktop / "tatil.txt"
+        target.write_text("Yeni plan: kamp yapmak istiyorum\n")
+        os.utime(target, (1, 1))
+        DesktopIndex.singleton().refresh()
+        assert service.get_snippet(('.txt',))["snippet"] == "Yeni plan: kamp yapmak istiyorum"
+        assert service.disk_reads == 2
+
+    def test_hard_byte_cap(self, desktop):
+        (desktop / "tatil.txt").write_text("x" * 3 + "\n" + "uzun satir " * 500)
+        DesktopIndex.singleton().refresh()
+        service = SnippetService.singleton()
+        service.MAX_FILE_SIZE = 100000
+        snippet = service.get_snippet(('.txt',))["snippet"]
+        assert len(snippet) <= SnippetService.SNIPPET_LEN
@@ -0,0 +1,84 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from core.function_dispatcher import FunctionDispatcher, WorkerPoolPolicy
+
+
+class TestElasticWorkerPool:
+
+    POLICY = WorkerPoolPolicy(min_workers=2, max_workers=4, grow_wait_s=0.05, idle_shrink_s=0.2)
+
+    @pytest.fixture
+    def dispatcher(self):
+        with patch.object(WorkerPoolPolicy, 'from_config', return_value=self.POLICY), \
+             patch('core.function_dispatcher.FakeUI'), \
+             patch('core.function_dispatcher.AudioOut'):
+            disp = FunctionDispatcher()
+        release = threading.Event()
+        disp._execute_action = lambda action, params, speech: release.wait(5)
+        yield disp, release
+        release.set()
+        disp.stop_dispatching()
+
+    def _stall(self, disp, count):
+        """Queue `count` blocking tasks, waiting past the grow threshold between them."""
+        for _ in range(count):
+            disp._do_dispatch({"action": "FAKE_FILE_DELETE", "params": {}, "speech": ""})
+            time.sleep(0.08)
+
+    def test_grows_to_max_when_queue_waits(self, dispatcher):
+        disp, release = dispatcher
+        assert len(disp._workers) == 2
+        self._stall(disp, 8)
+        stats = disp.stats()["pool"]
+        assert len(disp._workers) == 4  # Capped at max_workers
+        assert stats["grown"] == 2 and stats["size"] == 4
+
+    def test_growth_respects_cpu_budget(self, dispatcher):
+        disp, release = dispatcher
+        disp.resource_guard = MagicMock()
+        disp.resource_guard.has_cpu_headroom.return_value = False
+        self._stall(disp, 5)
+        assert len(disp._workers) == 2
+        assert disp.stats()["pool"]["capped_by_cpu"] > 0
+        disp.resource_guard.has_cpu_headroom.assert_called_with(self.POLICY.cpu_budget)
+
+    def test_idle_workers_retire_to_min(self, dispatcher):
+        disp, release = dispatcher
+        self._stall(disp, 8)
+        assert len(disp._workers) == 4
+        release.set()
+        assert disp._action_queue.join(timeout=2.0)
+        deadline = time.time() + 2.0
+        while len(disp._workers) > 2 and time.time() < deadline:
+            time.sleep(0.05)
+        assert len(disp._workers) == 2
+        assert disp.stats()["pool"]["retired"] == 2
+
+    def test_no_growth_while_a_worker_is_free(self, dispatcher):
+        disp, release = dispatcher
+        release.set()  # Tasks finish instantly
+        self._stall(disp, 5)
+        assert len(disp._workers) == 2
+
+
+class TestWorkerPoolPolicy:
+
+    def test_auto_max_matches_default(self):
+        from config import Config
+        Config().set("DISPATCH_WORKERS_MAX", 0, validate=False)
+        assert WorkerPoolPolicy.from_config().max_workers == WorkerPoolPolicy().max_workers
+
+    def test_configured_max(self):
+        from config import Config
+        Config().set("DISPATCH_WORKERS_MAX", 3, validate=False)
+        Config().set("DISPATCH_WORKERS_MIN", 2, validate=False)
+        assert WorkerPoolPolicy.from_config().max_workers == 3
@@ -0,0 +1,123 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import pytest
+from unittest.mock import MagicMock
+
+from core.exceptions import ValidationError
+from core.localization_manager import tr
+from story import act_timeline
+from story.act_timeline import (
+    ActEvent, clear_timeline_cache, compile_timeline, load_act_timeline, preload_act_timeline,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_timeline_cache()
+    yield
+    clear_timeline_cache()
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _strings(v)
+
+
+class TestShippedTimelines:
+
+    @pytest.mark.parametrize("name", ["act1", "act2", "act3"])
+    def test_compiles_sorted_and_localized(self, name):
+        timeline = load_act_timeline(name)
+        assert timeline.events
+        times = [event.at_ms for event in timeline.events]
+        assert times == sorted(times)
+        assert times[-1] < timeline.duration_ms
+        for event in timeline.events:
+            assert isinstance(event.params, dict)
+            for text in list(_strings(event.params)) + [event.speech]:
+                assert not text.startswith("tr:")
+
+    def test_notifications_are_parsed_params(self):
+        notifications = [e for e in load_act_timeline("act1").events if e.action == "FAKE_NOTIFICATION"]
+        assert notifications
+        first = notifications[0]
+        assert first.params == {"title": tr("notifications.title_info"),
+                                "message": tr("system.background_update")}
+        assert first.speech == ""
+
+    def test_compiled_once(self):
+        assert load_act_timeline("act2") is load_act_timeline("act2")
+
+
+class TestCompile:
+
+    def test_sorts_and_keeps_file_order_for_ties(self):
+        timeline = compile_timeline({"events": [
+            {"at": 500, "action": "GDI_FLASH"},
+            {"at": 100, "action": "FAKE_BSOD"},
+            {"at": 100, "action": "CAPSLOCK_TOGGLE"},
+        ]}, "t")
+        assert [e.action for e in timeline.events] == ["FAKE_BSOD", "CAPSLOCK_TOGGLE", "GDI_FLASH"]
+        assert timeline.duration_ms == 500
+
+    def test_unknown_action_rejected(self):
+        with pytest.raises(ValidationError, match="event #0"):
+            compile_timeline({"events": [{"at": 0, "action": "NOT_AN_ACTION"}]})
+
+    def test_missing_required_param_rejected(self):
+        with pytest.raises(ValidationError, match="text"):
+            compile_timeline({"events": [{"at": 0, "action": "OVERLAY_TEXT", "params": {}}]})
+
+    def test_bad_time_rejected(self):
+        with pytest.raises(ValidationError):
+            compile_timeline({"events": [{"at": -5, "action": "GDI_FLASH"}]})
+
+    def test_act_local_action_allowed(self):
+        timeline = compile_timeline({"events": [{"at": 0, "action": "ENABLE_CHAT", "speech": "hi"}]})
+        assert timeline.events == (ActEvent(0, "ENABLE_CHAT", {}, "hi"),)
+
+
+class TestPreload:
+
+    def test_preload_fills_cache_in_background(self, monkeypatch):
+        compiled = []
+        real = act_timeline.compile_timeline
+        monkeypatch.setattr(act_timeline, "compile_timeline",
+                            lambda *a, **kw: compiled.append(a[1]) or real(*a, **kw))
+
+        thread = preload_act_timeline("act3")
+        assert thread is not None
+        thread.join(5.0)
+        assert compiled == ["act3"]
+
+        load_act_timeline("act3")
+        assert compiled == ["act3"]  # Served from the cache
+        assert preload_act_timeline("act3") is None
+
+    def test_preload_without_file_is_noop(self):
+        assert preload_act_timeline("act4") is None
+
+
+@pytest.mark.usefixtures("runtime_sandbox")
+class TestActFiring:
+
+    def test_notification_dispatched_with_copied_params(self):
+        from story.act_1_infection import Act1Infection
+        dispatcher = MagicMock()
+        act = Act1Infection(dispatcher, MagicMock())
+        event = next(e for e in load_act_timeline("act1").events if e.action == "FAKE_NOTIFICATION")
+
+        act.trigger_event(event.action, event.params, event.speech)
+
+        command = dispatcher.dispatch.call_args[0][0]
+        assert command["params"] == event.params
+        assert command["params"] is not event.params
+        assert command["speech"] == ""
@@ -0,0 +1,115 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import pytest
+
+from story.simulator import SimBrain, VirtualClock, virtual_qtimer
+from story.timeline import TimelineScheduler
+
+
+@pytest.fixture(scope="session")
+def app():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock()
+
+
+@pytest.fixture
+def timers(app, clock):
+    scheduler = TimelineScheduler(clock=clock.monotonic)
+    timeline = scheduler.timeline("test")
+
+    def advance(ms):
+        clock.set_ms(clock.elapsed_ms + ms)
+        scheduler.poll()
+    timeline.advance = advance
+    yield timeline
+    timeline.cancel()
+
+
+class TestVirtualClock:
+
+    def test_time_follows_simulation(self, clock):
+        wall = clock.time()
+        clock.set_ms(90000)
+        assert clock.monotonic() == 90.0
+        assert clock.time() == pytest.approx(wall + 90.0)
+
+    def test_never_goes_back(self, clock):
+        clock.set_ms(5000)
+        clock.set_ms(1000)
+        assert clock.elapsed_ms == 5000
+
+    def test_other_names_come_from_time_module(self, clock):
+        assert clock.strftime("%Y").isdigit()
+
+
+class TestVirtualQTimer:
+
+    def test_repeating_timer(self, timers):
+        QTimer = virtual_qtimer(timers)
+        ticks = []
+        timer = QTimer()
+        timer.timeout.connect(lambda: ticks.append(1))
+        timer.start(5000)
+        timers.advance(16000)
+        assert len(ticks) == 3
+        timer.stop()
+        timers.advance(10000)
+        assert len(ticks) == 3
+        assert not timer.isActive()
+
+    def test_single_shot(self, timers):
+        QTimer = virtual_qtimer(timers)
+        fired = []
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: fired.append("t"))
+        timer.start(1000)
+        assert timer.isActive()
+        QTimer.singleShot(500, lambda: fired.append("s"))
+        timers.advance(2000)
+        assert fired == ["s", "t"]
+        assert not timer.isActive()
+
+    def test_restart_replaces_pending_shot(self, timers):
+        QTimer = virtual_qtimer(timers)
+        fired = []
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: fired.append(1))
+        timer.start(1000)
+        timers.advance(800)
+        timer.start(1000)
+        timers.advance(800)
+        assert fired == []
+        timers.advance(300)
+        assert fired == [1]
+
+
+class TestSimBrain:
+
+    def test_answers_after_virtual_latency(self, timers, clock):
+        brain = SimBrain(timers, clock, latency_ms=1500)
+        replies = []
+        brain.generate_async("prompt", replies.append)
+        timers.advance(1000)
+        assert replies == []
+        timers.advance(600)
+        assert len(replies) == 1 and "action" in replies[0]
+        assert brain.calls == 1
+
+    def test_counts_persona_switches(self, timers, clock):
+        brain = SimBrain(timers, clock)
+        brain.switch_persona("ENTITY")
+        brain.switch_persona("ENTITY")
+        assert brain.current_persona == "ENTITY"
+        assert brain.persona_switches == 1
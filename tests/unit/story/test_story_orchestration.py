@@ -10,6 +10,8 @@ from unittest.mock import MagicMock, patch
 from story.story_manager import StoryManager
 from story.dynamic_scheduler import DynamicEventScheduler
 
+pytestmark = pytest.mark.usefixtures("runtime_sandbox")
+
 class TestStoryOrchestration:
     @pytest.fixture
     def app(self):
@@ -48,6 +50,16 @@ class TestStoryOrchestration:
         assert story_mgr.current_act_instance is not None
         mock_act1.assert_called()
 
+    @patch('story.story_manager.Act1Infection')
+    def test_act_checkpoint_written_to_sandbox(self, mock_act1, story_mgr, runtime_sandbox):
+        story_mgr.memory.data = {"current_act": 1}
+
+        story_mgr._load_act(1)
+
+        checkpoints = list((runtime_sandbox / "checkpoints").glob("cp_*_act_1_start.json"))
+        assert len(checkpoints) == 1
+        assert "[CHECKPOINT] Created: act_1_start" in (runtime_sandbox / "sentient.log").read_text(encoding="utf-8")
+
 
     def test_dynamic_scheduler_adaptive_delay(self):
         scheduler = DynamicEventScheduler()
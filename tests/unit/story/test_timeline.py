@@ -0,0 +1,148 @@
+# Copyright (c) 2026 Muhammet Ali Büyük. All rights reserved.
+# This source code is proprietary. Confidential and private.
+# Unauthorized copying or distribution is strictly prohibited.
+# Contact: iletisim@alibuyuk.net | https://alibuyuk.net
+# ARCHITECT: MAB-SENTIENT-2026
+# =========================================================================
+
+import time
+import pytest
+from unittest.mock import MagicMock
+from story.timeline import TimelineScheduler
+
+
+@pytest.fixture(scope="session")
+def app():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(app, clock):
+    sched = TimelineScheduler(clock=clock)
+    yield sched
+    for timeline in sched.timelines():
+        timeline.cancel()
+
+
+def run(sched, clock, ms):
+    clock.advance(ms)
+    sched.poll()
+
+
+class TestTimeline:
+
+    def test_events_fire_in_time_order(self, scheduler, clock):
+        fired = []
+        tl = scheduler.timeline("act")
+        tl.at(300, fired.append, "c")
+        tl.at(100, fired.append, "a")
+        tl.at(100, fired.append, "b")  # Same time: insertion order
+        run(scheduler, clock, 99)
+        assert fired == []
+        run(scheduler, clock, 1)
+        assert fired == ["a", "b"]
+        run(scheduler, clock, 500)
+        assert fired == ["a", "b", "c"]
+        assert tl.pending == 0
+
+    def test_cancel_event_and_timeline(self, scheduler, clock):
+        fired = []
+        tl = scheduler.timeline("act")
+        first = tl.at(100, fired.append, 1)
+        tl.at(200, fired.append, 2)
+        first.stop()  # QTimer-compatible alias
+        run(scheduler, clock, 150)
+        assert fired == []
+        tl.cancel()
+        run(scheduler, clock, 500)
+        assert fired == []
+        assert scheduler.timelines() == []
+        assert not tl.at(10, fired.append, 3).active  # Cancelled timeline takes no new events
+
+    def test_pause_resume_freezes_clock(self, scheduler, clock):
+        fired = []
+        tl = scheduler.timeline("act")
+        tl.at(1000, fired.append, "beat")
+        run(scheduler, clock, 400)
+        tl.pause()
+        run(scheduler, clock, 5000)
+        assert fired == [] and tl.elapsed_ms == pytest.approx(400)
+        assert scheduler.next_due_ms() is None  # Nothing to wake up for
+        tl.resume()
+        run(scheduler, clock, 599)
+        assert fired == []
+        run(scheduler, clock, 1)
+        assert fired == ["beat"]
+
+    def test_scale_whole_timeline(self, scheduler, clock):
+        fired = []
+        fast = scheduler.timeline("fast")
+        slow = scheduler.timeline("slow")
+        fast.at(1000, fired.append, "fast")
+        slow.at(1000, fired.append, "slow")
+        run(scheduler, clock, 200)
+        fast.set_scale(4.0)   # 200ms done, 800 left -> 200ms real
+        slow.set_scale(0.5)   # 800 left -> 1600ms real
+        run(scheduler, clock, 200)
+        assert fired == ["fast"]
+        run(scheduler, clock, 1399)
+        assert fired == ["fast"]
+        run(scheduler, clock, 1)
+        assert fired == ["fast", "slow"]
+        with pytest.raises(ValueError):
+            fast.set_scale(0)
+
+    def test_repeating_event_and_errors_are_contained(self, scheduler, clock):
+        ticks = []
+        broken = MagicMock(side_effect=RuntimeError("boom"))
+        tl = scheduler.timeline("act")
+        tl.every(100, ticks.append, "tick")
+        tl.at(50, broken)
+        run(scheduler, clock, 350)
+        assert ticks == ["tick"] * 3
+        assert broken.called
+
+    def test_single_qt_timer_drives_many_events(self, scheduler):
+        from PyQt6.QtWidgets import QApplication
+        real = TimelineScheduler()
+        fired = []
+        tl = real.timeline("act")
+        for i in range(50):
+            tl.at(i, fired.append, i)
+        tl.at(60, fired.append, "end")
+        deadline = time.time() + 2.0
+        while "end" not in fired and time.time() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.002)
+        assert fired == list(range(50)) + ["end"]
+        assert real.fired == 51
+
+
+@pytest.mark.usefixtures("runtime_sandbox")
+class TestActsOnTimeline:
+
+    def test_act_entries_share_one_timeline(self, app):
+        from story.act_3_torment import Act3Torment
+        act = Act3Torment(MagicMock(), MagicMock())
+        act.start()
+        assert act.timeline.pending == len(act.timers)
+        act.timeline.set_scale(1000.0)  # Fast-forward: 20 minutes in 1.2s
+        act.stop()
+        assert act.timeline.pending == 0
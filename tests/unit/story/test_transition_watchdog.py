@@ -15,6 +15,8 @@ import pytest
 from unittest.mock import MagicMock, patch
 from story.story_manager import StoryManager
 
+pytestmark = pytest.mark.usefixtures("runtime_sandbox")
+
 
 @pytest.fixture
 def mock_dependencies():
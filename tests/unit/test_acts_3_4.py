@@ -11,6 +11,8 @@ from unittest.mock import MagicMock, patch
 from story.act_3_torment import Act3Torment
 from story.act_4_exorcism import Act4Exorcism
 
+pytestmark = pytest.mark.usefixtures("runtime_sandbox")
+
 class TestAct3Torment:
     @pytest.fixture
     def mock_dispatcher(self):
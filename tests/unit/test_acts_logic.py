@@ -11,6 +11,8 @@ from unittest.mock import MagicMock, patch
 from story.act_1_infection import Act1Infection
 from story.act_2_awakening import Act2Awakening
 
+pytestmark = pytest.mark.usefixtures("runtime_sandbox")
+
 class TestActEventLogic:
     """Tests for act-specific event scheduling and cleanup."""
 
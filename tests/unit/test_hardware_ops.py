@@ -5,6 +5,7 @@
 # ARCHITECT: MAB-SENTIENT-2026
 # =========================================================================
 
+import time
 import pytest
 from unittest.mock import MagicMock, patch
 from hardware.keyboard_ops import KeyboardOps
@@ -47,3 +48,43 @@ class TestHardwareOps:
         from hardware.brightness_ops import BrightnessOps
         BrightnessOps.flicker(times=1)
         assert mock_set_brightness.called
+
+
+class TestBrightnessDim:
+    """gradual_dim: the Effect covers the dim only; restore runs on its own timer."""
+
+    @pytest.fixture
+    def dim_env(self):
+        from core.effect_runtime import EffectRuntime
+        from hardware.brightness_ops import BrightnessOps
+        runtime = EffectRuntime()
+        config = MagicMock()
+        config.return_value.IS_MOCK = False
+        with patch('hardware.brightness_ops.HAS_BRIGHTNESS', True), \
+             patch('hardware.brightness_ops.sbc', create=True) as sbc, \
+             patch('hardware.brightness_ops.Config', config), \
+             patch('hardware.brightness_ops.get_effect_runtime', return_value=runtime), \
+             patch.object(BrightnessOps, 'restore_brightness') as restore, \
+             patch.object(BrightnessOps, '_original_brightness', 80):
+            yield BrightnessOps, sbc, restore, runtime
+        runtime.stop()
+
+    def test_effect_ends_at_target_and_restores_later(self, dim_env):
+        ops, sbc, restore, runtime = dim_env
+        effect = ops.gradual_dim(target=20, steps=2, auto_restore_ms=200)
+        assert effect.wait(2.0)
+        assert sbc.set_brightness.call_args_list[-1].args == (20,)
+        assert not restore.called  # Dimmed, lane free, restore still pending
+        deadline = time.time() + 2.0
+        while not restore.called and time.time() < deadline:
+            time.sleep(0.01)
+        restore.assert_called_once()
+
+    def test_cancel_mid_dim_restores(self, dim_env):
+        ops, sbc, restore, runtime = dim_env
+        effect = ops.gradual_dim(target=20, steps=4, auto_restore_ms=10000)
+        time.sleep(0.1)
+        effect.cancel()
+        assert effect.wait(2.0)
+        restore.assert_called_once()
+        assert runtime.active() == 0  # No auto-restore timer left behind
@@ -42,22 +42,25 @@ def run_stress_test(num_tasks=50, delay=0.01):
         completed_count = 0
         start_time = time.time()
         
-        # Patch execution to just count
-        original_execute = disp._execute_action
-        
+        # Patch the handler tables to just count
         executed_tasks = []
         
-        def mock_execute(action, params, speech):
-            nonlocal completed_count
-            # Simulate work based on action
-            if "HEAVY" in action:
-                time.sleep(0.1)
-            executed_tasks.append(action)
-            completed_count += 1
-            if completed_count % 10 == 0:
-                print(f"Progress: {completed_count}/{num_tasks}")
-                
-        disp._execute_action = mock_execute
+        def mock_handler(action):
+            def handler(params, speech=""):
+                nonlocal completed_count
+                # Simulate work based on action
+                if "HEAVY" in action:
+                    time.sleep(0.1)
+                executed_tasks.append(action)
+                completed_count += 1
+                if completed_count % 10 == 0:
+                    print(f"Progress: {completed_count}/{num_tasks}")
+            return handler
+        
+        for sub_dispatcher in disp._dispatchers():
+            sub_dispatcher._handlers = {action: mock_handler(action)
+                                        for action in sub_dispatcher.get_supported_actions()}
+        disp._action_map = disp._build_action_map()
         
         # Flood Queue
         print("Flooding queue...")
@@ -22,6 +22,7 @@ from PyQt6.QtCore import QObject, QTimer
 import random
 from config import Config
 from core.logger import log_info, log_error, log_debug
+from core.function_dispatcher import SOURCE_AMBIENT
 
 
 class AmbientHorror(QObject):
@@ -138,7 +139,7 @@ class AmbientHorror(QObject):
             "action": action,
             "params": params,
             "speech": ""
-        })
+        }, source=SOURCE_AMBIENT)
         
         # Schedule next
         self._schedule_next()
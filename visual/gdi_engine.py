@@ -9,6 +9,7 @@ import random
 import time
 from typing import Tuple
 from config import Config
+from core.effect_runtime import get_effect_runtime
 
 try:
     if Config().IS_MOCK:
@@ -65,11 +66,15 @@ class GDIEngine:
         """
         Optimized: Draws random black/white blocks (static) directly on the screen.
         Uses PatBlt instead of SetPixel for high performance.
+        Non-blocking: runs on the effect runtime, returns its Effect handle.
         """
         if not HAS_WIN32:
             print("[GDI_MOCK] Drawing static noise...")
-            return
+            return None
+        return get_effect_runtime().spawn(cls._static_noise_steps(area, duration_ms), "GDI_STATIC")
 
+    @classmethod
+    def _static_noise_steps(cls, area, duration_ms):
         dc = cls.get_screen_dc()
         vx, vy, vw, vh = cls.get_virtual_screen_rect()
         
@@ -77,6 +82,7 @@ class GDIEngine:
         x, y, w, h = area or (vx, vy, vw, vh)
         
         end_time = time.time() + (duration_ms / 1000.0)
+        black_brush = white_brush = None
         
         try:
             # Create brushes once
@@ -96,22 +102,27 @@ class GDIEngine:
                     win32gui.PatBlt(dc, bx, by, bw, bh, win32con.PATCOPY)
                     win32gui.SelectObject(dc, old_brush)
                 
-                time.sleep(0.01)
-                
-            win32gui.DeleteObject(black_brush)
-            win32gui.DeleteObject(white_brush)
+                yield 0.01
         finally:
+            if black_brush:
+                win32gui.DeleteObject(black_brush)
+            if white_brush:
+                win32gui.DeleteObject(white_brush)
             cls.release_dc(dc)
 
     @classmethod
     def invert_screen(cls, duration_ms=200):
-        """Inverts the colors of the entire screen temporarily."""
+        """Inverts the colors of the entire screen temporarily (non-blocking)."""
         if not HAS_WIN32:
             print("[GDI_MOCK] Inverting screen colors...")
-            return
+            return None
+        return get_effect_runtime().spawn(cls._invert_steps(duration_ms), "SCREEN_INVERT")
 
+    @classmethod
+    def _invert_steps(cls, duration_ms):
         dc = cls.get_screen_dc()
         x, y, w, h = cls.get_virtual_screen_rect()
+        inverted = False
         
         # PATINVERT uses the destination bits and PATTERN
         # DSTINVERT simply inverts the destination bits
@@ -120,9 +131,11 @@ class GDIEngine:
             duration = duration_ms if Config().get("ENABLE_STROBE", False) else (duration_ms * 3)
             
             win32gui.BitBlt(dc, x, y, w, h, dc, 0, 0, win32con.DSTINVERT)
-            time.sleep(duration / 1000.0)
-            win32gui.BitBlt(dc, x, y, w, h, dc, 0, 0, win32con.DSTINVERT) # Revert
+            inverted = True
+            yield duration / 1000.0
         finally:
+            if inverted:
+                win32gui.BitBlt(dc, x, y, w, h, dc, 0, 0, win32con.DSTINVERT) # Revert
             cls.release_dc(dc)
 
     @classmethod
@@ -150,29 +163,37 @@ class GDIEngine:
 
     @classmethod
     def flash_red_glitch(cls):
-        """Full screen red flash using PatBlt."""
-        if not HAS_WIN32: return
+        """Full screen red flash using PatBlt (non-blocking)."""
+        if not HAS_WIN32: return None
         
+        # SAFE MODE: Red flashing is a major seizure trigger. Suppress if not enabled.
+        if not Config().get("ENABLE_STROBE", False):
+            print("[GDI] Red flash suppressed for photosensitivity.")
+            return None
+        return get_effect_runtime().spawn(cls._red_flash_steps(), "GDI_FLASH")
+
+    @classmethod
+    def _red_flash_steps(cls):
         dc = cls.get_screen_dc()
         x, y, w, h = cls.get_virtual_screen_rect()
+        brush = old_brush = None
+        flashed = False
         
         try:
-            # SAFE MODE: Red flashing is a major seizure trigger. Suppress if not enabled.
-            if not Config().get("ENABLE_STROBE", False):
-                print("[GDI] Red flash suppressed for photosensitivity.")
-                return
-
             brush = win32gui.CreateSolidBrush(win32api.RGB(255, 0, 0))
             old_brush = win32gui.SelectObject(dc, brush)
             
             # Use PATINVERT for a ghostly flicker effect instead of solid fill
             win32gui.PatBlt(dc, x, y, w, h, win32con.PATINVERT)
-            time.sleep(0.05)
-            win32gui.PatBlt(dc, x, y, w, h, win32con.PATINVERT)
-            
-            win32gui.SelectObject(dc, old_brush)
-            win32gui.DeleteObject(brush)
+            flashed = True
+            yield 0.05
         finally:
+            if flashed:
+                win32gui.PatBlt(dc, x, y, w, h, win32con.PATINVERT)
+            if old_brush:
+                win32gui.SelectObject(dc, old_brush)
+            if brush:
+                win32gui.DeleteObject(brush)
             cls.release_dc(dc)
 
     @staticmethod
@@ -6,7 +6,8 @@
 # =========================================================================
 
 import random
-from core.event_bus import EventBus
+from core.function_dispatcher import SOURCE_AMBIENT, dispatch_source
+from core.event_bus import EventBus, WORKER
 from core.logger import log_info
 
 class GlitchLogic:
@@ -22,9 +23,11 @@ class GlitchLogic:
     def _setup_subscriptions(self):
         """Subscribe to events that should trigger glitches."""
         EventBus().subscribe("ui.window_changed", self._on_window_changed)
-        EventBus().subscribe("ui.user_activity", self._on_user_activity)
+        # Mouse activity is high-frequency: delivered off the sensor thread
+        EventBus().subscribe("ui.user_activity", self._on_user_activity, delivery=WORKER)
         EventBus().subscribe("anger.escalated", self._on_anger_escalated)
 
+    @dispatch_source(SOURCE_AMBIENT)
     def _on_window_changed(self, data):
         """Trigger a glitch based on Window Class (Language Independent)."""
         from hardware.window_ops import WindowOps
@@ -53,12 +56,14 @@ class GlitchLogic:
             if random.random() < 0.2: # 20% chance
                 self.dispatcher.dispatch({"action": "GDI_FLASH"})
 
+    @dispatch_source(SOURCE_AMBIENT)
     def _on_user_activity(self, data):
         """Trigger a flicker if the user is moving mouse too fast/hesitantly."""
         # Simple probability based reaction
         if random.random() < 0.05: # Rare subtle flicker
             self.dispatcher.dispatch({"action": "BRIGHTNESS_FLICKER", "params": {"times": 1}})
 
+    @dispatch_source(SOURCE_AMBIENT)
     def _on_anger_escalated(self, data):
         """Trigger more aggressive visuals when AI gets angrier."""
         level = data.get("level", 0)
@@ -22,7 +22,7 @@ from PyQt6.QtWidgets import QLabel, QApplication
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPixmap, QFont
 from config import Config
-from core.context_observer import ContextObserver
+from core.context_observer import ContextObserver, ContextView
 
 
 class HorrorEffects:
@@ -34,6 +34,7 @@ class HorrorEffects:
     def __init__(self, dispatcher=None):
         self._dispatcher = dispatcher
         self._crack_overlay = None
+        self._context_view = ContextView()  # Apps/desktop via context.changed
     
     def set_dispatcher(self, dispatcher):
         self._dispatcher = dispatcher
@@ -45,7 +46,7 @@ class HorrorEffects:
         Masaüstündeki dosyaları 'siliyormuş' gibi göster.
         GÜVENLİ: Hiçbir dosya gerçekten silinmez!
         """
-        desktop_files = ContextObserver.get_desktop_files()
+        desktop_files = self._context_view.current().get("desktop_files", [])
         
         if not desktop_files:
             desktop_files = ["document.pdf", "project.docx", "photo.jpg"]
@@ -238,7 +239,7 @@ class HorrorEffects:
 
     def app_specific_threat(self, params=None):
         """Targets a specific running app to scare the user."""
-        apps = ContextObserver.get_running_apps()
+        apps = list(self._context_view.current().get("running_apps", []))
         if not apps:
             apps = ["Chrome", "Discord", "Spotify"]
             
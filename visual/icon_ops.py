@@ -145,14 +145,9 @@ class IconOps:
             elif pattern == "random":
                 mask.capture_and_mask()
             
-            # Also use GDI for additional noise (in background thread to avoid UI freeze)
+            # Also use GDI for additional noise (effect runtime, does not block the UI)
             from visual.gdi_engine import GDIEngine
-            import threading
-            threading.Thread(
-                target=GDIEngine.draw_static_noise, 
-                kwargs={"duration_ms": 1000, "density": 0.02},
-                daemon=True
-            ).start()
+            GDIEngine.draw_static_noise(duration_ms=1000, density=0.02)
             
         except Exception as e:
             print(f"[ICONS] Scramble failed: {e}")